@@ -21,7 +21,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n+agent_platform/benchmark/v1/benchmark.proto\x12\x1b\x61gent_platform.benchmark.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\x1a$agent_platform/common/v1/types.proto\x1a%agent_platform/reward/v1/reward.proto\x1a.agent_platform/dataset/v1/prompt_dataset.proto"\xf1\x03\n\x0c\x42\x65nchmarkRun\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x19\n\x08\x61gent_id\x18\x02 \x01(\tR\x07\x61gentId\x12*\n\x11prompt_dataset_id\x18\x03 \x01(\tR\x0fpromptDatasetId\x12@\n\x04rows\x18\x04 \x03(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkRunRowR\x04rows\x12P\n\x0c\x66inal_reward\x18\x05 \x01(\x0b\x32-.agent_platform.benchmark.v1.AggregatedRewardR\x0b\x66inalReward\x12\x38\n\x06status\x18\x06 \x01(\x0e\x32 .agent_platform.common.v1.StatusR\x06status\x12\x39\n\nstarted_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tstartedAt\x12;\n\x0b\x66inished_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\nfinishedAt\x12\x44\n\x06\x63onfig\x18\t \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkConfigR\x06\x63onfig"\xbc\x02\n\x0f\x42\x65nchmarkRunRow\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x31\n\x15prompt_dataset_row_id\x18\x02 \x01(\tR\x12promptDatasetRowId\x12>\n\x06reward\x18\x03 \x01(\x0b\x32&.agent_platform.reward.v1.RewardResultR\x06reward\x12"\n\ragent_run_ids\x18\x04 \x03(\tR\x0b\x61gentRunIds\x12H\n\x0csme_comments\x18\x05 \x03(\x0b\x32%.agent_platform.dataset.v1.SMECommentR\x0bsmeComments\x12\x38\n\x06status\x18\x06 \x01(\x0e\x32 .agent_platform.common.v1.StatusR\x06status"\xcc\x03\n\x10\x41ggregatedReward\x12\x1d\n\nmean_score\x18\x01 \x01(\x02R\tmeanScore\x12!\n\x0cmedian_score\x18\x02 \x01(\x02R\x0bmedianScore\x12\x1b\n\tmin_score\x18\x03 \x01(\x02R\x08minScore\x12\x1b\n\tmax_score\x18\x04 \x01(\x02R\x08maxScore\x12\x17\n\x07std_dev\x18\x05 \x01(\x02R\x06stdDev\x12\x1d\n\ntotal_runs\x18\x06 \x01(\x05R\ttotalRuns\x12\'\n\x0fsuccessful_runs\x18\x07 \x01(\x05R\x0esuccessfulRuns\x12>\n\rtotal_latency\x18\x08 \x01(\x0b\x32\x19.google.protobuf.DurationR\x0ctotalLatency\x12:\n\x0b\x61vg_latency\x18\t \x01(\x0b\x32\x19.google.protobuf.DurationR\navgLatency\x12_\n\x13policy_aggregations\x18\n \x03(\x0b\x32..agent_platform.benchmark.v1.PolicyAggregationR\x12policyAggregations"\x98\x01\n\x11PolicyAggregation\x12&\n\x0fpolicy_agent_id\x18\x01 \x01(\tR\rpolicyAgentId\x12\x1d\n\nmean_score\x18\x02 \x01(\x02R\tmeanScore\x12\x1d\n\npass_count\x18\x03 \x01(\x05R\tpassCount\x12\x1d\n\nfail_count\x18\x04 \x01(\x05R\tfailCount"\x92\x01\n\x0f\x42\x65nchmarkConfig\x12&\n\x0fruns_per_prompt\x18\x01 \x01(\x05R\rrunsPerPrompt\x12*\n\x11max_parallel_runs\x18\x02 \x01(\x05R\x0fmaxParallelRuns\x12+\n\x11save_trajectories\x18\x03 \x01(\x08R\x10saveTrajectories"\xd3\x01\n\x13\x42\x65nchmarkComparison\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12*\n\x11\x62\x65nchmark_run_ids\x18\x02 \x03(\tR\x0f\x62\x65nchmarkRunIds\x12\x45\n\x06result\x18\x03 \x01(\x0b\x32-.agent_platform.benchmark.v1.ComparisonResultR\x06result\x12\x39\n\ncreated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt"\x94\x01\n\x10\x43omparisonResult\x12"\n\rbest_agent_id\x18\x01 \x01(\tR\x0b\x62\x65stAgentId\x12\\\n\x12\x61gent_performances\x18\x02 \x03(\x0b\x32-.agent_platform.benchmark.v1.AgentPerformanceR\x11\x61gentPerformances"\x9e\x01\n\x10\x41gentPerformance\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12(\n\x10\x62\x65nchmark_run_id\x18\x02 \x01(\tR\x0e\x62\x65nchmarkRunId\x12\x45\n\x06reward\x18\x03 \x01(\x0b\x32-.agent_platform.benchmark.v1.AggregatedRewardR\x06rewardB\x84\x02\n\x1f\x63om.agent_platform.benchmark.v1B\x0e\x42\x65nchmarkProtoP\x01ZGgithub.com/agentplatform/gen/go/agent_platform/benchmark/v1;benchmarkv1\xa2\x02\x03\x41\x42X\xaa\x02\x1a\x41gentPlatform.Benchmark.V1\xca\x02\x1a\x41gentPlatform\\Benchmark\\V1\xe2\x02&AgentPlatform\\Benchmark\\V1\\GPBMetadata\xea\x02\x1c\x41gentPlatform::Benchmark::V1b\x06proto3'
+    b'\n+agent_platform/benchmark/v1/benchmark.proto\x12\x1b\x61gent_platform.benchmark.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\x1a#agent_platform/agent/v1/agent.proto\x1a$agent_platform/common/v1/types.proto\x1a%agent_platform/reward/v1/reward.proto\x1a.agent_platform/dataset/v1/prompt_dataset.proto"\x9b\x05\n\x0c\x42\x65nchmarkRun\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x19\n\x08\x61gent_id\x18\x02 \x01(\tR\x07\x61gentId\x12*\n\x11prompt_dataset_id\x18\x03 \x01(\tR\x0fpromptDatasetId\x12@\n\x04rows\x18\x04 \x03(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkRunRowR\x04rows\x12P\n\x0c\x66inal_reward\x18\x05 \x01(\x0b\x32-.agent_platform.benchmark.v1.AggregatedRewardR\x0b\x66inalReward\x12\x38\n\x06status\x18\x06 \x01(\x0e\x32 .agent_platform.common.v1.StatusR\x06status\x12\x39\n\nstarted_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tstartedAt\x12;\n\x0b\x66inished_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\nfinishedAt\x12\x44\n\x06\x63onfig\x18\t \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkConfigR\x06\x63onfig\x12\x44\n\x05stats\x18\n \x01(\x0b\x32..agent_platform.benchmark.v1.BenchmarkRunStatsR\x05stats\x12\x19\n\x08sweep_id\x18\x0b \x01(\tR\x07sweepId\x12G\n\x0c\x61gent_config\x18\x0c \x01(\x0b\x32$.agent_platform.agent.v1.AgentConfigR\x0b\x61gentConfig"\xd6\x03\n\x11\x42\x65nchmarkRunStats\x12\x1f\n\x0breused_rows\x18\x01 \x01(\x05R\nreusedRows\x12#\n\rexecuted_rows\x18\x02 \x01(\x05R\x0c\x65xecutedRows\x12#\n\rstopped_early\x18\x03 \x01(\x08R\x0cstoppedEarly\x12\x1f\n\x0bstop_reason\x18\x04 \x01(\tR\nstopReason\x12!\n\x0cskipped_rows\x18\x05 \x01(\x05R\x0bskippedRows\x12\x1d\n\nsaved_runs\x18\x06 \x01(\x05R\tsavedRuns\x12%\n\x0einterval_lower\x18\x07 \x01(\x02R\rintervalLower\x12%\n\x0einterval_upper\x18\x08 \x01(\x02R\rintervalUpper\x12.\n\x13locally_scored_rows\x18\t \x01(\x05R\x11locallyScoredRows\x12\x34\n\x16local_scoring_fraction\x18\n \x01(\x02R\x14localScoringFraction\x12?\n\x1creward_latency_saved_seconds\x18\x0b \x01(\x02R\x19rewardLatencySavedSeconds"\xd4\x02\n\x0f\x42\x65nchmarkRunRow\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x31\n\x15prompt_dataset_row_id\x18\x02 \x01(\tR\x12promptDatasetRowId\x12>\n\x06reward\x18\x03 \x01(\x0b\x32&.agent_platform.reward.v1.RewardResultR\x06reward\x12"\n\ragent_run_ids\x18\x04 \x03(\tR\x0b\x61gentRunIds\x12H\n\x0csme_comments\x18\x05 \x03(\x0b\x32%.agent_platform.dataset.v1.SMECommentR\x0bsmeComments\x12\x38\n\x06status\x18\x06 \x01(\x0e\x32 .agent_platform.common.v1.StatusR\x06status\x12\x16\n\x06reused\x18\x07 \x01(\x08R\x06reused"\xcc\x03\n\x10\x41ggregatedReward\x12\x1d\n\nmean_score\x18\x01 \x01(\x02R\tmeanScore\x12!\n\x0cmedian_score\x18\x02 \x01(\x02R\x0bmedianScore\x12\x1b\n\tmin_score\x18\x03 \x01(\x02R\x08minScore\x12\x1b\n\tmax_score\x18\x04 \x01(\x02R\x08maxScore\x12\x17\n\x07std_dev\x18\x05 \x01(\x02R\x06stdDev\x12\x1d\n\ntotal_runs\x18\x06 \x01(\x05R\ttotalRuns\x12\'\n\x0fsuccessful_runs\x18\x07 \x01(\x05R\x0esuccessfulRuns\x12>\n\rtotal_latency\x18\x08 \x01(\x0b\x32\x19.google.protobuf.DurationR\x0ctotalLatency\x12:\n\x0b\x61vg_latency\x18\t \x01(\x0b\x32\x19.google.protobuf.DurationR\navgLatency\x12_\n\x13policy_aggregations\x18\n \x03(\x0b\x32..agent_platform.benchmark.v1.PolicyAggregationR\x12policyAggregations"\x98\x01\n\x11PolicyAggregation\x12&\n\x0fpolicy_agent_id\x18\x01 \x01(\tR\rpolicyAgentId\x12\x1d\n\nmean_score\x18\x02 \x01(\x02R\tmeanScore\x12\x1d\n\npass_count\x18\x03 \x01(\x05R\tpassCount\x12\x1d\n\nfail_count\x18\x04 \x01(\x05R\tfailCount"\xed\x02\n\x0f\x42\x65nchmarkConfig\x12&\n\x0fruns_per_prompt\x18\x01 \x01(\x05R\rrunsPerPrompt\x12*\n\x11max_parallel_runs\x18\x02 \x01(\x05R\x0fmaxParallelRuns\x12+\n\x11save_trajectories\x18\x03 \x01(\x08R\x10saveTrajectories\x12*\n\x11reuse_cached_rows\x18\x04 \x01(\x08R\x0freuseCachedRows\x12W\n\x0e\x65\x61rly_stopping\x18\x05 \x01(\x0b\x32\x30.agent_platform.benchmark.v1.EarlyStoppingConfigR\rearlyStopping\x12T\n\rlocal_scoring\x18\x06 \x01(\x0b\x32/.agent_platform.benchmark.v1.LocalScoringConfigR\x0clocalScoring"J\n\x12LocalScoringConfig\x12\x1a\n\x08\x64isabled\x18\x01 \x01(\x08R\x08\x64isabled\x12\x18\n\x07scorers\x18\x02 \x03(\tR\x07scorers"\xdc\x01\n\x13\x45\x61rlyStoppingConfig\x12\x18\n\x07\x65nabled\x18\x01 \x01(\x08R\x07\x65nabled\x12)\n\x10\x63onfidence_level\x18\x02 \x01(\x02R\x0f\x63onfidenceLevel\x12,\n\x12max_interval_width\x18\x03 \x01(\x02R\x10maxIntervalWidth\x12&\n\x0ctarget_score\x18\x04 \x01(\x02H\x00R\x0btargetScore\x88\x01\x01\x12\x19\n\x08min_rows\x18\x05 \x01(\x05R\x07minRowsB\x0f\n\r_target_score"\xd3\x01\n\x13\x42\x65nchmarkComparison\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12*\n\x11\x62\x65nchmark_run_ids\x18\x02 \x03(\tR\x0f\x62\x65nchmarkRunIds\x12\x45\n\x06result\x18\x03 \x01(\x0b\x32-.agent_platform.benchmark.v1.ComparisonResultR\x06result\x12\x39\n\ncreated_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt"\xc6\x02\n\x10\x43omparisonResult\x12"\n\rbest_agent_id\x18\x01 \x01(\tR\x0b\x62\x65stAgentId\x12\\\n\x12\x61gent_performances\x18\x02 \x03(\x0b\x32-.agent_platform.benchmark.v1.AgentPerformanceR\x11\x61gentPerformances\x12\x31\n\x15\x62\x65st_benchmark_run_id\x18\x03 \x01(\tR\x12\x62\x65stBenchmarkRunId\x12!\n\x0c\x61ligned_rows\x18\x04 \x01(\x05R\x0b\x61lignedRows\x12/\n\x13\x62ootstrap_resamples\x18\x05 \x01(\x05R\x12\x62ootstrapResamples\x12)\n\x10\x63onfidence_level\x18\x06 \x01(\x02R\x0f\x63onfidenceLevel"\xc0\x03\n\x10\x41gentPerformance\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12(\n\x10\x62\x65nchmark_run_id\x18\x02 \x01(\tR\x0e\x62\x65nchmarkRunId\x12\x45\n\x06reward\x18\x03 \x01(\x0b\x32-.agent_platform.benchmark.v1.AggregatedRewardR\x06reward\x12\x19\n\x08\x63i_lower\x18\x04 \x01(\x02R\x07\x63iLower\x12\x19\n\x08\x63i_upper\x18\x05 \x01(\x02R\x07\x63iUpper\x12\x1d\n\nmean_delta\x18\x06 \x01(\x02R\tmeanDelta\x12$\n\x0e\x64\x65lta_ci_lower\x18\x07 \x01(\x02R\x0c\x64\x65ltaCiLower\x12$\n\x0e\x64\x65lta_ci_upper\x18\x08 \x01(\x02R\x0c\x64\x65ltaCiUpper\x12\x19\n\x08win_rate\x18\t \x01(\x02R\x07winRate\x12\x1b\n\tprob_best\x18\n \x01(\x02R\x08probBest\x12G\n\x0c\x61gent_config\x18\x0b \x01(\x0b\x32$.agent_platform.agent.v1.AgentConfigR\x0b\x61gentConfig"\x95\x01\n\x12\x42\x65nchmarkSweepGrid\x12\x16\n\x06models\x18\x01 \x03(\tR\x06models\x12"\n\x0ctemperatures\x18\x02 \x03(\x02R\x0ctemperatures\x12\x1d\n\nmax_tokens\x18\x03 \x03(\x05R\tmaxTokens\x12$\n\x0emax_tool_calls\x18\x04 \x03(\x05R\x0cmaxToolCalls"\xc8\x05\n\x0e\x42\x65nchmarkSweep\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x19\n\x08\x61gent_id\x18\x02 \x01(\tR\x07\x61gentId\x12*\n\x11prompt_dataset_id\x18\x03 \x01(\tR\x0fpromptDatasetId\x12\x43\n\x04grid\x18\x04 \x01(\x0b\x32/.agent_platform.benchmark.v1.BenchmarkSweepGridR\x04grid\x12\x44\n\x06\x63onfig\x18\x05 \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkConfigR\x06\x63onfig\x12\x36\n\x18max_llm_calls_per_minute\x18\x06 \x01(\x05R\x14maxLlmCallsPerMinute\x12P\n\x0e\x62\x65nchmark_runs\x18\x07 \x03(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\rbenchmarkRuns\x12\x38\n\x06status\x18\x08 \x01(\x0e\x32 .agent_platform.common.v1.StatusR\x06status\x12\x39\n\nstarted_at\x18\t \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tstartedAt\x12;\n\x0b\x66inished_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.TimestampR\nfinishedAt\x12P\n\ncomparison\x18\x0b \x01(\x0b\x32\x30.agent_platform.benchmark.v1.BenchmarkComparisonR\ncomparison\x12\x46\n\x05stats\x18\x0c \x01(\x0b\x32\x30.agent_platform.benchmark.v1.BenchmarkSweepStatsR\x05stats"\x9f\x01\n\x13\x42\x65nchmarkSweepStats\x12$\n\x0ellm_cache_hits\x18\x01 \x01(\x05R\x0cllmCacheHits\x12\x1b\n\tllm_calls\x18\x02 \x01(\x05R\x08llmCalls\x12&\n\x0ftool_cache_hits\x18\x03 \x01(\x05R\rtoolCacheHits\x12\x1d\n\ntool_calls\x18\x04 \x01(\x05R\ttoolCallsB\x84\x02\n\x1f\x63om.agent_platform.benchmark.v1B\x0e\x42\x65nchmarkProtoP\x01ZGgithub.com/agentplatform/gen/go/agent_platform/benchmark/v1;benchmarkv1\xa2\x02\x03\x41\x42X\xaa\x02\x1a\x41gentPlatform.Benchmark.V1\xca\x02\x1a\x41gentPlatform\\Benchmark\\V1\xe2\x02&AgentPlatform\\Benchmark\\V1\\GPBMetadata\xea\x02\x1c\x41gentPlatform::Benchmark::V1b\x06proto3'
 )
 
 _globals = globals()
@@ -34,20 +34,32 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals[
         "DESCRIPTOR"
     ]._serialized_options = b"\n\037com.agent_platform.benchmark.v1B\016BenchmarkProtoP\001ZGgithub.com/agentplatform/gen/go/agent_platform/benchmark/v1;benchmarkv1\242\002\003ABX\252\002\032AgentPlatform.Benchmark.V1\312\002\032AgentPlatform\\Benchmark\\V1\342\002&AgentPlatform\\Benchmark\\V1\\GPBMetadata\352\002\034AgentPlatform::Benchmark::V1"
-    _globals["_BENCHMARKRUN"]._serialized_start = 267
-    _globals["_BENCHMARKRUN"]._serialized_end = 764
-    _globals["_BENCHMARKRUNROW"]._serialized_start = 767
-    _globals["_BENCHMARKRUNROW"]._serialized_end = 1083
-    _globals["_AGGREGATEDREWARD"]._serialized_start = 1086
-    _globals["_AGGREGATEDREWARD"]._serialized_end = 1546
-    _globals["_POLICYAGGREGATION"]._serialized_start = 1549
-    _globals["_POLICYAGGREGATION"]._serialized_end = 1701
-    _globals["_BENCHMARKCONFIG"]._serialized_start = 1704
-    _globals["_BENCHMARKCONFIG"]._serialized_end = 1850
-    _globals["_BENCHMARKCOMPARISON"]._serialized_start = 1853
-    _globals["_BENCHMARKCOMPARISON"]._serialized_end = 2064
-    _globals["_COMPARISONRESULT"]._serialized_start = 2067
-    _globals["_COMPARISONRESULT"]._serialized_end = 2215
-    _globals["_AGENTPERFORMANCE"]._serialized_start = 2218
-    _globals["_AGENTPERFORMANCE"]._serialized_end = 2376
+    _globals["_BENCHMARKRUN"]._serialized_start = 304
+    _globals["_BENCHMARKRUN"]._serialized_end = 971
+    _globals["_BENCHMARKRUNSTATS"]._serialized_start = 974
+    _globals["_BENCHMARKRUNSTATS"]._serialized_end = 1444
+    _globals["_BENCHMARKRUNROW"]._serialized_start = 1447
+    _globals["_BENCHMARKRUNROW"]._serialized_end = 1787
+    _globals["_AGGREGATEDREWARD"]._serialized_start = 1790
+    _globals["_AGGREGATEDREWARD"]._serialized_end = 2250
+    _globals["_POLICYAGGREGATION"]._serialized_start = 2253
+    _globals["_POLICYAGGREGATION"]._serialized_end = 2405
+    _globals["_BENCHMARKCONFIG"]._serialized_start = 2408
+    _globals["_BENCHMARKCONFIG"]._serialized_end = 2773
+    _globals["_LOCALSCORINGCONFIG"]._serialized_start = 2775
+    _globals["_LOCALSCORINGCONFIG"]._serialized_end = 2849
+    _globals["_EARLYSTOPPINGCONFIG"]._serialized_start = 2852
+    _globals["_EARLYSTOPPINGCONFIG"]._serialized_end = 3072
+    _globals["_BENCHMARKCOMPARISON"]._serialized_start = 3075
+    _globals["_BENCHMARKCOMPARISON"]._serialized_end = 3286
+    _globals["_COMPARISONRESULT"]._serialized_start = 3289
+    _globals["_COMPARISONRESULT"]._serialized_end = 3615
+    _globals["_AGENTPERFORMANCE"]._serialized_start = 3618
+    _globals["_AGENTPERFORMANCE"]._serialized_end = 4066
+    _globals["_BENCHMARKSWEEPGRID"]._serialized_start = 4069
+    _globals["_BENCHMARKSWEEPGRID"]._serialized_end = 4218
+    _globals["_BENCHMARKSWEEP"]._serialized_start = 4221
+    _globals["_BENCHMARKSWEEP"]._serialized_end = 4933
+    _globals["_BENCHMARKSWEEPSTATS"]._serialized_start = 4936
+    _globals["_BENCHMARKSWEEPSTATS"]._serialized_end = 5095
 # @@protoc_insertion_point(module_scope)
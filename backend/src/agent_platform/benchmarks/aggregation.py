@@ -0,0 +1,290 @@
+import math
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+POLICY_PASS_THRESHOLD: float = 0.5
+
+
+class RunningStats:
+    """Welford running mean/variance with Chan's parallel merge."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "RunningStats") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count: int = self.count + other.count
+        delta: float = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """Mergeable log-bucketed quantile sketch (DDSketch) with bounded relative error."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        self.relative_accuracy: float = relative_accuracy
+        self._gamma: float = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma: float = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self._zero_count: int = 0
+        self.count: int = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value > 0:
+            key: int = math.ceil(math.log(value) / self._log_gamma)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < 0:
+            key = math.ceil(math.log(-value) / self._log_gamma)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self._zero_count += 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + count
+        for key, count in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+        rank: float = q * (self.count - 1)
+        seen: int = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self._positive)) if self._positive else 0.0
+
+    def _bucket_value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+
+class _PolicyStats:
+    def __init__(self) -> None:
+        self.scores: RunningStats = RunningStats()
+        self.pass_count: int = 0
+        self.fail_count: int = 0
+
+    def add(self, score: float) -> None:
+        self.scores.add(score)
+        if score >= POLICY_PASS_THRESHOLD:
+            self.pass_count += 1
+        else:
+            self.fail_count += 1
+
+    def merge(self, other: "_PolicyStats") -> None:
+        self.scores.merge(other.scores)
+        self.pass_count += other.pass_count
+        self.fail_count += other.fail_count
+
+
+class RewardAggregator:
+    """Incrementally maintained ``AggregatedReward`` over completed benchmark rows.
+
+    Rows are folded in as they finish so a partial aggregate is always available
+    without re-reading earlier rows; the median comes from a quantile sketch and is
+    therefore approximate until ``aggregate_rows`` recomputes it exactly.
+    """
+
+    def __init__(self) -> None:
+        self.scores: RunningStats = RunningStats()
+        self.score_sketch: QuantileSketch = QuantileSketch()
+        self.total_runs: int = 0
+        self.successful_runs: int = 0
+        self.total_latency: float = 0.0
+        self.policies: dict[str, _PolicyStats] = {}
+
+    def add_row(self, row: dict[str, Any]) -> None:
+        metrics: dict = row.get("metrics") or {}
+        self.total_runs += int(metrics.get("runs", 0))
+        self.successful_runs += int(metrics.get("successful_runs", 0))
+        self.total_latency += float(metrics.get("latency_seconds", 0.0))
+
+        reward: dict | None = row.get("reward")
+        if not reward:
+            return
+        score: float = float(reward.get("score", 0.0))
+        self.scores.add(score)
+        self.score_sketch.add(score)
+        for breakdown in reward.get("breakdown", []):
+            policy_id: str = breakdown["policy_agent_id"]
+            self.policies.setdefault(policy_id, _PolicyStats()).add(
+                float(breakdown.get("score", 0.0))
+            )
+
+    def merge(self, other: "RewardAggregator") -> None:
+        self.scores.merge(other.scores)
+        self.score_sketch.merge(other.score_sketch)
+        self.total_runs += other.total_runs
+        self.successful_runs += other.successful_runs
+        self.total_latency += other.total_latency
+        for policy_id, stats in other.policies.items():
+            self.policies.setdefault(policy_id, _PolicyStats()).merge(stats)
+
+    def to_dict(self) -> dict[str, Any]:
+        has_scores: bool = self.scores.count > 0
+        return _aggregated_reward(
+            mean_score=self.scores.mean,
+            median_score=self.score_sketch.quantile(0.5),
+            min_score=self.scores.min if has_scores else 0.0,
+            max_score=self.scores.max if has_scores else 0.0,
+            std_dev=self.scores.std_dev,
+            total_runs=self.total_runs,
+            successful_runs=self.successful_runs,
+            total_latency=self.total_latency,
+            policy_aggregations=[
+                {
+                    "policy_agent_id": policy_id,
+                    "mean_score": stats.scores.mean,
+                    "pass_count": stats.pass_count,
+                    "fail_count": stats.fail_count,
+                }
+                for policy_id, stats in sorted(self.policies.items())
+            ],
+        )
+
+
+def aggregate_rows(rows: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    scores: list[float] = []
+    runs: list[int] = []
+    successful: list[int] = []
+    latencies: list[float] = []
+    policy_ids: list[str] = []
+    policy_scores: list[float] = []
+    for row in rows:
+        metrics: dict = row.get("metrics") or {}
+        runs.append(metrics.get("runs", 0))
+        successful.append(metrics.get("successful_runs", 0))
+        latencies.append(metrics.get("latency_seconds", 0.0))
+        reward: dict | None = row.get("reward")
+        if reward:
+            scores.append(reward.get("score", 0.0))
+            for breakdown in reward.get("breakdown", []):
+                policy_ids.append(breakdown["policy_agent_id"])
+                policy_scores.append(breakdown.get("score", 0.0))
+
+    return aggregate_arrays(
+        scores=np.asarray(scores, dtype=np.float64),
+        runs=np.asarray(runs, dtype=np.int64),
+        successful_runs=np.asarray(successful, dtype=np.int64),
+        latencies=np.asarray(latencies, dtype=np.float64),
+        policy_ids=np.asarray(policy_ids, dtype=object),
+        policy_scores=np.asarray(policy_scores, dtype=np.float64),
+    )
+
+
+def aggregate_arrays(
+    scores: np.ndarray,
+    runs: np.ndarray,
+    successful_runs: np.ndarray,
+    latencies: np.ndarray,
+    policy_ids: np.ndarray,
+    policy_scores: np.ndarray,
+) -> dict[str, Any]:
+    policy_aggregations: list[dict[str, Any]] = []
+    if policy_ids.size:
+        unique_ids, inverse = np.unique(policy_ids, return_inverse=True)
+        counts: np.ndarray = np.bincount(inverse, minlength=unique_ids.size)
+        sums: np.ndarray = np.bincount(inverse, weights=policy_scores, minlength=unique_ids.size)
+        passes: np.ndarray = np.bincount(
+            inverse, weights=policy_scores >= POLICY_PASS_THRESHOLD, minlength=unique_ids.size
+        )
+        for i, policy_id in enumerate(unique_ids):
+            policy_aggregations.append(
+                {
+                    "policy_agent_id": str(policy_id),
+                    "mean_score": float(sums[i] / counts[i]),
+                    "pass_count": int(passes[i]),
+                    "fail_count": int(counts[i] - passes[i]),
+                }
+            )
+
+    has_scores: bool = scores.size > 0
+    return _aggregated_reward(
+        mean_score=float(scores.mean()) if has_scores else 0.0,
+        median_score=float(np.median(scores)) if has_scores else 0.0,
+        min_score=float(scores.min()) if has_scores else 0.0,
+        max_score=float(scores.max()) if has_scores else 0.0,
+        std_dev=float(scores.std()) if has_scores else 0.0,
+        total_runs=int(runs.sum()),
+        successful_runs=int(successful_runs.sum()),
+        total_latency=float(latencies.sum()),
+        policy_aggregations=policy_aggregations,
+    )
+
+
+def _aggregated_reward(
+    mean_score: float,
+    median_score: float,
+    min_score: float,
+    max_score: float,
+    std_dev: float,
+    total_runs: int,
+    successful_runs: int,
+    total_latency: float,
+    policy_aggregations: list[dict[str, Any]],
+) -> dict[str, Any]:
+    avg_latency: float = total_latency / total_runs if total_runs else 0.0
+    return {
+        "mean_score": mean_score,
+        "median_score": median_score,
+        "min_score": min_score,
+        "max_score": max_score,
+        "std_dev": std_dev,
+        "total_runs": total_runs,
+        "successful_runs": successful_runs,
+        "total_latency": duration(total_latency),
+        "avg_latency": duration(avg_latency),
+        "policy_aggregations": policy_aggregations,
+    }
+
+
+def duration(seconds: float) -> dict[str, int]:
+    """``google.protobuf.Duration`` fields for ``seconds``."""
+    whole: int = int(seconds)
+    return {"seconds": whole, "nanos": min(int(round((seconds - whole) * 1e9)), 999_999_999)}
@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.benchmarks.aggregation import aggregate_rows
+from agent_platform.db.models.benchmark import BenchmarkComparison, BenchmarkRun
+from agent_platform.db.repository.benchmark import (
+    BenchmarkComparisonRepository,
+    BenchmarkRunRepository,
+    BenchmarkRunRowRepository,
+)
+from agent_platform.llm.executor import Status
+
+DEFAULT_BOOTSTRAP_RESAMPLES: int = 10_000
+DEFAULT_CONFIDENCE_LEVEL: float = 0.95
+# Upper bound on resample indices materialized at once; keeps memory flat for large runs.
+_CHUNK_ELEMENTS: int = 4_000_000
+
+
+def comparison_key(
+    runs: list[BenchmarkRun], row_counts: dict[str, int], resamples: int, confidence_level: float
+) -> str:
+    payload: dict[str, Any] = {
+        "runs": sorted(
+            [
+                run.id,
+                run.status,
+                run.finished_at.isoformat() if run.finished_at else None,
+                row_counts.get(run.id, 0),
+            ]
+            for run in runs
+        ),
+        "resamples": resamples,
+        "confidence_level": round(confidence_level, 6),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def align_rows(rows: list[list[dict]]) -> tuple[list[str], list[list[dict]]]:
+    """Return prompt dataset row ids scored in every run and the matching rows per run."""
+    scored: list[dict[str, dict]] = [
+        {row["prompt_dataset_row_id"]: row for row in run_rows if row.get("reward")}
+        for run_rows in rows
+    ]
+    common: set[str] = set(scored[0]) if scored else set()
+    for by_row_id in scored[1:]:
+        common &= by_row_id.keys()
+    row_ids: list[str] = sorted(common)
+    return row_ids, [[by_row_id[row_id] for row_id in row_ids] for by_row_id in scored]
+
+
+def bootstrap_means(scores: np.ndarray, resamples: int, rng: np.random.Generator) -> np.ndarray:
+    """Bootstrap distribution of per-column means, resampling whole rows so pairing is kept.
+
+    Each chunk draws row indices, turns them into multinomial counts with a single
+    ``bincount`` and reduces every column at once with a matrix product.
+    """
+    n, k = scores.shape
+    means: np.ndarray = np.empty((resamples, k), dtype=np.float64)
+    chunk: int = max(1, _CHUNK_ELEMENTS // n)
+    for start in range(0, resamples, chunk):
+        size: int = min(chunk, resamples - start)
+        indices: np.ndarray = rng.integers(0, n, size=(size, n))
+        indices += (np.arange(size) * n)[:, None]
+        counts: np.ndarray = np.bincount(indices.ravel(), minlength=size * n).reshape(size, n)
+        means[start : start + size] = counts @ scores / n
+    return means
+
+
+def compare_runs(
+    runs: list[BenchmarkRun],
+    rows: list[list[dict]],
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    row_ids, aligned = align_rows(rows)
+    if not row_ids:
+        raise ValueError("Benchmark runs have no scored prompt dataset rows in common")
+
+    scores: np.ndarray = np.array(
+        [[float(row["reward"].get("score", 0.0)) for row in rows] for rows in aligned],
+        dtype=np.float64,
+    ).T
+    k: int = scores.shape[1]
+    means: np.ndarray = scores.mean(axis=0)
+    best: int = int(np.argmax(means))
+
+    boot: np.ndarray = bootstrap_means(scores, resamples, np.random.default_rng(seed))
+    alpha: float = (1.0 - confidence_level) / 2
+    ci: np.ndarray = np.quantile(boot, [alpha, 1.0 - alpha], axis=0)
+    delta_ci: np.ndarray = np.quantile(boot - boot[:, [best]], [alpha, 1.0 - alpha], axis=0)
+    mean_delta: np.ndarray = (scores - scores[:, [best]]).mean(axis=0)
+    prob_best: np.ndarray = np.bincount(boot.argmax(axis=1), minlength=k) / resamples
+
+    wins: np.ndarray = (scores[:, :, None] > scores[:, None, :]).mean(axis=0)
+    ties: np.ndarray = (scores[:, :, None] == scores[:, None, :]).mean(axis=0)
+    pairwise: np.ndarray = wins + 0.5 * ties
+    np.fill_diagonal(pairwise, 0.0)
+    win_rate: np.ndarray = pairwise.sum(axis=1) / max(k - 1, 1)
+
+    return {
+        "best_agent_id": runs[best].agent_id,
+        "best_benchmark_run_id": runs[best].id,
+        "aligned_rows": len(row_ids),
+        "bootstrap_resamples": resamples,
+        "confidence_level": confidence_level,
+        "agent_performances": [
+            {
+                "agent_id": run.agent_id,
+                "benchmark_run_id": run.id,
+                "reward": aggregate_rows(aligned[i]),
+                "ci_lower": float(ci[0, i]),
+                "ci_upper": float(ci[1, i]),
+                "mean_delta": float(mean_delta[i]),
+                "delta_ci_lower": float(delta_ci[0, i]),
+                "delta_ci_upper": float(delta_ci[1, i]),
+                "win_rate": float(win_rate[i]),
+                "prob_best": float(prob_best[i]),
+                **({"agent_config": run.agent_config} if run.agent_config else {}),
+            }
+            for i, run in enumerate(runs)
+        ],
+    }
+
+
+async def compare_benchmark_runs(
+    session: AsyncSession, run_ids: list[str], resamples: int, confidence_level: float
+) -> BenchmarkComparison:
+    """Compare benchmark runs, reusing or materializing the comparison of finished runs."""
+    run_repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+    by_id: dict[str, BenchmarkRun] = {run.id: run for run in await run_repo.get_by_ids(run_ids)}
+    for run_id in run_ids:
+        if run_id not in by_id:
+            raise ValueError(f"Benchmark run {run_id} not found")
+    runs: list[BenchmarkRun] = [by_id[run_id] for run_id in run_ids]
+
+    row_repo: BenchmarkRunRowRepository = BenchmarkRunRowRepository(session)
+    comparison_repo: BenchmarkComparisonRepository = BenchmarkComparisonRepository(session)
+    key: str = comparison_key(
+        runs,
+        await row_repo.count_by_benchmark_run_ids(run_ids),
+        resamples,
+        confidence_level,
+    )
+    comparison: BenchmarkComparison | None = await comparison_repo.get_by_key(key)
+    if comparison is not None:
+        return comparison
+
+    rows: dict[str, list[dict]] = await row_repo.get_by_benchmark_run_ids(
+        run_ids, statuses=(Status.DONE,)
+    )
+    result: dict = await asyncio.to_thread(
+        compare_runs,
+        runs,
+        [rows[run_id] for run_id in run_ids],
+        resamples,
+        confidence_level,
+        int(key[:16], 16),
+    )
+    # Only finished runs are stable enough to materialize.
+    if all(run.status in (Status.DONE, Status.ERROR) for run in runs):
+        comparison = await comparison_repo.create(key=key, benchmark_run_ids=run_ids, result=result)
+        await session.commit()
+        return comparison
+    return BenchmarkComparison(
+        id=str(uuid.uuid4()),
+        key=key,
+        benchmark_run_ids=run_ids,
+        result=result,
+        created_at=datetime.utcnow(),
+    )
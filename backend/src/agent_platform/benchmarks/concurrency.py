@@ -0,0 +1,142 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any
+
+OVERLOAD_ERROR_TYPES: frozenset[str] = frozenset({"rate_limited", "overloaded", "timeout"})
+
+
+class AdaptiveLimiter:
+    """AIMD limit on the number of agent runs in flight.
+
+    The limit grows by one after a full limit's worth of healthy completions and is cut by
+    ``backoff`` on rate limiting, overload or timeouts, when the error rate over the last
+    ``window`` runs exceeds ``max_error_rate``, or when their p95 latency rises above
+    ``latency_tolerance`` times the lowest p95 seen so far. It never exceeds ``ceiling``.
+    Runs started before the last cut are not counted again, so one burst of 429s cuts once.
+    """
+
+    def __init__(
+        self,
+        ceiling: int,
+        initial: int | None = None,
+        floor: int = 1,
+        backoff: float = 0.5,
+        window: int = 50,
+        min_samples: int = 20,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.2,
+    ) -> None:
+        self.ceiling: int = max(1, ceiling)
+        self.floor: int = max(1, min(floor, self.ceiling))
+        self.limit: int = max(self.floor, min(initial or self.ceiling, self.ceiling))
+        self.backoff: float = backoff
+        self.min_samples: int = min(min_samples, window)
+        self.latency_tolerance: float = latency_tolerance
+        self.max_error_rate: float = max_error_rate
+        self.in_flight: int = 0
+        self.reason: str = ""
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._errors: deque[bool] = deque(maxlen=window)
+        self._baseline_p95: float = math.inf
+        self._healthy: int = 0
+        self._decreased_at: float = -math.inf
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self._errors) / len(self._errors) if self._errors else 0.0
+
+    @property
+    def p95_latency(self) -> float:
+        if not self._latencies:
+            return 0.0
+        latencies: list[float] = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+
+    async def acquire(self) -> float:
+        """Wait for a free slot and return the run's start time for ``release``."""
+        while self.in_flight >= self.limit:
+            waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float | None = None,
+        error_type: str | None = None,
+        finished: float | None = None,
+    ) -> bool:
+        """Free a slot; with ``started`` the run is observed. Returns whether the limit moved."""
+        self.in_flight -= 1
+        changed: bool = False
+        if started is not None:
+            latency: float = (finished or time.monotonic()) - started
+            changed = self._observe(started, latency, error_type)
+        self._wake()
+        return changed
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "ceiling": self.ceiling,
+            "in_flight": self.in_flight,
+            "p95_latency_seconds": self.p95_latency,
+            "error_rate": self.error_rate,
+            "reason": self.reason,
+        }
+
+    def _observe(self, started: float, latency: float, error_type: str | None) -> bool:
+        self._latencies.append(latency)
+        self._errors.append(error_type is not None)
+        if started < self._decreased_at:
+            return False
+
+        if error_type in OVERLOAD_ERROR_TYPES:
+            return self._decrease(error_type)
+        if len(self._errors) >= self.min_samples:
+            if self.error_rate > self.max_error_rate:
+                return self._decrease("error_rate")
+            p95: float = self.p95_latency
+            if p95 > self._baseline_p95 * self.latency_tolerance:
+                return self._decrease("latency")
+            self._baseline_p95 = min(self._baseline_p95, p95)
+
+        if error_type is None:
+            self._healthy += 1
+        if self._healthy >= self.limit and self.limit < self.ceiling:
+            self.limit += 1
+            self._healthy = 0
+            self.reason = "increase"
+            return True
+        return False
+
+    def _decrease(self, reason: str) -> bool:
+        previous: int = self.limit
+        self.limit = max(self.floor, int(self.limit * self.backoff))
+        self.reason = reason
+        self._healthy = 0
+        self._decreased_at = time.monotonic()
+        self._latencies.clear()
+        self._errors.clear()
+        return self.limit != previous
+
+    def _wake(self) -> None:
+        free: int = self.limit - self.in_flight
+        for waiter in list(self._waiters):
+            if free <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
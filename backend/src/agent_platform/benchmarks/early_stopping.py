@@ -0,0 +1,79 @@
+import math
+from statistics import NormalDist
+from typing import Any
+
+from agent_platform.benchmarks.aggregation import RunningStats
+
+DEFAULT_CONFIDENCE_LEVEL: float = 0.95
+DEFAULT_MIN_ROWS: int = 20
+
+
+class EarlyStopping:
+    """Sequential stopping rule on the mean row reward of a benchmark run.
+
+    After every completed row a normal confidence interval is recomputed. Rewards lie in
+    [0, 1], so the variance is floored at ``1 / (n + 1)``, about what one more score at the
+    other end of the range would add: runs of identical scores (common with exact-match
+    rewards) still get an interval of width of order ``1 / n`` instead of none. The error
+    budget is spent as ``alpha * 6 / (pi^2 * t^2)`` on the t-th look so the interval stays
+    valid however often it is checked. The run stops once the interval is narrower than
+    ``max_interval_width`` or lies entirely above or below ``target_score``.
+    """
+
+    def __init__(
+        self,
+        confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
+        max_interval_width: float = 0.0,
+        target_score: float | None = None,
+        min_rows: int = DEFAULT_MIN_ROWS,
+    ) -> None:
+        self.alpha: float = 1.0 - confidence_level
+        self.max_interval_width: float = max_interval_width
+        self.target_score: float | None = target_score
+        self.min_rows: int = max(2, min_rows)
+        self.looks: int = 0
+        self.lower: float = -math.inf
+        self.upper: float = math.inf
+        self.stop_reason: str = ""
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> "EarlyStopping | None":
+        if not config or not config.get("enabled"):
+            return None
+        return cls(
+            confidence_level=config.get("confidence_level") or DEFAULT_CONFIDENCE_LEVEL,
+            max_interval_width=config.get("max_interval_width") or 0.0,
+            target_score=config.get("target_score"),
+            min_rows=config.get("min_rows") or DEFAULT_MIN_ROWS,
+        )
+
+    @property
+    def stopped(self) -> bool:
+        return bool(self.stop_reason)
+
+    def update(self, scores: RunningStats) -> bool:
+        if self.stopped or scores.count < self.min_rows:
+            return self.stopped
+        self.looks += 1
+        alpha: float = self.alpha * 6.0 / (math.pi**2 * self.looks**2)
+        z: float = NormalDist().inv_cdf(1.0 - alpha / 2)
+        sample_variance: float = max(scores.m2 / (scores.count - 1), 1.0 / (scores.count + 1))
+        half_width: float = z * math.sqrt(sample_variance / scores.count)
+        self.lower = max(0.0, scores.mean - half_width)
+        self.upper = min(1.0, scores.mean + half_width)
+
+        if self.max_interval_width > 0 and self.upper - self.lower <= self.max_interval_width:
+            self.stop_reason = "interval_width"
+        elif self.target_score is not None and self.lower > self.target_score:
+            self.stop_reason = "above_target"
+        elif self.target_score is not None and self.upper < self.target_score:
+            self.stop_reason = "below_target"
+        return self.stopped
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stopped_early": self.stopped,
+            "stop_reason": self.stop_reason,
+            "interval_lower": self.lower if math.isfinite(self.lower) else 0.0,
+            "interval_upper": self.upper if math.isfinite(self.upper) else 0.0,
+        }
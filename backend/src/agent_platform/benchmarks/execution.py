@@ -0,0 +1,210 @@
+import logging
+import uuid
+from collections.abc import Iterable
+from typing import Any
+
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.agent import Agent, AgentRun
+from agent_platform.db.models.dataset import PromptDatasetRow
+from agent_platform.db.repository.agent import AgentRunRepository
+from agent_platform.llm.executor import AgentExecutor, Status
+from agent_platform.models.agent import AgentModel
+from agent_platform.models.agent_config import AgentConfig
+from agent_platform.rewards.evaluation import RewardEvaluator, combine_rewards
+
+logger = logging.getLogger(__name__)
+
+
+class RowState:
+    """Progress of one benchmark row across its ``runs_per_prompt`` agent runs."""
+
+    def __init__(self, row: PromptDatasetRow, runs_per_prompt: int, cache_key: str) -> None:
+        self.id: str = str(uuid.uuid4())
+        self.row: PromptDatasetRow = row
+        self.cache_key: str = cache_key
+        self.remaining: int = runs_per_prompt
+        self.agent_run_ids: list[str] = []
+        self.statuses: list[int] = []
+        self.latency_seconds: float = 0.0
+        self.rewards: list[tuple[dict, int]] = []
+        self.local_runs: int = 0
+
+    @classmethod
+    def from_checkpoint(
+        cls, row: PromptDatasetRow, runs_per_prompt: int, cache_key: str, checkpoint: dict
+    ) -> "RowState":
+        state: RowState = cls(row, runs_per_prompt, cache_key)
+        # Failed rows are retried as new rows so listeners see the retry as a fresh completion.
+        if checkpoint.get("status") != Status.ERROR:
+            state.id = checkpoint["id"]
+        metrics: dict = checkpoint.get("metrics") or {}
+        runs: int = int(metrics.get("runs", 0))
+        # Checkpointed runs are only kept when all of them succeeded; otherwise the row restarts.
+        if 0 < runs <= runs_per_prompt and metrics.get("successful_runs") == runs:
+            state.remaining = runs_per_prompt - runs
+            state.agent_run_ids = list(checkpoint["agent_run_ids"])
+            state.statuses = [Status.DONE] * runs
+            state.latency_seconds = float(metrics.get("latency_seconds", 0.0))
+            rewarded_runs: int = int(metrics.get("rewarded_runs", 0))
+            if checkpoint.get("reward") and rewarded_runs:
+                state.rewards = [(checkpoint["reward"], rewarded_runs)]
+                state.local_runs = int(metrics.get("local_runs", 0))
+        return state
+
+    def to_dict(self) -> dict[str, Any]:
+        status: int
+        if self.remaining > 0:
+            status = Status.RUNNING if self.statuses else Status.AWAITING_START
+        elif self.statuses and all(s == Status.DONE for s in self.statuses):
+            status = Status.DONE
+        else:
+            status = Status.ERROR
+        row: dict[str, Any] = {
+            "id": self.id,
+            "prompt_dataset_row_id": self.row.id,
+            "agent_run_ids": list(self.agent_run_ids),
+            "sme_comments": [],
+            "status": status,
+            "sequence": self.row.sequence,
+            "cache_key": self.cache_key,
+            "reused": False,
+            "metrics": {
+                "runs": len(self.statuses),
+                "successful_runs": sum(1 for s in self.statuses if s == Status.DONE),
+                "latency_seconds": self.latency_seconds,
+                "rewarded_runs": sum(runs for _, runs in self.rewards),
+                "local_runs": self.local_runs,
+            },
+        }
+        reward: dict | None = combine_rewards(self.rewards)
+        if reward is not None:
+            row["reward"] = reward
+        return row
+
+
+def run_stats(rows: Iterable[dict]) -> dict[str, int]:
+    """Additive row counters of a benchmark run; ``summarize_stats`` turns them into stats."""
+    counts: dict[str, int] = {
+        "reused_rows": 0,
+        "executed_rows": 0,
+        "locally_scored_rows": 0,
+        "local_runs": 0,
+        "judged_runs": 0,
+        "judge_latency_ms": 0,
+    }
+    for row in rows:
+        if row.get("reused"):
+            counts["reused_rows"] += 1
+            continue
+        if row["status"] not in (Status.DONE, Status.ERROR):
+            continue
+        counts["executed_rows"] += 1
+        metrics: dict = row.get("metrics") or {}
+        rewarded_runs: int = int(metrics.get("rewarded_runs", 0))
+        local_runs: int = int(metrics.get("local_runs", 0))
+        if rewarded_runs and local_runs == rewarded_runs:
+            counts["locally_scored_rows"] += 1
+        counts["local_runs"] += local_runs
+        counts["judged_runs"] += rewarded_runs - local_runs
+        if row.get("reward") and rewarded_runs > local_runs:
+            latency: dict = row["reward"]["latency"]
+            counts["judge_latency_ms"] += round(
+                (latency["seconds"] + latency["nanos"] / 1e9) * 1000
+            )
+    return counts
+
+
+def summarize_stats(counts: dict[str, int]) -> dict[str, Any]:
+    """``BenchmarkRunStats`` fields from ``run_stats`` counters.
+
+    The latency saved by local scoring is estimated from the mean reward latency of the runs
+    that did go to the reward agent.
+    """
+    judged_runs: int = counts.get("judged_runs", 0)
+    executed_rows: int = counts.get("executed_rows", 0)
+    return {
+        "reused_rows": counts.get("reused_rows", 0),
+        "executed_rows": executed_rows,
+        "locally_scored_rows": counts.get("locally_scored_rows", 0),
+        "local_scoring_fraction": counts.get("locally_scored_rows", 0) / executed_rows
+        if executed_rows
+        else 0.0,
+        "reward_latency_saved_seconds": counts.get("local_runs", 0)
+        * counts.get("judge_latency_ms", 0)
+        / judged_runs
+        / 1000
+        if judged_runs
+        else 0.0,
+    }
+
+
+def load_agent_model(agent_db: Agent, agent_config: dict | None = None) -> AgentModel:
+    return AgentModel(
+        id=agent_db.id,
+        name=agent_db.name,
+        task=agent_db.task,
+        tool_ids=agent_db.tool_ids,
+        system_prompt=agent_db.system_prompt,
+        policy_agent_ids=agent_db.policy_agent_ids,
+        config=AgentConfig.from_dict({**agent_db.config, **(agent_config or {})}),
+    )
+
+
+async def execute_agent_run(
+    executor: AgentExecutor,
+    agent: AgentModel,
+    state: RowState,
+    evaluator: RewardEvaluator | None = None,
+) -> str | None:
+    """Run the agent once on the row's prompt, persist the run and record it on ``state``.
+
+    Successful runs are scored by ``evaluator`` when given. Returns the run's error type,
+    or ``None`` if it succeeded.
+    """
+    error_type: str | None = None
+    try:
+        agent_run: AgentRun = await executor.run_agent(agent, state.row.prompt)
+        async with AsyncSessionLocal() as session:
+            await AgentRunRepository(session).create(**agent_run_to_dict(agent_run))
+            await session.commit()
+        state.agent_run_ids.append(agent_run.id)
+        state.statuses.append(agent_run.status)
+        if agent_run.finished_at is not None:
+            state.latency_seconds += (agent_run.finished_at - agent_run.started_at).total_seconds()
+        if agent_run.status == Status.ERROR:
+            error_type = (agent_run.metrics or {}).get("error_type") or "error"
+        elif evaluator is not None:
+            await _evaluate(evaluator, agent_run, state)
+    except Exception as e:
+        logger.warning("Benchmark row %s run failed: %s", state.row.id, e)
+        state.statuses.append(Status.ERROR)
+        error_type = "error"
+    state.remaining -= 1
+    return error_type
+
+
+async def _evaluate(evaluator: RewardEvaluator, agent_run: AgentRun, state: RowState) -> None:
+    try:
+        evaluated: tuple[dict, bool] | None = await evaluator.evaluate(agent_run, state.row)
+    except Exception as e:
+        logger.warning("Benchmark row %s reward evaluation failed: %s", state.row.id, e)
+        return
+    if evaluated is not None:
+        reward, local = evaluated
+        state.rewards.append((reward, 1))
+        state.local_runs += local
+
+
+def agent_run_to_dict(agent_run: AgentRun) -> dict[str, Any]:
+    return {
+        "id": agent_run.id,
+        "agent_id": agent_run.agent_id,
+        "started_at": agent_run.started_at,
+        "finished_at": agent_run.finished_at,
+        "blocks": agent_run.blocks,
+        "force_final_tool_call": agent_run.force_final_tool_call,
+        "status": agent_run.status,
+        "dataset_ids": agent_run.dataset_ids,
+        "metrics": agent_run.metrics,
+        "error_message": agent_run.error_message,
+    }
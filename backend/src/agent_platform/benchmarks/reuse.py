@@ -0,0 +1,56 @@
+import hashlib
+import json
+from typing import Any
+
+from agent_platform.db.models.agent import Agent
+from agent_platform.db.models.dataset import PromptDatasetRow
+from agent_platform.db.models.tool import Tool
+from agent_platform.models.agent_config import AgentConfig
+
+
+def content_hash(value: Any) -> str:
+    encoded: bytes = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def agent_fingerprint(agent: Agent, tools: list[Tool], agent_config: dict | None = None) -> str:
+    """Hash of everything that shapes an agent's output, independent of its id and name."""
+    return content_hash(
+        {
+            "task": agent.task,
+            "system_prompt": agent.system_prompt,
+            "config": AgentConfig.from_dict({**agent.config, **(agent_config or {})}).to_dict(),
+            "policy_agent_ids": sorted(agent.policy_agent_ids),
+            "tools": sorted(
+                (
+                    {
+                        "name": tool.name,
+                        "input_schema": tool.input_schema,
+                        "output_schema": tool.output_schema,
+                        "context": tool.context,
+                    }
+                    for tool in tools
+                ),
+                key=lambda tool: tool["name"],
+            ),
+        }
+    )
+
+
+def row_cache_key(
+    agent_version: str,
+    runs_per_prompt: int,
+    row: PromptDatasetRow,
+    reward_version: str,
+    local_scorers: list[str],
+) -> str:
+    return content_hash(
+        {
+            "agent": agent_version,
+            "runs_per_prompt": runs_per_prompt,
+            "prompt": row.prompt,
+            "ground_truths": row.ground_truths,
+            "reward_agent": reward_version,
+            "local_scorers": local_scorers,
+        }
+    )
@@ -0,0 +1,686 @@
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.benchmarks.aggregation import RewardAggregator, aggregate_rows
+from agent_platform.benchmarks.comparison import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_CONFIDENCE_LEVEL,
+    compare_benchmark_runs,
+)
+from agent_platform.benchmarks.concurrency import AdaptiveLimiter
+from agent_platform.benchmarks.early_stopping import EarlyStopping
+from agent_platform.benchmarks.execution import (
+    RowState,
+    execute_agent_run,
+    load_agent_model,
+    run_stats,
+    summarize_stats,
+)
+from agent_platform.benchmarks.reuse import agent_fingerprint, row_cache_key
+from agent_platform.benchmarks.sweep import SweepContext
+from agent_platform.config import settings
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.agent import Agent
+from agent_platform.db.models.benchmark import (
+    BenchmarkComparison,
+    BenchmarkRun,
+    BenchmarkSweep,
+    BenchmarkTask,
+)
+from agent_platform.db.models.dataset import PromptDatasetRow
+from agent_platform.db.models.policy import PolicyAgent
+from agent_platform.db.models.reward import RewardAgent
+from agent_platform.db.models.tool import Tool
+from agent_platform.db.repository.agent import AgentRepository
+from agent_platform.db.repository.benchmark import (
+    BenchmarkRowCacheRepository,
+    BenchmarkRunRepository,
+    BenchmarkRunRowRepository,
+    BenchmarkSweepRepository,
+    BenchmarkTaskRepository,
+)
+from agent_platform.db.repository.dataset import PromptDatasetRowRepository
+from agent_platform.db.repository.policy import PolicyAgentRepository
+from agent_platform.db.repository.reward import RewardAgentRepository
+from agent_platform.db.repository.tool import ToolRepository
+from agent_platform.llm.executor import AgentExecutor, Status
+from agent_platform.models.agent import AgentModel
+from agent_platform.rewards.cache import RewardCache, definition_version
+from agent_platform.rewards.evaluation import RewardEvaluator
+from agent_platform.rewards.scoring import configured_scorers
+
+logger = logging.getLogger(__name__)
+
+_POLL_OVERLAP: timedelta = timedelta(seconds=5)
+
+
+class BenchmarkRunner:
+    """Executes benchmark runs in the background and fans progress out to subscribers.
+
+    Every prompt dataset row is run ``runs_per_prompt`` times with at most
+    ``max_parallel_runs`` agent runs in flight. Rows are checkpointed as
+    ``BenchmarkRunRow`` records after every agent run and published to ``subscribe`` listeners once complete,
+    together with a running ``final_reward`` aggregate. Running an interrupted benchmark
+    again resumes it: finished rows are kept and only failed or in-progress rows execute.
+
+    Every row carries a content-addressed cache key; completed rows are recorded under it
+    and, with ``reuse_cached_rows``, later runs take matching rows instead of executing.
+
+    With ``early_stopping`` enabled rows run in a random order and execution stops as soon
+    as the confidence interval on the mean reward is decisive; unexecuted rows are kept as
+    skipped, so resuming does not run them, and are reported in the run's stats.
+
+    Runs of a sweep (``start_sweep``) are the cells of a grid of agent configs. They
+    execute together, sharing one concurrency limit, LLM call budget and LLM and tool
+    caches, and the sweep ends with one comparison of all of them.
+
+    With ``settings.benchmark_task_queue`` the rows are not executed in-process but queued
+    as ``BenchmarkTask`` records for ``agent_platform.worker`` processes; the runner then
+    only folds completed tasks into the benchmark run.
+    """
+
+    def __init__(self, executor: AgentExecutor) -> None:
+        self.executor: AgentExecutor = executor
+        self.reward_cache: RewardCache = RewardCache()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._rows: dict[str, dict[str, dict]] = {}
+        self._aggregators: dict[str, RewardAggregator] = {}
+        self._counts: dict[str, dict[str, int]] = {}
+        self._stoppers: dict[str, EarlyStopping | None] = {}
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._unrecorded: dict[str, set[str]] = {}
+        self._executors: dict[str, AgentExecutor] = {}
+        self._sweeps: dict[str, SweepContext] = {}
+        self._sweep_tasks: dict[str, asyncio.Task] = {}
+
+    def start(self, benchmark_run_id: str) -> None:
+        if benchmark_run_id in self._tasks:
+            return
+        task: asyncio.Task = asyncio.create_task(self.run(benchmark_run_id))
+        self._tasks[benchmark_run_id] = task
+
+    def is_running(self, benchmark_run_id: str) -> bool:
+        return benchmark_run_id in self._tasks
+
+    async def run(self, benchmark_run_id: str) -> None:
+        try:
+            await self._execute(benchmark_run_id)
+        except Exception as e:
+            logger.exception("Benchmark run %s failed", benchmark_run_id)
+            async with AsyncSessionLocal() as session:
+                repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+                await repo.update(
+                    benchmark_run_id, status=Status.ERROR, finished_at=datetime.utcnow()
+                )
+                await session.commit()
+            self._publish(
+                benchmark_run_id,
+                {"error": {"code": "BENCHMARK_ERROR", "message": str(e), "row_id": ""}},
+            )
+        finally:
+            self._tasks.pop(benchmark_run_id, None)
+            self._rows.pop(benchmark_run_id, None)
+            self._aggregators.pop(benchmark_run_id, None)
+            self._counts.pop(benchmark_run_id, None)
+            self._stoppers.pop(benchmark_run_id, None)
+            self._limiters.pop(benchmark_run_id, None)
+            self._locks.pop(benchmark_run_id, None)
+            self._unrecorded.pop(benchmark_run_id, None)
+            self._executors.pop(benchmark_run_id, None)
+
+    def start_sweep(self, sweep_id: str) -> None:
+        if sweep_id in self._sweep_tasks:
+            return
+        self._sweep_tasks[sweep_id] = asyncio.create_task(self.run_sweep(sweep_id))
+
+    async def run_sweep(self, sweep_id: str) -> None:
+        try:
+            await self._execute_sweep(sweep_id)
+        except Exception:
+            logger.exception("Benchmark sweep %s failed", sweep_id)
+            async with AsyncSessionLocal() as session:
+                await BenchmarkSweepRepository(session).update(
+                    sweep_id, status=Status.ERROR, finished_at=datetime.utcnow()
+                )
+                await session.commit()
+        finally:
+            self._sweep_tasks.pop(sweep_id, None)
+            self._sweeps.pop(sweep_id, None)
+
+    async def _execute_sweep(self, sweep_id: str) -> None:
+        async with AsyncSessionLocal() as session:
+            repo: BenchmarkSweepRepository = BenchmarkSweepRepository(session)
+            sweep: BenchmarkSweep | None = await repo.get_by_id(sweep_id)
+            if sweep is None:
+                raise ValueError(f"Benchmark sweep {sweep_id} not found")
+            await repo.update(sweep_id, status=Status.RUNNING, finished_at=None)
+            await session.commit()
+
+        context: SweepContext = SweepContext(
+            self.executor,
+            max(1, int(sweep.config.get("max_parallel_runs") or 1)),
+            sweep.max_llm_calls_per_minute,
+        )
+        self._sweeps[sweep_id] = context
+        cells: list[asyncio.Task] = []
+        for benchmark_run_id in sweep.benchmark_run_ids:
+            self.start(benchmark_run_id)
+            cells.append(self._tasks[benchmark_run_id])
+        # Cells interleave on the shared limiter; each records its own failures.
+        await asyncio.gather(*cells)
+
+        async with AsyncSessionLocal() as session:
+            runs: list[BenchmarkRun] = await BenchmarkRunRepository(session).get_by_ids(
+                sweep.benchmark_run_ids
+            )
+            finished: list[str] = [
+                run_id
+                for run_id in sweep.benchmark_run_ids
+                if any(run.id == run_id and run.status == Status.DONE for run in runs)
+            ]
+            comparison_id: str | None = None
+            if len(finished) >= 2:
+                try:
+                    comparison: BenchmarkComparison = await compare_benchmark_runs(
+                        session, finished, DEFAULT_BOOTSTRAP_RESAMPLES, DEFAULT_CONFIDENCE_LEVEL
+                    )
+                    comparison_id = comparison.id
+                except ValueError as e:
+                    logger.warning("Benchmark sweep %s cannot be compared: %s", sweep_id, e)
+            await BenchmarkSweepRepository(session).update(
+                sweep_id,
+                status=Status.DONE if finished else Status.ERROR,
+                finished_at=datetime.utcnow(),
+                comparison_id=comparison_id,
+                stats=context.to_dict(),
+            )
+            await session.commit()
+        logger.info(
+            "Benchmark sweep %s finished %d of %d cells", sweep_id, len(finished), len(runs)
+        )
+
+    async def subscribe(self, benchmark_run_id: str) -> AsyncIterator[dict]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(benchmark_run_id, set()).add(queue)
+        try:
+            async with AsyncSessionLocal() as session:
+                repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+                run: BenchmarkRun | None = await repo.get_by_id(benchmark_run_id)
+                if run is None:
+                    raise ValueError(f"Benchmark run {benchmark_run_id} not found")
+                completed: list[dict] = await BenchmarkRunRowRepository(
+                    session
+                ).get_by_benchmark_run_id(benchmark_run_id, statuses=(Status.DONE, Status.ERROR))
+
+            seen: set[str] = set()
+            for row in completed:
+                seen.add(row["id"])
+                yield {"row_completed": row}
+
+            if not self.is_running(benchmark_run_id) and run.status in (
+                Status.DONE,
+                Status.ERROR,
+            ):
+                yield {"benchmark_completed": benchmark_run_id}
+                return
+
+            limiter: AdaptiveLimiter | None = self._limiters.get(benchmark_run_id)
+            if limiter is not None:
+                yield {"concurrency": limiter.to_dict()}
+
+            if not self.is_running(benchmark_run_id):
+                async for polled in self._poll(benchmark_run_id, seen):
+                    yield polled
+                return
+
+            while True:
+                event: dict = await queue.get()
+                if "row_completed" in event:
+                    if event["row_completed"]["id"] in seen:
+                        continue
+                    seen.add(event["row_completed"]["id"])
+                yield event
+                # Errors of single rows leave the run going.
+                if "benchmark_completed" in event or (
+                    "error" in event and not event["error"]["row_id"]
+                ):
+                    return
+        finally:
+            subscribers: set[asyncio.Queue] = self._subscribers.get(benchmark_run_id, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                self._subscribers.pop(benchmark_run_id, None)
+
+    def _publish(self, benchmark_run_id: str, event: dict) -> None:
+        for queue in self._subscribers.get(benchmark_run_id, set()):
+            queue.put_nowait(event)
+
+    async def _poll(self, benchmark_run_id: str, seen: set[str]) -> AsyncIterator[dict]:
+        # The run is driven by another process; follow its checkpoints in the database.
+        # Rows are read from a trailing updated_at watermark so every poll stays small;
+        # the overlap absorbs commits that land out of timestamp order.
+        since: datetime | None = None
+        while True:
+            await asyncio.sleep(settings.benchmark_poll_interval)
+            async with AsyncSessionLocal() as session:
+                repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+                run: BenchmarkRun | None = await repo.get_by_id(benchmark_run_id)
+                if run is None:
+                    return
+                updated: list[tuple[datetime, dict]] = await BenchmarkRunRowRepository(
+                    session
+                ).get_updated_since(benchmark_run_id, since, (Status.DONE, Status.ERROR))
+            for updated_at, row in updated:
+                if since is None or updated_at - _POLL_OVERLAP > since:
+                    since = updated_at - _POLL_OVERLAP
+                if row["id"] not in seen:
+                    seen.add(row["id"])
+                    yield {"row_completed": row}
+            if run.status in (Status.DONE, Status.ERROR):
+                yield {"benchmark_completed": benchmark_run_id}
+                return
+
+    async def _execute(self, benchmark_run_id: str) -> None:
+        async with AsyncSessionLocal() as session:
+            run_repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+            run: BenchmarkRun | None = await run_repo.get_by_id(benchmark_run_id)
+            if run is None:
+                raise ValueError(f"Benchmark run {benchmark_run_id} not found")
+            agent_db: Agent | None = await AgentRepository(session).get_by_id(run.agent_id)
+            if agent_db is None:
+                raise ValueError(f"Agent {run.agent_id} not found")
+            dataset_rows: list[PromptDatasetRow] = await PromptDatasetRowRepository(
+                session
+            ).get_by_prompt_dataset_id(run.prompt_dataset_id)
+            tools: list[Tool] = await ToolRepository(session).get_by_ids(agent_db.tool_ids)
+            reward_agents: dict[str, RewardAgent] = {
+                reward_agent.id: reward_agent
+                for reward_agent in await RewardAgentRepository(session).get_by_ids(
+                    list({row.reward_agent_id for row in dataset_rows})
+                )
+            }
+            policies: dict[str, PolicyAgent] = {
+                policy.id: policy
+                for policy in await PolicyAgentRepository(session).get_by_ids(
+                    agent_db.policy_agent_ids
+                )
+            }
+            checkpoints: dict[str, dict] = {
+                row["prompt_dataset_row_id"]: row
+                for row in await BenchmarkRunRowRepository(session).get_by_benchmark_run_id(
+                    benchmark_run_id
+                )
+            }
+            await run_repo.update(benchmark_run_id, status=Status.RUNNING, finished_at=None)
+            await session.commit()
+
+        config: dict = run.config or {}
+        runs_per_prompt: int = max(1, int(config.get("runs_per_prompt") or 1))
+        max_parallel_runs: int = max(1, int(config.get("max_parallel_runs") or 1))
+        agent: AgentModel = load_agent_model(agent_db, run.agent_config)
+        local_scorers: list[str] = configured_scorers(config.get("local_scoring"))
+
+        agent_version: str = agent_fingerprint(agent_db, tools, run.agent_config)
+        # Reward versions cover the content of the agent's policies, so editing a policy
+        # stops cached rows judged by the old one from being reused.
+        agent_policies: list[PolicyAgent] = [
+            policies[id] for id in agent_db.policy_agent_ids if id in policies
+        ]
+        reward_versions: dict[str, str] = {
+            reward_agent_id: definition_version(reward_agents.get(reward_agent_id), agent_policies)
+            for reward_agent_id in {row.reward_agent_id for row in dataset_rows}
+        }
+        cache_keys: dict[str, str] = {
+            row.id: row_cache_key(
+                agent_version,
+                runs_per_prompt,
+                row,
+                reward_versions[row.reward_agent_id],
+                local_scorers,
+            )
+            for row in dataset_rows
+        }
+
+        rows: dict[str, dict] = {}
+        aggregator: RewardAggregator = RewardAggregator()
+        pending: list[RowState] = []
+        for dataset_row in dataset_rows:
+            checkpoint: dict | None = checkpoints.get(dataset_row.id)
+            if checkpoint is not None and checkpoint["status"] in (Status.DONE, Status.SKIPPED):
+                rows[dataset_row.id] = checkpoint
+                if checkpoint["status"] == Status.DONE:
+                    aggregator.add_row(checkpoint)
+                continue
+            cache_key: str = cache_keys[dataset_row.id]
+            state: RowState = (
+                RowState.from_checkpoint(dataset_row, runs_per_prompt, cache_key, checkpoint)
+                if checkpoint is not None
+                else RowState(dataset_row, runs_per_prompt, cache_key)
+            )
+            rows[dataset_row.id] = state.to_dict()
+            pending.append(state)
+
+        reused: list[dict] = []
+        if config.get("reuse_cached_rows") and pending:
+            async with AsyncSessionLocal() as session:
+                cached: dict[str, dict] = await BenchmarkRowCacheRepository(session).get_by_keys(
+                    [state.cache_key for state in pending]
+                )
+            still_pending: list[RowState] = []
+            for state in pending:
+                if state.cache_key not in cached:
+                    still_pending.append(state)
+                    continue
+                row: dict = {
+                    **cached[state.cache_key],
+                    "id": state.id,
+                    "prompt_dataset_row_id": state.row.id,
+                    "sme_comments": [],
+                    "cache_key": state.cache_key,
+                    "reused": True,
+                }
+                rows[state.row.id] = row
+                aggregator.add_row(row)
+                reused.append(row)
+            pending = still_pending
+            if reused:
+                async with AsyncSessionLocal() as session:
+                    await BenchmarkRunRowRepository(session).upsert(benchmark_run_id, reused)
+                    await BenchmarkRunRepository(session).update(
+                        benchmark_run_id,
+                        final_reward=aggregator.to_dict(),
+                        stats=summarize_stats(run_stats(rows.values())),
+                    )
+                    await session.commit()
+                for row in reused:
+                    self._publish(benchmark_run_id, {"row_completed": row})
+            logger.info("Benchmark run %s reused %d cached rows", benchmark_run_id, len(reused))
+
+        # Placeholders for pending rows, replacing failed checkpoints and dropping rows that
+        # are no longer in the dataset.
+        async with AsyncSessionLocal() as session:
+            row_repo: BenchmarkRunRowRepository = BenchmarkRunRowRepository(session)
+            await row_repo.upsert(benchmark_run_id, [rows[state.row.id] for state in pending])
+            await row_repo.delete_by_prompt_dataset_row_ids(
+                benchmark_run_id, [row_id for row_id in checkpoints if row_id not in rows]
+            )
+            await session.commit()
+
+        if checkpoints:
+            logger.info(
+                "Resuming benchmark run %s: %d rows done, %d to run",
+                benchmark_run_id,
+                len(rows) - len(pending),
+                len(pending),
+            )
+
+        stopper: EarlyStopping | None = EarlyStopping.from_config(config.get("early_stopping"))
+        if stopper is not None:
+            random.Random(benchmark_run_id).shuffle(pending)
+            stopper.update(aggregator.scores)
+
+        self._rows[benchmark_run_id] = rows
+        self._aggregators[benchmark_run_id] = aggregator
+        self._counts[benchmark_run_id] = run_stats(rows.values())
+        self._stoppers[benchmark_run_id] = stopper
+        self._locks[benchmark_run_id] = asyncio.Lock()
+        self._unrecorded[benchmark_run_id] = set()
+        if settings.benchmark_task_queue:
+            await self._run_on_queue(benchmark_run_id, pending)
+        else:
+            evaluator: RewardEvaluator = RewardEvaluator(
+                self.executor,
+                agent_db.policy_agent_ids,
+                cache=self.reward_cache,
+                local_scorers=local_scorers,
+            )
+            sweep: SweepContext | None = self._sweeps.get(run.sweep_id or "")
+            self._executors[benchmark_run_id] = sweep.executor if sweep else self.executor
+            limiter: AdaptiveLimiter = (
+                sweep.limiter
+                if sweep
+                else AdaptiveLimiter(
+                    max_parallel_runs, initial=settings.benchmark_initial_parallel_runs
+                )
+            )
+            await self._run_locally(benchmark_run_id, agent, evaluator, pending, limiter)
+
+        unfinished: list[dict] = [
+            row for row in rows.values() if row["status"] in (Status.AWAITING_START, Status.RUNNING)
+        ]
+        failed: list[dict] = [
+            rows[row_id]
+            for row_id in self._unrecorded[benchmark_run_id]
+            if rows[row_id]["status"] == Status.ERROR
+        ]
+        # Rows early stopping left unfinished are kept as skipped, so resuming the run does
+        # not execute them. Rows left unfinished otherwise fail the run, so resuming retries
+        # them.
+        stopped: list[dict] = []
+        if stopper is not None and stopper.stopped:
+            stopped = unfinished
+            unfinished = []
+            for row in stopped:
+                row["status"] = Status.SKIPPED
+            logger.info(
+                "Benchmark run %s stopped early (%s), skipping %d rows",
+                benchmark_run_id,
+                stopper.stop_reason,
+                len(stopped),
+            )
+        unfinished.extend(failed)
+        if unfinished:
+            logger.warning(
+                "Benchmark run %s left %d rows unfinished", benchmark_run_id, len(unfinished)
+            )
+        skipped: list[dict] = [row for row in rows.values() if row["status"] == Status.SKIPPED]
+        stats: dict = self._stats(benchmark_run_id)
+        if skipped:
+            stats["skipped_rows"] = len(skipped)
+            stats["saved_runs"] = sum(runs_per_prompt - row["metrics"]["runs"] for row in skipped)
+
+        async with AsyncSessionLocal() as session:
+            await BenchmarkRunRowRepository(session).upsert(benchmark_run_id, stopped + failed)
+            run_repo = BenchmarkRunRepository(session)
+            await run_repo.update(
+                benchmark_run_id,
+                status=Status.ERROR if unfinished else Status.DONE,
+                finished_at=datetime.utcnow(),
+                final_reward=aggregate_rows(
+                    row for row in rows.values() if row["status"] in (Status.DONE, Status.ERROR)
+                ),
+                stats=stats,
+            )
+            await session.commit()
+        self._publish(benchmark_run_id, {"benchmark_completed": benchmark_run_id})
+
+    async def _run_locally(
+        self,
+        benchmark_run_id: str,
+        agent: AgentModel,
+        evaluator: RewardEvaluator,
+        pending: list[RowState],
+        limiter: AdaptiveLimiter,
+    ) -> None:
+        self._limiters[benchmark_run_id] = limiter
+        self._publish(benchmark_run_id, {"concurrency": limiter.to_dict()})
+        in_flight: set[asyncio.Task] = set()
+
+        stopper: EarlyStopping | None = self._stoppers[benchmark_run_id]
+        try:
+            for state in pending:
+                if stopper is not None and stopper.stopped:
+                    break
+                for _ in range(state.remaining):
+                    started: float = await limiter.acquire()
+                    task: asyncio.Task = asyncio.create_task(
+                        self._run_once(benchmark_run_id, agent, evaluator, state, limiter, started)
+                    )
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
+                    task.add_done_callback(lambda task: self._check_task(benchmark_run_id, task))
+
+            if in_flight:
+                await asyncio.wait(set(in_flight))
+        except asyncio.CancelledError:
+            for task in list(in_flight):
+                task.cancel()
+            raise
+
+    async def _run_once(
+        self,
+        benchmark_run_id: str,
+        agent: AgentModel,
+        evaluator: RewardEvaluator,
+        state: RowState,
+        limiter: AdaptiveLimiter,
+        started: float,
+    ) -> None:
+        finished: float | None = None
+        error_type: str | None = None
+        completed: list[dict] = []
+        try:
+            error_type = await execute_agent_run(
+                self._executors[benchmark_run_id], agent, state, evaluator
+            )
+            finished = time.monotonic()
+            async with self._locks[benchmark_run_id]:
+                async with AsyncSessionLocal() as session:
+                    completed = await self._record_rows(
+                        session, benchmark_run_id, [state.to_dict()]
+                    )
+                    await session.commit()
+        except Exception as e:
+            logger.exception(
+                "Benchmark run %s could not record row %s", benchmark_run_id, state.row.id
+            )
+            completed = [self._fail_row(benchmark_run_id, state)]
+            self._publish(
+                benchmark_run_id,
+                {"error": {"code": "ROW_ERROR", "message": str(e), "row_id": state.id}},
+            )
+        finally:
+            # The slot is held until the row is recorded so execution cannot outrun
+            # recording (and early stopping); latency covers the agent run only.
+            changed: bool = limiter.release(
+                started if finished is not None else None, error_type, finished
+            )
+        if changed:
+            logger.info(
+                "Benchmark run %s concurrency limit %d (%s)",
+                benchmark_run_id,
+                limiter.limit,
+                limiter.reason,
+            )
+            self._publish(benchmark_run_id, {"concurrency": limiter.to_dict()})
+        for row in completed:
+            self._publish(benchmark_run_id, {"row_completed": row})
+
+    def _check_task(self, benchmark_run_id: str, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Benchmark run %s row task failed", benchmark_run_id, exc_info=task.exception()
+            )
+
+    def _fail_row(self, benchmark_run_id: str, state: RowState) -> dict:
+        """Mark a row whose run or checkpoint failed as an error; the run's final update
+        writes it and fails the run, so resuming retries the row."""
+        row: dict = {**state.to_dict(), "status": Status.ERROR}
+        rows: dict[str, dict] = self._rows[benchmark_run_id]
+        counts: dict[str, int] = self._counts[benchmark_run_id]
+        previous: dict | None = rows.get(state.row.id)
+        if previous is not None:
+            for key, value in run_stats([previous]).items():
+                counts[key] -= value
+        for key, value in run_stats([row]).items():
+            counts[key] += value
+        rows[state.row.id] = row
+        self._unrecorded[benchmark_run_id].add(state.row.id)
+        return row
+
+    async def _run_on_queue(self, benchmark_run_id: str, pending: list[RowState]) -> None:
+        async with AsyncSessionLocal() as session:
+            await BenchmarkTaskRepository(session).enqueue(
+                benchmark_run_id,
+                [
+                    (state.row.id, position, state.to_dict())
+                    for position, state in enumerate(pending)
+                ],
+            )
+            await session.commit()
+
+        stopper: EarlyStopping | None = self._stoppers[benchmark_run_id]
+        cancelled: bool = False
+        while True:
+            async with self._locks[benchmark_run_id]:
+                async with AsyncSessionLocal() as session:
+                    task_repo: BenchmarkTaskRepository = BenchmarkTaskRepository(session)
+                    tasks: list[BenchmarkTask] = await task_repo.claim_finished(benchmark_run_id)
+                    completed: list[dict] = await self._record_rows(
+                        session,
+                        benchmark_run_id,
+                        [{**task.checkpoint, "status": task.status} for task in tasks],
+                    )
+                    await task_repo.acknowledge([task.id for task in tasks])
+                    if stopper is not None and stopper.stopped and not cancelled:
+                        await task_repo.cancel_pending(benchmark_run_id)
+                        cancelled = True
+                    open_tasks: int = await task_repo.count_open(benchmark_run_id)
+                    await session.commit()
+            for row in completed:
+                self._publish(benchmark_run_id, {"row_completed": row})
+            if not open_tasks:
+                return
+            if not tasks:
+                await asyncio.sleep(settings.benchmark_poll_interval)
+
+    async def _record_rows(
+        self, session: AsyncSession, benchmark_run_id: str, updates: list[dict]
+    ) -> list[dict]:
+        """Checkpoint row updates on the benchmark run; callers hold the run's lock."""
+        if not updates:
+            return []
+        rows: dict[str, dict] = self._rows[benchmark_run_id]
+        aggregator: RewardAggregator = self._aggregators[benchmark_run_id]
+        counts: dict[str, int] = self._counts[benchmark_run_id]
+        completed: list[dict] = []
+        for row in updates:
+            previous: dict | None = rows.get(row["prompt_dataset_row_id"])
+            if previous is not None:
+                for key, value in run_stats([previous]).items():
+                    counts[key] -= value
+            for key, value in run_stats([row]).items():
+                counts[key] += value
+            rows[row["prompt_dataset_row_id"]] = row
+            if row["status"] in (Status.DONE, Status.ERROR):
+                aggregator.add_row(row)
+                completed.append(row)
+        stopper: EarlyStopping | None = self._stoppers[benchmark_run_id]
+        if stopper is not None and completed:
+            stopper.update(aggregator.scores)
+
+        await BenchmarkRunRowRepository(session).upsert(benchmark_run_id, updates)
+        await BenchmarkRowCacheRepository(session).put(
+            benchmark_run_id, [row for row in completed if row["status"] == Status.DONE]
+        )
+        await BenchmarkRunRepository(session).update(
+            benchmark_run_id,
+            final_reward=aggregator.to_dict(),
+            stats=self._stats(benchmark_run_id),
+        )
+        return completed
+
+    def _stats(self, benchmark_run_id: str) -> dict:
+        stats: dict = summarize_stats(self._counts[benchmark_run_id])
+        stopper: EarlyStopping | None = self._stoppers[benchmark_run_id]
+        if stopper is not None:
+            stats.update(stopper.to_dict())
+        return stats
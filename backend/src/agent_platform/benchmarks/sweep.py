@@ -0,0 +1,271 @@
+import asyncio
+import itertools
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+from anthropic.types import MessageParam, ToolParam
+
+from agent_platform.benchmarks.concurrency import AdaptiveLimiter
+from agent_platform.benchmarks.reuse import content_hash
+from agent_platform.config import settings
+from agent_platform.llm.client import AnthropicClient
+from agent_platform.llm.executor import AgentExecutor
+from agent_platform.models.agent_config import AgentConfig
+from agent_platform.tools.base import Tool
+from agent_platform.tools.registry import ToolRegistry
+
+_GRID_AXES: dict[str, str] = {
+    "models": "model",
+    "temperatures": "temperature",
+    "max_tokens": "max_tokens",
+    "max_tool_calls": "max_tool_calls",
+}
+
+
+def sweep_configs(base: AgentConfig, grid: dict[str, list]) -> list[AgentConfig]:
+    """Every combination of the grid's values, with empty axes fixed at ``base``."""
+    axes: list[tuple[str, list]] = [
+        (field, grid.get(axis) or [getattr(base, field)]) for axis, field in _GRID_AXES.items()
+    ]
+    configs: list[AgentConfig] = []
+    for values in itertools.product(*(values for _, values in axes)):
+        configs.append(
+            AgentConfig.from_dict(
+                {**base.to_dict(), **{field: value for (field, _), value in zip(axes, values)}}
+            )
+        )
+    return list({content_hash(config.to_dict()): config for config in configs}.values())
+
+
+class CallCache:
+    """LRU of call results shared by the cells of a sweep.
+
+    Concurrent calls with the same key wait for the first one instead of repeating it.
+    Results that ``keep`` rejects are neither stored nor shared, like failures.
+    """
+
+    def __init__(self, max_entries: int = settings.benchmark_sweep_cache_entries) -> None:
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.calls: int = 0
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._pending: dict[str, asyncio.Future] = {}
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Any]],
+        keep: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        self.calls += 1
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        pending: asyncio.Future | None = self._pending.get(key)
+        if pending is not None:
+            try:
+                result: Any = await asyncio.shield(pending)
+                if keep is None or keep(result):
+                    self.hits += 1
+                    return result
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            except Exception:
+                pass  # Failures are not shared; make our own attempt.
+
+        task: asyncio.Future = asyncio.ensure_future(call())
+        self._pending[key] = task
+        try:
+            result = await task
+        finally:
+            if self._pending.get(key) is task:
+                del self._pending[key]
+        if keep is not None and not keep(result):
+            return result
+        self._entries[key] = result
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return result
+
+
+class CallBudget:
+    """Sliding-window cap on calls per minute; ``0`` disables it."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.per_minute: int = per_minute
+        self._calls: deque[float] = deque()
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.per_minute <= 0:
+            return
+        async with self._lock:
+            while True:
+                now: float = time.monotonic()
+                while self._calls and now - self._calls[0] >= 60.0:
+                    self._calls.popleft()
+                if len(self._calls) < self.per_minute:
+                    self._calls.append(now)
+                    return
+                await asyncio.sleep(60.0 - (now - self._calls[0]))
+
+
+class SweepLLMClient(AnthropicClient):
+    """LLM client of a sweep: every call draws from the sweep's budget, and deterministic
+    ones (temperature 0) are answered from the shared cache when another cell made them."""
+
+    def __init__(self, llm_client: AnthropicClient, cache: CallCache, budget: CallBudget) -> None:
+        # Calls go through llm_client, so no Anthropic client of its own is created.
+        self.llm_client: AnthropicClient = llm_client
+        self.cache: CallCache = cache
+        self.budget: CallBudget = budget
+
+    async def create_message(
+        self,
+        model: str,
+        messages: list[MessageParam],
+        tools: list[ToolParam] | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+    ) -> Any:
+        kwargs: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system,
+        }
+        if temperature > 0:
+            self.cache.calls += 1
+            return await self._create_message(kwargs)
+        return await self.cache.get_or_call(
+            content_hash(kwargs), lambda: self._create_message(kwargs)
+        )
+
+    async def stream_message(
+        self,
+        model: str,
+        messages: list[MessageParam],
+        tools: list[ToolParam] | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        system: str | None = None,
+    ) -> AsyncIterator[Any]:
+        self.cache.calls += 1
+        await self.budget.acquire()
+        async for event in self.llm_client.stream_message(
+            model=model,
+            messages=messages,
+            tools=tools,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+        ):
+            yield event
+
+    async def _create_message(self, kwargs: dict[str, Any]) -> Any:
+        await self.budget.acquire()
+        return await self.llm_client.create_message(**kwargs)
+
+
+class SweepToolRegistry(ToolRegistry):
+    """Tool registry of a sweep whose deterministic tools share results for identical inputs."""
+
+    def __init__(self, registry: ToolRegistry, cache: CallCache) -> None:
+        super().__init__()
+        self.registry: ToolRegistry = registry
+        self.cache: CallCache = cache
+
+    async def get_tool(self, tool_id: str) -> Tool:
+        return _CachedTool(await self.registry.get_tool(tool_id), self.cache)
+
+    async def get_tools(self, tool_ids: list[str]) -> list[Tool]:
+        return [_CachedTool(tool, self.cache) for tool in await self.registry.get_tools(tool_ids)]
+
+    def list_tools(self) -> list[Tool]:
+        return self.registry.list_tools()
+
+
+class _CachedTool(Tool):
+    def __init__(self, tool: Tool, cache: CallCache) -> None:
+        self.tool: Tool = tool
+        self.cache: CallCache = cache
+
+    @property
+    def id(self) -> str:
+        return self.tool.id
+
+    @property
+    def name(self) -> str:
+        return self.tool.name
+
+    @property
+    def input_schema(self) -> dict[str, Any]:
+        return self.tool.input_schema
+
+    @property
+    def output_schema(self) -> dict[str, Any]:
+        return self.tool.output_schema
+
+    @property
+    def context(self) -> str:
+        return self.tool.context
+
+    @property
+    def deterministic(self) -> bool:
+        return self.tool.deterministic
+
+    async def execute(self, input_data: dict[str, Any]) -> Any:
+        if not self.tool.deterministic:
+            self.cache.calls += 1
+            return await self.tool.execute(input_data)
+        return await self.cache.get_or_call(
+            content_hash([self.tool.id, input_data]),
+            lambda: self.tool.execute(input_data),
+            keep=_succeeded,
+        )
+
+
+def _succeeded(output: Any) -> bool:
+    """Whether a tool output is a result rather than an error payload."""
+    return not (
+        isinstance(output, dict) and (output.get("error") or output.get("success") is False)
+    )
+
+
+class SweepContext:
+    """Scheduling state shared by the cells of a running sweep.
+
+    All cells draw agent runs from one adaptive concurrency limit and LLM calls from one
+    per-minute budget, and share LLM and tool results through an executor of their own.
+    """
+
+    def __init__(
+        self, executor: AgentExecutor, max_parallel_runs: int, max_llm_calls_per_minute: int = 0
+    ) -> None:
+        self.limiter: AdaptiveLimiter = AdaptiveLimiter(
+            max_parallel_runs, initial=settings.benchmark_initial_parallel_runs
+        )
+        self.llm_cache: CallCache = CallCache()
+        self.tool_cache: CallCache = CallCache()
+        self.executor: AgentExecutor = AgentExecutor(
+            SweepLLMClient(
+                executor.llm_client, self.llm_cache, CallBudget(max_llm_calls_per_minute)
+            ),
+            SweepToolRegistry(executor.tool_registry, self.tool_cache),
+            executor.retriever,
+        )
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "llm_cache_hits": self.llm_cache.hits,
+            "llm_calls": self.llm_cache.calls,
+            "tool_cache_hits": self.tool_cache.hits,
+            "tool_calls": self.tool_cache.calls,
+        }
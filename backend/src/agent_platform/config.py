@@ -25,5 +25,150 @@ class Settings(BaseSettings):
 
     log_level: str = Field(default="INFO", description="Logging level")
 
+    benchmark_task_queue: bool = Field(
+        default=False,
+        description="Queue benchmark rows for agent_platform.worker processes instead of "
+        "executing them in the server process",
+    )
+    benchmark_poll_interval: float = Field(
+        default=1.0, description="Seconds between benchmark task queue polls"
+    )
+    benchmark_resume_idle_seconds: float = Field(
+        default=900.0,
+        description="Seconds without row progress or a live task lease after which a running "
+        "benchmark run counts as interrupted and may be resumed",
+    )
+    benchmark_initial_parallel_runs: int = Field(
+        default=4, description="Starting adaptive concurrency limit, capped by max_parallel_runs"
+    )
+    benchmark_sweep_max_cells: int = Field(
+        default=64, description="Maximum agent configs in one benchmark sweep"
+    )
+    benchmark_sweep_cache_entries: int = Field(
+        default=10000, description="LLM and tool results each sweep keeps for its cells"
+    )
+    benchmark_comparison_max_resamples: int = Field(
+        default=100_000, description="Most bootstrap resamples one benchmark comparison may draw"
+    )
+    reward_max_parallel_policies: int = Field(
+        default=8, description="Policy judges run at once when scoring one agent run"
+    )
+    reward_cache_max_entries: int = Field(
+        default=10000,
+        description="Reward results kept in memory in front of the reward_cache table",
+    )
+    blob_store_path: str = Field(
+        default="data/blobs", description="Directory of the content-addressed dataset file store"
+    )
+    export_chunk_bytes: int = Field(
+        default=1024 * 1024, description="Size of the data messages of a trajectory export"
+    )
+    export_batch_size: int = Field(
+        default=1000, description="Trajectories fetched per round trip while exporting"
+    )
+    export_row_group_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="JSON text gathered into one Parquet row group of a trajectory export",
+    )
+    analytics_store_path: str = Field(
+        default="data/analytics", description="Directory of the columnar trajectory mirror"
+    )
+    analytics_refresh_seconds: float = Field(
+        default=10.0, description="Longest an analytics query may read an unsynced mirror"
+    )
+    analytics_sync_overlap_seconds: float = Field(
+        default=60.0,
+        description="Updates re-read by each mirror sync to catch late-committing writes",
+    )
+    analytics_segment_rows: int = Field(
+        default=100_000, description="Most trajectories per Parquet segment of the mirror"
+    )
+    analytics_max_segments: int = Field(
+        default=16, description="Segments of the mirror before they are compacted into one"
+    )
+    trajectory_pipeline: bool = Field(
+        default=True,
+        description="Create trajectories from completed agent runs in the background of the "
+        "server and of each agent_platform.worker process",
+    )
+    trajectory_batch_size: int = Field(
+        default=500, description="Completed agent runs turned into trajectories per insert"
+    )
+    trajectory_poll_interval: float = Field(
+        default=2.0, description="Seconds between checks for agent runs without trajectories"
+    )
+    trajectory_settle_seconds: float = Field(
+        default=120.0,
+        description="Longest a finished agent run waits for its benchmark reward",
+    )
+    trajectory_overlap_seconds: float = Field(
+        default=300.0,
+        description="Finished runs re-checked behind the pipeline cursor for late commits",
+    )
+    trajectory_lag_warning_seconds: float = Field(
+        default=300.0, description="Trajectory creation lag above which a warning is logged"
+    )
+    annotation_batch_max_items: int = Field(
+        default=10000, description="Most trajectory and step annotations in one BatchAnnotate"
+    )
+    download_chunk_bytes: int = Field(
+        default=256 * 1024,
+        description="Read size when streaming a dataset file download without sendfile",
+    )
+    ingestion_workers: int = Field(
+        default=2, description="Worker processes extracting and chunking dataset files"
+    )
+    ingestion_max_pending: int = Field(
+        default=8, description="Dataset files handed to the ingestion workers at once"
+    )
+    ingestion_chunk_chars: int = Field(
+        default=1500, description="Largest chunk of extracted text, in characters"
+    )
+    ingestion_chunk_overlap: int = Field(
+        default=200, description="Characters of the previous chunk repeated at a chunk's start"
+    )
+    retrieval_index_path: str = Field(
+        default="data/indexes", description="Directory of the per-dataset retrieval indexes"
+    )
+    retrieval_top_k: int = Field(
+        default=5, description="Dataset chunks added to an agent run's system prompt"
+    )
+    retrieval_max_context_chars: int = Field(
+        default=6000, description="Most characters of dataset chunks added to a system prompt"
+    )
+    retrieval_vectors: str = Field(
+        default="none",
+        description="Vector index fused with BM25: none, flat (brute force) or ivf",
+    )
+    retrieval_embedding_dim: int = Field(
+        default=256, description="Dimensions of the hashed local chunk embeddings"
+    )
+    retrieval_ivf_lists: int = Field(
+        default=0, description="Inverted lists of an ivf index; 0 for the square root of chunks"
+    )
+    retrieval_ivf_probes: int = Field(default=8, description="Inverted lists an ivf search scans")
+    retrieval_max_open_indexes: int = Field(
+        default=32, description="Dataset retrieval indexes kept open per process"
+    )
+    prompt_dataset_page_size: int = Field(
+        default=500, description="Prompt dataset rows per page when a request sets no size"
+    )
+    prompt_dataset_max_page_size: int = Field(
+        default=5000, description="Largest page of prompt dataset rows a request may ask for"
+    )
+    prompt_import_batch_size: int = Field(
+        default=10000, description="Rows validated and copied at a time by prompt dataset imports"
+    )
+    prompt_import_max_errors: int = Field(
+        default=1000, description="Failed rows an import reports individually"
+    )
+    worker_concurrency: int = Field(default=8, description="Maximum rows a worker executes at once")
+    worker_lease_seconds: int = Field(
+        default=60, description="Seconds a claimed row stays leased without a heartbeat"
+    )
+    worker_max_attempts: int = Field(
+        default=3, description="Claims of a row before it is marked as failed"
+    )
+
 
 settings = Settings()
@@ -0,0 +1,67 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import IO
+
+from agent_platform.config import settings
+
+
+class BlobStore:
+    """Files stored on local disk under the SHA-256 of their content.
+
+    Writes stream into a temporary file next to the blobs while hashing, then move it into
+    place atomically, so identical uploads (to any dataset) share one blob and readers never
+    see a partial one. Blobs are never rewritten or deleted once stored.
+    """
+
+    def __init__(self, root: str = settings.blob_store_path) -> None:
+        self.root: Path = Path(root)
+
+    def path(self, checksum: str) -> Path:
+        return self.root / checksum[:2] / checksum[2:4] / checksum
+
+    async def write(self, chunks: AsyncIterator[bytes]) -> tuple[str, int]:
+        """Store the streamed content and return its checksum and size in bytes.
+
+        Only one chunk is held in memory at a time; disk writes run in a worker thread.
+        """
+        staging: Path = self.root / "tmp"
+        await asyncio.to_thread(staging.mkdir, parents=True, exist_ok=True)
+        handle: IO[bytes] = await asyncio.to_thread(_staging_file, staging)
+        digest = hashlib.sha256()
+        size: int = 0
+        try:
+            with handle:
+                async for chunk in chunks:
+                    if not chunk:
+                        continue
+                    digest.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(handle.write, chunk)
+                await asyncio.to_thread(_sync, handle)
+            checksum: str = digest.hexdigest()
+            await asyncio.to_thread(self._commit, Path(handle.name), checksum)
+        except BaseException:
+            await asyncio.to_thread(Path(handle.name).unlink, missing_ok=True)
+            raise
+        return checksum, size
+
+    def _commit(self, staged: Path, checksum: str) -> None:
+        target: Path = self.path(checksum)
+        if target.exists():
+            staged.unlink()
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged, target)
+
+
+def _staging_file(directory: Path) -> IO[bytes]:
+    return tempfile.NamedTemporaryFile(dir=directory, delete=False)
+
+
+def _sync(handle: IO[bytes]) -> None:
+    handle.flush()
+    os.fsync(handle.fileno())
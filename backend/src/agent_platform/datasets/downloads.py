@@ -0,0 +1,82 @@
+import asyncio
+import os
+
+from starlette.requests import Request
+from starlette.responses import FileResponse, PlainTextResponse, Response
+
+from agent_platform.config import settings
+from agent_platform.datasets.blobs import BlobStore
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.dataset import Dataset
+from agent_platform.db.repository.dataset import DatasetRepository
+
+DOWNLOAD_PATH: str = "/datasets/{dataset_id}/files/{file_id}"
+
+
+def download_url(dataset_id: str, file_id: str) -> str:
+    return DOWNLOAD_PATH.format(dataset_id=dataset_id, file_id=file_id)
+
+
+class BlobResponse(FileResponse):
+    """A stored blob, sent by the server from the file when it supports the ASGI pathsend
+    extension and otherwise read in fixed-size chunks, so memory per download is constant.
+
+    Range and If-Range are handled by ``FileResponse``; since blobs never change, the
+    checksum is their ETag.
+    """
+
+    chunk_size: int = settings.download_chunk_bytes
+
+
+class FileDownloads:
+    """Endpoint serving the files of datasets from the blob store."""
+
+    def __init__(self, blob_store: BlobStore) -> None:
+        self.blob_store: BlobStore = blob_store
+
+    async def download(self, request: Request) -> Response:
+        dataset_id: str = request.path_params["dataset_id"]
+        file_id: str = request.path_params["file_id"]
+        async with AsyncSessionLocal() as session:
+            dataset: Dataset | None = await DatasetRepository(session).get_by_id(dataset_id)
+        files: list[dict] = dataset.files if dataset is not None else []
+        file: dict | None = next((file for file in files if file["id"] == file_id), None)
+        if file is None:
+            return PlainTextResponse("File not found", status_code=404)
+
+        etag: str = f'"{file["checksum"]}"'
+        headers: dict[str, str] = {
+            "etag": etag,
+            "cache-control": "private, max-age=31536000, immutable",
+        }
+        if_match: str | None = request.headers.get("if-match")
+        if if_match is not None and not _matches(if_match, etag, weak=False):
+            return Response(status_code=412, headers=headers)
+        if_none_match: str | None = request.headers.get("if-none-match")
+        if if_none_match is not None and _matches(if_none_match, etag, weak=True):
+            return Response(status_code=304, headers=headers)
+
+        try:
+            stat_result: os.stat_result = await asyncio.to_thread(
+                os.stat, self.blob_store.path(file["checksum"])
+            )
+        except FileNotFoundError:
+            return PlainTextResponse("File content is missing", status_code=410)
+        return BlobResponse(
+            self.blob_store.path(file["checksum"]),
+            headers=headers,
+            filename=file["filename"],
+            stat_result=stat_result,
+            content_disposition_type="attachment",
+        )
+
+
+def _matches(header: str, etag: str, weak: bool) -> bool:
+    """Whether an If-Match/If-None-Match header lists ``etag``.
+
+    If-None-Match compares weakly; If-Match compares strongly, so weak tags never match.
+    """
+    tags: list[str] = [tag.strip() for tag in header.split(",")]
+    if weak:
+        tags = [tag.removeprefix("W/") for tag in tags]
+    return "*" in tags or etag in tags
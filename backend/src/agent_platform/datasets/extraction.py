@@ -0,0 +1,227 @@
+"""Text extraction, normalization and chunking of dataset files.
+
+Everything here is plain CPU-bound work on local files, meant to run in worker processes;
+it imports the standard library, and pypdf only when a PDF is read, so spawning a worker
+stays cheap.
+"""
+
+import csv
+import json
+import re
+import unicodedata
+import zipfile
+from collections.abc import Iterator
+from typing import Any
+from xml.etree import ElementTree
+
+# Values of platform.dataset.v1.FileType.
+FILE_TYPE_PDF: int = 1
+FILE_TYPE_WORD: int = 2
+FILE_TYPE_CSV: int = 3
+FILE_TYPE_IMAGE: int = 4
+FILE_TYPE_JSON: int = 5
+FILE_TYPE_TEXT: int = 6
+FILE_TYPE_EXCEL: int = 7
+
+_WORD_NS: str = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_SHEET_NS: str = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_RELATIONSHIP_NS: str = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_CONTROL_CHARACTERS: re.Pattern[str] = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+_SPACES: re.Pattern[str] = re.compile(r"[ \t]+")
+_BLANK_LINES: re.Pattern[str] = re.compile(r"\n{3,}")
+
+
+def ingest_file(path: str, file_type: int, chunk_chars: int, overlap: int) -> list[str]:
+    """Extract, normalize and chunk one file; the unit of work of an ingestion worker."""
+    return chunk_text(normalize_text(extract_text(path, file_type)), chunk_chars, overlap)
+
+
+def extract_text(path: str, file_type: int) -> str:
+    if file_type == FILE_TYPE_PDF:
+        return _extract_pdf(path)
+    if file_type == FILE_TYPE_WORD:
+        return _extract_docx(path)
+    if file_type == FILE_TYPE_EXCEL:
+        return _extract_xlsx(path)
+    if file_type == FILE_TYPE_CSV:
+        return _extract_csv(path)
+    if file_type == FILE_TYPE_JSON:
+        with open(path, "rb") as file:
+            return "\n".join(_json_lines(json.loads(file.read()), ""))
+    if file_type == FILE_TYPE_IMAGE:
+        raise ValueError("Images have no extractable text")
+    with open(path, "rb") as file:
+        return file.read().decode("utf-8-sig", errors="replace")
+
+
+def normalize_text(text: str) -> str:
+    """NFKC text with one space between words, no control characters and at most one blank
+    line between paragraphs."""
+    text = unicodedata.normalize("NFKC", text).replace("\r\n", "\n").replace("\r", "\n")
+    text = _CONTROL_CHARACTERS.sub("", text)
+    lines: list[str] = [_SPACES.sub(" ", line).strip() for line in text.split("\n")]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def chunk_text(text: str, chunk_chars: int, overlap: int) -> list[str]:
+    """Pack paragraphs into chunks of up to ``chunk_chars`` characters.
+
+    Paragraphs that do not fit are split between words. Each chunk after the first starts
+    with up to ``overlap`` characters of the end of the previous one, so text near a
+    boundary keeps some of its context.
+    """
+    chunks: list[str] = []
+    current: str = ""
+    overlap = max(0, min(overlap, chunk_chars // 2))
+    for piece in _pieces(text, chunk_chars - overlap - 2 if overlap else chunk_chars):
+        if current and len(current) + 2 + len(piece) > chunk_chars:
+            chunks.append(current)
+            tail: str = _tail(current, min(overlap, chunk_chars - len(piece) - 2))
+            current = f"{tail}\n\n{piece}" if tail else piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _pieces(text: str, chunk_chars: int) -> Iterator[str]:
+    for paragraph in text.split("\n\n"):
+        start: int = 0
+        while len(paragraph) - start > chunk_chars:
+            cut: int = paragraph.rfind(" ", start, start + chunk_chars + 1)
+            if cut <= start:
+                cut = start + chunk_chars
+            yield paragraph[start:cut].rstrip()
+            start = cut
+            while start < len(paragraph) and paragraph[start] == " ":
+                start += 1
+        if start < len(paragraph):
+            yield paragraph[start:]
+
+
+def _tail(text: str, length: int) -> str:
+    if length <= 0:
+        return ""
+    tail: str = text[-length:]
+    if len(text) > length and " " in tail:
+        tail = tail.split(" ", 1)[1]
+    return tail
+
+
+def _extract_csv(path: str) -> str:
+    with open(path, encoding="utf-8-sig", errors="replace", newline="") as file:
+        reader: Iterator[list[str]] = csv.reader(file)
+        header: list[str] | None = next(reader, None)
+        if header is None:
+            return ""
+        lines: list[str] = [
+            " | ".join(f"{name}: {value}" for name, value in zip(header, row) if value)
+            for row in reader
+        ]
+    return "\n".join(lines)
+
+
+def _json_lines(value: Any, path: str) -> Iterator[str]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _json_lines(item, f"{path}.{key}" if path else str(key))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _json_lines(item, f"{path}[{index}]")
+    elif value is not None:
+        yield f"{path}: {value}" if path else str(value)
+
+
+def _extract_docx(path: str) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as document:
+            paragraphs: list[str] = []
+            for _, element in ElementTree.iterparse(document):
+                if element.tag == f"{_WORD_NS}p":
+                    paragraphs.append(
+                        "".join(
+                            node.text or ""
+                            if node.tag == f"{_WORD_NS}t"
+                            else "\t"
+                            if node.tag == f"{_WORD_NS}tab"
+                            else ""
+                            for node in element.iter()
+                        )
+                    )
+                    element.clear()
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"Not a Word (.docx) document: {e}") from None
+    return "\n\n".join(paragraphs)
+
+
+def _extract_xlsx(path: str) -> str:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            shared: list[str] = []
+            if "xl/sharedStrings.xml" in archive.namelist():
+                with archive.open("xl/sharedStrings.xml") as strings:
+                    for _, element in ElementTree.iterparse(strings):
+                        if element.tag == f"{_SHEET_NS}si":
+                            shared.append("".join(element.itertext()))
+                            element.clear()
+            sheets: list[str] = []
+            for name, sheet_path in _xlsx_sheets(archive):
+                rows: list[str] = [f"# {name}"]
+                with archive.open(sheet_path) as sheet:
+                    for _, element in ElementTree.iterparse(sheet):
+                        if element.tag == f"{_SHEET_NS}row":
+                            cells: list[str] = [
+                                value
+                                for cell in element.iter(f"{_SHEET_NS}c")
+                                if (value := _xlsx_cell(cell, shared))
+                            ]
+                            if cells:
+                                rows.append(" | ".join(cells))
+                            element.clear()
+                sheets.append("\n".join(rows))
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"Not an Excel (.xlsx) workbook: {e}") from None
+    return "\n\n".join(sheets)
+
+
+def _xlsx_sheets(archive: zipfile.ZipFile) -> list[tuple[str, str]]:
+    relationships: dict[str, str] = {
+        relationship.get("Id", ""): relationship.get("Target", "")
+        for relationship in ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    }
+    workbook: ElementTree.Element = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    sheets: list[tuple[str, str]] = []
+    for sheet in workbook.iter(f"{_SHEET_NS}sheet"):
+        target: str = relationships.get(sheet.get(f"{_RELATIONSHIP_NS}id", ""), "")
+        if target:
+            sheets.append(
+                (
+                    sheet.get("name", ""),
+                    target.lstrip("/") if target.startswith("/") else f"xl/{target}",
+                )
+            )
+    return sheets
+
+
+def _xlsx_cell(cell: ElementTree.Element, shared: list[str]) -> str:
+    kind: str | None = cell.get("t")
+    if kind == "inlineStr":
+        return "".join(cell.itertext())
+    value: ElementTree.Element | None = cell.find(f"{_SHEET_NS}v")
+    if value is None or value.text is None:
+        return ""
+    if kind == "s":
+        index: int = int(value.text)
+        return shared[index] if index < len(shared) else ""
+    return value.text
+
+
+def _extract_pdf(path: str) -> str:
+    from pypdf import PdfReader
+    from pypdf.errors import PyPdfError
+
+    try:
+        return "\n\n".join(page.extract_text() or "" for page in PdfReader(path).pages)
+    except PyPdfError as e:
+        raise ValueError(f"Not a readable PDF document: {e}") from None
@@ -0,0 +1,256 @@
+import asyncio
+import csv
+import io
+import itertools
+import json
+import re
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import IO, Any
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.config import settings
+from agent_platform.db.models.dataset import PromptDatasetRow
+from agent_platform.db.models.reward import RewardAgent
+
+IMPORT_FORMATS: dict[int, str] = {1: "csv", 2: "jsonl"}
+
+_UNDECODABLE: re.Pattern[str] = re.compile("[\udc80-\udcff]")
+_INVALID_UTF8: str = "Invalid UTF-8"
+
+_COPY_COLUMNS: list[str] = [
+    "id",
+    "prompt_dataset_id",
+    "prompt",
+    "reward_agent_id",
+    "ground_truths",
+    "sme_comments",
+    "sequence",
+]
+
+
+async def spool(chunks: AsyncIterator[bytes]) -> IO[bytes]:
+    """Copy streamed bytes to an anonymous temporary file, rewound for reading."""
+    file: IO[bytes] = await asyncio.to_thread(tempfile.TemporaryFile)
+    try:
+        async for chunk in chunks:
+            await asyncio.to_thread(file.write, chunk)
+        await asyncio.to_thread(file.seek, 0)
+    except BaseException:
+        file.close()
+        raise
+    return file
+
+
+def read_records(file: IO[bytes], format: str) -> Iterator[tuple[int, Any]]:
+    """Yield the file's records with the line each starts on.
+
+    Records are parsed dicts, or an error message for lines that are not one: bytes that
+    are not UTF-8 and CSV errors (such as cells over the csv module's field size limit)
+    fail their own record rather than the import.
+    """
+    # Undecodable bytes become lone surrogates, found per record below.
+    text: io.TextIOWrapper = io.TextIOWrapper(
+        file, encoding="utf-8-sig", errors="surrogateescape", newline=""
+    )
+    if format == "jsonl":
+        for line, content in enumerate(text, start=1):
+            if not content.strip():
+                continue
+            if _UNDECODABLE.search(content):
+                yield line, _INVALID_UTF8
+                continue
+            try:
+                yield line, json.loads(content)
+            except ValueError as e:
+                yield line, f"Invalid JSON: {e}"
+        return
+
+    # Lines are counted as the reader consumes them: after a csv.Error, reader.line_num
+    # can lag behind the lines the failed record used.
+    lines_read: int = 0
+
+    def counted_lines() -> Iterator[str]:
+        nonlocal lines_read
+        for content in text:
+            lines_read += 1
+            yield content
+
+    reader: csv.DictReader = csv.DictReader(counted_lines())
+    try:
+        fieldnames: Sequence[str] | None = reader.fieldnames
+    except csv.Error as e:
+        raise ValueError(f"Invalid CSV header: {e}") from e
+    if not fieldnames or "prompt" not in fieldnames:
+        raise ValueError("CSV imports need a header row with a prompt column")
+    record_line: int = lines_read + 1
+    while True:
+        try:
+            record: dict = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield record_line, f"Invalid CSV: {e}"
+        else:
+            if None in record:
+                yield record_line, f"Expected {len(fieldnames)} columns"
+            elif any(_UNDECODABLE.search(value) for value in record.values() if value):
+                yield record_line, _INVALID_UTF8
+            else:
+                yield record_line, record
+        record_line = lines_read + 1
+
+
+class PromptRowImport:
+    """Validates records of an import in batches and appends the valid ones with COPY.
+
+    Rows take sequences after the dataset's last row in record order; the caller holds a
+    lock on the prompt dataset for the session's transaction so concurrent imports do not
+    interleave.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        prompt_dataset_id: str,
+        default_reward_agent_id: str = "",
+        max_errors: int = settings.prompt_import_max_errors,
+    ) -> None:
+        self.session: AsyncSession = session
+        self.prompt_dataset_id: str = prompt_dataset_id
+        self.default_reward_agent_id: str = default_reward_agent_id
+        self.max_errors: int = max_errors
+        self.imported_rows: int = 0
+        self.failed_rows: int = 0
+        self.errors: list[dict] = []
+        self._sequence: int | None = None
+        self._reward_agents: dict[str, bool] = {}
+
+    async def load(
+        self,
+        records: Iterator[tuple[int, Any]],
+        batch_size: int = settings.prompt_import_batch_size,
+    ) -> None:
+        while True:
+            batch: list[tuple[int, Any]] = await asyncio.to_thread(
+                list, itertools.islice(records, batch_size)
+            )
+            if not batch:
+                return
+            await self.load_batch(batch)
+
+    async def load_batch(self, batch: list[tuple[int, Any]]) -> None:
+        rows: list[tuple[int, dict]] = []
+        for line, record in batch:
+            row: dict | str = self._validate(record)
+            if isinstance(row, str):
+                self._fail(line, row)
+            else:
+                rows.append((line, row))
+
+        await self._check_reward_agents({row["reward_agent_id"] for _, row in rows})
+        records: list[tuple] = []
+        sequence: int = await self._next_sequence()
+        for line, row in rows:
+            if not self._reward_agents[row["reward_agent_id"]]:
+                self._fail(line, f"Reward agent {row['reward_agent_id']} not found")
+                continue
+            records.append(
+                (
+                    str(uuid.uuid4()),
+                    self.prompt_dataset_id,
+                    row["prompt"],
+                    row["reward_agent_id"],
+                    json.dumps(row["ground_truths"]),
+                    "[]",
+                    sequence,
+                )
+            )
+            sequence += 1
+        if not records:
+            return
+
+        raw_connection = await (await self.session.connection()).get_raw_connection()
+        # The asyncpg connection under the session.
+        driver_connection: Any = raw_connection.driver_connection
+        await driver_connection.copy_records_to_table(
+            PromptDatasetRow.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+        self._sequence = sequence
+        self.imported_rows += len(records)
+
+    def _validate(self, record: Any) -> dict | str:
+        if isinstance(record, str):
+            return record
+        if not isinstance(record, dict):
+            return "Expected an object"
+        prompt: Any = record.get("prompt")
+        if not isinstance(prompt, str) or not prompt.strip():
+            return "Missing prompt"
+        reward_agent_id: Any = record.get("reward_agent_id") or self.default_reward_agent_id
+        if not isinstance(reward_agent_id, str) or not reward_agent_id:
+            return "Missing reward_agent_id"
+        ground_truths: list[dict] | str = _ground_truths(record.get("ground_truths"))
+        if isinstance(ground_truths, str):
+            return ground_truths
+        return {
+            "prompt": prompt,
+            "reward_agent_id": reward_agent_id,
+            "ground_truths": ground_truths,
+        }
+
+    async def _check_reward_agents(self, reward_agent_ids: set[str]) -> None:
+        unknown: set[str] = reward_agent_ids - self._reward_agents.keys()
+        if not unknown:
+            return
+        result = await self.session.execute(
+            select(RewardAgent.id).where(RewardAgent.id.in_(unknown))
+        )
+        found: set[str] = set(result.scalars().all())
+        for reward_agent_id in unknown:
+            self._reward_agents[reward_agent_id] = reward_agent_id in found
+
+    async def _next_sequence(self) -> int:
+        if self._sequence is None:
+            result = await self.session.execute(
+                select(func.max(PromptDatasetRow.sequence)).where(
+                    PromptDatasetRow.prompt_dataset_id == self.prompt_dataset_id
+                )
+            )
+            last: int | None = result.scalar_one()
+            self._sequence = 0 if last is None else last + 1
+        return self._sequence
+
+    def _fail(self, line: int, message: str) -> None:
+        self.failed_rows += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "message": message})
+
+
+def _ground_truths(value: Any) -> list[dict] | str:
+    """Ground truths as stored on rows; CSV cells hold a JSON array or a single text."""
+    if value is None or value == "":
+        return []
+    if isinstance(value, str):
+        if not value.lstrip().startswith("["):
+            return [{"text": value}]
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return "ground_truths is not a valid JSON array"
+    if not isinstance(value, list):
+        return "ground_truths must be a list"
+    ground_truths: list[dict] = []
+    for item in value:
+        if isinstance(item, str):
+            item = {"text": item}
+        if not isinstance(item, dict):
+            return "Ground truths must be texts or objects"
+        fields: dict = {key: item[key] for key in ("text", "dataset_id") if item.get(key)}
+        if len(fields) != 1 or not isinstance(next(iter(fields.values())), str):
+            return "A ground truth needs exactly one of text or dataset_id"
+        ground_truths.append(fields)
+    return ground_truths
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from agent_platform.config import settings
+from agent_platform.datasets.blobs import BlobStore
+from agent_platform.datasets.extraction import ingest_file
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.dataset import Dataset, FileIngestion
+from agent_platform.db.repository.dataset import DatasetRepository, FileIngestionRepository
+from agent_platform.llm.executor import Status
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction or normalization changes so stored chunks are rebuilt.
+EXTRACTOR_VERSION: str = "1"
+
+
+class IngestionPipeline:
+    """Extracts, normalizes and chunks dataset files in a pool of worker processes.
+
+    At most ``max_pending`` files are handed to the pool at once and further files wait for
+    a slot, which bounds the work and results held in memory however many uploads arrive.
+    Outcomes, chunks included, are stored per file checksum, so content uploaded to several
+    datasets or uploaded again is processed once. Extraction errors are stored as final, but
+    failures of the worker or the machine (a worker dying, I/O errors) leave the file
+    ``AWAITING_START`` so the next request for it tries again.
+    """
+
+    def __init__(
+        self,
+        blob_store: BlobStore,
+        workers: int = settings.ingestion_workers,
+        max_pending: int = settings.ingestion_max_pending,
+        chunk_chars: int = settings.ingestion_chunk_chars,
+        chunk_overlap: int = settings.ingestion_chunk_overlap,
+    ) -> None:
+        self.blob_store: BlobStore = blob_store
+        self.workers: int = max(1, workers)
+        self.chunk_chars: int = chunk_chars
+        self.chunk_overlap: int = chunk_overlap
+        self.version: str = f"{EXTRACTOR_VERSION}:{chunk_chars}:{chunk_overlap}"
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(max(1, max_pending))
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending: dict[str, asyncio.Future[FileIngestion]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, file: dict) -> None:
+        """Ingest ``file`` in the background."""
+        task: asyncio.Task = asyncio.create_task(self.ingest(file))
+        self._tasks.add(task)
+        task.add_done_callback(self._finished)
+
+    async def ingest(self, file: dict) -> FileIngestion:
+        checksum: str = file["checksum"]
+        async with AsyncSessionLocal() as session:
+            stored: FileIngestion | None = await FileIngestionRepository(session).get_by_id(
+                checksum
+            )
+        if (
+            stored is not None
+            and stored.version == self.version
+            and stored.status in (Status.DONE, Status.ERROR)
+        ):
+            return stored
+
+        pending: asyncio.Future[FileIngestion] | None = self._pending.get(checksum)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        task: asyncio.Future[FileIngestion] = asyncio.ensure_future(self._process(file))
+        self._pending[checksum] = task
+        try:
+            return await task
+        finally:
+            if self._pending.get(checksum) is task:
+                del self._pending[checksum]
+
+    async def ingest_dataset(self, dataset_id: str) -> list[FileIngestion]:
+        async with AsyncSessionLocal() as session:
+            dataset: Dataset | None = await DatasetRepository(session).get_by_id(dataset_id)
+        if dataset is None:
+            raise ValueError(f"Dataset {dataset_id} not found")
+        return list(await asyncio.gather(*(self.ingest(file) for file in dataset.files)))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _process(self, file: dict) -> FileIngestion:
+        chunks: list[str] = []
+        error: str | None = None
+        status: int = Status.ERROR
+        async with self._slots:
+            pool: ProcessPoolExecutor = self._executor()
+            try:
+                chunks = await asyncio.get_running_loop().run_in_executor(
+                    pool,
+                    ingest_file,
+                    str(self.blob_store.path(file["checksum"])),
+                    int(file.get("file_type", 0)),
+                    self.chunk_chars,
+                    self.chunk_overlap,
+                )
+            except BrokenProcessPool:
+                # A worker died (out of memory, say); later files get a fresh pool.
+                if self._pool is pool:
+                    self.close()
+                error = "Ingestion worker exited unexpectedly"
+                status = Status.AWAITING_START
+            except (OSError, MemoryError) as e:
+                error = str(e) or type(e).__name__
+                status = Status.AWAITING_START
+            except Exception as e:
+                error = str(e) or type(e).__name__
+        if error is not None:
+            logger.warning(
+                "Could not ingest %s (%s): %s", file["filename"], file["checksum"], error
+            )
+
+        async with AsyncSessionLocal() as session:
+            ingestion: FileIngestion = await FileIngestionRepository(session).save(
+                file["checksum"],
+                self.version,
+                status if error is not None else Status.DONE,
+                chunks,
+                error,
+            )
+            await session.commit()
+        return ingestion
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background ingestion failed", exc_info=task.exception())
@@ -0,0 +1,466 @@
+import asyncio
+import json
+import logging
+import mmap
+import re
+import shutil
+import unicodedata
+import uuid
+import zlib
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from agent_platform.benchmarks.reuse import content_hash
+from agent_platform.config import settings
+from agent_platform.datasets.ingestion import IngestionPipeline
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.dataset import Dataset, DocumentChunk, FileIngestion
+from agent_platform.db.repository.dataset import DatasetRepository, FileIngestionRepository
+from agent_platform.llm.executor import Status
+
+logger = logging.getLogger(__name__)
+
+_TOKEN: re.Pattern[str] = re.compile(r"\w+")
+_BM25_K1: float = 1.2
+_BM25_B: float = 0.75
+_RRF_K: int = 60
+# Cosine similarity below which a chunk does not count as a vector match.
+_MIN_SIMILARITY: float = 0.2
+_KMEANS_SAMPLE: int = 20_000
+_STOPWORDS: frozenset[str] = frozenset(
+    "a an and are as at be but by do does for from has have how i if in into is it its of on "
+    "or so than that the their then there these they this to was we were what when where "
+    "which who why will with you your".split()
+)
+VECTOR_MODES: tuple[str, ...] = ("none", "flat", "ivf")
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in _TOKEN.findall(unicodedata.normalize("NFKC", text).casefold())
+        if token not in _STOPWORDS
+    ]
+
+
+def embed(texts: list[str], dim: int) -> np.ndarray:
+    """Unit-length hashed vectors of each text's words and their character trigrams.
+
+    A local embedding that needs no model: texts sharing wording share dimensions.
+    """
+    vectors: np.ndarray = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        features: list[tuple[np.ndarray, np.ndarray]] = [
+            _features(token, dim) for token in tokenize(text)
+        ]
+        if features:
+            vectors[row] = np.bincount(
+                np.concatenate([indices for indices, _ in features]),
+                weights=np.concatenate([signs for _, signs in features]),
+                minlength=dim,
+            )
+    norms: np.ndarray = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+@lru_cache(maxsize=100_000)
+def _features(token: str, dim: int) -> tuple[np.ndarray, np.ndarray]:
+    hashes: np.ndarray = np.array(
+        [
+            zlib.crc32(feature.encode())
+            for feature in (token, *(token[i : i + 3] for i in range(len(token) - 2)))
+        ],
+        dtype=np.int64,
+    )
+    return hashes % dim, np.where(hashes & (1 << 31), 1.0, -1.0).astype(np.float32)
+
+
+def build_index(
+    directory: Path,
+    chunks: list[tuple[str, str]],
+    vectors: str = "none",
+    dim: int = 256,
+    lists: int = 0,
+) -> None:
+    """Write a retrieval index over ``(source, text)`` chunks to ``directory``.
+
+    Texts go to one file addressed by offsets, BM25 postings to CSR arrays and, unless
+    ``vectors`` is ``"none"``, chunk embeddings (clustered into ``lists`` inverted lists for
+    ``"ivf"``) to ``.npy`` files, so searches memory-map what they read. The index is built
+    next to ``directory`` and renamed into place.
+    """
+    staging: Path = directory.with_name(f".{directory.name}-{uuid.uuid4().hex}")
+    staging.mkdir(parents=True)
+    try:
+        sources: list[str] = []
+        source_ids: dict[str, int] = {}
+        chunk_sources: list[int] = []
+        offsets: list[int] = [0]
+        lengths: list[int] = []
+        term_ids: dict[str, int] = {}
+        occurrences: array[int] = array("q")
+        with open(staging / "texts.bin", "wb") as texts:
+            for doc, (source, text) in enumerate(chunks):
+                data: bytes = text.encode()
+                texts.write(data)
+                offsets.append(offsets[-1] + len(data))
+                if source not in source_ids:
+                    source_ids[source] = len(sources)
+                    sources.append(source)
+                chunk_sources.append(source_ids[source])
+                tokens: list[str] = tokenize(text)
+                lengths.append(len(tokens))
+                # Term and chunk packed in one integer, so sorting groups postings by term.
+                occurrences.extend(
+                    term_ids.setdefault(token, len(term_ids)) * len(chunks) + doc
+                    for token in tokens
+                )
+
+        postings, frequencies = np.unique(
+            np.frombuffer(occurrences, dtype=np.int64), return_counts=True
+        )
+        del occurrences
+        terms: list[str] = list(term_ids)
+        pointers: np.ndarray = np.zeros(len(terms) + 1, dtype=np.int64)
+        pointers[1:] = np.cumsum(np.bincount(postings // max(len(chunks), 1), minlength=len(terms)))
+        docs: np.ndarray = (postings % max(len(chunks), 1)).astype(np.int32)
+        frequencies = frequencies.astype(np.float32)
+        np.save(staging / "offsets.npy", np.asarray(offsets, dtype=np.int64))
+        np.save(staging / "lengths.npy", np.asarray(lengths, dtype=np.float32))
+        np.save(staging / "sources.npy", np.asarray(chunk_sources, dtype=np.int32))
+        np.save(staging / "pointers.npy", pointers)
+        np.save(staging / "docs.npy", docs)
+        np.save(staging / "frequencies.npy", frequencies)
+        (staging / "terms.json").write_text(json.dumps(terms))
+
+        if vectors != "none" and chunks:
+            embeddings: np.ndarray = embed([text for _, text in chunks], dim)
+            np.save(staging / "embeddings.npy", embeddings)
+            if vectors == "ivf":
+                _build_ivf(staging, embeddings, lists or int(np.sqrt(len(chunks))) or 1)
+
+        (staging / "meta.json").write_text(
+            json.dumps({"sources": sources, "vectors": vectors, "dim": dim})
+        )
+        try:
+            staging.rename(directory)
+        except OSError:
+            if not directory.exists():
+                raise
+            shutil.rmtree(staging, ignore_errors=True)  # Another process built it first.
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def _build_ivf(directory: Path, embeddings: np.ndarray, lists: int, iterations: int = 10) -> None:
+    """Cluster the embeddings with spherical k-means, trained on a sample, into ``lists``
+    inverted lists."""
+    rng: np.random.Generator = np.random.default_rng(0)
+    sample: np.ndarray = embeddings[
+        np.sort(rng.choice(len(embeddings), min(len(embeddings), _KMEANS_SAMPLE), replace=False))
+    ]
+    lists = min(lists, len(sample))
+    centroids: np.ndarray = sample[rng.choice(len(sample), lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignments: np.ndarray = np.argmax(sample @ centroids.T, axis=1)
+        sums: np.ndarray = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+        norms: np.ndarray = np.linalg.norm(sums, axis=1, keepdims=True)
+        filled: np.ndarray = norms[:, 0] > 0
+        centroids[filled] = sums[filled] / norms[filled]
+
+    assignments = np.concatenate(
+        [
+            np.argmax(embeddings[start : start + _KMEANS_SAMPLE] @ centroids.T, axis=1)
+            for start in range(0, len(embeddings), _KMEANS_SAMPLE)
+        ]
+    )
+    pointers: np.ndarray = np.zeros(lists + 1, dtype=np.int64)
+    pointers[1:] = np.cumsum(np.bincount(assignments, minlength=lists))
+    np.save(directory / "centroids.npy", centroids.astype(np.float32))
+    np.save(directory / "ivf_pointers.npy", pointers)
+    np.save(directory / "ivf_docs.npy", np.argsort(assignments, kind="stable").astype(np.int32))
+
+
+class RetrievalIndex:
+    """A built index, opened with its arrays and texts memory-mapped."""
+
+    def __init__(self, directory: Path) -> None:
+        meta: dict = json.loads((directory / "meta.json").read_text())
+        self.sources: list[str] = meta["sources"]
+        self.dim: int = meta["dim"]
+        self.terms: dict[str, int] = {
+            term: index
+            for index, term in enumerate(json.loads((directory / "terms.json").read_text()))
+        }
+        self.offsets: np.ndarray = np.load(directory / "offsets.npy", mmap_mode="r")
+        self.lengths: np.ndarray = np.load(directory / "lengths.npy", mmap_mode="r")
+        self.chunk_sources: np.ndarray = np.load(directory / "sources.npy", mmap_mode="r")
+        self.pointers: np.ndarray = np.load(directory / "pointers.npy", mmap_mode="r")
+        self.docs: np.ndarray = np.load(directory / "docs.npy", mmap_mode="r")
+        self.frequencies: np.ndarray = np.load(directory / "frequencies.npy", mmap_mode="r")
+        self.size: int = len(self.lengths)
+        self.average_length: float = float(np.mean(self.lengths)) if self.size else 0.0
+        self.embeddings: np.ndarray | None = None
+        self.centroids: np.ndarray | None = None
+        if meta["vectors"] != "none" and self.size:
+            self.embeddings = np.load(directory / "embeddings.npy", mmap_mode="r")
+            if meta["vectors"] == "ivf":
+                self.centroids = np.load(directory / "centroids.npy", mmap_mode="r")
+                self.ivf_pointers: np.ndarray = np.load(
+                    directory / "ivf_pointers.npy", mmap_mode="r"
+                )
+                self.ivf_docs: np.ndarray = np.load(directory / "ivf_docs.npy", mmap_mode="r")
+        self._texts_file = open(directory / "texts.bin", "rb")
+        self._texts: mmap.mmap | None = (
+            mmap.mmap(self._texts_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.offsets[-1] > 0
+            else None
+        )
+
+    def close(self) -> None:
+        if self._texts is not None:
+            self._texts.close()
+        self._texts_file.close()
+
+    def text(self, doc: int) -> str:
+        if self._texts is None:
+            return ""
+        return self._texts[int(self.offsets[doc]) : int(self.offsets[doc + 1])].decode()
+
+    def source(self, doc: int) -> str:
+        return self.sources[int(self.chunk_sources[doc])]
+
+    def search(self, query: str, k: int, probes: int = 8) -> list[tuple[int, float]]:
+        """Top ``k`` chunks for ``query`` as ``(chunk, score)`` pairs, best first.
+
+        BM25 ranks the chunks and, when the index has vectors, is fused with the vector
+        ranking by reciprocal rank.
+        """
+        if not self.size or k <= 0:
+            return []
+        rankings: list[np.ndarray] = [self._bm25(query, k * 4)]
+        if self.embeddings is not None:
+            rankings.append(self._nearest(self.embeddings, query, k * 4, probes))
+        fused: dict[int, float] = {}
+        for ranking in rankings:
+            for rank, doc in enumerate(ranking.tolist()):
+                fused[doc] = fused.get(doc, 0.0) + 1.0 / (_RRF_K + rank + 1)
+        return sorted(fused.items(), key=lambda item: -item[1])[:k]
+
+    def _bm25(self, query: str, k: int) -> np.ndarray:
+        scores: np.ndarray = np.zeros(self.size, dtype=np.float32)
+        for term in set(tokenize(query)):
+            index: int | None = self.terms.get(term)
+            if index is None:
+                continue
+            start, end = int(self.pointers[index]), int(self.pointers[index + 1])
+            docs: np.ndarray = self.docs[start:end]
+            frequencies: np.ndarray = self.frequencies[start:end]
+            idf: float = float(
+                np.log(1.0 + (self.size - (end - start) + 0.5) / (end - start + 0.5))
+            )
+            norms: np.ndarray = _BM25_K1 * (
+                1.0 - _BM25_B + _BM25_B * self.lengths[docs] / max(self.average_length, 1e-9)
+            )
+            scores[docs] += idf * frequencies * (_BM25_K1 + 1.0) / (frequencies + norms)
+        return _top(scores, k, minimum=0.0)
+
+    def _nearest(self, embeddings: np.ndarray, query: str, k: int, probes: int) -> np.ndarray:
+        vector: np.ndarray = embed([query], self.dim)[0]
+        if self.centroids is None:
+            return _top(embeddings @ vector, k, minimum=_MIN_SIMILARITY)
+        clusters: np.ndarray = _top(self.centroids @ vector, probes)
+        candidates: np.ndarray = np.concatenate(
+            [
+                self.ivf_docs[int(self.ivf_pointers[cluster]) : int(self.ivf_pointers[cluster + 1])]
+                for cluster in clusters
+            ]
+        )
+        if not len(candidates):
+            return candidates
+        return candidates[_top(embeddings[candidates] @ vector, k, minimum=_MIN_SIMILARITY)]
+
+
+def _top(scores: np.ndarray, k: int, minimum: float | None = None) -> np.ndarray:
+    """Indices of the ``k`` highest scores above ``minimum``, highest first."""
+    if minimum is not None:
+        candidates: np.ndarray = np.flatnonzero(scores > minimum)
+        scores = scores[candidates]
+    else:
+        candidates = np.arange(len(scores))
+    if len(candidates) > k:
+        best: np.ndarray = np.argpartition(-scores, k - 1)[:k]
+        candidates, scores = candidates[best], scores[best]
+    return candidates[np.argsort(-scores, kind="stable")]
+
+
+class DatasetRetriever:
+    """Per-dataset retrieval indexes on local disk, built from ingested dataset files.
+
+    An index is named after the dataset's files and the index settings, so uploads make
+    the next lookup build a fresh one; indexes are built on first use and kept open in an
+    LRU of ``max_open`` datasets. Indexes that are replaced or evicted are closed once no
+    search still uses them. An index built while some file's ingestion awaits a retry
+    is used for that lookup only, so the next one retries the file.
+    """
+
+    def __init__(
+        self,
+        ingestion: IngestionPipeline,
+        root: str = settings.retrieval_index_path,
+        top_k: int = settings.retrieval_top_k,
+        max_context_chars: int = settings.retrieval_max_context_chars,
+        vectors: str = settings.retrieval_vectors,
+        max_open: int = settings.retrieval_max_open_indexes,
+    ) -> None:
+        if vectors not in VECTOR_MODES:
+            raise ValueError(f"Unknown retrieval vector mode {vectors!r}")
+        self.ingestion: IngestionPipeline = ingestion
+        self.root: Path = Path(root)
+        self.top_k: int = top_k
+        self.max_context_chars: int = max_context_chars
+        self.vectors: str = vectors
+        self.max_open: int = max_open
+        self._open: OrderedDict[str, tuple[str, RetrievalIndex]] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: dict[RetrievalIndex, int] = {}
+        self._retired: set[RetrievalIndex] = set()
+
+    async def retrieve(self, dataset_ids: list[str], query: str) -> list[dict]:
+        """The ``top_k`` chunks across the datasets most relevant to ``query``."""
+        if not dataset_ids or self.top_k <= 0:
+            return []
+        async with AsyncSessionLocal() as session:
+            repo: DatasetRepository = DatasetRepository(session)
+            datasets: list[Dataset] = [
+                dataset
+                for dataset_id in dict.fromkeys(dataset_ids)
+                if (dataset := await repo.get_by_id(dataset_id)) is not None
+            ]
+        results: list[dict] = []
+        for dataset in datasets:
+            if not dataset.files:
+                continue
+            index: RetrievalIndex = await self.index(dataset)
+            try:
+                for doc, score in await asyncio.to_thread(
+                    index.search, query, self.top_k, settings.retrieval_ivf_probes
+                ):
+                    results.append(
+                        {
+                            "dataset_id": dataset.id,
+                            "source": index.source(doc),
+                            "text": index.text(doc),
+                            "score": score,
+                        }
+                    )
+            finally:
+                self.release(index)
+        results.sort(key=lambda result: -result["score"])
+        return results[: self.top_k]
+
+    async def context(self, dataset_ids: list[str], query: str) -> tuple[str, int]:
+        """Retrieved chunks rendered for a system prompt, and how many were included."""
+        chunks: list[dict] = await self.retrieve(dataset_ids, query)
+        sections: list[str] = []
+        remaining: int = self.max_context_chars
+        for chunk in chunks:
+            text: str = chunk["text"][:remaining]
+            if not text:
+                break
+            sections.append(f'<document source="{chunk["source"]}">\n{text}\n</document>')
+            remaining -= len(text)
+        if not sections:
+            return "", 0
+        return (
+            "Excerpts from the datasets attached to this run, most relevant first:\n\n"
+            + "\n\n".join(sections)
+        ), len(sections)
+
+    async def index(self, dataset: Dataset) -> RetrievalIndex:
+        """The dataset's open index; hand it to ``release`` when done with it."""
+        key: str = content_hash(
+            {
+                "files": sorted(file["checksum"] for file in dataset.files),
+                "ingestion": self.ingestion.version,
+                "vectors": self.vectors,
+                "dim": settings.retrieval_embedding_dim,
+                "lists": settings.retrieval_ivf_lists,
+            }
+        )[:16]
+        lock: asyncio.Lock = self._locks.setdefault(dataset.id, asyncio.Lock())
+        async with lock:
+            opened: tuple[str, RetrievalIndex] | None = self._open.get(dataset.id)
+            if opened is not None and opened[0] == key:
+                self._open.move_to_end(dataset.id)
+                return self._acquire(opened[1])
+            directory: Path = self.root / dataset.id / key
+            if not directory.exists():
+                directory = await self._build(dataset, directory)
+            index: RetrievalIndex = await asyncio.to_thread(RetrievalIndex, directory)
+            if opened is not None:
+                self._retire(opened[1])
+            self._open[dataset.id] = (directory.name, index)
+            self._open.move_to_end(dataset.id)
+            while len(self._open) > self.max_open:
+                _, (_, evicted) = self._open.popitem(last=False)
+                self._retire(evicted)
+            return self._acquire(index)
+
+    def release(self, index: RetrievalIndex) -> None:
+        self._users[index] -= 1
+        if not self._users[index]:
+            del self._users[index]
+            if index in self._retired:
+                self._retired.discard(index)
+                index.close()
+
+    def _acquire(self, index: RetrievalIndex) -> RetrievalIndex:
+        self._users[index] = self._users.get(index, 0) + 1
+        return index
+
+    def _retire(self, index: RetrievalIndex) -> None:
+        if index in self._users:
+            self._retired.add(index)
+        else:
+            index.close()
+
+    async def _build(self, dataset: Dataset, directory: Path) -> Path:
+        """Build the dataset's index into ``directory`` and return where it was built: a
+        uniquely named sibling when some file's ingestion is to be retried."""
+        ingestions: list[FileIngestion] = list(
+            await asyncio.gather(*(self.ingestion.ingest(file) for file in dataset.files))
+        )
+        if any(ingestion.status == Status.AWAITING_START for ingestion in ingestions):
+            directory = directory.with_name(f"{directory.name}-{uuid.uuid4().hex[:8]}")
+        chunks: list[tuple[str, str]] = []
+        async with AsyncSessionLocal() as session:
+            repo: FileIngestionRepository = FileIngestionRepository(session)
+            for file, ingestion in zip(dataset.files, ingestions):
+                if ingestion.status != Status.DONE:
+                    continue
+                stored: list[DocumentChunk] = await repo.get_chunks(ingestion.checksum)
+                chunks.extend((file["filename"], chunk.text) for chunk in stored)
+        await asyncio.to_thread(
+            build_index,
+            directory,
+            chunks,
+            self.vectors,
+            settings.retrieval_embedding_dim,
+            settings.retrieval_ivf_lists,
+        )
+        await asyncio.to_thread(_remove_stale, directory)
+        logger.info("Built retrieval index of %d chunks for dataset %s", len(chunks), dataset.id)
+        return directory
+
+
+def _remove_stale(directory: Path) -> None:
+    for other in directory.parent.iterdir():
+        if other != directory and not other.name.startswith("."):
+            shutil.rmtree(other, ignore_errors=True)
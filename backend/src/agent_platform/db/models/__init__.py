@@ -1,16 +1,36 @@
 from agent_platform.db.models.agent import Agent, AgentRun
-from agent_platform.db.models.benchmark import BenchmarkConfig, BenchmarkRun, BenchmarkRunRow
+from agent_platform.db.models.benchmark import (
+    BenchmarkComparison,
+    BenchmarkConfig,
+    BenchmarkRowCache,
+    BenchmarkRun,
+    BenchmarkRunRow,
+    BenchmarkSweep,
+    BenchmarkTask,
+)
 from agent_platform.db.models.dataset import (
     Dataset,
+    DocumentChunk,
+    FileIngestion,
     GroundTruth,
     PromptDataset,
     PromptDatasetRow,
     SMEComment,
 )
 from agent_platform.db.models.policy import PolicyAgent, PolicyRun, PolicyTool
-from agent_platform.db.models.reward import RewardAgent, RewardBreakdown, RewardResult
+from agent_platform.db.models.reward import (
+    RewardAgent,
+    RewardBreakdown,
+    RewardCacheEntry,
+    RewardResult,
+)
 from agent_platform.db.models.tool import Tool
-from agent_platform.db.models.trajectory import StepAnnotation, Trajectory, TrajectoryAnnotation
+from agent_platform.db.models.trajectory import (
+    StepAnnotation,
+    Trajectory,
+    TrajectoryAnnotation,
+    TrajectoryLshBucket,
+)
 
 __all__ = [
     "Agent",
@@ -21,16 +41,24 @@ __all__ = [
     "PromptDatasetRow",
     "GroundTruth",
     "SMEComment",
+    "FileIngestion",
+    "DocumentChunk",
     "BenchmarkRun",
     "BenchmarkRunRow",
     "BenchmarkConfig",
+    "BenchmarkComparison",
+    "BenchmarkRowCache",
+    "BenchmarkSweep",
+    "BenchmarkTask",
     "PolicyAgent",
     "PolicyRun",
     "PolicyTool",
     "Trajectory",
     "TrajectoryAnnotation",
+    "TrajectoryLshBucket",
     "StepAnnotation",
     "RewardAgent",
+    "RewardCacheEntry",
     "RewardResult",
     "RewardBreakdown",
 ]
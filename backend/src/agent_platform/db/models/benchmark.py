@@ -1,7 +1,18 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    cast,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from agent_platform.db.engine import Base
@@ -13,16 +24,44 @@ class BenchmarkRun(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     agent_id: Mapped[str] = mapped_column(String, nullable=False)
     prompt_dataset_id: Mapped[str] = mapped_column(String, nullable=False)
-    rows: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
     final_reward: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     status: Mapped[int] = mapped_column(Integer, nullable=False)
     started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    stats: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    sweep_id: Mapped[str | None] = mapped_column(
+        String, ForeignKey("benchmark_sweeps.id", ondelete="CASCADE"), nullable=True, index=True
+    )
+    agent_config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
+
+class BenchmarkSweep(Base):
+    __tablename__ = "benchmark_sweeps"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    agent_id: Mapped[str] = mapped_column(String, nullable=False)
+    prompt_dataset_id: Mapped[str] = mapped_column(String, nullable=False)
+    grid: Mapped[dict] = mapped_column(JSON, nullable=False)
+    config: Mapped[dict] = mapped_column(JSON, nullable=False)
+    max_llm_calls_per_minute: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    benchmark_run_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    status: Mapped[int] = mapped_column(Integer, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    comparison_id: Mapped[str | None] = mapped_column(
+        String, ForeignKey("benchmark_comparisons.id", ondelete="SET NULL"), nullable=True
+    )
+    stats: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
 
 class BenchmarkRunRow(Base):
     __tablename__ = "benchmark_run_rows"
+    __table_args__ = (
+        UniqueConstraint("benchmark_run_id", "prompt_dataset_row_id"),
+        Index("ix_benchmark_run_rows_run_sequence", "benchmark_run_id", "sequence"),
+        Index("ix_benchmark_run_rows_run_updated", "benchmark_run_id", "updated_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     benchmark_run_id: Mapped[str] = mapped_column(
@@ -33,6 +72,19 @@ class BenchmarkRunRow(Base):
     agent_run_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
     sme_comments: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
     status: Mapped[int] = mapped_column(Integer, nullable=False)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cache_key: Mapped[str | None] = mapped_column(String, nullable=True)
+    reused: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    metrics: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+# Finds the rows holding an agent run, for attaching rewards to trajectories.
+Index(
+    "ix_benchmark_run_rows_agent_run_ids",
+    cast(BenchmarkRunRow.agent_run_ids, JSONB),
+    postgresql_using="gin",
+)
 
 
 class BenchmarkConfig(Base):
@@ -45,3 +97,50 @@ class BenchmarkConfig(Base):
     runs_per_prompt: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     max_parallel_runs: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
     save_trajectories: Mapped[bool] = mapped_column(Integer, nullable=False, default=True)
+
+
+class BenchmarkComparison(Base):
+    __tablename__ = "benchmark_comparisons"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    key: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    benchmark_run_ids: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+    result: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class BenchmarkRowCache(Base):
+    __tablename__ = "benchmark_row_cache"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    benchmark_run_id: Mapped[str] = mapped_column(
+        String, ForeignKey("benchmark_runs.id", ondelete="CASCADE"), nullable=False
+    )
+    row: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class BenchmarkTask(Base):
+    __tablename__ = "benchmark_tasks"
+    __table_args__ = (
+        UniqueConstraint("benchmark_run_id", "prompt_dataset_row_id"),
+        Index("ix_benchmark_tasks_claim", "status", "lease_expires_at"),
+        Index("ix_benchmark_tasks_run_acknowledged", "benchmark_run_id", "acknowledged"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    benchmark_run_id: Mapped[str] = mapped_column(
+        String, ForeignKey("benchmark_runs.id", ondelete="CASCADE"), nullable=False
+    )
+    prompt_dataset_row_id: Mapped[str] = mapped_column(String, nullable=False)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    status: Mapped[int] = mapped_column(Integer, nullable=False)
+    checkpoint: Mapped[dict] = mapped_column(JSON, nullable=False)
+    worker_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    acknowledged: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
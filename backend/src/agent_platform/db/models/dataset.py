@@ -1,7 +1,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from agent_platform.db.engine import Base
@@ -36,6 +45,9 @@ class PromptDataset(Base):
 
 class PromptDatasetRow(Base):
     __tablename__ = "prompt_dataset_rows"
+    __table_args__ = (
+        Index("ix_prompt_dataset_rows_dataset_sequence", "prompt_dataset_id", "sequence"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     prompt_dataset_id: Mapped[str] = mapped_column(
@@ -55,7 +67,10 @@ class GroundTruth(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     prompt_dataset_row_id: Mapped[str] = mapped_column(
-        String, ForeignKey("prompt_dataset_rows.id", ondelete="CASCADE"), nullable=False
+        String,
+        ForeignKey("prompt_dataset_rows.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     dataset_id: Mapped[str | None] = mapped_column(String, nullable=True)
     text: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -66,8 +81,38 @@ class SMEComment(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     prompt_dataset_row_id: Mapped[str] = mapped_column(
-        String, ForeignKey("prompt_dataset_rows.id", ondelete="CASCADE"), nullable=False
+        String,
+        ForeignKey("prompt_dataset_rows.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     author_id: Mapped[str] = mapped_column(String, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class FileIngestion(Base):
+    """Outcome of extracting and chunking the file content with a given checksum."""
+
+    __tablename__ = "file_ingestions"
+
+    checksum: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[int] = mapped_column(Integer, nullable=False)
+    chunk_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+class DocumentChunk(Base):
+    __tablename__ = "document_chunks"
+    __table_args__ = (UniqueConstraint("checksum", "position"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    checksum: Mapped[str] = mapped_column(
+        String, ForeignKey("file_ingestions.checksum", ondelete="CASCADE"), nullable=False
+    )
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -1,6 +1,7 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import JSON, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -13,6 +14,10 @@ class RewardAgent(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     agent: Mapped[dict] = mapped_column(JSON, nullable=False)
     force_final_tool_call: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    comments: Mapped[list[dict]] = mapped_column(JSON, nullable=False, default=list)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
 
 
 class RewardResult(Base):
@@ -37,3 +42,12 @@ class RewardBreakdown(Base):
     policy_agent_id: Mapped[str] = mapped_column(String, nullable=False)
     score: Mapped[float] = mapped_column(Float, nullable=False)
     reasoning: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+class RewardCacheEntry(Base):
+    __tablename__ = "reward_cache"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    reward_agent_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    result: Mapped[dict] = mapped_column(JSON, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
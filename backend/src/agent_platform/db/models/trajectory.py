@@ -1,7 +1,20 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from agent_platform.db.engine import Base
@@ -9,17 +22,50 @@ from agent_platform.db.engine import Base
 
 class Trajectory(Base):
     __tablename__ = "trajectories"
+    __table_args__ = (
+        Index("ix_trajectories_created_at_id", "created_at", "id"),
+        Index("ix_trajectories_updated_at_id", "updated_at", "id"),
+        Index(
+            "ix_trajectories_unhashed",
+            "created_at",
+            "id",
+            postgresql_where=text("minhash IS NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     agent_id: Mapped[str] = mapped_column(String, nullable=False)
+    agent_run_id: Mapped[str | None] = mapped_column(String, nullable=True, unique=True)
     agent_run: Mapped[dict] = mapped_column(JSON, nullable=False)
     reward: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     annotation: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    # MinHash signature of the trajectory's text, and its highest estimated similarity to a
+    # trajectory hashed before it; both are null until the deduplication index reaches it.
+    minhash: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    duplicate_similarity: Mapped[float | None] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+
+class TrajectoryLshBucket(Base):
+    """A trajectory filed under one LSH band of its MinHash signature.
+
+    There is no foreign key, which would double the cost of filing a batch; entries of
+    trajectories that no longer exist are skipped when read.
+    """
+
+    __tablename__ = "trajectory_lsh_buckets"
+
+    band: Mapped[int] = mapped_column(Integer, primary_key=True)
+    bucket: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    trajectory_id: Mapped[str] = mapped_column(String, primary_key=True)
 
 
 class TrajectoryAnnotation(Base):
     __tablename__ = "trajectory_annotations"
+    __table_args__ = (UniqueConstraint("trajectory_id", "annotator_id"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     trajectory_id: Mapped[str] = mapped_column(
@@ -36,6 +82,7 @@ class TrajectoryAnnotation(Base):
 
 class StepAnnotation(Base):
     __tablename__ = "step_annotations"
+    __table_args__ = (UniqueConstraint("trajectory_annotation_id", "block_id"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     trajectory_annotation_id: Mapped[str] = mapped_column(
@@ -1,7 +1,20 @@
 from agent_platform.db.repository.agent import AgentRepository, AgentRunRepository
-from agent_platform.db.repository.benchmark import BenchmarkRunRepository
-from agent_platform.db.repository.dataset import DatasetRepository, PromptDatasetRepository
+from agent_platform.db.repository.benchmark import (
+    BenchmarkComparisonRepository,
+    BenchmarkRowCacheRepository,
+    BenchmarkRunRepository,
+    BenchmarkRunRowRepository,
+    BenchmarkSweepRepository,
+    BenchmarkTaskRepository,
+)
+from agent_platform.db.repository.dataset import (
+    DatasetRepository,
+    FileIngestionRepository,
+    PromptDatasetRepository,
+    PromptDatasetRowRepository,
+)
 from agent_platform.db.repository.policy import PolicyAgentRepository, PolicyRunRepository
+from agent_platform.db.repository.reward import RewardAgentRepository, RewardCacheRepository
 from agent_platform.db.repository.tool import ToolRepository
 from agent_platform.db.repository.trajectory import TrajectoryRepository
 
@@ -11,8 +24,17 @@ __all__ = [
     "ToolRepository",
     "DatasetRepository",
     "PromptDatasetRepository",
+    "PromptDatasetRowRepository",
+    "FileIngestionRepository",
     "BenchmarkRunRepository",
+    "BenchmarkRunRowRepository",
+    "BenchmarkComparisonRepository",
+    "BenchmarkRowCacheRepository",
+    "BenchmarkSweepRepository",
+    "BenchmarkTaskRepository",
     "PolicyAgentRepository",
     "PolicyRunRepository",
     "TrajectoryRepository",
+    "RewardAgentRepository",
+    "RewardCacheRepository",
 ]
@@ -1,8 +1,35 @@
-from sqlalchemy import select
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agent_platform.db.models.benchmark import BenchmarkRun
+from agent_platform.db.models.benchmark import (
+    BenchmarkComparison,
+    BenchmarkRowCache,
+    BenchmarkRun,
+    BenchmarkRunRow,
+    BenchmarkSweep,
+    BenchmarkTask,
+)
 from agent_platform.db.repository.base import BaseRepository
+from agent_platform.llm.executor import Status
+
+ENQUEUE_BATCH_SIZE: int = 1000
+ROW_BATCH_SIZE: int = 1000
+_ROW_FIELDS: tuple[str, ...] = (
+    "id",
+    "prompt_dataset_row_id",
+    "reward",
+    "agent_run_ids",
+    "sme_comments",
+    "status",
+    "sequence",
+    "cache_key",
+    "reused",
+    "metrics",
+)
 
 
 class BenchmarkRunRepository(BaseRepository[BenchmarkRun]):
@@ -38,3 +65,417 @@ class BenchmarkRunRepository(BaseRepository[BenchmarkRun]):
             query = query.limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def get_by_ids(self, ids: list[str]) -> list[BenchmarkRun]:
+        result = await self.session.execute(select(BenchmarkRun).where(BenchmarkRun.id.in_(ids)))
+        return list(result.scalars().all())
+
+    async def claim_for_resume(self, benchmark_run_id: str, idle_since: datetime) -> bool:
+        """Mark a failed run, or a running one that has made no progress and holds no task
+        lease since ``idle_since``, as running again; returns whether it was claimed.
+
+        The run is locked first and its unfinished rows are touched, so of several claims
+        of one run only the first succeeds.
+        """
+        status: int | None = (
+            await self.session.execute(
+                select(BenchmarkRun.status)
+                .where(BenchmarkRun.id == benchmark_run_id)
+                .with_for_update()
+            )
+        ).scalar_one_or_none()
+        if status == Status.RUNNING:
+            now: datetime = datetime.utcnow()
+            active = await self.session.execute(
+                select(
+                    exists().where(
+                        BenchmarkRunRow.benchmark_run_id == benchmark_run_id,
+                        BenchmarkRunRow.updated_at >= idle_since,
+                    )
+                    | exists().where(
+                        BenchmarkTask.benchmark_run_id == benchmark_run_id,
+                        BenchmarkTask.status == Status.RUNNING,
+                        BenchmarkTask.lease_expires_at >= now,
+                    )
+                )
+            )
+            if active.scalar_one():
+                return False
+        elif status != Status.ERROR:
+            return False
+        await self.session.execute(
+            update(BenchmarkRun)
+            .where(BenchmarkRun.id == benchmark_run_id)
+            .values(status=Status.RUNNING, finished_at=None)
+        )
+        await self.session.execute(
+            update(BenchmarkRunRow)
+            .where(
+                BenchmarkRunRow.benchmark_run_id == benchmark_run_id,
+                BenchmarkRunRow.status.not_in([Status.DONE, Status.SKIPPED]),
+            )
+            .values(updated_at=datetime.utcnow())
+        )
+        return True
+
+
+class BenchmarkRunRowRepository(BaseRepository[BenchmarkRunRow]):
+    """Rows of benchmark runs, read and written as the dicts the runner works with."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(BenchmarkRunRow, session)
+
+    async def upsert(self, benchmark_run_id: str, rows: list[dict]) -> None:
+        """Insert or update rows by prompt dataset row with batched multi-row statements."""
+        now: datetime = datetime.utcnow()
+        for start in range(0, len(rows), ROW_BATCH_SIZE):
+            values: list[dict] = [
+                {
+                    "benchmark_run_id": benchmark_run_id,
+                    "id": row["id"],
+                    "prompt_dataset_row_id": row["prompt_dataset_row_id"],
+                    "reward": row.get("reward"),
+                    "agent_run_ids": row.get("agent_run_ids", []),
+                    "sme_comments": row.get("sme_comments", []),
+                    "status": row["status"],
+                    "sequence": row.get("sequence", 0),
+                    "cache_key": row.get("cache_key"),
+                    "reused": row.get("reused", False),
+                    "metrics": row.get("metrics"),
+                    "updated_at": now,
+                }
+                for row in rows[start : start + ROW_BATCH_SIZE]
+            ]
+            statement = insert(BenchmarkRunRow).values(values)
+            await self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        BenchmarkRunRow.benchmark_run_id,
+                        BenchmarkRunRow.prompt_dataset_row_id,
+                    ],
+                    set_={
+                        field: statement.excluded[field]
+                        for field in (*_ROW_FIELDS, "updated_at")
+                        if field != "prompt_dataset_row_id"
+                    },
+                )
+            )
+
+    async def get_by_benchmark_run_id(
+        self,
+        benchmark_run_id: str,
+        statuses: tuple[int, ...] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[dict]:
+        query = (
+            select(BenchmarkRunRow)
+            .where(BenchmarkRunRow.benchmark_run_id == benchmark_run_id)
+            .order_by(BenchmarkRunRow.sequence, BenchmarkRunRow.prompt_dataset_row_id)
+        )
+        if statuses is not None:
+            query = query.where(BenchmarkRunRow.status.in_(statuses))
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return [_row_to_dict(row) for row in result.scalars().all()]
+
+    async def get_by_benchmark_run_ids(
+        self, benchmark_run_ids: list[str], statuses: tuple[int, ...] | None = None
+    ) -> dict[str, list[dict]]:
+        query = (
+            select(BenchmarkRunRow)
+            .where(BenchmarkRunRow.benchmark_run_id.in_(benchmark_run_ids))
+            .order_by(BenchmarkRunRow.sequence, BenchmarkRunRow.prompt_dataset_row_id)
+        )
+        if statuses is not None:
+            query = query.where(BenchmarkRunRow.status.in_(statuses))
+        result = await self.session.execute(query)
+        rows: dict[str, list[dict]] = {run_id: [] for run_id in benchmark_run_ids}
+        for row in result.scalars().all():
+            rows[row.benchmark_run_id].append(_row_to_dict(row))
+        return rows
+
+    async def get_updated_since(
+        self, benchmark_run_id: str, since: datetime | None, statuses: tuple[int, ...]
+    ) -> list[tuple[datetime, dict]]:
+        query = (
+            select(BenchmarkRunRow)
+            .where(
+                BenchmarkRunRow.benchmark_run_id == benchmark_run_id,
+                BenchmarkRunRow.status.in_(statuses),
+            )
+            .order_by(BenchmarkRunRow.updated_at)
+        )
+        if since is not None:
+            query = query.where(BenchmarkRunRow.updated_at >= since)
+        result = await self.session.execute(query)
+        return [(row.updated_at, _row_to_dict(row)) for row in result.scalars().all()]
+
+    async def count_by_benchmark_run_ids(
+        self, benchmark_run_ids: list[str], statuses: tuple[int, ...] | None = None
+    ) -> dict[str, int]:
+        query = (
+            select(BenchmarkRunRow.benchmark_run_id, func.count())
+            .where(BenchmarkRunRow.benchmark_run_id.in_(benchmark_run_ids))
+            .group_by(BenchmarkRunRow.benchmark_run_id)
+        )
+        if statuses is not None:
+            query = query.where(BenchmarkRunRow.status.in_(statuses))
+        result = await self.session.execute(query)
+        counts: dict[str, int] = {run_id: 0 for run_id in benchmark_run_ids}
+        counts.update({run_id: count for run_id, count in result.all()})
+        return counts
+
+    async def delete_by_prompt_dataset_row_ids(
+        self, benchmark_run_id: str, prompt_dataset_row_ids: list[str]
+    ) -> None:
+        for start in range(0, len(prompt_dataset_row_ids), ROW_BATCH_SIZE):
+            await self.session.execute(
+                delete(BenchmarkRunRow).where(
+                    BenchmarkRunRow.benchmark_run_id == benchmark_run_id,
+                    BenchmarkRunRow.prompt_dataset_row_id.in_(
+                        prompt_dataset_row_ids[start : start + ROW_BATCH_SIZE]
+                    ),
+                )
+            )
+
+
+class BenchmarkComparisonRepository(BaseRepository[BenchmarkComparison]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(BenchmarkComparison, session)
+
+    async def get_by_key(self, key: str) -> BenchmarkComparison | None:
+        result = await self.session.execute(
+            select(BenchmarkComparison).where(BenchmarkComparison.key == key)
+        )
+        return result.scalar_one_or_none()
+
+
+class BenchmarkSweepRepository(BaseRepository[BenchmarkSweep]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(BenchmarkSweep, session)
+
+
+class BenchmarkRowCacheRepository(BaseRepository[BenchmarkRowCache]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(BenchmarkRowCache, session)
+
+    async def get_by_keys(self, keys: list[str]) -> dict[str, dict]:
+        if not keys:
+            return {}
+        result = await self.session.execute(
+            select(BenchmarkRowCache.key, BenchmarkRowCache.row).where(
+                BenchmarkRowCache.key.in_(keys)
+            )
+        )
+        return {key: row for key, row in result.all()}
+
+    async def put(self, benchmark_run_id: str, rows: list[dict]) -> None:
+        """Cache rows under their ``cache_key``, replacing older entries."""
+        # A multi-row upsert may not touch the same key twice.
+        by_key: dict[str, dict] = {row["cache_key"]: row for row in rows}
+        items: list[tuple[str, dict]] = list(by_key.items())
+        for start in range(0, len(items), ROW_BATCH_SIZE):
+            statement = insert(BenchmarkRowCache).values(
+                [
+                    {"key": key, "benchmark_run_id": benchmark_run_id, "row": row}
+                    for key, row in items[start : start + ROW_BATCH_SIZE]
+                ]
+            )
+            await self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[BenchmarkRowCache.key],
+                    set_={
+                        "benchmark_run_id": statement.excluded.benchmark_run_id,
+                        "row": statement.excluded.row,
+                    },
+                )
+            )
+
+
+class BenchmarkTaskRepository(BaseRepository[BenchmarkTask]):
+    """Work queue of benchmark rows claimed by workers with ``FOR UPDATE SKIP LOCKED``."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(BenchmarkTask, session)
+
+    async def enqueue(self, benchmark_run_id: str, items: list[tuple[str, int, dict]]) -> None:
+        now: datetime = datetime.utcnow()
+        for start in range(0, len(items), ENQUEUE_BATCH_SIZE):
+            statement = insert(BenchmarkTask).values(
+                [
+                    {
+                        "id": str(uuid.uuid4()),
+                        "benchmark_run_id": benchmark_run_id,
+                        "prompt_dataset_row_id": prompt_dataset_row_id,
+                        "sequence": sequence,
+                        "status": Status.AWAITING_START,
+                        "checkpoint": checkpoint,
+                        "attempts": 0,
+                        "acknowledged": False,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for prompt_dataset_row_id, sequence, checkpoint in items[
+                        start : start + ENQUEUE_BATCH_SIZE
+                    ]
+                ]
+            )
+            # Tasks still owned by the queue are left alone; folded ones are requeued.
+            await self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        BenchmarkTask.benchmark_run_id,
+                        BenchmarkTask.prompt_dataset_row_id,
+                    ],
+                    set_={
+                        "status": Status.AWAITING_START,
+                        "checkpoint": statement.excluded.checkpoint,
+                        "worker_id": None,
+                        "lease_expires_at": None,
+                        "attempts": 0,
+                        "acknowledged": False,
+                        "updated_at": now,
+                    },
+                    where=BenchmarkTask.acknowledged.is_(True),
+                )
+            )
+
+    async def claim(
+        self, worker_id: str, limit: int, lease_seconds: int, max_attempts: int
+    ) -> list[BenchmarkTask]:
+        now: datetime = datetime.utcnow()
+        expired = and_(BenchmarkTask.status == Status.RUNNING, BenchmarkTask.lease_expires_at < now)
+        await self.session.execute(
+            update(BenchmarkTask)
+            .where(expired, BenchmarkTask.attempts >= max_attempts)
+            .values(status=Status.ERROR, worker_id=None, lease_expires_at=None, updated_at=now)
+        )
+        claimable = (
+            select(BenchmarkTask.id)
+            .where(or_(BenchmarkTask.status == Status.AWAITING_START, expired))
+            .order_by(BenchmarkTask.created_at, BenchmarkTask.sequence)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(BenchmarkTask)
+            .where(BenchmarkTask.id.in_(claimable.scalar_subquery()))
+            .values(
+                status=Status.RUNNING,
+                worker_id=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=BenchmarkTask.attempts + 1,
+                updated_at=now,
+            )
+            .returning(BenchmarkTask)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
+    async def heartbeat(self, worker_id: str, task_ids: list[str], lease_seconds: int) -> int:
+        if not task_ids:
+            return 0
+        now: datetime = datetime.utcnow()
+        result = await self.session.execute(
+            update(BenchmarkTask)
+            .where(
+                BenchmarkTask.id.in_(task_ids),
+                BenchmarkTask.worker_id == worker_id,
+                BenchmarkTask.status == Status.RUNNING,
+            )
+            .values(lease_expires_at=now + timedelta(seconds=lease_seconds), updated_at=now)
+        )
+        return result.rowcount
+
+    async def checkpoint(self, task_id: str, worker_id: str, row: dict, lease_seconds: int) -> bool:
+        now: datetime = datetime.utcnow()
+        values: dict = {"checkpoint": row, "updated_at": now}
+        if row["status"] in (Status.DONE, Status.ERROR):
+            values.update(status=row["status"], worker_id=None, lease_expires_at=None)
+        else:
+            values.update(lease_expires_at=now + timedelta(seconds=lease_seconds))
+        # Fenced on the lease owner so a worker that lost its lease cannot overwrite progress.
+        result = await self.session.execute(
+            update(BenchmarkTask)
+            .where(
+                BenchmarkTask.id == task_id,
+                BenchmarkTask.worker_id == worker_id,
+                BenchmarkTask.status == Status.RUNNING,
+            )
+            .values(**values)
+        )
+        return result.rowcount > 0
+
+    async def release(self, worker_id: str, task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+        await self.session.execute(
+            update(BenchmarkTask)
+            .where(
+                BenchmarkTask.id.in_(task_ids),
+                BenchmarkTask.worker_id == worker_id,
+                BenchmarkTask.status == Status.RUNNING,
+            )
+            .values(
+                status=Status.AWAITING_START,
+                worker_id=None,
+                lease_expires_at=None,
+                attempts=BenchmarkTask.attempts - 1,
+                updated_at=datetime.utcnow(),
+            )
+        )
+
+    async def cancel_pending(self, benchmark_run_id: str) -> int:
+        result = await self.session.execute(
+            delete(BenchmarkTask).where(
+                BenchmarkTask.benchmark_run_id == benchmark_run_id,
+                BenchmarkTask.status == Status.AWAITING_START,
+                BenchmarkTask.acknowledged.is_(False),
+            )
+        )
+        return result.rowcount
+
+    async def claim_finished(self, benchmark_run_id: str, limit: int = 500) -> list[BenchmarkTask]:
+        result = await self.session.execute(
+            select(BenchmarkTask)
+            .where(
+                BenchmarkTask.benchmark_run_id == benchmark_run_id,
+                BenchmarkTask.acknowledged.is_(False),
+                BenchmarkTask.status.in_([Status.DONE, Status.ERROR]),
+            )
+            .order_by(BenchmarkTask.sequence)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def acknowledge(self, task_ids: list[str]) -> None:
+        if not task_ids:
+            return
+        await self.session.execute(
+            update(BenchmarkTask).where(BenchmarkTask.id.in_(task_ids)).values(acknowledged=True)
+        )
+
+    async def count_open(self, benchmark_run_id: str) -> int:
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(BenchmarkTask)
+            .where(
+                BenchmarkTask.benchmark_run_id == benchmark_run_id,
+                BenchmarkTask.acknowledged.is_(False),
+            )
+        )
+        return int(result.scalar_one())
+
+
+def _row_to_dict(row: BenchmarkRunRow) -> dict:
+    result: dict = {field: getattr(row, field) for field in _ROW_FIELDS}
+    if result["reward"] is None:
+        del result["reward"]
+    if result["metrics"] is None:
+        del result["metrics"]
+    return result
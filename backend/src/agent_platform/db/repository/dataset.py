@@ -1,7 +1,18 @@
-from sqlalchemy import select
+from collections import defaultdict
+from collections.abc import AsyncIterator
+
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agent_platform.db.models.dataset import Dataset, PromptDataset
+from agent_platform.db.models.dataset import (
+    Dataset,
+    DocumentChunk,
+    FileIngestion,
+    GroundTruth,
+    PromptDataset,
+    PromptDatasetRow,
+    SMEComment,
+)
 from agent_platform.db.repository.base import BaseRepository
 
 
@@ -13,6 +24,31 @@ class DatasetRepository(BaseRepository[Dataset]):
         result = await self.session.execute(select(Dataset).where(Dataset.name == name))
         return result.scalar_one_or_none()
 
+    async def append_file(self, dataset_id: str, file: dict) -> dict | None:
+        """Add ``file`` to the dataset's files under a row lock so concurrent appends all land.
+
+        Returns the stored entry, which is an existing one when the dataset already has the
+        same content under the same filename, or ``None`` when the dataset does not exist.
+        """
+        result = await self.session.execute(
+            select(Dataset)
+            .where(Dataset.id == dataset_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        dataset: Dataset | None = result.scalar_one_or_none()
+        if dataset is None:
+            return None
+        for existing in dataset.files:
+            if (
+                existing.get("checksum") == file["checksum"]
+                and existing.get("filename") == file["filename"]
+            ):
+                return existing
+        dataset.files = [*dataset.files, file]
+        await self.session.flush()
+        return file
+
 
 class PromptDatasetRepository(BaseRepository[PromptDataset]):
     def __init__(self, session: AsyncSession):
@@ -21,3 +57,119 @@ class PromptDatasetRepository(BaseRepository[PromptDataset]):
     async def get_by_name(self, name: str) -> PromptDataset | None:
         result = await self.session.execute(select(PromptDataset).where(PromptDataset.name == name))
         return result.scalar_one_or_none()
+
+    async def get_for_update(self, id: str) -> PromptDataset | None:
+        result = await self.session.execute(
+            select(PromptDataset).where(PromptDataset.id == id).with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+
+class PromptDatasetRowRepository(BaseRepository[PromptDatasetRow]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(PromptDatasetRow, session)
+
+    async def get_by_prompt_dataset_id(self, prompt_dataset_id: str) -> list[PromptDatasetRow]:
+        result = await self.session.execute(
+            select(PromptDatasetRow)
+            .where(PromptDatasetRow.prompt_dataset_id == prompt_dataset_id)
+            .order_by(PromptDatasetRow.sequence)
+        )
+        return list(result.scalars().all())
+
+    async def get_page(
+        self, prompt_dataset_id: str, start_sequence: int, limit: int
+    ) -> list[PromptDatasetRow]:
+        result = await self.session.execute(
+            select(PromptDatasetRow)
+            .where(
+                PromptDatasetRow.prompt_dataset_id == prompt_dataset_id,
+                PromptDatasetRow.sequence >= start_sequence,
+            )
+            .order_by(PromptDatasetRow.sequence)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def stream_pages(
+        self, prompt_dataset_id: str, start_sequence: int, page_size: int
+    ) -> AsyncIterator[list[PromptDatasetRow]]:
+        """Rows in sequence order, fetched ``page_size`` at a time through a server-side cursor."""
+        result = await self.session.stream(
+            select(PromptDatasetRow)
+            .where(
+                PromptDatasetRow.prompt_dataset_id == prompt_dataset_id,
+                PromptDatasetRow.sequence >= start_sequence,
+            )
+            .order_by(PromptDatasetRow.sequence)
+            .execution_options(yield_per=page_size)
+        )
+        async for partition in result.scalars().partitions():
+            yield list(partition)
+
+    async def count_by_prompt_dataset_id(self, prompt_dataset_id: str) -> int:
+        result = await self.session.execute(
+            select(func.count())
+            .select_from(PromptDatasetRow)
+            .where(PromptDatasetRow.prompt_dataset_id == prompt_dataset_id)
+        )
+        return result.scalar_one()
+
+    async def get_ground_truths(self, row_ids: list[str]) -> dict[str, list[GroundTruth]]:
+        result = await self.session.execute(
+            select(GroundTruth)
+            .where(GroundTruth.prompt_dataset_row_id.in_(row_ids))
+            .order_by(GroundTruth.id)
+        )
+        ground_truths: dict[str, list[GroundTruth]] = defaultdict(list)
+        for ground_truth in result.scalars().all():
+            ground_truths[ground_truth.prompt_dataset_row_id].append(ground_truth)
+        return ground_truths
+
+    async def get_sme_comments(self, row_ids: list[str]) -> dict[str, list[SMEComment]]:
+        result = await self.session.execute(
+            select(SMEComment)
+            .where(SMEComment.prompt_dataset_row_id.in_(row_ids))
+            .order_by(SMEComment.created_at, SMEComment.id)
+        )
+        comments: dict[str, list[SMEComment]] = defaultdict(list)
+        for comment in result.scalars().all():
+            comments[comment.prompt_dataset_row_id].append(comment)
+        return comments
+
+
+class FileIngestionRepository(BaseRepository[FileIngestion]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(FileIngestion, session)
+
+    async def save(
+        self, checksum: str, version: str, status: int, chunks: list[str], error: str | None
+    ) -> FileIngestion:
+        """Record an ingestion outcome, replacing the chunks of any earlier one."""
+        await self.session.execute(delete(FileIngestion).where(FileIngestion.checksum == checksum))
+        ingestion: FileIngestion = FileIngestion(
+            checksum=checksum,
+            version=version,
+            status=status,
+            chunk_count=len(chunks),
+            error=error,
+        )
+        self.session.add(ingestion)
+        await self.session.flush()
+        if chunks:
+            await self.session.execute(
+                insert(DocumentChunk),
+                [
+                    {"checksum": checksum, "position": position, "text": text}
+                    for position, text in enumerate(chunks)
+                ],
+            )
+        return ingestion
+
+    async def get_chunks(self, checksum: str) -> list[DocumentChunk]:
+        result = await self.session.execute(
+            select(DocumentChunk)
+            .where(DocumentChunk.checksum == checksum)
+            .order_by(DocumentChunk.position)
+        )
+        return list(result.scalars().all())
@@ -13,6 +13,12 @@ class PolicyAgentRepository(BaseRepository[PolicyAgent]):
         result = await self.session.execute(select(PolicyAgent).where(PolicyAgent.name == name))
         return result.scalar_one_or_none()
 
+    async def get_by_ids(self, ids: list[str]) -> list[PolicyAgent]:
+        if not ids:
+            return []
+        result = await self.session.execute(select(PolicyAgent).where(PolicyAgent.id.in_(ids)))
+        return list(result.scalars().all())
+
 
 class PolicyRunRepository(BaseRepository[PolicyRun]):
     def __init__(self, session: AsyncSession):
@@ -0,0 +1,45 @@
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.db.models.reward import RewardAgent, RewardCacheEntry
+from agent_platform.db.repository.base import BaseRepository
+
+
+class RewardAgentRepository(BaseRepository[RewardAgent]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(RewardAgent, session)
+
+    async def get_by_ids(self, ids: list[str]) -> list[RewardAgent]:
+        if not ids:
+            return []
+        result = await self.session.execute(select(RewardAgent).where(RewardAgent.id.in_(ids)))
+        return list(result.scalars().all())
+
+
+class RewardCacheRepository(BaseRepository[RewardCacheEntry]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(RewardCacheEntry, session)
+
+    async def get_result(self, key: str) -> dict | None:
+        result = await self.session.execute(
+            select(RewardCacheEntry.result).where(RewardCacheEntry.key == key)
+        )
+        return result.scalar_one_or_none()
+
+    async def put(self, key: str, reward_agent_id: str, result: dict) -> None:
+        statement = insert(RewardCacheEntry).values(
+            key=key, reward_agent_id=reward_agent_id, result=result
+        )
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[RewardCacheEntry.key],
+                set_={"result": statement.excluded.result},
+            )
+        )
+
+    async def delete_by_reward_agent_id(self, reward_agent_id: str) -> int:
+        result = await self.session.execute(
+            delete(RewardCacheEntry).where(RewardCacheEntry.reward_agent_id == reward_agent_id)
+        )
+        return result.rowcount or 0
@@ -12,3 +12,9 @@ class ToolRepository(BaseRepository[Tool]):
     async def get_by_name(self, name: str) -> Tool | None:
         result = await self.session.execute(select(Tool).where(Tool.name == name))
         return result.scalar_one_or_none()
+
+    async def get_by_ids(self, ids: list[str]) -> list[Tool]:
+        if not ids:
+            return []
+        result = await self.session.execute(select(Tool).where(Tool.id.in_(ids)))
+        return list(result.scalars().all())
@@ -1,8 +1,59 @@
-from sqlalchemy import select
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    DateTime,
+    Float,
+    Integer,
+    LargeBinary,
+    Row,
+    SQLColumnExpression,
+    String,
+    Text,
+    any_,
+    case,
+    cast,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from agent_platform.db.models.trajectory import Trajectory
+from agent_platform.db.models.agent import AgentRun
+from agent_platform.db.models.benchmark import BenchmarkRunRow
+from agent_platform.db.models.trajectory import (
+    StepAnnotation,
+    Trajectory,
+    TrajectoryAnnotation,
+    TrajectoryLshBucket,
+)
 from agent_platform.db.repository.base import BaseRepository
+from agent_platform.llm.executor import Status
+
+# Rows of benchmark runs that scored an agent run; the reward of a trajectory is theirs.
+_REWARDED_ROW: ColumnElement[bool] = cast(BenchmarkRunRow.agent_run_ids, JSONB).contains(
+    func.jsonb_build_array(AgentRun.id)
+) & (func.json_typeof(BenchmarkRunRow.reward) == "object")
+
+
+def _timestamp_json(column: SQLColumnExpression[datetime | None]) -> ColumnElement[Any]:
+    """A naive UTC timestamp as the JSON form of a ``google.protobuf.Timestamp``."""
+    return case(
+        (column.is_(None), None),
+        else_=func.json_build_object(
+            "seconds",
+            cast(func.floor(func.extract("epoch", column)), BigInteger),
+            "nanos",
+            cast(func.mod(func.extract("microseconds", column), 1_000_000), BigInteger) * 1000,
+        ),
+    )
 
 
 class TrajectoryRepository(BaseRepository[Trajectory]):
@@ -23,3 +74,437 @@ class TrajectoryRepository(BaseRepository[Trajectory]):
             query = query.limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def get_by_ids(self, trajectory_ids: Sequence[str]) -> list[Trajectory]:
+        result = await self.session.execute(
+            select(Trajectory).where(
+                Trajectory.id == any_(literal(list(trajectory_ids), ARRAY(String)))
+            )
+        )
+        return list(result.scalars().all())
+
+    async def get_existing_ids(self, trajectory_ids: Sequence[str]) -> set[str]:
+        result = await self.session.execute(
+            select(Trajectory.id).where(
+                Trajectory.id == any_(literal(list(trajectory_ids), ARRAY(String)))
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_filtered(
+        self,
+        conditions: Sequence[ColumnElement[bool]],
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[Trajectory]:
+        query = select(Trajectory).where(*conditions).order_by(Trajectory.created_at.desc())
+        if offset:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_rows(
+        self,
+        columns: Sequence[SQLColumnExpression[Any]],
+        conditions: Sequence[ColumnElement[bool]],
+        batch_size: int,
+        order_by: Sequence[SQLColumnExpression[Any]] = (Trajectory.created_at, Trajectory.id),
+    ) -> AsyncIterator[Sequence[Row]]:
+        """``columns`` of the matching trajectories, in creation order by default, fetched
+        ``batch_size`` rows at a time through a server-side cursor."""
+        result = await self.session.stream(
+            select(*columns)
+            .where(*conditions)
+            .order_by(*order_by)
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def pending_agent_runs(
+        self, finished_after: datetime | None, settled_before: datetime, limit: int
+    ) -> list[Row]:
+        """Ids and finish times of completed agent runs that have no trajectory yet, oldest
+        first.
+
+        A run is ready once it finished before ``settled_before`` or a benchmark row holding
+        it has been rewarded, so runs being scored are not taken before their reward.
+        """
+        query = (
+            select(AgentRun.id, AgentRun.finished_at)
+            .where(
+                AgentRun.status.in_([Status.DONE, Status.ERROR]),
+                AgentRun.finished_at.is_not(None),
+                or_(
+                    AgentRun.finished_at < settled_before,
+                    exists().where(_REWARDED_ROW),
+                ),
+                ~exists().where(Trajectory.agent_run_id == AgentRun.id),
+            )
+            .order_by(AgentRun.finished_at)
+            .limit(limit)
+        )
+        if finished_after is not None:
+            query = query.where(AgentRun.finished_at >= finished_after)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def create_from_agent_runs(self, agent_run_ids: Sequence[str]) -> int:
+        """Insert one trajectory per agent run in a single statement, skipping runs that
+        already have one. The run JSON is built and copied by the database."""
+        now: datetime = datetime.utcnow()
+        reward = (
+            select(BenchmarkRunRow.reward)
+            .where(_REWARDED_ROW)
+            .order_by(BenchmarkRunRow.updated_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        agent_run = func.json_build_object(
+            "id",
+            AgentRun.id,
+            "agent_id",
+            AgentRun.agent_id,
+            "started_at",
+            _timestamp_json(AgentRun.started_at),
+            "finished_at",
+            _timestamp_json(AgentRun.finished_at),
+            "blocks",
+            AgentRun.blocks,
+            "force_final_tool_call",
+            AgentRun.force_final_tool_call,
+            "status",
+            AgentRun.status,
+            "dataset_ids",
+            func.to_json(AgentRun.dataset_ids),
+            "metrics",
+            AgentRun.metrics,
+            "error_message",
+            AgentRun.error_message,
+        )
+        statement = (
+            insert(Trajectory)
+            .from_select(
+                [
+                    "id",
+                    "agent_id",
+                    "agent_run_id",
+                    "agent_run",
+                    "reward",
+                    "created_at",
+                    "updated_at",
+                ],
+                select(
+                    cast(func.gen_random_uuid(), Trajectory.id.type),
+                    AgentRun.agent_id,
+                    AgentRun.id,
+                    agent_run,
+                    reward,
+                    literal(now, DateTime),
+                    literal(now, DateTime),
+                ).where(AgentRun.id.in_(agent_run_ids)),
+            )
+            .on_conflict_do_nothing(index_elements=[Trajectory.agent_run_id])
+        )
+        result = await self.session.execute(statement)
+        return result.rowcount
+
+    async def try_lock(self, key: int) -> bool:
+        """Take the transaction-level advisory lock ``key`` if no other session holds it."""
+        result = await self.session.execute(select(func.pg_try_advisory_xact_lock(key)))
+        return bool(result.scalar_one())
+
+    async def get_unhashed(self, limit: int) -> list[Row]:
+        """Ids and blocks of the oldest trajectories without a MinHash signature."""
+        result = await self.session.execute(
+            select(Trajectory.id, Trajectory.agent_run["blocks"].label("blocks"))
+            .where(Trajectory.minhash.is_(None))
+            .order_by(Trajectory.created_at, Trajectory.id)
+            .limit(limit)
+        )
+        return list(result.all())
+
+    async def get_bucket_members(self, keys: Sequence[tuple[int, int]]) -> list[Row]:
+        """``(band, bucket, trajectory_id)`` of everything filed under any ``(band, bucket)``."""
+        bands, buckets = zip(*keys, strict=True)
+        wanted = (
+            func.unnest(
+                literal(list(bands), ARRAY(Integer)), literal(list(buckets), ARRAY(BigInteger))
+            )
+            .table_valued("band", "bucket")
+            .render_derived()
+        )
+        result = await self.session.execute(
+            select(
+                TrajectoryLshBucket.band,
+                TrajectoryLshBucket.bucket,
+                TrajectoryLshBucket.trajectory_id,
+            ).join(
+                wanted,
+                (TrajectoryLshBucket.band == wanted.c.band)
+                & (TrajectoryLshBucket.bucket == wanted.c.bucket),
+            )
+        )
+        return list(result.all())
+
+    async def get_minhashes(self, trajectory_ids: Sequence[str]) -> dict[str, bytes]:
+        result = await self.session.execute(
+            select(Trajectory.id, Trajectory.minhash).where(
+                Trajectory.id == any_(literal(list(trajectory_ids), ARRAY(String)))
+            )
+        )
+        return {id: minhash for id, minhash in result.all() if minhash is not None}
+
+    async def save_minhashes(
+        self, hashed: Sequence[tuple[str, bytes, float]], buckets: Sequence[tuple[int, int, str]]
+    ) -> None:
+        """Store ``(trajectory_id, minhash, duplicate_similarity)`` and file the trajectories
+        under ``(band, bucket, trajectory_id)``, each in one statement over unnested arrays."""
+        ids, minhashes, similarities = zip(*hashed, strict=True)
+        values = (
+            func.unnest(
+                literal(list(ids), ARRAY(String)),
+                literal(list(minhashes), ARRAY(LargeBinary)),
+                literal(list(similarities), ARRAY(Float)),
+            )
+            .table_valued("id", "minhash", "similarity")
+            .render_derived()
+        )
+        await self.session.execute(
+            update(Trajectory)
+            .where(Trajectory.id == values.c.id)
+            .values(
+                minhash=values.c.minhash,
+                duplicate_similarity=values.c.similarity,
+                updated_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if buckets:
+            bands, bucket_keys, trajectory_ids = zip(*buckets, strict=True)
+            await self.session.execute(
+                insert(TrajectoryLshBucket)
+                .from_select(
+                    ["band", "bucket", "trajectory_id"],
+                    select(
+                        func.unnest(
+                            literal(list(bands), ARRAY(Integer)),
+                            literal(list(bucket_keys), ARRAY(BigInteger)),
+                            literal(list(trajectory_ids), ARRAY(String)),
+                        )
+                        .table_valued("band", "bucket", "trajectory_id")
+                        .render_derived()
+                    ),
+                )
+                .on_conflict_do_nothing()
+            )
+
+
+class TrajectoryAnnotationRepository(BaseRepository[TrajectoryAnnotation]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(TrajectoryAnnotation, session)
+
+    async def upsert_batch(
+        self,
+        annotator_id: str,
+        labels: Sequence[tuple[str, int, str]],
+        steps: Sequence[tuple[str, str, int, str]],
+    ) -> dict[str, dict]:
+        """Write an annotator's ``(trajectory_id, label, notes)`` and ``(trajectory_id,
+        block_id, label, feedback)`` annotations, later duplicates winning, and copy the
+        touched annotations onto their trajectories.
+
+        Every kind of row is written by one statement over unnested arrays, in trajectory
+        order so concurrent batches lock rows in the same order. Returns the new annotation
+        JSON of each touched trajectory.
+        """
+        now: datetime = datetime.utcnow()
+        by_trajectory: dict[str, tuple[int, str]] = {
+            trajectory_id: (label, notes) for trajectory_id, label, notes in labels
+        }
+        by_step: dict[tuple[str, str], tuple[int, str]] = {
+            (trajectory_id, block_id): (label, feedback)
+            for trajectory_id, block_id, label, feedback in steps
+        }
+        annotation_ids: dict[str, str] = {}
+        if by_trajectory:
+            trajectory_ids, label_values, notes = zip(
+                *((id, *by_trajectory[id]) for id in sorted(by_trajectory)), strict=True
+            )
+            rows = _unnest(
+                trajectory_id=(trajectory_ids, String),
+                label=(label_values, Integer),
+                notes=(notes, Text),
+            )
+            statement = insert(TrajectoryAnnotation).from_select(
+                self._annotation_columns,
+                self._annotation_values(annotator_id, rows.c.trajectory_id, now).add_columns(
+                    rows.c.label, rows.c.notes
+                ),
+            )
+            annotation_ids.update(
+                await self._upsert_annotations(
+                    statement,
+                    {
+                        "label": statement.excluded.label,
+                        "notes": statement.excluded.notes,
+                        "annotated_at": statement.excluded.annotated_at,
+                    },
+                )
+            )
+        unlabelled: list[str] = sorted(
+            {trajectory_id for trajectory_id, _ in by_step} - by_trajectory.keys()
+        )
+        if unlabelled:
+            rows = _unnest(trajectory_id=(unlabelled, String))
+            statement = insert(TrajectoryAnnotation).from_select(
+                self._annotation_columns,
+                self._annotation_values(annotator_id, rows.c.trajectory_id, now).add_columns(
+                    literal(0), literal(None, Text)
+                ),
+            )
+            # New annotations get TRAJECTORY_LABEL_UNSPECIFIED; existing labels and notes are
+            # kept, and the annotation is re-dated.
+            annotation_ids.update(
+                await self._upsert_annotations(
+                    statement, {"annotated_at": statement.excluded.annotated_at}
+                )
+            )
+
+        if by_step:
+            keys: list[tuple[str, str]] = sorted(by_step)
+            rows = _unnest(
+                trajectory_annotation_id=([annotation_ids[id] for id, _ in keys], String),
+                block_id=([block_id for _, block_id in keys], String),
+                label=([by_step[key][0] for key in keys], Integer),
+                feedback=([by_step[key][1] for key in keys], Text),
+            )
+            statement = insert(StepAnnotation).from_select(
+                ["id", "trajectory_annotation_id", "block_id", "label", "feedback"],
+                select(
+                    cast(func.gen_random_uuid(), String),
+                    rows.c.trajectory_annotation_id,
+                    rows.c.block_id,
+                    rows.c.label,
+                    rows.c.feedback,
+                ),
+            )
+            await self.session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[
+                        StepAnnotation.trajectory_annotation_id,
+                        StepAnnotation.block_id,
+                    ],
+                    set_={
+                        "label": statement.excluded.label,
+                        "feedback": statement.excluded.feedback,
+                    },
+                )
+            )
+            step_annotations = (
+                select(
+                    func.coalesce(
+                        func.json_agg(
+                            aggregate_order_by(
+                                func.json_build_object(
+                                    "block_id",
+                                    StepAnnotation.block_id,
+                                    "label",
+                                    StepAnnotation.label,
+                                    "feedback",
+                                    func.coalesce(StepAnnotation.feedback, ""),
+                                ),
+                                StepAnnotation.block_id,
+                            )
+                        ),
+                        func.json_build_array(),
+                    )
+                )
+                .where(StepAnnotation.trajectory_annotation_id == TrajectoryAnnotation.id)
+                .scalar_subquery()
+            )
+            await self.session.execute(
+                update(TrajectoryAnnotation)
+                .where(
+                    TrajectoryAnnotation.id
+                    == any_(literal(sorted({annotation_ids[id] for id, _ in keys}), ARRAY(String)))
+                )
+                .values(step_annotations=step_annotations)
+                .execution_options(synchronize_session=False)
+            )
+
+        if not annotation_ids:
+            return {}
+        # Core updates skip the ORM's onupdate, so updated_at is bumped explicitly for the
+        # analytics mirror.
+        result = await self.session.execute(
+            update(Trajectory)
+            .where(
+                Trajectory.id == TrajectoryAnnotation.trajectory_id,
+                TrajectoryAnnotation.id
+                == any_(literal(sorted(annotation_ids.values()), ARRAY(String))),
+            )
+            .values(
+                annotation=func.json_build_object(
+                    "annotator_id",
+                    TrajectoryAnnotation.annotator_id,
+                    "label",
+                    TrajectoryAnnotation.label,
+                    "notes",
+                    func.coalesce(TrajectoryAnnotation.notes, ""),
+                    "step_annotations",
+                    TrajectoryAnnotation.step_annotations,
+                    "annotated_at",
+                    _timestamp_json(TrajectoryAnnotation.annotated_at),
+                ),
+                updated_at=now,
+            )
+            .returning(Trajectory.id, Trajectory.annotation)
+            .execution_options(synchronize_session=False)
+        )
+        return {id: annotation for id, annotation in result.all()}
+
+    _annotation_columns: list[str] = [
+        "id",
+        "trajectory_id",
+        "annotator_id",
+        "step_annotations",
+        "annotated_at",
+        "label",
+        "notes",
+    ]
+
+    @staticmethod
+    def _annotation_values(
+        annotator_id: str, trajectory_id: ColumnElement[str], now: datetime
+    ) -> Any:
+        return select(
+            cast(func.gen_random_uuid(), String),
+            trajectory_id,
+            literal(annotator_id, String),
+            func.json_build_array(),
+            literal(now, DateTime),
+        )
+
+    async def _upsert_annotations(self, statement: Any, set_: dict[str, Any]) -> dict[str, str]:
+        result = await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    TrajectoryAnnotation.trajectory_id,
+                    TrajectoryAnnotation.annotator_id,
+                ],
+                set_=set_,
+            ).returning(TrajectoryAnnotation.trajectory_id, TrajectoryAnnotation.id)
+        )
+        return {trajectory_id: id for trajectory_id, id in result.all()}
+
+
+def _unnest(**columns: tuple[Sequence[Any], Any]) -> Any:
+    """A table of the given equal-length ``(values, type)`` columns, bound as one array each."""
+    return (
+        func.unnest(*(literal(list(values), ARRAY(type)) for values, type in columns.values()))
+        .table_valued(*columns)
+        .render_derived()
+    )
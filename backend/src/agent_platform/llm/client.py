@@ -1,12 +1,25 @@
 from collections.abc import AsyncIterator
 from typing import Any
 
-from anthropic import AsyncAnthropic
+from anthropic import APIStatusError, APITimeoutError, AsyncAnthropic, RateLimitError
 from anthropic._types import Omit
 from anthropic.types import MessageParam, ToolParam
 
 from agent_platform.config import settings
 
+OVERLOADED_STATUS_CODES: frozenset[int] = frozenset({503, 529})
+
+
+def classify_error(error: Exception) -> str:
+    """Coarse error type used to back off on rate limiting and overload."""
+    if isinstance(error, RateLimitError):
+        return "rate_limited"
+    if isinstance(error, APIStatusError) and error.status_code in OVERLOADED_STATUS_CODES:
+        return "overloaded"
+    if isinstance(error, APITimeoutError | TimeoutError):
+        return "timeout"
+    return "error"
+
 
 class AnthropicClient:
     def __init__(self, api_key: str | None = None) -> None:
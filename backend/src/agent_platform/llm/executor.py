@@ -17,13 +17,15 @@ from anthropic.types import (
 )
 
 from agent_platform.db.models.agent import AgentRun
-from agent_platform.llm.client import AnthropicClient
+from agent_platform.llm.client import AnthropicClient, classify_error
 from agent_platform.models.agent import AgentModel
 from agent_platform.models.agent_config import AgentConfig
 from agent_platform.tools.base import Tool
 from agent_platform.tools.registry import ToolRegistry
 
 if TYPE_CHECKING:
+    from agent_platform.datasets.retrieval import DatasetRetriever
+
     ContentBlockDelta = TextDelta | InputJSONDelta | CitationsDelta | ThinkingDelta | SignatureDelta
 
 
@@ -32,12 +34,19 @@ class Status:
     RUNNING = 1
     DONE = 2
     ERROR = 3
+    SKIPPED = 4
 
 
 class AgentExecutor:
-    def __init__(self, llm_client: AnthropicClient, tool_registry: ToolRegistry):
+    def __init__(
+        self,
+        llm_client: AnthropicClient,
+        tool_registry: ToolRegistry,
+        retriever: "DatasetRetriever | None" = None,
+    ):
         self.llm_client = llm_client
         self.tool_registry = tool_registry
+        self.retriever = retriever
 
     async def run_agent(
         self,
@@ -49,9 +58,13 @@ class AgentExecutor:
         started_at: datetime = datetime.utcnow()
         blocks: list[dict] = []
         tool_call_count: int = 0
+        retrieved_chunks: int = 0
         status: int = Status.RUNNING
 
         try:
+            system_prompt, retrieved_chunks = await self._system_prompt(
+                agent, input_text, dataset_ids
+            )
             tools: list[Tool] = await self.tool_registry.get_tools(agent.tool_ids)
             tool_params: list[ToolParam] = [self._tool_to_param(tool) for tool in tools]
 
@@ -74,7 +87,7 @@ class AgentExecutor:
                     tools=tool_params if tool_params else None,
                     max_tokens=max_tokens,
                     temperature=temperature,
-                    system=agent.system_prompt,
+                    system=system_prompt,
                 )
 
                 assistant_content: str = ""
@@ -153,8 +166,10 @@ class AgentExecutor:
         except Exception as e:
             status = Status.ERROR
             error_message: str | None = str(e)
+            error_type: str | None = classify_error(e)
         else:
             error_message = None
+            error_type = None
 
         finished_at: datetime = datetime.utcnow()
 
@@ -168,6 +183,8 @@ class AgentExecutor:
             dataset_ids=dataset_ids or [],
             metrics={
                 "tool_call_count": tool_call_count,
+                **({"retrieved_chunks": retrieved_chunks} if retrieved_chunks else {}),
+                **({"error_type": error_type} if error_type else {}),
             },
             error_message=error_message if status == Status.ERROR else None,
         )
@@ -183,6 +200,7 @@ class AgentExecutor:
         sequence: int = 0
 
         try:
+            system_prompt, _ = await self._system_prompt(agent, input_text, dataset_ids)
             tools: list[Tool] = await self.tool_registry.get_tools(agent.tool_ids)
             tool_params: list[ToolParam] = [self._tool_to_param(tool) for tool in tools]
 
@@ -210,7 +228,7 @@ class AgentExecutor:
                 tools=tool_params if tool_params else None,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=agent.system_prompt,
+                system=system_prompt,
             ):
                 if isinstance(event, ContentBlockStartEvent):
                     if isinstance(event.content_block, ThinkingBlock):
@@ -276,6 +294,18 @@ class AgentExecutor:
             }
         }
 
+    async def _system_prompt(
+        self, agent: AgentModel, input_text: str, dataset_ids: list[str] | None
+    ) -> tuple[str, int]:
+        """The agent's system prompt followed by the dataset chunks most relevant to the input,
+        and how many chunks were added."""
+        if not dataset_ids or self.retriever is None:
+            return agent.system_prompt, 0
+        context, chunks = await self.retriever.context(dataset_ids, input_text)
+        if not context:
+            return agent.system_prompt, 0
+        return f"{agent.system_prompt}\n\n{context}", chunks
+
     def _tool_to_param(self, tool: Tool) -> ToolParam:
         return {
             "name": tool.name,
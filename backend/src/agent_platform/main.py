@@ -1,24 +1,54 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
-from starlette.routing import Mount
+from starlette.routing import BaseRoute, Mount, Route
 
+from agent_platform.benchmarks.runner import BenchmarkRunner
 from agent_platform.config import settings
+from agent_platform.datasets.blobs import BlobStore
+from agent_platform.datasets.downloads import DOWNLOAD_PATH, FileDownloads
+from agent_platform.datasets.ingestion import IngestionPipeline
+from agent_platform.datasets.retrieval import DatasetRetriever
 from agent_platform.llm.client import AnthropicClient
 from agent_platform.llm.executor import AgentExecutor
 from agent_platform.services.agent import AgentServiceImpl
 from agent_platform.services.tool import ToolServiceImpl
 from agent_platform.tools.registry import ToolRegistry
+from agent_platform.trajectories.pipeline import TrajectoryPipeline
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    if not settings.trajectory_pipeline:
+        yield
+        return
+    pipeline: TrajectoryPipeline = TrajectoryPipeline()
+    task: asyncio.Task = asyncio.create_task(pipeline.run())
+    try:
+        yield
+    finally:
+        pipeline.stop()
+        await task
 
 
 def create_app() -> Starlette:
     llm_client: AnthropicClient = AnthropicClient()
     tool_registry: ToolRegistry = ToolRegistry()
-    executor: AgentExecutor = AgentExecutor(llm_client, tool_registry)
+    blob_store: BlobStore = BlobStore()
+    ingestion: IngestionPipeline = IngestionPipeline(blob_store)
+    executor: AgentExecutor = AgentExecutor(llm_client, tool_registry, DatasetRetriever(ingestion))
+
+    benchmark_runner: BenchmarkRunner = BenchmarkRunner(executor)
 
     agent_service: AgentServiceImpl = AgentServiceImpl(executor)
     tool_service: ToolServiceImpl = ToolServiceImpl()
 
-    routes: list[Mount] = []
+    routes: list[BaseRoute] = [
+        Route(DOWNLOAD_PATH, FileDownloads(blob_store).download, methods=["GET", "HEAD"]),
+    ]
 
     try:
         from agent_platform.service.v1.agent_service_connect import (
@@ -45,8 +75,8 @@ def create_app() -> Starlette:
         from agent_platform.services.trajectory import TrajectoryServiceImpl
 
         policy_service = PolicyServiceImpl()
-        dataset_service = DatasetServiceImpl()
-        benchmark_service = BenchmarkServiceImpl()
+        dataset_service = DatasetServiceImpl(blob_store, ingestion)
+        benchmark_service = BenchmarkServiceImpl(benchmark_runner)
         trajectory_service = TrajectoryServiceImpl()
 
         agent_app = AgentServiceASGIApplication(agent_service)
@@ -73,13 +103,14 @@ def create_app() -> Starlette:
             f"Could not import generated connect code: {e}. Make sure to run 'pixi run proto' first."
         )
 
-    app = Starlette(routes=routes)
+    app = Starlette(routes=routes, lifespan=lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Accept-Ranges", "Content-Disposition", "Content-Range", "ETag"],
     )
 
     return app
@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import json
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from agent_platform.config import settings
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.policy import PolicyAgent
+from agent_platform.db.models.reward import RewardAgent
+from agent_platform.db.repository.reward import RewardCacheRepository
+
+
+class RewardCache:
+    """Reward results stored in the ``reward_cache`` table behind an in-memory LRU tier.
+
+    Keys hash the judged output together with a content version of the reward agent and
+    policy definitions, so editing either makes old entries unreachable in every process;
+    ``UpdateRewardAgent`` also deletes the reward agent's stored entries and has ``forget``
+    drop them from memory so they do not linger.
+    Concurrent lookups of the same key share one evaluation, which covers identical outputs
+    among the ``runs_per_prompt`` runs of a row.
+    """
+
+    def __init__(self, max_entries: int = settings.reward_cache_max_entries) -> None:
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, tuple[str, dict]] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[dict]] = {}
+
+    async def get_or_evaluate(
+        self, key: str, reward_agent_id: str, evaluate: Callable[[], Awaitable[dict]]
+    ) -> tuple[dict, bool]:
+        """Return the cached result for ``key`` or store ``evaluate()``'s, and whether it hit."""
+        cached: dict | None = await self.get(key, reward_agent_id)
+        if cached is not None:
+            return cached, True
+
+        # Another lookup may have evaluated the key while ours waited for Postgres.
+        if key in self._entries:
+            return self._entries[key][1], True
+        pending: asyncio.Future[dict] | None = self._pending.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending), True
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            except Exception:
+                pass  # The other evaluation failed; try again ourselves.
+
+        task: asyncio.Future[dict] = asyncio.ensure_future(evaluate())
+        self._pending[key] = task
+        try:
+            result: dict = await task
+            self._remember(key, reward_agent_id, result)
+        finally:
+            if self._pending.get(key) is task:
+                del self._pending[key]
+        await self.put(key, reward_agent_id, result)
+        return result, False
+
+    async def get(self, key: str, reward_agent_id: str) -> dict | None:
+        entry: tuple[str, dict] | None = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[1]
+        async with AsyncSessionLocal() as session:
+            result: dict | None = await RewardCacheRepository(session).get_result(key)
+        if result is None:
+            return None
+        self._remember(key, reward_agent_id, result)
+        return result
+
+    async def put(self, key: str, reward_agent_id: str, result: dict) -> None:
+        async with AsyncSessionLocal() as session:
+            await RewardCacheRepository(session).put(key, reward_agent_id, result)
+            await session.commit()
+        self._remember(key, reward_agent_id, result)
+
+    def forget(self, reward_agent_id: str) -> None:
+        for key in [key for key, (owner, _) in self._entries.items() if owner == reward_agent_id]:
+            del self._entries[key]
+
+    def _remember(self, key: str, reward_agent_id: str, result: dict) -> None:
+        self._entries[key] = (reward_agent_id, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+def normalize_output(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def definition_version(reward_agent: RewardAgent | None, policies: list[PolicyAgent]) -> str:
+    """Content hash of everything that shapes a judgement besides the judged run."""
+    definition: dict = {
+        "reward_agent": {
+            "agent": reward_agent.agent,
+            "force_final_tool_call": reward_agent.force_final_tool_call,
+            "comments": reward_agent.comments,
+        }
+        if reward_agent is not None
+        else None,
+        "policies": [
+            {
+                "id": policy.id,
+                "name": policy.name,
+                "system_prompt": policy.system_prompt,
+                "policy_tool": policy.policy_tool,
+                "output_schema": policy.output_schema,
+            }
+            for policy in policies
+        ],
+    }
+    return hashlib.sha256(json.dumps(definition, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def reward_cache_key(prompt: str, output: str, ground_truths: list[dict], version: str) -> str:
+    payload: str = json.dumps(
+        [normalize_output(prompt), normalize_output(output), ground_truths, version],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
@@ -0,0 +1,312 @@
+import asyncio
+import json
+import logging
+import re
+import time
+import uuid
+from collections.abc import Sequence
+from typing import Any
+
+from agent_platform.benchmarks.aggregation import duration
+from agent_platform.config import settings
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.agent import AgentRun
+from agent_platform.db.models.dataset import PromptDatasetRow
+from agent_platform.db.models.policy import PolicyAgent
+from agent_platform.db.models.reward import RewardAgent
+from agent_platform.db.repository.policy import PolicyAgentRepository
+from agent_platform.db.repository.reward import RewardAgentRepository
+from agent_platform.llm.executor import AgentExecutor, Status
+from agent_platform.models.agent import AgentModel
+from agent_platform.models.agent_config import AgentConfig
+from agent_platform.rewards.cache import RewardCache, definition_version, reward_cache_key
+from agent_platform.rewards.scoring import LOCAL_SCORERS, score_batch
+
+logger = logging.getLogger(__name__)
+
+_JSON_OBJECT: re.Pattern[str] = re.compile(r"\{.*\}", re.DOTALL)
+
+GRADING_INSTRUCTIONS: str = (
+    "Grade the agent's response. Reply with only a JSON object of the form "
+    '{"score": <number between 0 and 1>, "reasoning": "<one paragraph>"}.'
+)
+
+
+class RewardEvaluator:
+    """Scores agent runs against the agent's policy agents with LLM judges.
+
+    Every policy is judged by the row's reward agent with the policy's prompt added to its
+    system prompt; the judges of one agent run execute concurrently, at most
+    ``max_parallel_policies`` at a time, so scoring takes about as long as the slowest
+    policy. Without policies the reward agent judges the run on its own. Policy and reward
+    agent definitions are read for every evaluation, so edits apply to runs in progress and
+    their results are cached under the new definitions. With a ``cache``, runs whose final
+    output was already judged for the same prompt, ground truths and definitions reuse
+    that judgement. For agents without policies, ``local_scorers`` first compare the final
+    output with the row's text ground truths; runs they decide skip the reward agent's LLM
+    judge. Policy judges always run. Local scoring is batched over all runs that finish
+    scoring in the same event loop iteration.
+    """
+
+    def __init__(
+        self,
+        executor: AgentExecutor,
+        policy_agent_ids: list[str],
+        max_parallel_policies: int = settings.reward_max_parallel_policies,
+        cache: RewardCache | None = None,
+        local_scorers: Sequence[str] = tuple(LOCAL_SCORERS),
+    ) -> None:
+        self.executor: AgentExecutor = executor
+        self.policy_agent_ids: list[str] = list(policy_agent_ids)
+        self.max_parallel_policies: int = max(1, max_parallel_policies)
+        self.cache: RewardCache | None = cache
+        self.local_scorers: list[str] = list(local_scorers)
+        self._local_batch: list[tuple[str, list[dict], asyncio.Future]] = []
+
+    async def evaluate(
+        self, agent_run: AgentRun, row: PromptDatasetRow
+    ) -> tuple[dict, bool] | None:
+        """Return a ``RewardResult`` dict for ``agent_run`` and whether it was scored locally.
+
+        Returns ``None`` if nothing can judge the run.
+        """
+        started: float = time.monotonic()
+        reward_agent, policies = await self._load_definitions(row.reward_agent_id)
+        if self.local_scorers and not policies:
+            local: tuple[float, str] | None = await self._score_locally(
+                final_text(agent_run.blocks), row.ground_truths
+            )
+            if local is not None:
+                return {
+                    "id": str(uuid.uuid4()),
+                    "score": local[0],
+                    "reasoning": local[1],
+                    "policy_agent_ids": [],
+                    "latency": duration(time.monotonic() - started),
+                    "tool_call_count": 0,
+                    "breakdown": [],
+                }, True
+
+        if reward_agent is None and not policies:
+            return None
+
+        if self.cache is None:
+            return await self._evaluate(agent_run, row, reward_agent, policies, started), False
+
+        key: str = reward_cache_key(
+            row.prompt,
+            final_text(agent_run.blocks),
+            row.ground_truths,
+            definition_version(reward_agent, policies),
+        )
+        reward, hit = await self.cache.get_or_evaluate(
+            key,
+            row.reward_agent_id,
+            lambda: self._evaluate(agent_run, row, reward_agent, policies, started),
+        )
+        if not hit:
+            return reward, False
+        logger.debug("Reused cached reward for agent run %s", agent_run.id)
+        return {
+            **reward,
+            "id": str(uuid.uuid4()),
+            "latency": duration(time.monotonic() - started),
+        }, False
+
+    async def _score_locally(
+        self, output: str, ground_truths: list[dict]
+    ) -> tuple[float, str] | None:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._local_batch.append((output, ground_truths, future))
+        if len(self._local_batch) == 1:
+            asyncio.get_running_loop().call_soon(self._flush_local_batch)
+        return await future
+
+    def _flush_local_batch(self) -> None:
+        batch: list[tuple[str, list[dict], asyncio.Future]] = self._local_batch
+        self._local_batch = []
+        results: list[tuple[float, str] | None]
+        try:
+            results = score_batch(
+                [output for output, _, _ in batch],
+                [ground_truths for _, ground_truths, _ in batch],
+                self.local_scorers,
+            )
+        except Exception as e:
+            logger.warning("Local scoring of %d runs failed: %s", len(batch), e)
+            results = [None] * len(batch)
+        for (_, _, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+    async def _evaluate(
+        self,
+        agent_run: AgentRun,
+        row: PromptDatasetRow,
+        reward_agent: RewardAgent | None,
+        policies: list[PolicyAgent],
+        started: float,
+    ) -> dict:
+        transcript: str = render_transcript(agent_run.blocks, row.ground_truths)
+        # Without policies the reward agent judges the run once on its own.
+        judges: list[PolicyAgent | None] = list(policies) if policies else [None]
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.max_parallel_policies)
+        judged: list[tuple[float, str, int] | BaseException] = await asyncio.gather(
+            *(self._judge(semaphore, reward_agent, policy, transcript) for policy in judges),
+            return_exceptions=True,
+        )
+
+        breakdown: list[dict[str, Any]] = []
+        reasoning: list[str] = []
+        scores: list[float] = []
+        tool_call_count: int = 0
+        for policy, outcome in zip(judges, judged, strict=True):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            name: str = policy.name if policy is not None else "reward"
+            if isinstance(outcome, BaseException):
+                logger.warning(
+                    "Reward evaluation of %s by %s failed: %s", agent_run.id, name, outcome
+                )
+                reasoning.append(f"{name}: evaluation failed ({outcome})")
+                continue
+            score, text, tool_calls = outcome
+            scores.append(score)
+            tool_call_count += tool_calls
+            reasoning.append(f"{name}: {text}" if policies else text)
+            if policy is not None:
+                breakdown.append({"policy_agent_id": policy.id, "score": score, "reasoning": text})
+        if not scores:
+            raise ValueError(f"No judge could score agent run {agent_run.id}")
+
+        return {
+            "id": str(uuid.uuid4()),
+            "score": sum(scores) / len(scores),
+            "reasoning": "\n".join(reasoning),
+            "policy_agent_ids": [policy.id for policy in policies],
+            "latency": duration(time.monotonic() - started),
+            "tool_call_count": tool_call_count,
+            "breakdown": breakdown,
+        }
+
+    async def _judge(
+        self,
+        semaphore: asyncio.Semaphore,
+        reward_agent: RewardAgent | None,
+        policy: PolicyAgent | None,
+        transcript: str,
+    ) -> tuple[float, str, int]:
+        judge: AgentModel = judge_model(reward_agent, policy)
+        async with semaphore:
+            judge_run: AgentRun = await self.executor.run_agent(judge, transcript)
+        if judge_run.status != Status.DONE:
+            raise ValueError(judge_run.error_message or "judge run failed")
+        score, reasoning = parse_judgement(final_text(judge_run.blocks))
+        return score, reasoning, int((judge_run.metrics or {}).get("tool_call_count", 0))
+
+    async def _load_definitions(
+        self, reward_agent_id: str
+    ) -> tuple[RewardAgent | None, list[PolicyAgent]]:
+        async with AsyncSessionLocal() as session:
+            reward_agent: RewardAgent | None = await RewardAgentRepository(session).get_by_id(
+                reward_agent_id
+            )
+            by_id: dict[str, PolicyAgent] = {
+                policy.id: policy
+                for policy in await PolicyAgentRepository(session).get_by_ids(self.policy_agent_ids)
+            }
+        return reward_agent, [by_id[id] for id in self.policy_agent_ids if id in by_id]
+
+
+def judge_model(reward_agent: RewardAgent | None, policy: PolicyAgent | None) -> AgentModel:
+    agent: dict = reward_agent.agent if reward_agent is not None else {}
+    system_prompt: list[str] = [agent.get("system_prompt") or ""]
+    if reward_agent is not None and reward_agent.comments:
+        system_prompt.append(
+            "Reviewer guidance:\n"
+            + "\n".join(f"- {comment['content']}" for comment in reward_agent.comments)
+        )
+    if policy is not None:
+        system_prompt.append(f"Policy {policy.name}:\n{policy.system_prompt}")
+        policy_content: str = (policy.policy_tool or {}).get("policy_content") or ""
+        if policy_content:
+            system_prompt.append(policy_content)
+    system_prompt.append(GRADING_INSTRUCTIONS)
+    return AgentModel(
+        id=agent.get("id") or (reward_agent.id if reward_agent is not None else ""),
+        name=agent.get("name") or "reward",
+        task=agent.get("task") or "Grade agent responses",
+        tool_ids=list(agent.get("tool_ids") or []),
+        system_prompt="\n\n".join(part for part in system_prompt if part),
+        policy_agent_ids=[],
+        config=AgentConfig.from_dict(agent.get("config") or {}),
+    )
+
+
+def render_transcript(blocks: list[dict], ground_truths: list[dict]) -> str:
+    parts: list[str] = []
+    for block in blocks:
+        if "user_input" in block:
+            parts.append(f"User: {block['user_input']['text']}")
+        elif "assistant_message" in block:
+            parts.append(f"Agent: {block['assistant_message']['text']}")
+        elif "tool_call" in block:
+            tool_call: dict = block["tool_call"]
+            parts.append(
+                f"Tool call {tool_call['tool_id']}: "
+                f"{json.dumps(tool_call.get('input'), default=str)} -> "
+                f"{json.dumps(tool_call.get('output'), default=str)}"
+            )
+    for ground_truth in ground_truths:
+        parts.append(f"Expected answer: {ground_truth.get('text', ground_truth)}")
+    return "\n\n".join(parts)
+
+
+def final_text(blocks: list[dict]) -> str:
+    for block in reversed(blocks):
+        if "assistant_message" in block:
+            return block["assistant_message"]["text"]
+    return ""
+
+
+def parse_judgement(text: str) -> tuple[float, str]:
+    match: re.Match[str] | None = _JSON_OBJECT.search(text)
+    if match is None:
+        raise ValueError(f"Judge reply is not JSON: {text[:200]!r}")
+    judgement: dict = json.loads(match.group(0))
+    score: float = min(1.0, max(0.0, float(judgement["score"])))
+    return score, str(judgement.get("reasoning", ""))
+
+
+def combine_rewards(rewards: list[tuple[dict, int]]) -> dict | None:
+    """Row-level ``RewardResult`` over ``(reward, runs)`` pairs of a row's agent runs.
+
+    ``runs`` weights a reward that already stands for several runs, e.g. the reward of a
+    checkpointed row; latency and tool calls are totals and add up unweighted.
+    """
+    total_runs: int = sum(runs for _, runs in rewards)
+    if not total_runs:
+        return None
+    policy_scores: dict[str, list[float]] = {}
+    for reward, runs in rewards:
+        for breakdown in reward["breakdown"]:
+            totals: list[float] = policy_scores.setdefault(breakdown["policy_agent_id"], [0.0, 0])
+            totals[0] += breakdown["score"] * runs
+            totals[1] += runs
+    latency: float = sum(
+        reward["latency"]["seconds"] + reward["latency"]["nanos"] / 1e9 for reward, _ in rewards
+    )
+    return {
+        "id": str(uuid.uuid4()),
+        "score": sum(reward["score"] * runs for reward, runs in rewards) / total_runs,
+        "reasoning": "\n\n".join(reward["reasoning"] for reward, _ in rewards),
+        "policy_agent_ids": list(
+            dict.fromkeys(id for reward, _ in rewards for id in reward["policy_agent_ids"])
+        ),
+        "latency": duration(latency),
+        "tool_call_count": sum(reward["tool_call_count"] for reward, _ in rewards),
+        "breakdown": [
+            {"policy_agent_id": policy_agent_id, "score": total / runs, "reasoning": ""}
+            for policy_agent_id, (total, runs) in policy_scores.items()
+        ],
+    }
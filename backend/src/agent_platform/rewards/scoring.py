@@ -0,0 +1,194 @@
+import json
+import re
+import string
+import unicodedata
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+_JSON_OBJECT: re.Pattern[str] = re.compile(r"\{.*\}", re.DOTALL)
+_REGEX_GROUND_TRUTH: re.Pattern[str] = re.compile(
+    r"^/(?P<pattern>.+)/(?P<flags>[imsx]*)$", re.DOTALL
+)
+_PUNCTUATION: dict[int, None] = dict.fromkeys(map(ord, string.punctuation))
+_FLAGS: dict[str, re.RegexFlag] = {
+    "i": re.IGNORECASE,
+    "m": re.MULTILINE,
+    "s": re.DOTALL,
+    "x": re.VERBOSE,
+}
+
+# A scorer compares agent outputs with expected answers pairwise and returns one score per
+# pair, NaN where it cannot decide.
+Scorer = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def exact_match(outputs: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """1 for outputs equal to the expected text up to surrounding whitespace."""
+    equal: np.ndarray = np.char.strip(outputs) == np.char.strip(expected)
+    return np.where(equal, 1.0, np.nan)
+
+
+def normalized_match(outputs: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """1 for outputs equal to the expected text ignoring case, punctuation and spacing.
+
+    Regex and JSON ground truths are left to their own scorers.
+    """
+    normalized: dict[str, str] = {text: normalize_answer(text) for text in {*outputs, *expected}}
+    equal: np.ndarray = np.array(
+        [
+            normalized[output] == normalized[text] and not _is_structured(text)
+            for output, text in zip(outputs, expected)
+        ],
+        dtype=bool,
+    )
+    return np.where(equal, 1.0, np.nan)
+
+
+def regex_match(outputs: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """Score ``/pattern/flags`` ground truths by whether the pattern occurs in the output."""
+    scores: np.ndarray = np.full(len(outputs), np.nan)
+    for index, (output, text) in enumerate(zip(outputs, expected)):
+        pattern: re.Pattern[str] | None = _compile_ground_truth(text)
+        if pattern is not None:
+            scores[index] = 1.0 if pattern.search(output) else 0.0
+    return scores
+
+
+def json_field_match(outputs: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """Score JSON object ground truths by whether the output's JSON carries their fields."""
+    parsed: dict[str, Any] = {}
+    scores: np.ndarray = np.full(len(outputs), np.nan)
+    for index, (output, text) in enumerate(zip(outputs, expected)):
+        if text not in parsed:
+            parsed[text] = _parse_json_object(text, strict=True)
+        fields: Any = parsed[text]
+        if fields is None:
+            continue
+        if output not in parsed:
+            parsed[output] = _parse_json_object(output, strict=False)
+        if parsed[output] is not None:
+            scores[index] = 1.0 if _contains(parsed[output], fields) else 0.0
+    return scores
+
+
+LOCAL_SCORERS: dict[str, Scorer] = {
+    "exact": exact_match,
+    "normalized": normalized_match,
+    "regex": regex_match,
+    "json_fields": json_field_match,
+}
+
+
+def configured_scorers(config: dict | None) -> list[str]:
+    """Local scorers selected by a benchmark's ``local_scoring`` config; all by default."""
+    if not config:
+        return list(LOCAL_SCORERS)
+    if config.get("disabled"):
+        return []
+    return list(config.get("scorers") or LOCAL_SCORERS)
+
+
+def score_batch(
+    outputs: list[str], ground_truths: list[list[dict]], scorers: list[str]
+) -> list[tuple[float, str] | None]:
+    """Score agent outputs against their rows' text ground truths without an LLM.
+
+    Each output is compared with every text ground truth of its row, trying ``scorers`` in
+    order until one decides a pair. An output scores 1 when any pair matches and 0 when every
+    pair was decided as a mismatch and the row has no other kind of ground truth; otherwise
+    it is left undecided (``None``) for the reward agent. All pairs of the batch go through
+    each scorer at once.
+    """
+    other_ground_truths: set[int] = set()
+    run_indices: list[int] = []
+    pair_outputs: list[str] = []
+    pair_expected: list[str] = []
+    for index, (output, row_ground_truths) in enumerate(zip(outputs, ground_truths, strict=True)):
+        for ground_truth in row_ground_truths:
+            if ground_truth.get("text"):
+                run_indices.append(index)
+                pair_outputs.append(output)
+                pair_expected.append(ground_truth["text"])
+            else:
+                other_ground_truths.add(index)
+    results: list[tuple[float, str] | None] = [None] * len(outputs)
+    if not run_indices:
+        return results
+
+    output_array: np.ndarray = np.array(pair_outputs, dtype=str)
+    expected_array: np.ndarray = np.array(pair_expected, dtype=str)
+    scores: np.ndarray = np.full(len(run_indices), np.nan)
+    deciders: np.ndarray = np.full(len(run_indices), -1)
+    for position, name in enumerate(scorers):
+        undecided: np.ndarray = np.flatnonzero(np.isnan(scores))
+        if not len(undecided):
+            break
+        decided: np.ndarray = LOCAL_SCORERS[name](
+            output_array[undecided], expected_array[undecided]
+        )
+        scores[undecided] = decided
+        deciders[undecided[~np.isnan(decided)]] = position
+
+    runs: np.ndarray = np.array(run_indices)
+    for index in np.unique(runs):
+        pairs: np.ndarray = np.flatnonzero(runs == index)
+        matched: np.ndarray = pairs[scores[pairs] == 1.0]
+        if len(matched):
+            results[index] = (1.0, f"{scorers[deciders[matched[0]]]} match")
+        elif index not in other_ground_truths and not np.isnan(scores[pairs]).any():
+            names: list[str] = sorted({scorers[decider] for decider in deciders[pairs]})
+            results[index] = (0.0, f"{', '.join(names)} mismatch")
+    return results
+
+
+def normalize_answer(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text).casefold().translate(_PUNCTUATION)
+    return " ".join(text.split())
+
+
+def _is_structured(text: str) -> bool:
+    return (
+        _compile_ground_truth(text) is not None or _parse_json_object(text, strict=True) is not None
+    )
+
+
+@lru_cache(maxsize=1024)
+def _compile_ground_truth(text: str) -> re.Pattern[str] | None:
+    match: re.Match[str] | None = _REGEX_GROUND_TRUTH.match(text.strip())
+    if match is None:
+        return None
+    flags: int = 0
+    for flag in match.group("flags"):
+        flags |= _FLAGS[flag]
+    try:
+        return re.compile(match.group("pattern"), flags)
+    except re.error:
+        return None
+
+
+def _parse_json_object(text: str, strict: bool) -> dict | None:
+    """Parse a JSON object from ``text``; unless ``strict``, from the first ``{...}`` in it."""
+    candidate: str = text.strip()
+    if not strict:
+        match: re.Match[str] | None = _JSON_OBJECT.search(candidate)
+        if match is None:
+            return None
+        candidate = match.group(0)
+    elif not candidate.startswith("{"):
+        return None
+    try:
+        value: Any = json.loads(candidate)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _contains(actual: Any, expected: Any) -> bool:
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _contains(actual[key], value) for key, value in expected.items()
+        )
+    return actual == expected
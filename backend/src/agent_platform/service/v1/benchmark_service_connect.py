@@ -46,6 +46,13 @@ class BenchmarkService(Protocol):
     ]:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    async def resume_benchmark_run(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     async def compare_benchmarks(
         self,
         request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CompareBenchmarksRequest,
@@ -88,6 +95,22 @@ class BenchmarkService(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.UpdateRewardAgentResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    async def create_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+        ctx: RequestContext,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse
+    ):
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
+    async def get_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
 
 class BenchmarkServiceASGIApplication(ConnectASGIApplication):
     def __init__(
@@ -139,6 +162,16 @@ class BenchmarkServiceASGIApplication(ConnectASGIApplication):
                     ),
                     function=service.stream_benchmark_run,
                 ),
+                "/agent_platform.service.v1.BenchmarkService/ResumeBenchmarkRun": Endpoint.unary(
+                    method=MethodInfo(
+                        name="ResumeBenchmarkRun",
+                        service_name="agent_platform.service.v1.BenchmarkService",
+                        input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.resume_benchmark_run,
+                ),
                 "/agent_platform.service.v1.BenchmarkService/CompareBenchmarks": Endpoint.unary(
                     method=MethodInfo(
                         name="CompareBenchmarks",
@@ -199,6 +232,26 @@ class BenchmarkServiceASGIApplication(ConnectASGIApplication):
                     ),
                     function=service.update_reward_agent,
                 ),
+                "/agent_platform.service.v1.BenchmarkService/CreateBenchmarkSweep": Endpoint.unary(
+                    method=MethodInfo(
+                        name="CreateBenchmarkSweep",
+                        service_name="agent_platform.service.v1.BenchmarkService",
+                        input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.create_benchmark_sweep,
+                ),
+                "/agent_platform.service.v1.BenchmarkService/GetBenchmarkSweep": Endpoint.unary(
+                    method=MethodInfo(
+                        name="GetBenchmarkSweep",
+                        service_name="agent_platform.service.v1.BenchmarkService",
+                        input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.get_benchmark_sweep,
+                ),
             },
             interceptors=interceptors,
             read_max_bytes=read_max_bytes,
@@ -293,6 +346,26 @@ class BenchmarkServiceClient(ConnectClient):
             timeout_ms=timeout_ms,
         )
 
+    async def resume_benchmark_run(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse:
+        return await self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="ResumeBenchmarkRun",
+                service_name="agent_platform.service.v1.BenchmarkService",
+                input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+                output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     async def compare_benchmarks(
         self,
         request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CompareBenchmarksRequest,
@@ -413,6 +486,48 @@ class BenchmarkServiceClient(ConnectClient):
             timeout_ms=timeout_ms,
         )
 
+    async def create_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse
+    ):
+        return await self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="CreateBenchmarkSweep",
+                service_name="agent_platform.service.v1.BenchmarkService",
+                input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+                output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
+    async def get_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse:
+        return await self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="GetBenchmarkSweep",
+                service_name="agent_platform.service.v1.BenchmarkService",
+                input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+                output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
 
 class BenchmarkServiceSync(Protocol):
     def create_benchmark_run(
@@ -445,6 +560,13 @@ class BenchmarkServiceSync(Protocol):
     ]:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def resume_benchmark_run(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     def compare_benchmarks(
         self,
         request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CompareBenchmarksRequest,
@@ -487,6 +609,22 @@ class BenchmarkServiceSync(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.UpdateRewardAgentResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def create_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+        ctx: RequestContext,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse
+    ):
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
+    def get_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
 
 class BenchmarkServiceWSGIApplication(ConnectWSGIApplication):
     def __init__(
@@ -537,6 +675,16 @@ class BenchmarkServiceWSGIApplication(ConnectWSGIApplication):
                     ),
                     function=service.stream_benchmark_run,
                 ),
+                "/agent_platform.service.v1.BenchmarkService/ResumeBenchmarkRun": EndpointSync.unary(
+                    method=MethodInfo(
+                        name="ResumeBenchmarkRun",
+                        service_name="agent_platform.service.v1.BenchmarkService",
+                        input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.resume_benchmark_run,
+                ),
                 "/agent_platform.service.v1.BenchmarkService/CompareBenchmarks": EndpointSync.unary(
                     method=MethodInfo(
                         name="CompareBenchmarks",
@@ -597,6 +745,26 @@ class BenchmarkServiceWSGIApplication(ConnectWSGIApplication):
                     ),
                     function=service.update_reward_agent,
                 ),
+                "/agent_platform.service.v1.BenchmarkService/CreateBenchmarkSweep": EndpointSync.unary(
+                    method=MethodInfo(
+                        name="CreateBenchmarkSweep",
+                        service_name="agent_platform.service.v1.BenchmarkService",
+                        input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.create_benchmark_sweep,
+                ),
+                "/agent_platform.service.v1.BenchmarkService/GetBenchmarkSweep": EndpointSync.unary(
+                    method=MethodInfo(
+                        name="GetBenchmarkSweep",
+                        service_name="agent_platform.service.v1.BenchmarkService",
+                        input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.get_benchmark_sweep,
+                ),
             },
             interceptors=interceptors,
             read_max_bytes=read_max_bytes,
@@ -691,6 +859,26 @@ class BenchmarkServiceClientSync(ConnectClientSync):
             timeout_ms=timeout_ms,
         )
 
+    def resume_benchmark_run(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse:
+        return self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="ResumeBenchmarkRun",
+                service_name="agent_platform.service.v1.BenchmarkService",
+                input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunRequest,
+                output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.ResumeBenchmarkRunResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     def compare_benchmarks(
         self,
         request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CompareBenchmarksRequest,
@@ -810,3 +998,45 @@ class BenchmarkServiceClientSync(ConnectClientSync):
             headers=headers,
             timeout_ms=timeout_ms,
         )
+
+    def create_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse
+    ):
+        return self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="CreateBenchmarkSweep",
+                service_name="agent_platform.service.v1.BenchmarkService",
+                input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepRequest,
+                output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.CreateBenchmarkSweepResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
+    def get_benchmark_sweep(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse:
+        return self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="GetBenchmarkSweep",
+                service_name="agent_platform.service.v1.BenchmarkService",
+                input=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepRequest,
+                output=agent__platform_dot_service_dot_v1_dot_benchmark__service__pb2.GetBenchmarkSweepResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
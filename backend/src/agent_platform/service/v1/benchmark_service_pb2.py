@@ -26,7 +26,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n1agent_platform/service/v1/benchmark_service.proto\x12\x19\x61gent_platform.service.v1\x1a+agent_platform/benchmark/v1/benchmark.proto\x1a%agent_platform/reward/v1/reward.proto\x1a.agent_platform/dataset/v1/prompt_dataset.proto\x1a$agent_platform/common/v1/types.proto"\xa8\x01\n\x19\x43reateBenchmarkRunRequest\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12*\n\x11prompt_dataset_id\x18\x02 \x01(\tR\x0fpromptDatasetId\x12\x44\n\x06\x63onfig\x18\x03 \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkConfigR\x06\x63onfig"l\n\x1a\x43reateBenchmarkRunResponse\x12N\n\rbenchmark_run\x18\x01 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\x0c\x62\x65nchmarkRun"B\n\x16GetBenchmarkRunRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId"i\n\x17GetBenchmarkRunResponse\x12N\n\rbenchmark_run\x18\x01 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\x0c\x62\x65nchmarkRun"{\n\x18ListBenchmarkRunsRequest\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12\x44\n\npagination\x18\x02 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xbb\x01\n\x19ListBenchmarkRunsResponse\x12P\n\x0e\x62\x65nchmark_runs\x18\x01 \x03(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\rbenchmarkRuns\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"E\n\x19StreamBenchmarkRunRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId"\x9e\x02\n\x1aStreamBenchmarkRunResponse\x12S\n\rrow_completed\x18\x01 \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkRunRowH\x00R\x0crowCompleted\x12\\\n\x13\x62\x65nchmark_completed\x18\x02 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunH\x00R\x12\x62\x65nchmarkCompleted\x12\x44\n\x05\x65rror\x18\x03 \x01(\x0b\x32,.agent_platform.service.v1.BenchmarkRunErrorH\x00R\x05\x65rrorB\x07\n\x05\x65vent"X\n\x11\x42\x65nchmarkRunError\x12\x12\n\x04\x63ode\x18\x01 \x01(\tR\x04\x63ode\x12\x18\n\x07message\x18\x02 \x01(\tR\x07message\x12\x15\n\x06row_id\x18\x03 \x01(\tR\x05rowId"F\n\x18\x43ompareBenchmarksRequest\x12*\n\x11\x62\x65nchmark_run_ids\x18\x01 \x03(\tR\x0f\x62\x65nchmarkRunIds"m\n\x19\x43ompareBenchmarksResponse\x12P\n\ncomparison\x18\x01 \x01(\x0b\x32\x30.agent_platform.benchmark.v1.BenchmarkComparisonR\ncomparison"w\n\x1a\x41\x64\x64\x42\x65nchmarkCommentRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId\x12\x15\n\x06row_id\x18\x02 \x01(\tR\x05rowId\x12\x18\n\x07\x63ontent\x18\x03 \x01(\tR\x07\x63ontent"^\n\x1b\x41\x64\x64\x42\x65nchmarkCommentResponse\x12?\n\x07\x63omment\x18\x01 \x01(\x0b\x32%.agent_platform.dataset.v1.SMECommentR\x07\x63omment"d\n\x18\x43reateRewardAgentRequest\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"e\n\x19\x43reateRewardAgentResponse\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"?\n\x15GetRewardAgentRequest\x12&\n\x0freward_agent_id\x18\x01 \x01(\tR\rrewardAgentId"b\n\x16GetRewardAgentResponse\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"_\n\x17ListRewardAgentsRequest\x12\x44\n\npagination\x18\x01 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xb4\x01\n\x18ListRewardAgentsResponse\x12J\n\rreward_agents\x18\x01 \x03(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0crewardAgents\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"_\n\x18UpdateRewardAgentRequest\x12\x43\n\x06update\x18\x01 \x01(\x0b\x32+.agent_platform.reward.v1.RewardAgentUpdateR\x06update"e\n\x19UpdateRewardAgentResponse\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent2\x91\n\n\x10\x42\x65nchmarkService\x12\x81\x01\n\x12\x43reateBenchmarkRun\x12\x34.agent_platform.service.v1.CreateBenchmarkRunRequest\x1a\x35.agent_platform.service.v1.CreateBenchmarkRunResponse\x12x\n\x0fGetBenchmarkRun\x12\x31.agent_platform.service.v1.GetBenchmarkRunRequest\x1a\x32.agent_platform.service.v1.GetBenchmarkRunResponse\x12~\n\x11ListBenchmarkRuns\x12\x33.agent_platform.service.v1.ListBenchmarkRunsRequest\x1a\x34.agent_platform.service.v1.ListBenchmarkRunsResponse\x12\x83\x01\n\x12StreamBenchmarkRun\x12\x34.agent_platform.service.v1.StreamBenchmarkRunRequest\x1a\x35.agent_platform.service.v1.StreamBenchmarkRunResponse0\x01\x12~\n\x11\x43ompareBenchmarks\x12\x33.agent_platform.service.v1.CompareBenchmarksRequest\x1a\x34.agent_platform.service.v1.CompareBenchmarksResponse\x12\x84\x01\n\x13\x41\x64\x64\x42\x65nchmarkComment\x12\x35.agent_platform.service.v1.AddBenchmarkCommentRequest\x1a\x36.agent_platform.service.v1.AddBenchmarkCommentResponse\x12~\n\x11\x43reateRewardAgent\x12\x33.agent_platform.service.v1.CreateRewardAgentRequest\x1a\x34.agent_platform.service.v1.CreateRewardAgentResponse\x12u\n\x0eGetRewardAgent\x12\x30.agent_platform.service.v1.GetRewardAgentRequest\x1a\x31.agent_platform.service.v1.GetRewardAgentResponse\x12{\n\x10ListRewardAgents\x12\x32.agent_platform.service.v1.ListRewardAgentsRequest\x1a\x33.agent_platform.service.v1.ListRewardAgentsResponse\x12~\n\x11UpdateRewardAgent\x12\x33.agent_platform.service.v1.UpdateRewardAgentRequest\x1a\x34.agent_platform.service.v1.UpdateRewardAgentResponseB\xfd\x01\n\x1d\x63om.agent_platform.service.v1B\x15\x42\x65nchmarkServiceProtoP\x01ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\xa2\x02\x03\x41SX\xaa\x02\x18\x41gentPlatform.Service.V1\xca\x02\x18\x41gentPlatform\\Service\\V1\xe2\x02$AgentPlatform\\Service\\V1\\GPBMetadata\xea\x02\x1a\x41gentPlatform::Service::V1b\x06proto3'
+    b'\n1agent_platform/service/v1/benchmark_service.proto\x12\x19\x61gent_platform.service.v1\x1a+agent_platform/benchmark/v1/benchmark.proto\x1a%agent_platform/reward/v1/reward.proto\x1a.agent_platform/dataset/v1/prompt_dataset.proto\x1a$agent_platform/common/v1/types.proto"\xa8\x01\n\x19\x43reateBenchmarkRunRequest\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12*\n\x11prompt_dataset_id\x18\x02 \x01(\tR\x0fpromptDatasetId\x12\x44\n\x06\x63onfig\x18\x03 \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkConfigR\x06\x63onfig"l\n\x1a\x43reateBenchmarkRunResponse\x12N\n\rbenchmark_run\x18\x01 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\x0c\x62\x65nchmarkRun"\x98\x01\n\x16GetBenchmarkRunRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId\x12\x46\n\trows_page\x18\x02 \x01(\x0b\x32$.agent_platform.common.v1.PaginationH\x00R\x08rowsPage\x88\x01\x01\x42\x0c\n\n_rows_page"\xc0\x01\n\x17GetBenchmarkRunResponse\x12N\n\rbenchmark_run\x18\x01 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\x0c\x62\x65nchmarkRun\x12U\n\x0frows_pagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\x0erowsPagination"{\n\x18ListBenchmarkRunsRequest\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12\x44\n\npagination\x18\x02 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xbb\x01\n\x19ListBenchmarkRunsResponse\x12P\n\x0e\x62\x65nchmark_runs\x18\x01 \x03(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\rbenchmarkRuns\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"E\n\x19StreamBenchmarkRunRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId"\xf3\x02\n\x1aStreamBenchmarkRunResponse\x12S\n\rrow_completed\x18\x01 \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkRunRowH\x00R\x0crowCompleted\x12\\\n\x13\x62\x65nchmark_completed\x18\x02 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunH\x00R\x12\x62\x65nchmarkCompleted\x12\x44\n\x05\x65rror\x18\x03 \x01(\x0b\x32,.agent_platform.service.v1.BenchmarkRunErrorH\x00R\x05\x65rror\x12S\n\x0b\x63oncurrency\x18\x04 \x01(\x0b\x32/.agent_platform.service.v1.BenchmarkConcurrencyH\x00R\x0b\x63oncurrencyB\x07\n\x05\x65vent"\xca\x01\n\x14\x42\x65nchmarkConcurrency\x12\x14\n\x05limit\x18\x01 \x01(\x05R\x05limit\x12\x18\n\x07\x63\x65iling\x18\x02 \x01(\x05R\x07\x63\x65iling\x12\x1b\n\tin_flight\x18\x03 \x01(\x05R\x08inFlight\x12.\n\x13p95_latency_seconds\x18\x04 \x01(\x02R\x11p95LatencySeconds\x12\x1d\n\nerror_rate\x18\x05 \x01(\x02R\terrorRate\x12\x16\n\x06reason\x18\x06 \x01(\tR\x06reason"X\n\x11\x42\x65nchmarkRunError\x12\x12\n\x04\x63ode\x18\x01 \x01(\tR\x04\x63ode\x12\x18\n\x07message\x18\x02 \x01(\tR\x07message\x12\x15\n\x06row_id\x18\x03 \x01(\tR\x05rowId"E\n\x19ResumeBenchmarkRunRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId"l\n\x1aResumeBenchmarkRunResponse\x12N\n\rbenchmark_run\x18\x01 \x01(\x0b\x32).agent_platform.benchmark.v1.BenchmarkRunR\x0c\x62\x65nchmarkRun"\xa2\x01\n\x18\x43ompareBenchmarksRequest\x12*\n\x11\x62\x65nchmark_run_ids\x18\x01 \x03(\tR\x0f\x62\x65nchmarkRunIds\x12/\n\x13\x62ootstrap_resamples\x18\x02 \x01(\x05R\x12\x62ootstrapResamples\x12)\n\x10\x63onfidence_level\x18\x03 \x01(\x02R\x0f\x63onfidenceLevel"m\n\x19\x43ompareBenchmarksResponse\x12P\n\ncomparison\x18\x01 \x01(\x0b\x32\x30.agent_platform.benchmark.v1.BenchmarkComparisonR\ncomparison"w\n\x1a\x41\x64\x64\x42\x65nchmarkCommentRequest\x12(\n\x10\x62\x65nchmark_run_id\x18\x01 \x01(\tR\x0e\x62\x65nchmarkRunId\x12\x15\n\x06row_id\x18\x02 \x01(\tR\x05rowId\x12\x18\n\x07\x63ontent\x18\x03 \x01(\tR\x07\x63ontent"^\n\x1b\x41\x64\x64\x42\x65nchmarkCommentResponse\x12?\n\x07\x63omment\x18\x01 \x01(\x0b\x32%.agent_platform.dataset.v1.SMECommentR\x07\x63omment"d\n\x18\x43reateRewardAgentRequest\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"e\n\x19\x43reateRewardAgentResponse\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"?\n\x15GetRewardAgentRequest\x12&\n\x0freward_agent_id\x18\x01 \x01(\tR\rrewardAgentId"b\n\x16GetRewardAgentResponse\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"_\n\x17ListRewardAgentsRequest\x12\x44\n\npagination\x18\x01 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xb4\x01\n\x18ListRewardAgentsResponse\x12J\n\rreward_agents\x18\x01 \x03(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0crewardAgents\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"_\n\x18UpdateRewardAgentRequest\x12\x43\n\x06update\x18\x01 \x01(\x0b\x32+.agent_platform.reward.v1.RewardAgentUpdateR\x06update"e\n\x19UpdateRewardAgentResponse\x12H\n\x0creward_agent\x18\x01 \x01(\x0b\x32%.agent_platform.reward.v1.RewardAgentR\x0brewardAgent"\xa7\x02\n\x1b\x43reateBenchmarkSweepRequest\x12\x19\n\x08\x61gent_id\x18\x01 \x01(\tR\x07\x61gentId\x12*\n\x11prompt_dataset_id\x18\x02 \x01(\tR\x0fpromptDatasetId\x12\x43\n\x04grid\x18\x03 \x01(\x0b\x32/.agent_platform.benchmark.v1.BenchmarkSweepGridR\x04grid\x12\x44\n\x06\x63onfig\x18\x04 \x01(\x0b\x32,.agent_platform.benchmark.v1.BenchmarkConfigR\x06\x63onfig\x12\x36\n\x18max_llm_calls_per_minute\x18\x05 \x01(\x05R\x14maxLlmCallsPerMinute"a\n\x1c\x43reateBenchmarkSweepResponse\x12\x41\n\x05sweep\x18\x01 \x01(\x0b\x32+.agent_platform.benchmark.v1.BenchmarkSweepR\x05sweep"5\n\x18GetBenchmarkSweepRequest\x12\x19\n\x08sweep_id\x18\x01 \x01(\tR\x07sweepId"^\n\x19GetBenchmarkSweepResponse\x12\x41\n\x05sweep\x18\x01 \x01(\x0b\x32+.agent_platform.benchmark.v1.BenchmarkSweepR\x05sweep2\x9f\r\n\x10\x42\x65nchmarkService\x12\x81\x01\n\x12\x43reateBenchmarkRun\x12\x34.agent_platform.service.v1.CreateBenchmarkRunRequest\x1a\x35.agent_platform.service.v1.CreateBenchmarkRunResponse\x12x\n\x0fGetBenchmarkRun\x12\x31.agent_platform.service.v1.GetBenchmarkRunRequest\x1a\x32.agent_platform.service.v1.GetBenchmarkRunResponse\x12~\n\x11ListBenchmarkRuns\x12\x33.agent_platform.service.v1.ListBenchmarkRunsRequest\x1a\x34.agent_platform.service.v1.ListBenchmarkRunsResponse\x12\x83\x01\n\x12StreamBenchmarkRun\x12\x34.agent_platform.service.v1.StreamBenchmarkRunRequest\x1a\x35.agent_platform.service.v1.StreamBenchmarkRunResponse0\x01\x12\x81\x01\n\x12ResumeBenchmarkRun\x12\x34.agent_platform.service.v1.ResumeBenchmarkRunRequest\x1a\x35.agent_platform.service.v1.ResumeBenchmarkRunResponse\x12~\n\x11\x43ompareBenchmarks\x12\x33.agent_platform.service.v1.CompareBenchmarksRequest\x1a\x34.agent_platform.service.v1.CompareBenchmarksResponse\x12\x84\x01\n\x13\x41\x64\x64\x42\x65nchmarkComment\x12\x35.agent_platform.service.v1.AddBenchmarkCommentRequest\x1a\x36.agent_platform.service.v1.AddBenchmarkCommentResponse\x12~\n\x11\x43reateRewardAgent\x12\x33.agent_platform.service.v1.CreateRewardAgentRequest\x1a\x34.agent_platform.service.v1.CreateRewardAgentResponse\x12u\n\x0eGetRewardAgent\x12\x30.agent_platform.service.v1.GetRewardAgentRequest\x1a\x31.agent_platform.service.v1.GetRewardAgentResponse\x12{\n\x10ListRewardAgents\x12\x32.agent_platform.service.v1.ListRewardAgentsRequest\x1a\x33.agent_platform.service.v1.ListRewardAgentsResponse\x12~\n\x11UpdateRewardAgent\x12\x33.agent_platform.service.v1.UpdateRewardAgentRequest\x1a\x34.agent_platform.service.v1.UpdateRewardAgentResponse\x12\x87\x01\n\x14\x43reateBenchmarkSweep\x12\x36.agent_platform.service.v1.CreateBenchmarkSweepRequest\x1a\x37.agent_platform.service.v1.CreateBenchmarkSweepResponse\x12~\n\x11GetBenchmarkSweep\x12\x33.agent_platform.service.v1.GetBenchmarkSweepRequest\x1a\x34.agent_platform.service.v1.GetBenchmarkSweepResponseB\xfd\x01\n\x1d\x63om.agent_platform.service.v1B\x15\x42\x65nchmarkServiceProtoP\x01ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\xa2\x02\x03\x41SX\xaa\x02\x18\x41gentPlatform.Service.V1\xca\x02\x18\x41gentPlatform\\Service\\V1\xe2\x02$AgentPlatform\\Service\\V1\\GPBMetadata\xea\x02\x1a\x41gentPlatform::Service::V1b\x06proto3'
 )
 
 _globals = globals()
@@ -43,44 +43,58 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_CREATEBENCHMARKRUNREQUEST"]._serialized_end = 419
     _globals["_CREATEBENCHMARKRUNRESPONSE"]._serialized_start = 421
     _globals["_CREATEBENCHMARKRUNRESPONSE"]._serialized_end = 529
-    _globals["_GETBENCHMARKRUNREQUEST"]._serialized_start = 531
-    _globals["_GETBENCHMARKRUNREQUEST"]._serialized_end = 597
-    _globals["_GETBENCHMARKRUNRESPONSE"]._serialized_start = 599
-    _globals["_GETBENCHMARKRUNRESPONSE"]._serialized_end = 704
-    _globals["_LISTBENCHMARKRUNSREQUEST"]._serialized_start = 706
-    _globals["_LISTBENCHMARKRUNSREQUEST"]._serialized_end = 829
-    _globals["_LISTBENCHMARKRUNSRESPONSE"]._serialized_start = 832
-    _globals["_LISTBENCHMARKRUNSRESPONSE"]._serialized_end = 1019
-    _globals["_STREAMBENCHMARKRUNREQUEST"]._serialized_start = 1021
-    _globals["_STREAMBENCHMARKRUNREQUEST"]._serialized_end = 1090
-    _globals["_STREAMBENCHMARKRUNRESPONSE"]._serialized_start = 1093
-    _globals["_STREAMBENCHMARKRUNRESPONSE"]._serialized_end = 1379
-    _globals["_BENCHMARKRUNERROR"]._serialized_start = 1381
-    _globals["_BENCHMARKRUNERROR"]._serialized_end = 1469
-    _globals["_COMPAREBENCHMARKSREQUEST"]._serialized_start = 1471
-    _globals["_COMPAREBENCHMARKSREQUEST"]._serialized_end = 1541
-    _globals["_COMPAREBENCHMARKSRESPONSE"]._serialized_start = 1543
-    _globals["_COMPAREBENCHMARKSRESPONSE"]._serialized_end = 1652
-    _globals["_ADDBENCHMARKCOMMENTREQUEST"]._serialized_start = 1654
-    _globals["_ADDBENCHMARKCOMMENTREQUEST"]._serialized_end = 1773
-    _globals["_ADDBENCHMARKCOMMENTRESPONSE"]._serialized_start = 1775
-    _globals["_ADDBENCHMARKCOMMENTRESPONSE"]._serialized_end = 1869
-    _globals["_CREATEREWARDAGENTREQUEST"]._serialized_start = 1871
-    _globals["_CREATEREWARDAGENTREQUEST"]._serialized_end = 1971
-    _globals["_CREATEREWARDAGENTRESPONSE"]._serialized_start = 1973
-    _globals["_CREATEREWARDAGENTRESPONSE"]._serialized_end = 2074
-    _globals["_GETREWARDAGENTREQUEST"]._serialized_start = 2076
-    _globals["_GETREWARDAGENTREQUEST"]._serialized_end = 2139
-    _globals["_GETREWARDAGENTRESPONSE"]._serialized_start = 2141
-    _globals["_GETREWARDAGENTRESPONSE"]._serialized_end = 2239
-    _globals["_LISTREWARDAGENTSREQUEST"]._serialized_start = 2241
-    _globals["_LISTREWARDAGENTSREQUEST"]._serialized_end = 2336
-    _globals["_LISTREWARDAGENTSRESPONSE"]._serialized_start = 2339
-    _globals["_LISTREWARDAGENTSRESPONSE"]._serialized_end = 2519
-    _globals["_UPDATEREWARDAGENTREQUEST"]._serialized_start = 2521
-    _globals["_UPDATEREWARDAGENTREQUEST"]._serialized_end = 2616
-    _globals["_UPDATEREWARDAGENTRESPONSE"]._serialized_start = 2618
-    _globals["_UPDATEREWARDAGENTRESPONSE"]._serialized_end = 2719
-    _globals["_BENCHMARKSERVICE"]._serialized_start = 2722
-    _globals["_BENCHMARKSERVICE"]._serialized_end = 4019
+    _globals["_GETBENCHMARKRUNREQUEST"]._serialized_start = 532
+    _globals["_GETBENCHMARKRUNREQUEST"]._serialized_end = 684
+    _globals["_GETBENCHMARKRUNRESPONSE"]._serialized_start = 687
+    _globals["_GETBENCHMARKRUNRESPONSE"]._serialized_end = 879
+    _globals["_LISTBENCHMARKRUNSREQUEST"]._serialized_start = 881
+    _globals["_LISTBENCHMARKRUNSREQUEST"]._serialized_end = 1004
+    _globals["_LISTBENCHMARKRUNSRESPONSE"]._serialized_start = 1007
+    _globals["_LISTBENCHMARKRUNSRESPONSE"]._serialized_end = 1194
+    _globals["_STREAMBENCHMARKRUNREQUEST"]._serialized_start = 1196
+    _globals["_STREAMBENCHMARKRUNREQUEST"]._serialized_end = 1265
+    _globals["_STREAMBENCHMARKRUNRESPONSE"]._serialized_start = 1268
+    _globals["_STREAMBENCHMARKRUNRESPONSE"]._serialized_end = 1639
+    _globals["_BENCHMARKCONCURRENCY"]._serialized_start = 1642
+    _globals["_BENCHMARKCONCURRENCY"]._serialized_end = 1844
+    _globals["_BENCHMARKRUNERROR"]._serialized_start = 1846
+    _globals["_BENCHMARKRUNERROR"]._serialized_end = 1934
+    _globals["_RESUMEBENCHMARKRUNREQUEST"]._serialized_start = 1936
+    _globals["_RESUMEBENCHMARKRUNREQUEST"]._serialized_end = 2005
+    _globals["_RESUMEBENCHMARKRUNRESPONSE"]._serialized_start = 2007
+    _globals["_RESUMEBENCHMARKRUNRESPONSE"]._serialized_end = 2115
+    _globals["_COMPAREBENCHMARKSREQUEST"]._serialized_start = 2118
+    _globals["_COMPAREBENCHMARKSREQUEST"]._serialized_end = 2280
+    _globals["_COMPAREBENCHMARKSRESPONSE"]._serialized_start = 2282
+    _globals["_COMPAREBENCHMARKSRESPONSE"]._serialized_end = 2391
+    _globals["_ADDBENCHMARKCOMMENTREQUEST"]._serialized_start = 2393
+    _globals["_ADDBENCHMARKCOMMENTREQUEST"]._serialized_end = 2512
+    _globals["_ADDBENCHMARKCOMMENTRESPONSE"]._serialized_start = 2514
+    _globals["_ADDBENCHMARKCOMMENTRESPONSE"]._serialized_end = 2608
+    _globals["_CREATEREWARDAGENTREQUEST"]._serialized_start = 2610
+    _globals["_CREATEREWARDAGENTREQUEST"]._serialized_end = 2710
+    _globals["_CREATEREWARDAGENTRESPONSE"]._serialized_start = 2712
+    _globals["_CREATEREWARDAGENTRESPONSE"]._serialized_end = 2813
+    _globals["_GETREWARDAGENTREQUEST"]._serialized_start = 2815
+    _globals["_GETREWARDAGENTREQUEST"]._serialized_end = 2878
+    _globals["_GETREWARDAGENTRESPONSE"]._serialized_start = 2880
+    _globals["_GETREWARDAGENTRESPONSE"]._serialized_end = 2978
+    _globals["_LISTREWARDAGENTSREQUEST"]._serialized_start = 2980
+    _globals["_LISTREWARDAGENTSREQUEST"]._serialized_end = 3075
+    _globals["_LISTREWARDAGENTSRESPONSE"]._serialized_start = 3078
+    _globals["_LISTREWARDAGENTSRESPONSE"]._serialized_end = 3258
+    _globals["_UPDATEREWARDAGENTREQUEST"]._serialized_start = 3260
+    _globals["_UPDATEREWARDAGENTREQUEST"]._serialized_end = 3355
+    _globals["_UPDATEREWARDAGENTRESPONSE"]._serialized_start = 3357
+    _globals["_UPDATEREWARDAGENTRESPONSE"]._serialized_end = 3458
+    _globals["_CREATEBENCHMARKSWEEPREQUEST"]._serialized_start = 3461
+    _globals["_CREATEBENCHMARKSWEEPREQUEST"]._serialized_end = 3756
+    _globals["_CREATEBENCHMARKSWEEPRESPONSE"]._serialized_start = 3758
+    _globals["_CREATEBENCHMARKSWEEPRESPONSE"]._serialized_end = 3855
+    _globals["_GETBENCHMARKSWEEPREQUEST"]._serialized_start = 3857
+    _globals["_GETBENCHMARKSWEEPREQUEST"]._serialized_end = 3910
+    _globals["_GETBENCHMARKSWEEPRESPONSE"]._serialized_start = 3912
+    _globals["_GETBENCHMARKSWEEPRESPONSE"]._serialized_end = 4006
+    _globals["_BENCHMARKSERVICE"]._serialized_start = 4009
+    _globals["_BENCHMARKSERVICE"]._serialized_end = 5704
 # @@protoc_insertion_point(module_scope)
@@ -60,6 +60,17 @@ class DatasetService(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.CreatePromptDatasetResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    async def import_prompt_dataset_rows(
+        self,
+        request: AsyncIterator[
+            agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest
+        ],
+        ctx: RequestContext,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse
+    ):
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     async def get_prompt_dataset(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.GetPromptDatasetRequest,
@@ -67,6 +78,15 @@ class DatasetService(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.GetPromptDatasetResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def stream_prompt_dataset_rows(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+        ctx: RequestContext,
+    ) -> AsyncIterator[
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse
+    ]:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     async def list_prompt_datasets(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ListPromptDatasetsRequest,
@@ -161,6 +181,16 @@ class DatasetServiceASGIApplication(ConnectASGIApplication):
                     ),
                     function=service.create_prompt_dataset,
                 ),
+                "/agent_platform.service.v1.DatasetService/ImportPromptDatasetRows": Endpoint.client_stream(
+                    method=MethodInfo(
+                        name="ImportPromptDatasetRows",
+                        service_name="agent_platform.service.v1.DatasetService",
+                        input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.import_prompt_dataset_rows,
+                ),
                 "/agent_platform.service.v1.DatasetService/GetPromptDataset": Endpoint.unary(
                     method=MethodInfo(
                         name="GetPromptDataset",
@@ -171,6 +201,16 @@ class DatasetServiceASGIApplication(ConnectASGIApplication):
                     ),
                     function=service.get_prompt_dataset,
                 ),
+                "/agent_platform.service.v1.DatasetService/StreamPromptDatasetRows": Endpoint.server_stream(
+                    method=MethodInfo(
+                        name="StreamPromptDatasetRows",
+                        service_name="agent_platform.service.v1.DatasetService",
+                        input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.stream_prompt_dataset_rows,
+                ),
                 "/agent_platform.service.v1.DatasetService/ListPromptDatasets": Endpoint.unary(
                     method=MethodInfo(
                         name="ListPromptDatasets",
@@ -335,6 +375,30 @@ class DatasetServiceClient(ConnectClient):
             timeout_ms=timeout_ms,
         )
 
+    async def import_prompt_dataset_rows(
+        self,
+        request: AsyncIterator[
+            agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest
+        ],
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse
+    ):
+        return await self.execute_client_stream(
+            request=request,
+            method=MethodInfo(
+                name="ImportPromptDatasetRows",
+                service_name="agent_platform.service.v1.DatasetService",
+                input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest,
+                output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     async def get_prompt_dataset(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.GetPromptDatasetRequest,
@@ -355,6 +419,28 @@ class DatasetServiceClient(ConnectClient):
             timeout_ms=timeout_ms,
         )
 
+    def stream_prompt_dataset_rows(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> AsyncIterator[
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse
+    ]:
+        return self.execute_server_stream(
+            request=request,
+            method=MethodInfo(
+                name="StreamPromptDatasetRows",
+                service_name="agent_platform.service.v1.DatasetService",
+                input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+                output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     async def list_prompt_datasets(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ListPromptDatasetsRequest,
@@ -463,6 +549,17 @@ class DatasetServiceSync(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.CreatePromptDatasetResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def import_prompt_dataset_rows(
+        self,
+        request: Iterator[
+            agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest
+        ],
+        ctx: RequestContext,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse
+    ):
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     def get_prompt_dataset(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.GetPromptDatasetRequest,
@@ -470,6 +567,15 @@ class DatasetServiceSync(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.GetPromptDatasetResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def stream_prompt_dataset_rows(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+        ctx: RequestContext,
+    ) -> Iterator[
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse
+    ]:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     def list_prompt_datasets(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ListPromptDatasetsRequest,
@@ -563,6 +669,16 @@ class DatasetServiceWSGIApplication(ConnectWSGIApplication):
                     ),
                     function=service.create_prompt_dataset,
                 ),
+                "/agent_platform.service.v1.DatasetService/ImportPromptDatasetRows": EndpointSync.client_stream(
+                    method=MethodInfo(
+                        name="ImportPromptDatasetRows",
+                        service_name="agent_platform.service.v1.DatasetService",
+                        input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.import_prompt_dataset_rows,
+                ),
                 "/agent_platform.service.v1.DatasetService/GetPromptDataset": EndpointSync.unary(
                     method=MethodInfo(
                         name="GetPromptDataset",
@@ -573,6 +689,16 @@ class DatasetServiceWSGIApplication(ConnectWSGIApplication):
                     ),
                     function=service.get_prompt_dataset,
                 ),
+                "/agent_platform.service.v1.DatasetService/StreamPromptDatasetRows": EndpointSync.server_stream(
+                    method=MethodInfo(
+                        name="StreamPromptDatasetRows",
+                        service_name="agent_platform.service.v1.DatasetService",
+                        input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.stream_prompt_dataset_rows,
+                ),
                 "/agent_platform.service.v1.DatasetService/ListPromptDatasets": EndpointSync.unary(
                     method=MethodInfo(
                         name="ListPromptDatasets",
@@ -737,6 +863,30 @@ class DatasetServiceClientSync(ConnectClientSync):
             timeout_ms=timeout_ms,
         )
 
+    def import_prompt_dataset_rows(
+        self,
+        request: Iterator[
+            agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest
+        ],
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> (
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse
+    ):
+        return self.execute_client_stream(
+            request=request,
+            method=MethodInfo(
+                name="ImportPromptDatasetRows",
+                service_name="agent_platform.service.v1.DatasetService",
+                input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsRequest,
+                output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ImportPromptDatasetRowsResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     def get_prompt_dataset(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.GetPromptDatasetRequest,
@@ -757,6 +907,28 @@ class DatasetServiceClientSync(ConnectClientSync):
             timeout_ms=timeout_ms,
         )
 
+    def stream_prompt_dataset_rows(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> Iterator[
+        agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse
+    ]:
+        return self.execute_server_stream(
+            request=request,
+            method=MethodInfo(
+                name="StreamPromptDatasetRows",
+                service_name="agent_platform.service.v1.DatasetService",
+                input=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsRequest,
+                output=agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.StreamPromptDatasetRowsResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     def list_prompt_datasets(
         self,
         request: agent__platform_dot_service_dot_v1_dot_dataset__service__pb2.ListPromptDatasetsRequest,
@@ -21,7 +21,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n/agent_platform/service/v1/dataset_service.proto\x12\x19\x61gent_platform.service.v1\x1a\'agent_platform/dataset/v1/dataset.proto\x1a.agent_platform/dataset/v1/prompt_dataset.proto\x1a$agent_platform/common/v1/types.proto"*\n\x14\x43reateDatasetRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name"U\n\x15\x43reateDatasetResponse\x12<\n\x07\x64\x61taset\x18\x01 \x01(\x0b\x32".agent_platform.dataset.v1.DatasetR\x07\x64\x61taset"2\n\x11GetDatasetRequest\x12\x1d\n\ndataset_id\x18\x01 \x01(\tR\tdatasetId"R\n\x12GetDatasetResponse\x12<\n\x07\x64\x61taset\x18\x01 \x01(\x0b\x32".agent_platform.dataset.v1.DatasetR\x07\x64\x61taset"[\n\x13ListDatasetsRequest\x12\x44\n\npagination\x18\x01 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xa4\x01\n\x14ListDatasetsResponse\x12>\n\x08\x64\x61tasets\x18\x01 \x03(\x0b\x32".agent_platform.dataset.v1.DatasetR\x08\x64\x61tasets\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"5\n\x14\x44\x65leteDatasetRequest\x12\x1d\n\ndataset_id\x18\x01 \x01(\tR\tdatasetId"\x17\n\x15\x44\x65leteDatasetResponse"\x80\x01\n\x11UploadFileRequest\x12K\n\x08metadata\x18\x01 \x01(\x0b\x32-.agent_platform.service.v1.UploadFileMetadataH\x00R\x08metadata\x12\x16\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00R\x05\x63hunkB\x06\n\x04\x64\x61ta"\x91\x01\n\x12UploadFileMetadata\x12\x1d\n\ndataset_id\x18\x01 \x01(\tR\tdatasetId\x12\x1a\n\x08\x66ilename\x18\x02 \x01(\tR\x08\x66ilename\x12@\n\tfile_type\x18\x03 \x01(\x0e\x32#.agent_platform.dataset.v1.FileTypeR\x08\x66ileType"P\n\x12UploadFileResponse\x12:\n\x04\x66ile\x18\x01 \x01(\x0b\x32&.agent_platform.dataset.v1.DatasetFileR\x04\x66ile"q\n\x1a\x43reatePromptDatasetRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12?\n\x04rows\x18\x02 \x03(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x04rows"n\n\x1b\x43reatePromptDatasetResponse\x12O\n\x0eprompt_dataset\x18\x01 \x01(\x0b\x32(.agent_platform.dataset.v1.PromptDatasetR\rpromptDataset"E\n\x17GetPromptDatasetRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId"k\n\x18GetPromptDatasetResponse\x12O\n\x0eprompt_dataset\x18\x01 \x01(\x0b\x32(.agent_platform.dataset.v1.PromptDatasetR\rpromptDataset"a\n\x19ListPromptDatasetsRequest\x12\x44\n\npagination\x18\x01 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xbd\x01\n\x1aListPromptDatasetsResponse\x12Q\n\x0fprompt_datasets\x18\x01 \x03(\x0b\x32(.agent_platform.dataset.v1.PromptDatasetR\x0epromptDatasets\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"\x8a\x01\n\x1dUpdatePromptDatasetRowRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12=\n\x03row\x18\x02 \x01(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x03row"_\n\x1eUpdatePromptDatasetRowResponse\x12=\n\x03row\x18\x01 \x01(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x03row"s\n\x14\x41\x64\x64SMECommentRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12\x15\n\x06row_id\x18\x02 \x01(\tR\x05rowId\x12\x18\n\x07\x63ontent\x18\x03 \x01(\tR\x07\x63ontent"X\n\x15\x41\x64\x64SMECommentResponse\x12?\n\x07\x63omment\x18\x01 \x01(\x0b\x32%.agent_platform.dataset.v1.SMECommentR\x07\x63omment2\xcd\t\n\x0e\x44\x61tasetService\x12r\n\rCreateDataset\x12/.agent_platform.service.v1.CreateDatasetRequest\x1a\x30.agent_platform.service.v1.CreateDatasetResponse\x12i\n\nGetDataset\x12,.agent_platform.service.v1.GetDatasetRequest\x1a-.agent_platform.service.v1.GetDatasetResponse\x12o\n\x0cListDatasets\x12..agent_platform.service.v1.ListDatasetsRequest\x1a/.agent_platform.service.v1.ListDatasetsResponse\x12r\n\rDeleteDataset\x12/.agent_platform.service.v1.DeleteDatasetRequest\x1a\x30.agent_platform.service.v1.DeleteDatasetResponse\x12k\n\nUploadFile\x12,.agent_platform.service.v1.UploadFileRequest\x1a-.agent_platform.service.v1.UploadFileResponse(\x01\x12\x84\x01\n\x13\x43reatePromptDataset\x12\x35.agent_platform.service.v1.CreatePromptDatasetRequest\x1a\x36.agent_platform.service.v1.CreatePromptDatasetResponse\x12{\n\x10GetPromptDataset\x12\x32.agent_platform.service.v1.GetPromptDatasetRequest\x1a\x33.agent_platform.service.v1.GetPromptDatasetResponse\x12\x81\x01\n\x12ListPromptDatasets\x12\x34.agent_platform.service.v1.ListPromptDatasetsRequest\x1a\x35.agent_platform.service.v1.ListPromptDatasetsResponse\x12\x8d\x01\n\x16UpdatePromptDatasetRow\x12\x38.agent_platform.service.v1.UpdatePromptDatasetRowRequest\x1a\x39.agent_platform.service.v1.UpdatePromptDatasetRowResponse\x12r\n\rAddSMEComment\x12/.agent_platform.service.v1.AddSMECommentRequest\x1a\x30.agent_platform.service.v1.AddSMECommentResponseB\xfb\x01\n\x1d\x63om.agent_platform.service.v1B\x13\x44\x61tasetServiceProtoP\x01ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\xa2\x02\x03\x41SX\xaa\x02\x18\x41gentPlatform.Service.V1\xca\x02\x18\x41gentPlatform\\Service\\V1\xe2\x02$AgentPlatform\\Service\\V1\\GPBMetadata\xea\x02\x1a\x41gentPlatform::Service::V1b\x06proto3'
+    b'\n/agent_platform/service/v1/dataset_service.proto\x12\x19\x61gent_platform.service.v1\x1a\'agent_platform/dataset/v1/dataset.proto\x1a.agent_platform/dataset/v1/prompt_dataset.proto\x1a$agent_platform/common/v1/types.proto"*\n\x14\x43reateDatasetRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name"U\n\x15\x43reateDatasetResponse\x12<\n\x07\x64\x61taset\x18\x01 \x01(\x0b\x32".agent_platform.dataset.v1.DatasetR\x07\x64\x61taset"2\n\x11GetDatasetRequest\x12\x1d\n\ndataset_id\x18\x01 \x01(\tR\tdatasetId"R\n\x12GetDatasetResponse\x12<\n\x07\x64\x61taset\x18\x01 \x01(\x0b\x32".agent_platform.dataset.v1.DatasetR\x07\x64\x61taset"[\n\x13ListDatasetsRequest\x12\x44\n\npagination\x18\x01 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xa4\x01\n\x14ListDatasetsResponse\x12>\n\x08\x64\x61tasets\x18\x01 \x03(\x0b\x32".agent_platform.dataset.v1.DatasetR\x08\x64\x61tasets\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"5\n\x14\x44\x65leteDatasetRequest\x12\x1d\n\ndataset_id\x18\x01 \x01(\tR\tdatasetId"\x17\n\x15\x44\x65leteDatasetResponse"\x80\x01\n\x11UploadFileRequest\x12K\n\x08metadata\x18\x01 \x01(\x0b\x32-.agent_platform.service.v1.UploadFileMetadataH\x00R\x08metadata\x12\x16\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00R\x05\x63hunkB\x06\n\x04\x64\x61ta"\x91\x01\n\x12UploadFileMetadata\x12\x1d\n\ndataset_id\x18\x01 \x01(\tR\tdatasetId\x12\x1a\n\x08\x66ilename\x18\x02 \x01(\tR\x08\x66ilename\x12@\n\tfile_type\x18\x03 \x01(\x0e\x32#.agent_platform.dataset.v1.FileTypeR\x08\x66ileType"P\n\x12UploadFileResponse\x12:\n\x04\x66ile\x18\x01 \x01(\x0b\x32&.agent_platform.dataset.v1.DatasetFileR\x04\x66ile"q\n\x1a\x43reatePromptDatasetRequest\x12\x12\n\x04name\x18\x01 \x01(\tR\x04name\x12?\n\x04rows\x18\x02 \x03(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x04rows"n\n\x1b\x43reatePromptDatasetResponse\x12O\n\x0eprompt_dataset\x18\x01 \x01(\x0b\x32(.agent_platform.dataset.v1.PromptDatasetR\rpromptDataset"\x9a\x01\n\x1eImportPromptDatasetRowsRequest\x12X\n\x08metadata\x18\x01 \x01(\x0b\x32:.agent_platform.service.v1.ImportPromptDatasetRowsMetadataH\x00R\x08metadata\x12\x16\n\x05\x63hunk\x18\x02 \x01(\x0cH\x00R\x05\x63hunkB\x06\n\x04\x64\x61ta"\xc5\x01\n\x1fImportPromptDatasetRowsMetadata\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12?\n\x06\x66ormat\x18\x02 \x01(\x0e\x32\'.agent_platform.service.v1.ImportFormatR\x06\x66ormat\x12\x35\n\x17\x64\x65\x66\x61ult_reward_agent_id\x18\x03 \x01(\tR\x14\x64\x65\x66\x61ultRewardAgentId"\xaa\x01\n\x1fImportPromptDatasetRowsResponse\x12#\n\rimported_rows\x18\x01 \x01(\x03R\x0cimportedRows\x12\x1f\n\x0b\x66\x61iled_rows\x18\x02 \x01(\x03R\nfailedRows\x12\x41\n\x06\x65rrors\x18\x03 \x03(\x0b\x32).agent_platform.service.v1.ImportRowErrorR\x06\x65rrors">\n\x0eImportRowError\x12\x12\n\x04line\x18\x01 \x01(\x03R\x04line\x12\x18\n\x07message\x18\x02 \x01(\tR\x07message"\x88\x01\n\x17GetPromptDatasetRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12\x41\n\trows_page\x18\x02 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\x08rowsPage"\xc2\x01\n\x18GetPromptDatasetResponse\x12O\n\x0eprompt_dataset\x18\x01 \x01(\x0b\x32(.agent_platform.dataset.v1.PromptDatasetR\rpromptDataset\x12U\n\x0frows_pagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\x0erowsPagination"\x90\x01\n\x1eStreamPromptDatasetRowsRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12%\n\x0estart_sequence\x18\x02 \x01(\x05R\rstartSequence\x12\x1b\n\tpage_size\x18\x03 \x01(\x05R\x08pageSize"b\n\x1fStreamPromptDatasetRowsResponse\x12?\n\x04rows\x18\x01 \x03(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x04rows"a\n\x19ListPromptDatasetsRequest\x12\x44\n\npagination\x18\x01 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xbd\x01\n\x1aListPromptDatasetsResponse\x12Q\n\x0fprompt_datasets\x18\x01 \x03(\x0b\x32(.agent_platform.dataset.v1.PromptDatasetR\x0epromptDatasets\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"\x8a\x01\n\x1dUpdatePromptDatasetRowRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12=\n\x03row\x18\x02 \x01(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x03row"_\n\x1eUpdatePromptDatasetRowResponse\x12=\n\x03row\x18\x01 \x01(\x0b\x32+.agent_platform.dataset.v1.PromptDatasetRowR\x03row"s\n\x14\x41\x64\x64SMECommentRequest\x12*\n\x11prompt_dataset_id\x18\x01 \x01(\tR\x0fpromptDatasetId\x12\x15\n\x06row_id\x18\x02 \x01(\tR\x05rowId\x12\x18\n\x07\x63ontent\x18\x03 \x01(\tR\x07\x63ontent"X\n\x15\x41\x64\x64SMECommentResponse\x12?\n\x07\x63omment\x18\x01 \x01(\x0b\x32%.agent_platform.dataset.v1.SMECommentR\x07\x63omment*]\n\x0cImportFormat\x12\x1d\n\x19IMPORT_FORMAT_UNSPECIFIED\x10\x00\x12\x15\n\x11IMPORT_FORMAT_CSV\x10\x01\x12\x17\n\x13IMPORT_FORMAT_JSONL\x10\x02\x32\xf7\x0b\n\x0e\x44\x61tasetService\x12r\n\rCreateDataset\x12/.agent_platform.service.v1.CreateDatasetRequest\x1a\x30.agent_platform.service.v1.CreateDatasetResponse\x12i\n\nGetDataset\x12,.agent_platform.service.v1.GetDatasetRequest\x1a-.agent_platform.service.v1.GetDatasetResponse\x12o\n\x0cListDatasets\x12..agent_platform.service.v1.ListDatasetsRequest\x1a/.agent_platform.service.v1.ListDatasetsResponse\x12r\n\rDeleteDataset\x12/.agent_platform.service.v1.DeleteDatasetRequest\x1a\x30.agent_platform.service.v1.DeleteDatasetResponse\x12k\n\nUploadFile\x12,.agent_platform.service.v1.UploadFileRequest\x1a-.agent_platform.service.v1.UploadFileResponse(\x01\x12\x84\x01\n\x13\x43reatePromptDataset\x12\x35.agent_platform.service.v1.CreatePromptDatasetRequest\x1a\x36.agent_platform.service.v1.CreatePromptDatasetResponse\x12\x92\x01\n\x17ImportPromptDatasetRows\x12\x39.agent_platform.service.v1.ImportPromptDatasetRowsRequest\x1a:.agent_platform.service.v1.ImportPromptDatasetRowsResponse(\x01\x12{\n\x10GetPromptDataset\x12\x32.agent_platform.service.v1.GetPromptDatasetRequest\x1a\x33.agent_platform.service.v1.GetPromptDatasetResponse\x12\x92\x01\n\x17StreamPromptDatasetRows\x12\x39.agent_platform.service.v1.StreamPromptDatasetRowsRequest\x1a:.agent_platform.service.v1.StreamPromptDatasetRowsResponse0\x01\x12\x81\x01\n\x12ListPromptDatasets\x12\x34.agent_platform.service.v1.ListPromptDatasetsRequest\x1a\x35.agent_platform.service.v1.ListPromptDatasetsResponse\x12\x8d\x01\n\x16UpdatePromptDatasetRow\x12\x38.agent_platform.service.v1.UpdatePromptDatasetRowRequest\x1a\x39.agent_platform.service.v1.UpdatePromptDatasetRowResponse\x12r\n\rAddSMEComment\x12/.agent_platform.service.v1.AddSMECommentRequest\x1a\x30.agent_platform.service.v1.AddSMECommentResponseB\xfb\x01\n\x1d\x63om.agent_platform.service.v1B\x13\x44\x61tasetServiceProtoP\x01ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\xa2\x02\x03\x41SX\xaa\x02\x18\x41gentPlatform.Service.V1\xca\x02\x18\x41gentPlatform\\Service\\V1\xe2\x02$AgentPlatform\\Service\\V1\\GPBMetadata\xea\x02\x1a\x41gentPlatform::Service::V1b\x06proto3'
 )
 
 _globals = globals()
@@ -34,6 +34,8 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals[
         "DESCRIPTOR"
     ]._serialized_options = b"\n\035com.agent_platform.service.v1B\023DatasetServiceProtoP\001ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\242\002\003ASX\252\002\030AgentPlatform.Service.V1\312\002\030AgentPlatform\\Service\\V1\342\002$AgentPlatform\\Service\\V1\\GPBMetadata\352\002\032AgentPlatform::Service::V1"
+    _globals["_IMPORTFORMAT"]._serialized_start = 3313
+    _globals["_IMPORTFORMAT"]._serialized_end = 3406
     _globals["_CREATEDATASETREQUEST"]._serialized_start = 205
     _globals["_CREATEDATASETREQUEST"]._serialized_end = 247
     _globals["_CREATEDATASETRESPONSE"]._serialized_start = 249
@@ -60,22 +62,34 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_CREATEPROMPTDATASETREQUEST"]._serialized_end = 1286
     _globals["_CREATEPROMPTDATASETRESPONSE"]._serialized_start = 1288
     _globals["_CREATEPROMPTDATASETRESPONSE"]._serialized_end = 1398
-    _globals["_GETPROMPTDATASETREQUEST"]._serialized_start = 1400
-    _globals["_GETPROMPTDATASETREQUEST"]._serialized_end = 1469
-    _globals["_GETPROMPTDATASETRESPONSE"]._serialized_start = 1471
-    _globals["_GETPROMPTDATASETRESPONSE"]._serialized_end = 1578
-    _globals["_LISTPROMPTDATASETSREQUEST"]._serialized_start = 1580
-    _globals["_LISTPROMPTDATASETSREQUEST"]._serialized_end = 1677
-    _globals["_LISTPROMPTDATASETSRESPONSE"]._serialized_start = 1680
-    _globals["_LISTPROMPTDATASETSRESPONSE"]._serialized_end = 1869
-    _globals["_UPDATEPROMPTDATASETROWREQUEST"]._serialized_start = 1872
-    _globals["_UPDATEPROMPTDATASETROWREQUEST"]._serialized_end = 2010
-    _globals["_UPDATEPROMPTDATASETROWRESPONSE"]._serialized_start = 2012
-    _globals["_UPDATEPROMPTDATASETROWRESPONSE"]._serialized_end = 2107
-    _globals["_ADDSMECOMMENTREQUEST"]._serialized_start = 2109
-    _globals["_ADDSMECOMMENTREQUEST"]._serialized_end = 2224
-    _globals["_ADDSMECOMMENTRESPONSE"]._serialized_start = 2226
-    _globals["_ADDSMECOMMENTRESPONSE"]._serialized_end = 2314
-    _globals["_DATASETSERVICE"]._serialized_start = 2317
-    _globals["_DATASETSERVICE"]._serialized_end = 3546
+    _globals["_IMPORTPROMPTDATASETROWSREQUEST"]._serialized_start = 1401
+    _globals["_IMPORTPROMPTDATASETROWSREQUEST"]._serialized_end = 1555
+    _globals["_IMPORTPROMPTDATASETROWSMETADATA"]._serialized_start = 1558
+    _globals["_IMPORTPROMPTDATASETROWSMETADATA"]._serialized_end = 1755
+    _globals["_IMPORTPROMPTDATASETROWSRESPONSE"]._serialized_start = 1758
+    _globals["_IMPORTPROMPTDATASETROWSRESPONSE"]._serialized_end = 1928
+    _globals["_IMPORTROWERROR"]._serialized_start = 1930
+    _globals["_IMPORTROWERROR"]._serialized_end = 1992
+    _globals["_GETPROMPTDATASETREQUEST"]._serialized_start = 1995
+    _globals["_GETPROMPTDATASETREQUEST"]._serialized_end = 2131
+    _globals["_GETPROMPTDATASETRESPONSE"]._serialized_start = 2134
+    _globals["_GETPROMPTDATASETRESPONSE"]._serialized_end = 2328
+    _globals["_STREAMPROMPTDATASETROWSREQUEST"]._serialized_start = 2331
+    _globals["_STREAMPROMPTDATASETROWSREQUEST"]._serialized_end = 2475
+    _globals["_STREAMPROMPTDATASETROWSRESPONSE"]._serialized_start = 2477
+    _globals["_STREAMPROMPTDATASETROWSRESPONSE"]._serialized_end = 2575
+    _globals["_LISTPROMPTDATASETSREQUEST"]._serialized_start = 2577
+    _globals["_LISTPROMPTDATASETSREQUEST"]._serialized_end = 2674
+    _globals["_LISTPROMPTDATASETSRESPONSE"]._serialized_start = 2677
+    _globals["_LISTPROMPTDATASETSRESPONSE"]._serialized_end = 2866
+    _globals["_UPDATEPROMPTDATASETROWREQUEST"]._serialized_start = 2869
+    _globals["_UPDATEPROMPTDATASETROWREQUEST"]._serialized_end = 3007
+    _globals["_UPDATEPROMPTDATASETROWRESPONSE"]._serialized_start = 3009
+    _globals["_UPDATEPROMPTDATASETROWRESPONSE"]._serialized_end = 3104
+    _globals["_ADDSMECOMMENTREQUEST"]._serialized_start = 3106
+    _globals["_ADDSMECOMMENTREQUEST"]._serialized_end = 3221
+    _globals["_ADDSMECOMMENTRESPONSE"]._serialized_start = 3223
+    _globals["_ADDSMECOMMENTRESPONSE"]._serialized_end = 3311
+    _globals["_DATASETSERVICE"]._serialized_start = 3409
+    _globals["_DATASETSERVICE"]._serialized_end = 4936
 # @@protoc_insertion_point(module_scope)
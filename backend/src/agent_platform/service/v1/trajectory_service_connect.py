@@ -44,6 +44,13 @@ class TrajectoryService(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.AnnotateStepResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    async def batch_annotate(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     def export_trajectories(
         self,
         request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.ExportTrajectoriesRequest,
@@ -53,6 +60,20 @@ class TrajectoryService(Protocol):
     ]:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    async def query_trajectory_analytics(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
+    async def sample_trajectories(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
 
 class TrajectoryServiceASGIApplication(ConnectASGIApplication):
     def __init__(
@@ -104,6 +125,16 @@ class TrajectoryServiceASGIApplication(ConnectASGIApplication):
                     ),
                     function=service.annotate_step,
                 ),
+                "/agent_platform.service.v1.TrajectoryService/BatchAnnotate": Endpoint.unary(
+                    method=MethodInfo(
+                        name="BatchAnnotate",
+                        service_name="agent_platform.service.v1.TrajectoryService",
+                        input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.batch_annotate,
+                ),
                 "/agent_platform.service.v1.TrajectoryService/ExportTrajectories": Endpoint.server_stream(
                     method=MethodInfo(
                         name="ExportTrajectories",
@@ -114,6 +145,26 @@ class TrajectoryServiceASGIApplication(ConnectASGIApplication):
                     ),
                     function=service.export_trajectories,
                 ),
+                "/agent_platform.service.v1.TrajectoryService/QueryTrajectoryAnalytics": Endpoint.unary(
+                    method=MethodInfo(
+                        name="QueryTrajectoryAnalytics",
+                        service_name="agent_platform.service.v1.TrajectoryService",
+                        input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.query_trajectory_analytics,
+                ),
+                "/agent_platform.service.v1.TrajectoryService/SampleTrajectories": Endpoint.unary(
+                    method=MethodInfo(
+                        name="SampleTrajectories",
+                        service_name="agent_platform.service.v1.TrajectoryService",
+                        input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.sample_trajectories,
+                ),
             },
             interceptors=interceptors,
             read_max_bytes=read_max_bytes,
@@ -206,6 +257,26 @@ class TrajectoryServiceClient(ConnectClient):
             timeout_ms=timeout_ms,
         )
 
+    async def batch_annotate(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse:
+        return await self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="BatchAnnotate",
+                service_name="agent_platform.service.v1.TrajectoryService",
+                input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+                output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     def export_trajectories(
         self,
         request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.ExportTrajectoriesRequest,
@@ -228,6 +299,46 @@ class TrajectoryServiceClient(ConnectClient):
             timeout_ms=timeout_ms,
         )
 
+    async def query_trajectory_analytics(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse:
+        return await self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="QueryTrajectoryAnalytics",
+                service_name="agent_platform.service.v1.TrajectoryService",
+                input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+                output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
+    async def sample_trajectories(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse:
+        return await self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="SampleTrajectories",
+                service_name="agent_platform.service.v1.TrajectoryService",
+                input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+                output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
 
 class TrajectoryServiceSync(Protocol):
     def get_trajectory(
@@ -258,6 +369,13 @@ class TrajectoryServiceSync(Protocol):
     ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.AnnotateStepResponse:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def batch_annotate(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
     def export_trajectories(
         self,
         request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.ExportTrajectoriesRequest,
@@ -267,6 +385,20 @@ class TrajectoryServiceSync(Protocol):
     ]:
         raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
 
+    def query_trajectory_analytics(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
+    def sample_trajectories(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+        ctx: RequestContext,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse:
+        raise ConnectError(Code.UNIMPLEMENTED, "Not implemented")
+
 
 class TrajectoryServiceWSGIApplication(ConnectWSGIApplication):
     def __init__(
@@ -317,6 +449,16 @@ class TrajectoryServiceWSGIApplication(ConnectWSGIApplication):
                     ),
                     function=service.annotate_step,
                 ),
+                "/agent_platform.service.v1.TrajectoryService/BatchAnnotate": EndpointSync.unary(
+                    method=MethodInfo(
+                        name="BatchAnnotate",
+                        service_name="agent_platform.service.v1.TrajectoryService",
+                        input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.batch_annotate,
+                ),
                 "/agent_platform.service.v1.TrajectoryService/ExportTrajectories": EndpointSync.server_stream(
                     method=MethodInfo(
                         name="ExportTrajectories",
@@ -327,6 +469,26 @@ class TrajectoryServiceWSGIApplication(ConnectWSGIApplication):
                     ),
                     function=service.export_trajectories,
                 ),
+                "/agent_platform.service.v1.TrajectoryService/QueryTrajectoryAnalytics": EndpointSync.unary(
+                    method=MethodInfo(
+                        name="QueryTrajectoryAnalytics",
+                        service_name="agent_platform.service.v1.TrajectoryService",
+                        input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.query_trajectory_analytics,
+                ),
+                "/agent_platform.service.v1.TrajectoryService/SampleTrajectories": EndpointSync.unary(
+                    method=MethodInfo(
+                        name="SampleTrajectories",
+                        service_name="agent_platform.service.v1.TrajectoryService",
+                        input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+                        output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse,
+                        idempotency_level=IdempotencyLevel.UNKNOWN,
+                    ),
+                    function=service.sample_trajectories,
+                ),
             },
             interceptors=interceptors,
             read_max_bytes=read_max_bytes,
@@ -419,6 +581,26 @@ class TrajectoryServiceClientSync(ConnectClientSync):
             timeout_ms=timeout_ms,
         )
 
+    def batch_annotate(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse:
+        return self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="BatchAnnotate",
+                service_name="agent_platform.service.v1.TrajectoryService",
+                input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateRequest,
+                output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.BatchAnnotateResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
     def export_trajectories(
         self,
         request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.ExportTrajectoriesRequest,
@@ -440,3 +622,43 @@ class TrajectoryServiceClientSync(ConnectClientSync):
             headers=headers,
             timeout_ms=timeout_ms,
         )
+
+    def query_trajectory_analytics(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse:
+        return self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="QueryTrajectoryAnalytics",
+                service_name="agent_platform.service.v1.TrajectoryService",
+                input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsRequest,
+                output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.QueryTrajectoryAnalyticsResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
+
+    def sample_trajectories(
+        self,
+        request: agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+        *,
+        headers: Headers | Mapping[str, str] | None = None,
+        timeout_ms: int | None = None,
+    ) -> agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse:
+        return self.execute_unary(
+            request=request,
+            method=MethodInfo(
+                name="SampleTrajectories",
+                service_name="agent_platform.service.v1.TrajectoryService",
+                input=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesRequest,
+                output=agent__platform_dot_service_dot_v1_dot_trajectory__service__pb2.SampleTrajectoriesResponse,
+                idempotency_level=IdempotencyLevel.UNKNOWN,
+            ),
+            headers=headers,
+            timeout_ms=timeout_ms,
+        )
@@ -26,7 +26,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n2agent_platform/service/v1/trajectory_service.proto\x12\x19\x61gent_platform.service.v1\x1a-agent_platform/trajectory/v1/trajectory.proto\x1a$agent_platform/common/v1/types.proto";\n\x14GetTrajectoryRequest\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId"a\n\x15GetTrajectoryResponse\x12H\n\ntrajectory\x18\x01 \x01(\x0b\x32(.agent_platform.trajectory.v1.TrajectoryR\ntrajectory"\xa7\x01\n\x17ListTrajectoriesRequest\x12\x46\n\x06\x66ilter\x18\x01 \x01(\x0b\x32..agent_platform.trajectory.v1.TrajectoryFilterR\x06\x66ilter\x12\x44\n\npagination\x18\x02 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xb6\x01\n\x18ListTrajectoriesResponse\x12L\n\x0ctrajectories\x18\x01 \x03(\x0b\x32(.agent_platform.trajectory.v1.TrajectoryR\x0ctrajectories\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"\x9b\x01\n\x19\x41nnotateTrajectoryRequest\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId\x12\x43\n\x05label\x18\x02 \x01(\x0e\x32-.agent_platform.trajectory.v1.TrajectoryLabelR\x05label\x12\x14\n\x05notes\x18\x03 \x01(\tR\x05notes"p\n\x1a\x41nnotateTrajectoryResponse\x12R\n\nannotation\x18\x01 \x01(\x0b\x32\x32.agent_platform.trajectory.v1.TrajectoryAnnotationR\nannotation"\xb0\x01\n\x13\x41nnotateStepRequest\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId\x12\x19\n\x08\x62lock_id\x18\x02 \x01(\tR\x07\x62lockId\x12=\n\x05label\x18\x03 \x01(\x0e\x32\'.agent_platform.trajectory.v1.StepLabelR\x05label\x12\x1a\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x04 \x01(\tR\x08\x66\x65\x65\x64\x62\x61\x63k"d\n\x14\x41nnotateStepResponse\x12L\n\nannotation\x18\x01 \x01(\x0b\x32,.agent_platform.trajectory.v1.StepAnnotationR\nannotation"\xa4\x01\n\x19\x45xportTrajectoriesRequest\x12\x46\n\x06\x66ilter\x18\x01 \x01(\x0b\x32..agent_platform.trajectory.v1.TrajectoryFilterR\x06\x66ilter\x12?\n\x06\x66ormat\x18\x02 \x01(\x0e\x32\'.agent_platform.service.v1.ExportFormatR\x06\x66ormat"0\n\x1a\x45xportTrajectoriesResponse\x12\x12\n\x04\x64\x61ta\x18\x01 \x01(\x0cR\x04\x64\x61ta*a\n\x0c\x45xportFormat\x12\x1d\n\x19\x45XPORT_FORMAT_UNSPECIFIED\x10\x00\x12\x17\n\x13\x45XPORT_FORMAT_JSONL\x10\x01\x12\x19\n\x15\x45XPORT_FORMAT_PARQUET\x10\x02\x32\xff\x04\n\x11TrajectoryService\x12r\n\rGetTrajectory\x12/.agent_platform.service.v1.GetTrajectoryRequest\x1a\x30.agent_platform.service.v1.GetTrajectoryResponse\x12{\n\x10ListTrajectories\x12\x32.agent_platform.service.v1.ListTrajectoriesRequest\x1a\x33.agent_platform.service.v1.ListTrajectoriesResponse\x12\x81\x01\n\x12\x41nnotateTrajectory\x12\x34.agent_platform.service.v1.AnnotateTrajectoryRequest\x1a\x35.agent_platform.service.v1.AnnotateTrajectoryResponse\x12o\n\x0c\x41nnotateStep\x12..agent_platform.service.v1.AnnotateStepRequest\x1a/.agent_platform.service.v1.AnnotateStepResponse\x12\x83\x01\n\x12\x45xportTrajectories\x12\x34.agent_platform.service.v1.ExportTrajectoriesRequest\x1a\x35.agent_platform.service.v1.ExportTrajectoriesResponse0\x01\x42\xfe\x01\n\x1d\x63om.agent_platform.service.v1B\x16TrajectoryServiceProtoP\x01ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\xa2\x02\x03\x41SX\xaa\x02\x18\x41gentPlatform.Service.V1\xca\x02\x18\x41gentPlatform\\Service\\V1\xe2\x02$AgentPlatform\\Service\\V1\\GPBMetadata\xea\x02\x1a\x41gentPlatform::Service::V1b\x06proto3'
+    b'\n2agent_platform/service/v1/trajectory_service.proto\x12\x19\x61gent_platform.service.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a-agent_platform/trajectory/v1/trajectory.proto\x1a$agent_platform/common/v1/types.proto";\n\x14GetTrajectoryRequest\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId"a\n\x15GetTrajectoryResponse\x12H\n\ntrajectory\x18\x01 \x01(\x0b\x32(.agent_platform.trajectory.v1.TrajectoryR\ntrajectory"\xa7\x01\n\x17ListTrajectoriesRequest\x12\x46\n\x06\x66ilter\x18\x01 \x01(\x0b\x32..agent_platform.trajectory.v1.TrajectoryFilterR\x06\x66ilter\x12\x44\n\npagination\x18\x02 \x01(\x0b\x32$.agent_platform.common.v1.PaginationR\npagination"\xb6\x01\n\x18ListTrajectoriesResponse\x12L\n\x0ctrajectories\x18\x01 \x03(\x0b\x32(.agent_platform.trajectory.v1.TrajectoryR\x0ctrajectories\x12L\n\npagination\x18\x02 \x01(\x0b\x32,.agent_platform.common.v1.PaginationResponseR\npagination"\xbe\x01\n\x19\x41nnotateTrajectoryRequest\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId\x12\x43\n\x05label\x18\x02 \x01(\x0e\x32-.agent_platform.trajectory.v1.TrajectoryLabelR\x05label\x12\x14\n\x05notes\x18\x03 \x01(\tR\x05notes\x12!\n\x0c\x61nnotator_id\x18\x04 \x01(\tR\x0b\x61nnotatorId"p\n\x1a\x41nnotateTrajectoryResponse\x12R\n\nannotation\x18\x01 \x01(\x0b\x32\x32.agent_platform.trajectory.v1.TrajectoryAnnotationR\nannotation"\xd3\x01\n\x13\x41nnotateStepRequest\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId\x12\x19\n\x08\x62lock_id\x18\x02 \x01(\tR\x07\x62lockId\x12=\n\x05label\x18\x03 \x01(\x0e\x32\'.agent_platform.trajectory.v1.StepLabelR\x05label\x12\x1a\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x04 \x01(\tR\x08\x66\x65\x65\x64\x62\x61\x63k\x12!\n\x0c\x61nnotator_id\x18\x05 \x01(\tR\x0b\x61nnotatorId"d\n\x14\x41nnotateStepResponse\x12L\n\nannotation\x18\x01 \x01(\x0b\x32,.agent_platform.trajectory.v1.StepAnnotationR\nannotation"\xd9\x01\n\x14\x42\x61tchAnnotateRequest\x12!\n\x0c\x61nnotator_id\x18\x01 \x01(\tR\x0b\x61nnotatorId\x12X\n\x0ctrajectories\x18\x02 \x03(\x0b\x32\x34.agent_platform.service.v1.AnnotateTrajectoryRequestR\x0ctrajectories\x12\x44\n\x05steps\x18\x03 \x03(\x0b\x32..agent_platform.service.v1.AnnotateStepRequestR\x05steps"i\n\x15\x42\x61tchAnnotateResponse\x12P\n\x0b\x61nnotations\x18\x01 \x03(\x0b\x32..agent_platform.service.v1.AnnotatedTrajectoryR\x0b\x61nnotations"\x8e\x01\n\x13\x41nnotatedTrajectory\x12#\n\rtrajectory_id\x18\x01 \x01(\tR\x0ctrajectoryId\x12R\n\nannotation\x18\x02 \x01(\x0b\x32\x32.agent_platform.trajectory.v1.TrajectoryAnnotationR\nannotation"\xa4\x01\n\x19\x45xportTrajectoriesRequest\x12\x46\n\x06\x66ilter\x18\x01 \x01(\x0b\x32..agent_platform.trajectory.v1.TrajectoryFilterR\x06\x66ilter\x12?\n\x06\x66ormat\x18\x02 \x01(\x0e\x32\'.agent_platform.service.v1.ExportFormatR\x06\x66ormat"0\n\x1a\x45xportTrajectoriesResponse\x12\x12\n\x04\x64\x61ta\x18\x01 \x01(\x0cR\x04\x64\x61ta"\xb8\x03\n\x1fQueryTrajectoryAnalyticsRequest\x12\x46\n\x06\x66ilter\x18\x01 \x01(\x0b\x32..agent_platform.trajectory.v1.TrajectoryFilterR\x06\x66ilter\x12H\n\x08group_by\x18\x02 \x03(\x0e\x32-.agent_platform.service.v1.AnalyticsDimensionR\x07groupBy\x12\x42\n\x06metric\x18\x03 \x01(\x0e\x32*.agent_platform.service.v1.AnalyticsMetricR\x06metric\x12 \n\x0bpercentiles\x18\x04 \x03(\x01R\x0bpercentiles\x12%\n\x0ehistogram_bins\x18\x05 \x01(\x05R\rhistogramBins\x12(\n\rhistogram_min\x18\x06 \x01(\x01H\x00R\x0chistogramMin\x88\x01\x01\x12(\n\rhistogram_max\x18\x07 \x01(\x01H\x01R\x0chistogramMax\x88\x01\x01\x42\x10\n\x0e_histogram_minB\x10\n\x0e_histogram_max"\xf2\x01\n QueryTrajectoryAnalyticsResponse\x12\x41\n\x06groups\x18\x01 \x03(\x0b\x32).agent_platform.service.v1.AnalyticsGroupR\x06groups\x12\'\n\x0fhistogram_edges\x18\x02 \x03(\x01R\x0ehistogramEdges\x12)\n\x10trajectory_count\x18\x03 \x01(\x03R\x0ftrajectoryCount\x12\x37\n\tsynced_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x08syncedAt"\xc4\x01\n\x0e\x41nalyticsGroup\x12\x12\n\x04keys\x18\x01 \x03(\tR\x04keys\x12\x14\n\x05\x63ount\x18\x02 \x01(\x03R\x05\x63ount\x12\x10\n\x03sum\x18\x03 \x01(\x01R\x03sum\x12\x12\n\x04mean\x18\x04 \x01(\x01R\x04mean\x12\x10\n\x03min\x18\x05 \x01(\x01R\x03min\x12\x10\n\x03max\x18\x06 \x01(\x01R\x03max\x12 \n\x0bpercentiles\x18\x07 \x03(\x01R\x0bpercentiles\x12\x1c\n\thistogram\x18\x08 \x03(\x03R\thistogram"\x8a\x02\n\x19SampleTrajectoriesRequest\x12\x46\n\x06\x66ilter\x18\x01 \x01(\x0b\x32..agent_platform.trajectory.v1.TrajectoryFilterR\x06\x66ilter\x12I\n\x0bstratify_by\x18\x02 \x03(\x0e\x32(.agent_platform.service.v1.SampleStratumR\nstratifyBy\x12\x1f\n\x0bper_stratum\x18\x03 \x01(\x05R\nperStratum\x12\x12\n\x04seed\x18\x04 \x01(\x04R\x04seed\x12%\n\x0ereward_buckets\x18\x05 \x01(\x05R\rrewardBuckets"c\n\x1aSampleTrajectoriesResponse\x12\x45\n\x07samples\x18\x01 \x03(\x0b\x32+.agent_platform.service.v1.TrajectorySampleR\x07samples"\x94\x01\n\x10TrajectorySample\x12\x12\n\x04keys\x18\x01 \x03(\tR\x04keys\x12\x1e\n\npopulation\x18\x02 \x01(\x03R\npopulation\x12L\n\x0ctrajectories\x18\x03 \x03(\x0b\x32(.agent_platform.trajectory.v1.TrajectoryR\x0ctrajectories*a\n\x0c\x45xportFormat\x12\x1d\n\x19\x45XPORT_FORMAT_UNSPECIFIED\x10\x00\x12\x17\n\x13\x45XPORT_FORMAT_JSONL\x10\x01\x12\x19\n\x15\x45XPORT_FORMAT_PARQUET\x10\x02*\xb4\x01\n\x12\x41nalyticsDimension\x12#\n\x1f\x41NALYTICS_DIMENSION_UNSPECIFIED\x10\x00\x12\x1d\n\x19\x41NALYTICS_DIMENSION_AGENT\x10\x01\x12\x1b\n\x17\x41NALYTICS_DIMENSION_DAY\x10\x02\x12\x1d\n\x19\x41NALYTICS_DIMENSION_LABEL\x10\x03\x12\x1e\n\x1a\x41NALYTICS_DIMENSION_STATUS\x10\x04*\xe8\x01\n\x0f\x41nalyticsMetric\x12 \n\x1c\x41NALYTICS_METRIC_UNSPECIFIED\x10\x00\x12!\n\x1d\x41NALYTICS_METRIC_REWARD_SCORE\x10\x01\x12$\n ANALYTICS_METRIC_TOOL_CALL_COUNT\x10\x02\x12 \n\x1c\x41NALYTICS_METRIC_BLOCK_COUNT\x10\x03\x12%\n!ANALYTICS_METRIC_DURATION_SECONDS\x10\x04\x12!\n\x1d\x41NALYTICS_METRIC_TOTAL_TOKENS\x10\x05*\x85\x01\n\rSampleStratum\x12\x1e\n\x1aSAMPLE_STRATUM_UNSPECIFIED\x10\x00\x12\x18\n\x14SAMPLE_STRATUM_LABEL\x10\x01\x12\x18\n\x14SAMPLE_STRATUM_AGENT\x10\x02\x12 \n\x1cSAMPLE_STRATUM_REWARD_BUCKET\x10\x03\x32\x8d\x08\n\x11TrajectoryService\x12r\n\rGetTrajectory\x12/.agent_platform.service.v1.GetTrajectoryRequest\x1a\x30.agent_platform.service.v1.GetTrajectoryResponse\x12{\n\x10ListTrajectories\x12\x32.agent_platform.service.v1.ListTrajectoriesRequest\x1a\x33.agent_platform.service.v1.ListTrajectoriesResponse\x12\x81\x01\n\x12\x41nnotateTrajectory\x12\x34.agent_platform.service.v1.AnnotateTrajectoryRequest\x1a\x35.agent_platform.service.v1.AnnotateTrajectoryResponse\x12o\n\x0c\x41nnotateStep\x12..agent_platform.service.v1.AnnotateStepRequest\x1a/.agent_platform.service.v1.AnnotateStepResponse\x12r\n\rBatchAnnotate\x12/.agent_platform.service.v1.BatchAnnotateRequest\x1a\x30.agent_platform.service.v1.BatchAnnotateResponse\x12\x83\x01\n\x12\x45xportTrajectories\x12\x34.agent_platform.service.v1.ExportTrajectoriesRequest\x1a\x35.agent_platform.service.v1.ExportTrajectoriesResponse0\x01\x12\x93\x01\n\x18QueryTrajectoryAnalytics\x12:.agent_platform.service.v1.QueryTrajectoryAnalyticsRequest\x1a;.agent_platform.service.v1.QueryTrajectoryAnalyticsResponse\x12\x81\x01\n\x12SampleTrajectories\x12\x34.agent_platform.service.v1.SampleTrajectoriesRequest\x1a\x35.agent_platform.service.v1.SampleTrajectoriesResponseB\xfe\x01\n\x1d\x63om.agent_platform.service.v1B\x16TrajectoryServiceProtoP\x01ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\xa2\x02\x03\x41SX\xaa\x02\x18\x41gentPlatform.Service.V1\xca\x02\x18\x41gentPlatform\\Service\\V1\xe2\x02$AgentPlatform\\Service\\V1\\GPBMetadata\xea\x02\x1a\x41gentPlatform::Service::V1b\x06proto3'
 )
 
 _globals = globals()
@@ -39,28 +39,52 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals[
         "DESCRIPTOR"
     ]._serialized_options = b"\n\035com.agent_platform.service.v1B\026TrajectoryServiceProtoP\001ZCgithub.com/agentplatform/gen/go/agent_platform/service/v1;servicev1\242\002\003ASX\252\002\030AgentPlatform.Service.V1\312\002\030AgentPlatform\\Service\\V1\342\002$AgentPlatform\\Service\\V1\\GPBMetadata\352\002\032AgentPlatform::Service::V1"
-    _globals["_EXPORTFORMAT"]._serialized_start = 1451
-    _globals["_EXPORTFORMAT"]._serialized_end = 1548
-    _globals["_GETTRAJECTORYREQUEST"]._serialized_start = 166
-    _globals["_GETTRAJECTORYREQUEST"]._serialized_end = 225
-    _globals["_GETTRAJECTORYRESPONSE"]._serialized_start = 227
-    _globals["_GETTRAJECTORYRESPONSE"]._serialized_end = 324
-    _globals["_LISTTRAJECTORIESREQUEST"]._serialized_start = 327
-    _globals["_LISTTRAJECTORIESREQUEST"]._serialized_end = 494
-    _globals["_LISTTRAJECTORIESRESPONSE"]._serialized_start = 497
-    _globals["_LISTTRAJECTORIESRESPONSE"]._serialized_end = 679
-    _globals["_ANNOTATETRAJECTORYREQUEST"]._serialized_start = 682
-    _globals["_ANNOTATETRAJECTORYREQUEST"]._serialized_end = 837
-    _globals["_ANNOTATETRAJECTORYRESPONSE"]._serialized_start = 839
-    _globals["_ANNOTATETRAJECTORYRESPONSE"]._serialized_end = 951
-    _globals["_ANNOTATESTEPREQUEST"]._serialized_start = 954
-    _globals["_ANNOTATESTEPREQUEST"]._serialized_end = 1130
-    _globals["_ANNOTATESTEPRESPONSE"]._serialized_start = 1132
-    _globals["_ANNOTATESTEPRESPONSE"]._serialized_end = 1232
-    _globals["_EXPORTTRAJECTORIESREQUEST"]._serialized_start = 1235
-    _globals["_EXPORTTRAJECTORIESREQUEST"]._serialized_end = 1399
-    _globals["_EXPORTTRAJECTORIESRESPONSE"]._serialized_start = 1401
-    _globals["_EXPORTTRAJECTORIESRESPONSE"]._serialized_end = 1449
-    _globals["_TRAJECTORYSERVICE"]._serialized_start = 1551
-    _globals["_TRAJECTORYSERVICE"]._serialized_end = 2190
+    _globals["_EXPORTFORMAT"]._serialized_start = 3434
+    _globals["_EXPORTFORMAT"]._serialized_end = 3531
+    _globals["_ANALYTICSDIMENSION"]._serialized_start = 3534
+    _globals["_ANALYTICSDIMENSION"]._serialized_end = 3714
+    _globals["_ANALYTICSMETRIC"]._serialized_start = 3717
+    _globals["_ANALYTICSMETRIC"]._serialized_end = 3949
+    _globals["_SAMPLESTRATUM"]._serialized_start = 3952
+    _globals["_SAMPLESTRATUM"]._serialized_end = 4085
+    _globals["_GETTRAJECTORYREQUEST"]._serialized_start = 199
+    _globals["_GETTRAJECTORYREQUEST"]._serialized_end = 258
+    _globals["_GETTRAJECTORYRESPONSE"]._serialized_start = 260
+    _globals["_GETTRAJECTORYRESPONSE"]._serialized_end = 357
+    _globals["_LISTTRAJECTORIESREQUEST"]._serialized_start = 360
+    _globals["_LISTTRAJECTORIESREQUEST"]._serialized_end = 527
+    _globals["_LISTTRAJECTORIESRESPONSE"]._serialized_start = 530
+    _globals["_LISTTRAJECTORIESRESPONSE"]._serialized_end = 712
+    _globals["_ANNOTATETRAJECTORYREQUEST"]._serialized_start = 715
+    _globals["_ANNOTATETRAJECTORYREQUEST"]._serialized_end = 905
+    _globals["_ANNOTATETRAJECTORYRESPONSE"]._serialized_start = 907
+    _globals["_ANNOTATETRAJECTORYRESPONSE"]._serialized_end = 1019
+    _globals["_ANNOTATESTEPREQUEST"]._serialized_start = 1022
+    _globals["_ANNOTATESTEPREQUEST"]._serialized_end = 1233
+    _globals["_ANNOTATESTEPRESPONSE"]._serialized_start = 1235
+    _globals["_ANNOTATESTEPRESPONSE"]._serialized_end = 1335
+    _globals["_BATCHANNOTATEREQUEST"]._serialized_start = 1338
+    _globals["_BATCHANNOTATEREQUEST"]._serialized_end = 1555
+    _globals["_BATCHANNOTATERESPONSE"]._serialized_start = 1557
+    _globals["_BATCHANNOTATERESPONSE"]._serialized_end = 1662
+    _globals["_ANNOTATEDTRAJECTORY"]._serialized_start = 1665
+    _globals["_ANNOTATEDTRAJECTORY"]._serialized_end = 1807
+    _globals["_EXPORTTRAJECTORIESREQUEST"]._serialized_start = 1810
+    _globals["_EXPORTTRAJECTORIESREQUEST"]._serialized_end = 1974
+    _globals["_EXPORTTRAJECTORIESRESPONSE"]._serialized_start = 1976
+    _globals["_EXPORTTRAJECTORIESRESPONSE"]._serialized_end = 2024
+    _globals["_QUERYTRAJECTORYANALYTICSREQUEST"]._serialized_start = 2027
+    _globals["_QUERYTRAJECTORYANALYTICSREQUEST"]._serialized_end = 2467
+    _globals["_QUERYTRAJECTORYANALYTICSRESPONSE"]._serialized_start = 2470
+    _globals["_QUERYTRAJECTORYANALYTICSRESPONSE"]._serialized_end = 2712
+    _globals["_ANALYTICSGROUP"]._serialized_start = 2715
+    _globals["_ANALYTICSGROUP"]._serialized_end = 2911
+    _globals["_SAMPLETRAJECTORIESREQUEST"]._serialized_start = 2914
+    _globals["_SAMPLETRAJECTORIESREQUEST"]._serialized_end = 3180
+    _globals["_SAMPLETRAJECTORIESRESPONSE"]._serialized_start = 3182
+    _globals["_SAMPLETRAJECTORIESRESPONSE"]._serialized_end = 3281
+    _globals["_TRAJECTORYSAMPLE"]._serialized_start = 3284
+    _globals["_TRAJECTORYSAMPLE"]._serialized_end = 3432
+    _globals["_TRAJECTORYSERVICE"]._serialized_start = 4088
+    _globals["_TRAJECTORYSERVICE"]._serialized_end = 5125
 # @@protoc_insertion_point(module_scope)
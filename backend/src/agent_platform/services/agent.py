@@ -161,7 +161,7 @@ class AgentServiceImpl(AgentService):
                 list(request.dataset_ids),
             ):
                 if "block" in event and event["block"] is not None:
-                    block_proto = self._dict_to_block_proto(event["block"])
+                    block_proto = self.dict_to_block_proto(event["block"])
                     yield StreamAgentRunResponse(block=block_proto)
                 elif "completed" in event and event["completed"] is not None:
                     yield StreamAgentRunResponse(completed=event["completed"])
@@ -267,7 +267,18 @@ class AgentServiceImpl(AgentService):
             "error_message": agent_run.error_message,
         }
 
-    def _dict_to_block_proto(self, block_dict: dict[str, Any]) -> Any:
+    @staticmethod
+    def metrics_to_proto(metrics: dict[str, Any] | None) -> Any:
+        from agent_platform.agent.v1.agent_run_pb2 import AgentRunMetrics
+
+        # Metrics the proto has no field for stay in the database.
+        fields = AgentRunMetrics.DESCRIPTOR.fields_by_name
+        return AgentRunMetrics(
+            **{key: value for key, value in (metrics or {}).items() if key in fields}
+        )
+
+    @staticmethod
+    def dict_to_block_proto(block_dict: dict[str, Any]) -> Any:
         import json
 
         from google.protobuf.duration_pb2 import Duration
@@ -347,7 +358,7 @@ class AgentServiceImpl(AgentService):
             finished_at = Timestamp()
             finished_at.FromDatetime(run_db.finished_at)
 
-        blocks_proto: list[Any] = [self._dict_to_block_proto(b) for b in run_db.blocks]
+        blocks_proto: list[Any] = [self.dict_to_block_proto(b) for b in run_db.blocks]
 
         return AgentRunProto(
             id=run_db.id,
@@ -358,6 +369,6 @@ class AgentServiceImpl(AgentService):
             force_final_tool_call=run_db.force_final_tool_call,
             status=run_db.status,
             dataset_ids=run_db.dataset_ids,
-            metrics=run_db.metrics,
+            metrics=self.metrics_to_proto(run_db.metrics),
             error_message=run_db.error_message,
         )
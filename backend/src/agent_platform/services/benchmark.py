@@ -1,22 +1,54 @@
+import logging
+from datetime import datetime, timedelta
 from typing import Any
 
+from agent_platform.benchmarks.comparison import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_CONFIDENCE_LEVEL,
+    compare_benchmark_runs,
+)
+from agent_platform.benchmarks.runner import BenchmarkRunner
+from agent_platform.benchmarks.sweep import sweep_configs
 from agent_platform.common.v1.types_pb2 import PaginationResponse
+from agent_platform.config import settings
 from agent_platform.db.engine import AsyncSessionLocal
-from agent_platform.db.models.benchmark import BenchmarkRun
-from agent_platform.db.repository.benchmark import BenchmarkRunRepository
+from agent_platform.db.models.agent import Agent
+from agent_platform.db.models.benchmark import BenchmarkComparison, BenchmarkRun, BenchmarkSweep
+from agent_platform.db.models.reward import RewardAgent
+from agent_platform.db.repository.agent import AgentRepository
+from agent_platform.db.repository.benchmark import (
+    BenchmarkComparisonRepository,
+    BenchmarkRunRepository,
+    BenchmarkRunRowRepository,
+    BenchmarkSweepRepository,
+)
+from agent_platform.db.repository.reward import RewardAgentRepository, RewardCacheRepository
+from agent_platform.llm.executor import Status
+from agent_platform.models.agent_config import AgentConfig
+from agent_platform.rewards.scoring import LOCAL_SCORERS
 from agent_platform.service.v1.benchmark_service_connect import (
     BenchmarkService,
 )
 from agent_platform.service.v1.benchmark_service_pb2 import (
+    BenchmarkConcurrency,
+    BenchmarkRunError,
+    CompareBenchmarksResponse,
     CreateBenchmarkRunResponse,
+    CreateBenchmarkSweepResponse,
     GetBenchmarkRunResponse,
+    GetBenchmarkSweepResponse,
     ListBenchmarkRunsResponse,
+    ResumeBenchmarkRunResponse,
+    StreamBenchmarkRunResponse,
+    UpdateRewardAgentResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class BenchmarkServiceImpl(BenchmarkService):
-    def __init__(self) -> None:
-        pass
+    def __init__(self, runner: BenchmarkRunner) -> None:
+        self.runner: BenchmarkRunner = runner
 
     async def create_benchmark_run(self, request, ctx):
         import uuid
@@ -28,13 +60,50 @@ class BenchmarkServiceImpl(BenchmarkService):
                 id=str(uuid.uuid4()),
                 agent_id=request.agent_id,
                 prompt_dataset_id=request.prompt_dataset_id,
-                rows=[],
-                status=0,
+                status=Status.AWAITING_START,
                 started_at=datetime.utcnow(),
-                config=dict(request.config) if request.config else None,
+                config=self._config_to_dict(request.config),
             )
             await session.commit()
-            return CreateBenchmarkRunResponse(benchmark_run=self._db_to_proto(run))
+
+        self.runner.start(run.id)
+        return CreateBenchmarkRunResponse(benchmark_run=self._db_to_proto(run))
+
+    def _config_to_dict(self, config: Any) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "runs_per_prompt": config.runs_per_prompt or 1,
+            "max_parallel_runs": config.max_parallel_runs or 1,
+            "save_trajectories": config.save_trajectories,
+            "reuse_cached_rows": config.reuse_cached_rows,
+        }
+        early_stopping: Any = config.early_stopping
+        if early_stopping.enabled:
+            if not early_stopping.max_interval_width and not early_stopping.HasField(
+                "target_score"
+            ):
+                raise ValueError("Early stopping needs a max_interval_width or a target_score")
+            if early_stopping.confidence_level and not 0.0 < early_stopping.confidence_level < 1.0:
+                raise ValueError(f"Invalid confidence level {early_stopping.confidence_level}")
+            if early_stopping.max_interval_width < 0:
+                raise ValueError(f"Invalid max interval width {early_stopping.max_interval_width}")
+            result["early_stopping"] = {
+                "enabled": True,
+                "confidence_level": early_stopping.confidence_level,
+                "max_interval_width": early_stopping.max_interval_width,
+                "min_rows": early_stopping.min_rows,
+            }
+            if early_stopping.HasField("target_score"):
+                result["early_stopping"]["target_score"] = early_stopping.target_score
+        local_scoring: Any = config.local_scoring
+        for scorer in local_scoring.scorers:
+            if scorer not in LOCAL_SCORERS:
+                raise ValueError(f"Unknown local scorer {scorer}")
+        if local_scoring.disabled or local_scoring.scorers:
+            result["local_scoring"] = {
+                "disabled": local_scoring.disabled,
+                "scorers": list(local_scoring.scorers),
+            }
+        return result
 
     async def get_benchmark_run(self, request, ctx):
         async with AsyncSessionLocal() as session:
@@ -42,7 +111,25 @@ class BenchmarkServiceImpl(BenchmarkService):
             run: BenchmarkRun | None = await repo.get_by_id(request.benchmark_run_id)
             if not run:
                 raise ValueError(f"Benchmark run {request.benchmark_run_id} not found")
-            return GetBenchmarkRunResponse(benchmark_run=self._db_to_proto(run))
+            row_repo: BenchmarkRunRowRepository = BenchmarkRunRowRepository(session)
+            if not request.HasField("rows_page") or request.rows_page.page_size <= 0:
+                rows: list[dict] = await row_repo.get_by_benchmark_run_id(run.id)
+                return GetBenchmarkRunResponse(benchmark_run=self._db_to_proto(run, rows))
+
+            page_size: int = request.rows_page.page_size
+            offset: int = int(request.rows_page.page_token or 0)
+            # One extra row tells whether another page follows.
+            rows = await row_repo.get_by_benchmark_run_id(
+                run.id, limit=page_size + 1, offset=offset
+            )
+            total_count: int = (await row_repo.count_by_benchmark_run_ids([run.id]))[run.id]
+            return GetBenchmarkRunResponse(
+                benchmark_run=self._db_to_proto(run, rows[:page_size]),
+                rows_pagination=PaginationResponse(
+                    next_page_token=str(offset + page_size) if len(rows) > page_size else "",
+                    total_count=total_count,
+                ),
+            )
 
     async def list_benchmark_runs(self, request, ctx):
         async with AsyncSessionLocal() as session:
@@ -55,6 +142,7 @@ class BenchmarkServiceImpl(BenchmarkService):
             runs: list[BenchmarkRun] = await repo.get_by_agent_id(
                 request.agent_id, limit=page_size, offset=0
             )
+            # Rows are paged through GetBenchmarkRun; listed runs carry their stats only.
             return ListBenchmarkRunsResponse(
                 benchmark_runs=[self._db_to_proto(r) for r in runs],
                 pagination=PaginationResponse(
@@ -63,7 +151,275 @@ class BenchmarkServiceImpl(BenchmarkService):
                 ),
             )
 
-    def _db_to_proto(self, run_db: BenchmarkRun) -> Any:
+    async def stream_benchmark_run(self, request, ctx):
+        async for event in self.runner.subscribe(request.benchmark_run_id):
+            if "row_completed" in event:
+                yield StreamBenchmarkRunResponse(
+                    row_completed=self._row_to_proto(event["row_completed"])
+                )
+            elif "benchmark_completed" in event:
+                async with AsyncSessionLocal() as session:
+                    repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+                    run: BenchmarkRun | None = await repo.get_by_id(request.benchmark_run_id)
+                    rows: list[dict] = await BenchmarkRunRowRepository(
+                        session
+                    ).get_by_benchmark_run_id(request.benchmark_run_id)
+                if run is not None:
+                    yield StreamBenchmarkRunResponse(
+                        benchmark_completed=self._db_to_proto(run, rows)
+                    )
+            elif "error" in event:
+                yield StreamBenchmarkRunResponse(error=BenchmarkRunError(**event["error"]))
+            elif "concurrency" in event:
+                yield StreamBenchmarkRunResponse(
+                    concurrency=BenchmarkConcurrency(**event["concurrency"])
+                )
+
+    async def resume_benchmark_run(self, request, ctx):
+        async with AsyncSessionLocal() as session:
+            repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+            run: BenchmarkRun | None = await repo.get_by_id(request.benchmark_run_id)
+            if not run:
+                raise ValueError(f"Benchmark run {request.benchmark_run_id} not found")
+            if self.runner.is_running(run.id) or not await repo.claim_for_resume(
+                run.id,
+                datetime.utcnow() - timedelta(seconds=settings.benchmark_resume_idle_seconds),
+            ):
+                raise ValueError(
+                    f"Benchmark run {run.id} is finished or still running and cannot be resumed"
+                )
+            await session.commit()
+            await session.refresh(run)
+            rows: list[dict] = await BenchmarkRunRowRepository(session).get_by_benchmark_run_id(
+                run.id
+            )
+
+        self.runner.start(run.id)
+        return ResumeBenchmarkRunResponse(benchmark_run=self._db_to_proto(run, rows))
+
+    async def compare_benchmarks(self, request, ctx):
+        run_ids: list[str] = list(dict.fromkeys(request.benchmark_run_ids))
+        if len(run_ids) < 2:
+            raise ValueError("At least two benchmark runs are required for comparison")
+        if request.bootstrap_resamples < 0:
+            raise ValueError(f"Invalid bootstrap resamples {request.bootstrap_resamples}")
+        resamples: int = min(
+            request.bootstrap_resamples or DEFAULT_BOOTSTRAP_RESAMPLES,
+            settings.benchmark_comparison_max_resamples,
+        )
+        confidence_level: float = request.confidence_level or DEFAULT_CONFIDENCE_LEVEL
+        if not 0.0 < confidence_level < 1.0:
+            raise ValueError(f"Invalid confidence level {confidence_level}")
+
+        async with AsyncSessionLocal() as session:
+            comparison: BenchmarkComparison = await compare_benchmark_runs(
+                session, run_ids, resamples, confidence_level
+            )
+        return CompareBenchmarksResponse(comparison=self._comparison_to_proto(comparison))
+
+    async def create_benchmark_sweep(self, request, ctx):
+        import uuid
+        from datetime import datetime
+
+        grid: dict[str, list] = {
+            "models": list(request.grid.models),
+            "temperatures": [round(value, 6) for value in request.grid.temperatures],
+            "max_tokens": list(request.grid.max_tokens),
+            "max_tool_calls": list(request.grid.max_tool_calls),
+        }
+        config: dict[str, Any] = self._config_to_dict(request.config)
+        async with AsyncSessionLocal() as session:
+            agent: Agent | None = await AgentRepository(session).get_by_id(request.agent_id)
+            if not agent:
+                raise ValueError(f"Agent {request.agent_id} not found")
+            agent_configs: list[AgentConfig] = sweep_configs(
+                AgentConfig.from_dict(agent.config), grid
+            )
+            if len(agent_configs) > settings.benchmark_sweep_max_cells:
+                raise ValueError(
+                    f"Sweep has {len(agent_configs)} cells, more than the limit of "
+                    f"{settings.benchmark_sweep_max_cells}"
+                )
+
+            sweep_repo: BenchmarkSweepRepository = BenchmarkSweepRepository(session)
+            sweep: BenchmarkSweep = await sweep_repo.create(
+                id=str(uuid.uuid4()),
+                agent_id=request.agent_id,
+                prompt_dataset_id=request.prompt_dataset_id,
+                grid=grid,
+                config=config,
+                max_llm_calls_per_minute=max(0, request.max_llm_calls_per_minute),
+                benchmark_run_ids=[],
+                status=Status.AWAITING_START,
+                started_at=datetime.utcnow(),
+            )
+            run_repo: BenchmarkRunRepository = BenchmarkRunRepository(session)
+            runs: list[BenchmarkRun] = [
+                await run_repo.create(
+                    id=str(uuid.uuid4()),
+                    agent_id=request.agent_id,
+                    prompt_dataset_id=request.prompt_dataset_id,
+                    status=Status.AWAITING_START,
+                    started_at=sweep.started_at,
+                    config=config,
+                    sweep_id=sweep.id,
+                    agent_config=agent_config.to_dict(),
+                )
+                for agent_config in agent_configs
+            ]
+            sweep.benchmark_run_ids = [run.id for run in runs]
+            await session.commit()
+
+        self.runner.start_sweep(sweep.id)
+        return CreateBenchmarkSweepResponse(sweep=self._sweep_to_proto(sweep, runs))
+
+    async def get_benchmark_sweep(self, request, ctx):
+        async with AsyncSessionLocal() as session:
+            sweep: BenchmarkSweep | None = await BenchmarkSweepRepository(session).get_by_id(
+                request.sweep_id
+            )
+            if not sweep:
+                raise ValueError(f"Benchmark sweep {request.sweep_id} not found")
+            by_id: dict[str, BenchmarkRun] = {
+                run.id: run
+                for run in await BenchmarkRunRepository(session).get_by_ids(sweep.benchmark_run_ids)
+            }
+            comparison: BenchmarkComparison | None = (
+                await BenchmarkComparisonRepository(session).get_by_id(sweep.comparison_id)
+                if sweep.comparison_id
+                else None
+            )
+        runs: list[BenchmarkRun] = [
+            by_id[run_id] for run_id in sweep.benchmark_run_ids if run_id in by_id
+        ]
+        return GetBenchmarkSweepResponse(sweep=self._sweep_to_proto(sweep, runs, comparison))
+
+    async def update_reward_agent(self, request, ctx):
+        import uuid
+
+        update: Any = request.update
+        async with AsyncSessionLocal() as session:
+            repo: RewardAgentRepository = RewardAgentRepository(session)
+            reward_agent: RewardAgent | None = await repo.get_by_id(update.reward_agent_id)
+            if not reward_agent:
+                raise ValueError(f"Reward agent {update.reward_agent_id} not found")
+            comments: dict[str, dict] = {
+                comment["id"]: comment for comment in reward_agent.comments
+            }
+            for comment in update.comments:
+                comment_id: str = comment.id or str(uuid.uuid4())
+                comments[comment_id] = {
+                    "id": comment_id,
+                    "author_id": comment.author_id,
+                    "content": comment.content,
+                    "type": comment.type,
+                }
+            reward_agent.comments = list(comments.values())
+            # Judgements made under the previous definition must not be served again.
+            deleted: int = await RewardCacheRepository(session).delete_by_reward_agent_id(
+                reward_agent.id
+            )
+            await session.commit()
+        self.runner.reward_cache.forget(reward_agent.id)
+        logger.info("Updated reward agent %s, dropped %d cached rewards", reward_agent.id, deleted)
+        return UpdateRewardAgentResponse(reward_agent=self._reward_agent_to_proto(reward_agent))
+
+    def _reward_agent_to_proto(self, reward_agent_db: RewardAgent) -> Any:
+        from agent_platform.agent.v1.agent_pb2 import Agent as AgentProto
+        from agent_platform.agent.v1.agent_pb2 import AgentConfig
+        from agent_platform.reward.v1.reward_pb2 import RewardAgent as RewardAgentProto
+        from agent_platform.tool.v1.tool_call_pb2 import ForceFinalToolCall
+
+        agent: dict = reward_agent_db.agent
+        config: dict = agent.get("config") or {}
+        force_final_tool_call: dict | None = reward_agent_db.force_final_tool_call
+        return RewardAgentProto(
+            agent=AgentProto(
+                id=agent.get("id") or reward_agent_db.id,
+                name=agent.get("name", ""),
+                task=agent.get("task", ""),
+                tool_ids=agent.get("tool_ids", []),
+                system_prompt=agent.get("system_prompt", ""),
+                policy_agent_ids=agent.get("policy_agent_ids", []),
+                config=AgentConfig(
+                    model=config.get("model", ""),
+                    temperature=config.get("temperature", 0.0),
+                    max_tokens=config.get("max_tokens", 0),
+                    max_tool_calls=config.get("max_tool_calls", 0),
+                ),
+            ),
+            force_final_tool_call=ForceFinalToolCall(
+                tool_id=force_final_tool_call.get("tool_id", ""),
+                forced_output_schema=force_final_tool_call.get("forced_output_schema"),
+            )
+            if force_final_tool_call
+            else None,
+        )
+
+    def _sweep_to_proto(
+        self,
+        sweep_db: BenchmarkSweep,
+        runs: list[BenchmarkRun],
+        comparison: BenchmarkComparison | None = None,
+    ) -> Any:
+        from google.protobuf.timestamp_pb2 import Timestamp
+
+        from agent_platform.benchmark.v1.benchmark_pb2 import (
+            BenchmarkSweep as BenchmarkSweepProto,
+        )
+
+        started_at: Timestamp = Timestamp()
+        started_at.FromDatetime(sweep_db.started_at)
+        finished_at: Timestamp | None = None
+        if sweep_db.finished_at:
+            finished_at = Timestamp()
+            finished_at.FromDatetime(sweep_db.finished_at)
+
+        return BenchmarkSweepProto(
+            id=sweep_db.id,
+            agent_id=sweep_db.agent_id,
+            prompt_dataset_id=sweep_db.prompt_dataset_id,
+            grid=sweep_db.grid,
+            config=sweep_db.config,
+            max_llm_calls_per_minute=sweep_db.max_llm_calls_per_minute,
+            benchmark_runs=[self._db_to_proto(run) for run in runs],
+            status=sweep_db.status,
+            started_at=started_at,
+            finished_at=finished_at,
+            comparison=self._comparison_to_proto(comparison) if comparison else None,
+            stats=sweep_db.stats,
+        )
+
+    def _comparison_to_proto(self, comparison_db: BenchmarkComparison) -> Any:
+        from google.protobuf.timestamp_pb2 import Timestamp
+
+        from agent_platform.benchmark.v1.benchmark_pb2 import (
+            BenchmarkComparison as BenchmarkComparisonProto,
+        )
+
+        created_at: Timestamp = Timestamp()
+        created_at.FromDatetime(comparison_db.created_at)
+        return BenchmarkComparisonProto(
+            id=comparison_db.id,
+            benchmark_run_ids=comparison_db.benchmark_run_ids,
+            result=comparison_db.result,
+            created_at=created_at,
+        )
+
+    def _row_to_proto(self, row: dict) -> Any:
+        from agent_platform.benchmark.v1.benchmark_pb2 import BenchmarkRunRow
+
+        return BenchmarkRunRow(
+            id=row["id"],
+            prompt_dataset_row_id=row["prompt_dataset_row_id"],
+            reward=row.get("reward"),
+            agent_run_ids=row["agent_run_ids"],
+            sme_comments=row.get("sme_comments", []),
+            status=row["status"],
+            reused=row.get("reused", False),
+        )
+
+    def _db_to_proto(self, run_db: BenchmarkRun, rows: list[dict] | None = None) -> Any:
         from google.protobuf.timestamp_pb2 import Timestamp
 
         from agent_platform.benchmark.v1.benchmark_pb2 import (
@@ -81,10 +437,13 @@ class BenchmarkServiceImpl(BenchmarkService):
             id=run_db.id,
             agent_id=run_db.agent_id,
             prompt_dataset_id=run_db.prompt_dataset_id,
-            rows=run_db.rows,
+            rows=[self._row_to_proto(row) for row in rows or [] if row["status"] != Status.SKIPPED],
             final_reward=run_db.final_reward,
             status=run_db.status,
             started_at=started_at,
             finished_at=finished_at,
             config=run_db.config,
+            stats=run_db.stats,
+            sweep_id=run_db.sweep_id or "",
+            agent_config=run_db.agent_config,
         )
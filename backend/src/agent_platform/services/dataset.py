@@ -1,9 +1,26 @@
+import uuid
+from collections.abc import AsyncIterator
 from typing import Any
 
-from agent_platform.common.v1.types_pb2 import PaginationResponse
+from agent_platform.common.v1.types_pb2 import Pagination, PaginationResponse
+from agent_platform.config import settings
+from agent_platform.datasets.blobs import BlobStore
+from agent_platform.datasets.downloads import download_url
+from agent_platform.datasets.imports import IMPORT_FORMATS, PromptRowImport, read_records, spool
+from agent_platform.datasets.ingestion import IngestionPipeline
 from agent_platform.db.engine import AsyncSessionLocal
-from agent_platform.db.models.dataset import Dataset, PromptDataset
-from agent_platform.db.repository.dataset import DatasetRepository, PromptDatasetRepository
+from agent_platform.db.models.dataset import (
+    Dataset,
+    GroundTruth,
+    PromptDataset,
+    PromptDatasetRow,
+    SMEComment,
+)
+from agent_platform.db.repository.dataset import (
+    DatasetRepository,
+    PromptDatasetRepository,
+    PromptDatasetRowRepository,
+)
 from agent_platform.service.v1.dataset_service_connect import DatasetService
 from agent_platform.service.v1.dataset_service_pb2 import (
     CreateDatasetResponse,
@@ -11,14 +28,22 @@ from agent_platform.service.v1.dataset_service_pb2 import (
     DeleteDatasetResponse,
     GetDatasetResponse,
     GetPromptDatasetResponse,
+    ImportPromptDatasetRowsRequest,
+    ImportPromptDatasetRowsResponse,
     ListDatasetsResponse,
     ListPromptDatasetsResponse,
+    StreamPromptDatasetRowsResponse,
+    UploadFileRequest,
+    UploadFileResponse,
 )
 
 
 class DatasetServiceImpl(DatasetService):
-    def __init__(self) -> None:
-        pass
+    def __init__(
+        self, blob_store: BlobStore | None = None, ingestion: IngestionPipeline | None = None
+    ) -> None:
+        self.blob_store: BlobStore = blob_store or BlobStore()
+        self.ingestion: IngestionPipeline = ingestion or IngestionPipeline(self.blob_store)
 
     async def create_dataset(self, request, ctx):
         async with AsyncSessionLocal() as session:
@@ -59,6 +84,38 @@ class DatasetServiceImpl(DatasetService):
             await session.commit()
             return DeleteDatasetResponse()
 
+    async def upload_file(self, request: AsyncIterator[UploadFileRequest], ctx):
+        messages: AsyncIterator[UploadFileRequest] = aiter(request)
+        first: UploadFileRequest | None = await anext(messages, None)
+        if first is None or not first.HasField("metadata"):
+            raise ValueError("The first upload message must carry the file metadata")
+        metadata = first.metadata
+        async with AsyncSessionLocal() as session:
+            if await DatasetRepository(session).get_by_id(metadata.dataset_id) is None:
+                raise ValueError(f"Dataset {metadata.dataset_id} not found")
+
+        checksum, size_bytes = await self.blob_store.write(_chunks(messages))
+        file_id: str = str(uuid.uuid4())
+        file: dict = {
+            "id": file_id,
+            "filename": metadata.filename,
+            "file_type": metadata.file_type,
+            "url": download_url(metadata.dataset_id, file_id),
+            "size_bytes": size_bytes,
+            "checksum": checksum,
+        }
+        async with AsyncSessionLocal() as session:
+            stored: dict | None = await DatasetRepository(session).append_file(
+                metadata.dataset_id, file
+            )
+            if stored is None:
+                raise ValueError(f"Dataset {metadata.dataset_id} not found")
+            await session.commit()
+        self.ingestion.submit(stored)
+        from agent_platform.dataset.v1.dataset_pb2 import DatasetFile
+
+        return UploadFileResponse(file=DatasetFile(**stored))
+
     async def create_prompt_dataset(self, request, ctx):
         async with AsyncSessionLocal() as session:
             repo: PromptDatasetRepository = PromptDatasetRepository(session)
@@ -66,13 +123,71 @@ class DatasetServiceImpl(DatasetService):
             await session.commit()
             return CreatePromptDatasetResponse(prompt_dataset=self._db_prompt_to_proto(dataset))
 
+    async def import_prompt_dataset_rows(
+        self, request: AsyncIterator[ImportPromptDatasetRowsRequest], ctx
+    ):
+        messages: AsyncIterator[ImportPromptDatasetRowsRequest] = aiter(request)
+        first: ImportPromptDatasetRowsRequest | None = await anext(messages, None)
+        if first is None or not first.HasField("metadata"):
+            raise ValueError("The first import message must carry the import metadata")
+        metadata = first.metadata
+        if metadata.format not in IMPORT_FORMATS:
+            raise ValueError("Import format must be CSV or JSONL")
+        async with AsyncSessionLocal() as session:
+            if await PromptDatasetRepository(session).get_by_id(metadata.prompt_dataset_id) is None:
+                raise ValueError(f"Prompt dataset {metadata.prompt_dataset_id} not found")
+
+        with await spool(_chunks(messages)) as file:
+            async with AsyncSessionLocal() as session:
+                if (
+                    await PromptDatasetRepository(session).get_for_update(
+                        metadata.prompt_dataset_id
+                    )
+                    is None
+                ):
+                    raise ValueError(f"Prompt dataset {metadata.prompt_dataset_id} not found")
+                rows: PromptRowImport = PromptRowImport(
+                    session, metadata.prompt_dataset_id, metadata.default_reward_agent_id
+                )
+                await rows.load(read_records(file, IMPORT_FORMATS[metadata.format]))
+                await session.commit()
+        return ImportPromptDatasetRowsResponse(
+            imported_rows=rows.imported_rows, failed_rows=rows.failed_rows, errors=rows.errors
+        )
+
     async def get_prompt_dataset(self, request, ctx):
         async with AsyncSessionLocal() as session:
             repo: PromptDatasetRepository = PromptDatasetRepository(session)
             dataset: PromptDataset | None = await repo.get_by_id(request.prompt_dataset_id)
             if not dataset:
                 raise ValueError(f"Prompt dataset {request.prompt_dataset_id} not found")
-            return GetPromptDatasetResponse(prompt_dataset=self._db_prompt_to_proto(dataset))
+            prompt_dataset = self._db_prompt_to_proto(dataset)
+            if not request.HasField("rows_page"):
+                return GetPromptDatasetResponse(prompt_dataset=prompt_dataset)
+
+            row_repo: PromptDatasetRowRepository = PromptDatasetRowRepository(session)
+            page_size: int = _page_size(request.rows_page.page_size)
+            rows: list[PromptDatasetRow] = await row_repo.get_page(
+                dataset.id, _start_sequence(request.rows_page), page_size + 1
+            )
+            prompt_dataset.rows.extend(await self._rows_to_proto(row_repo, rows[:page_size]))
+            return GetPromptDatasetResponse(
+                prompt_dataset=prompt_dataset,
+                rows_pagination=PaginationResponse(
+                    next_page_token=str(rows[page_size].sequence) if len(rows) > page_size else "",
+                    total_count=await row_repo.count_by_prompt_dataset_id(dataset.id),
+                ),
+            )
+
+    async def stream_prompt_dataset_rows(self, request, ctx):
+        async with AsyncSessionLocal() as session:
+            if await PromptDatasetRepository(session).get_by_id(request.prompt_dataset_id) is None:
+                raise ValueError(f"Prompt dataset {request.prompt_dataset_id} not found")
+            repo: PromptDatasetRowRepository = PromptDatasetRowRepository(session)
+            async for rows in repo.stream_pages(
+                request.prompt_dataset_id, request.start_sequence, _page_size(request.page_size)
+            ):
+                yield StreamPromptDatasetRowsResponse(rows=await self._rows_to_proto(repo, rows))
 
     async def list_prompt_datasets(self, request, ctx):
         async with AsyncSessionLocal() as session:
@@ -104,11 +219,78 @@ class DatasetServiceImpl(DatasetService):
         return DatasetProto(
             id=dataset_db.id,
             name=dataset_db.name,
-            files=dataset_db.files,
+            # Files uploaded before downloads existed stored a blob:// URL.
+            files=[
+                {**file, "url": download_url(dataset_db.id, file["id"])}
+                for file in dataset_db.files
+            ],
             created_at=created_at,
             updated_at=updated_at,
         )
 
+    async def _rows_to_proto(
+        self, repo: PromptDatasetRowRepository, rows: list[PromptDatasetRow]
+    ) -> list[Any]:
+        """Convert a page of rows, loading their ground truths and SME comments in one go."""
+        if not rows:
+            return []
+        row_ids: list[str] = [row.id for row in rows]
+        ground_truths: dict[str, list[GroundTruth]] = await repo.get_ground_truths(row_ids)
+        comments: dict[str, list[SMEComment]] = await repo.get_sme_comments(row_ids)
+        return [
+            self._db_row_to_proto(row, ground_truths.get(row.id, []), comments.get(row.id, []))
+            for row in rows
+        ]
+
+    def _db_row_to_proto(
+        self, row: PromptDatasetRow, ground_truths: list[GroundTruth], comments: list[SMEComment]
+    ) -> Any:
+        from google.protobuf.timestamp_pb2 import Timestamp
+
+        from agent_platform.dataset.v1.dataset_pb2 import GroundTruth as GroundTruthProto
+        from agent_platform.dataset.v1.prompt_dataset_pb2 import (
+            PromptDatasetRow as PromptDatasetRowProto,
+        )
+        from agent_platform.dataset.v1.prompt_dataset_pb2 import SMEComment as SMECommentProto
+
+        ground_truth_protos: list[Any] = [
+            GroundTruthProto(**ground_truth) for ground_truth in row.ground_truths
+        ]
+        for ground_truth in ground_truths:
+            if ground_truth.text is not None:
+                ground_truth_protos.append(GroundTruthProto(text=ground_truth.text))
+            elif ground_truth.dataset_id is not None:
+                ground_truth_protos.append(GroundTruthProto(dataset_id=ground_truth.dataset_id))
+
+        comment_protos: list[Any] = [
+            SMECommentProto(
+                id=comment.get("id", ""),
+                author_id=comment.get("author_id", ""),
+                content=comment.get("content", ""),
+            )
+            for comment in row.sme_comments
+        ]
+        for comment in comments:
+            created_at: Timestamp = Timestamp()
+            created_at.FromDatetime(comment.created_at)
+            comment_protos.append(
+                SMECommentProto(
+                    id=comment.id,
+                    author_id=comment.author_id,
+                    content=comment.content,
+                    created_at=created_at,
+                )
+            )
+
+        return PromptDatasetRowProto(
+            id=row.id,
+            prompt=row.prompt,
+            reward_agent_id=row.reward_agent_id,
+            ground_truths=ground_truth_protos,
+            sme_comments=comment_protos,
+            sequence=row.sequence,
+        )
+
     def _db_prompt_to_proto(self, dataset_db: PromptDataset) -> Any:
         from google.protobuf.timestamp_pb2 import Timestamp
 
@@ -128,3 +310,27 @@ class DatasetServiceImpl(DatasetService):
             created_at=created_at,
             updated_at=updated_at,
         )
+
+
+def _page_size(requested: int) -> int:
+    if requested <= 0:
+        return settings.prompt_dataset_page_size
+    return min(requested, settings.prompt_dataset_max_page_size)
+
+
+def _start_sequence(page: Pagination) -> int:
+    if not page.page_token:
+        return 0
+    try:
+        return int(page.page_token)
+    except ValueError:
+        raise ValueError(f"Invalid page token {page.page_token!r}") from None
+
+
+async def _chunks(
+    messages: AsyncIterator[UploadFileRequest | ImportPromptDatasetRowsRequest],
+) -> AsyncIterator[bytes]:
+    async for message in messages:
+        if message.HasField("metadata"):
+            raise ValueError("Metadata may only be sent once, first")
+        yield message.chunk
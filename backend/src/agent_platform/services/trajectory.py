@@ -1,21 +1,39 @@
 from typing import Any
 
 from agent_platform.common.v1.types_pb2 import PaginationResponse
+from agent_platform.config import settings
 from agent_platform.db.engine import AsyncSessionLocal
 from agent_platform.db.models.trajectory import Trajectory
-from agent_platform.db.repository.trajectory import TrajectoryRepository
+from agent_platform.db.repository.trajectory import (
+    TrajectoryAnnotationRepository,
+    TrajectoryRepository,
+)
 from agent_platform.service.v1.trajectory_service_connect import (
     TrajectoryService,
 )
 from agent_platform.service.v1.trajectory_service_pb2 import (
+    AnalyticsGroup,
+    AnnotatedTrajectory,
+    AnnotateStepResponse,
+    AnnotateTrajectoryResponse,
+    BatchAnnotateResponse,
+    ExportTrajectoriesResponse,
     GetTrajectoryResponse,
     ListTrajectoriesResponse,
+    QueryTrajectoryAnalyticsResponse,
+    SampleTrajectoriesResponse,
+    TrajectorySample,
 )
+from agent_platform.services.agent import AgentServiceImpl
+from agent_platform.trajectories.analytics import AnalyticsStore
+from agent_platform.trajectories.export import EXPORT_FORMATS, TrajectoryExport
+from agent_platform.trajectories.filters import filter_conditions
+from agent_platform.trajectories.sampling import DEFAULT_REWARD_BUCKETS, StratifiedSampler
 
 
 class TrajectoryServiceImpl(TrajectoryService):
-    def __init__(self) -> None:
-        pass
+    def __init__(self, analytics: AnalyticsStore | None = None) -> None:
+        self.analytics: AnalyticsStore = analytics or AnalyticsStore()
 
     async def get_trajectory(self, request, ctx):
         async with AsyncSessionLocal() as session:
@@ -33,7 +51,9 @@ class TrajectoryServiceImpl(TrajectoryService):
                 if request.pagination and request.pagination.page_size > 0
                 else 100
             )
-            trajectories: list[Trajectory] = await repo.get_all(limit=page_size, offset=0)
+            trajectories: list[Trajectory] = await repo.get_filtered(
+                filter_conditions(request.filter), limit=page_size, offset=0
+            )
             return ListTrajectoriesResponse(
                 trajectories=[self._db_to_proto(t) for t in trajectories],
                 pagination=PaginationResponse(
@@ -42,6 +62,129 @@ class TrajectoryServiceImpl(TrajectoryService):
                 ),
             )
 
+    async def annotate_trajectory(self, request, ctx):
+        annotations: dict[str, Any] = await self._annotate(request.annotator_id, [request], [])
+        return AnnotateTrajectoryResponse(annotation=annotations[request.trajectory_id])
+
+    async def annotate_step(self, request, ctx):
+        annotations: dict[str, Any] = await self._annotate(request.annotator_id, [], [request])
+        step: Any = next(
+            step
+            for step in annotations[request.trajectory_id].step_annotations
+            if step.block_id == request.block_id
+        )
+        return AnnotateStepResponse(annotation=step)
+
+    async def batch_annotate(self, request, ctx):
+        annotations: dict[str, Any] = await self._annotate(
+            request.annotator_id, list(request.trajectories), list(request.steps)
+        )
+        return BatchAnnotateResponse(
+            annotations=[
+                AnnotatedTrajectory(trajectory_id=trajectory_id, annotation=annotation)
+                for trajectory_id, annotation in annotations.items()
+            ]
+        )
+
+    async def export_trajectories(self, request, ctx):
+        format: str | None = EXPORT_FORMATS.get(request.format)
+        if format is None:
+            raise ValueError("Export format must be JSONL or Parquet")
+        async with AsyncSessionLocal() as session:
+            export: TrajectoryExport = TrajectoryExport(format)
+            async for chunk in export.stream(session, filter_conditions(request.filter)):
+                yield ExportTrajectoriesResponse(data=chunk)
+
+    async def query_trajectory_analytics(self, request, ctx):
+        from google.protobuf.timestamp_pb2 import Timestamp
+
+        result: dict[str, Any] = await self.analytics.query(
+            request.filter,
+            list(request.group_by),
+            request.metric,
+            list(request.percentiles),
+            request.histogram_bins,
+            (
+                request.histogram_min if request.HasField("histogram_min") else None,
+                request.histogram_max if request.HasField("histogram_max") else None,
+            ),
+        )
+        synced_at: Timestamp | None = None
+        if self.analytics.synced_at is not None:
+            synced_at = Timestamp()
+            synced_at.FromDatetime(self.analytics.synced_at)
+        return QueryTrajectoryAnalyticsResponse(
+            groups=[AnalyticsGroup(**group) for group in result["groups"]],
+            histogram_edges=result["histogram_edges"],
+            trajectory_count=result["trajectory_count"],
+            synced_at=synced_at,
+        )
+
+    async def sample_trajectories(self, request, ctx):
+        sampler: StratifiedSampler = StratifiedSampler(
+            list(request.stratify_by),
+            request.per_stratum,
+            request.seed,
+            request.reward_buckets or DEFAULT_REWARD_BUCKETS,
+        )
+        async with AsyncSessionLocal() as session:
+            samples: list[dict[str, Any]] = await sampler.sample(
+                session, filter_conditions(request.filter)
+            )
+            trajectories: dict[str, Trajectory] = {
+                trajectory.id: trajectory
+                for trajectory in await TrajectoryRepository(session).get_by_ids(
+                    [id for sample in samples for id in sample["trajectory_ids"]]
+                )
+            }
+        return SampleTrajectoriesResponse(
+            samples=[
+                TrajectorySample(
+                    keys=sample["keys"],
+                    population=sample["population"],
+                    trajectories=[
+                        self._db_to_proto(trajectories[id])
+                        for id in sample["trajectory_ids"]
+                        if id in trajectories
+                    ],
+                )
+                for sample in samples
+            ]
+        )
+
+    async def _annotate(
+        self, annotator_id: str, trajectories: list[Any], steps: list[Any]
+    ) -> dict[str, Any]:
+        """Write annotation requests in one transaction; returns each touched trajectory's
+        ``TrajectoryAnnotation``."""
+        from agent_platform.trajectory.v1.trajectory_pb2 import (
+            TrajectoryAnnotation as TrajectoryAnnotationProto,
+        )
+
+        if len(trajectories) + len(steps) > settings.annotation_batch_max_items:
+            raise ValueError(
+                f"At most {settings.annotation_batch_max_items} annotations can be written at once"
+            )
+        trajectory_ids: set[str] = {item.trajectory_id for item in trajectories + steps}
+        async with AsyncSessionLocal() as session:
+            missing: set[str] = trajectory_ids - await TrajectoryRepository(
+                session
+            ).get_existing_ids(list(trajectory_ids))
+            if missing:
+                raise ValueError(f"Trajectory {min(missing)} not found")
+            annotations: dict[str, dict] = await TrajectoryAnnotationRepository(
+                session
+            ).upsert_batch(
+                annotator_id,
+                [(item.trajectory_id, item.label, item.notes) for item in trajectories],
+                [(item.trajectory_id, item.block_id, item.label, item.feedback) for item in steps],
+            )
+            await session.commit()
+        return {
+            trajectory_id: TrajectoryAnnotationProto(**annotation)
+            for trajectory_id, annotation in annotations.items()
+        }
+
     def _db_to_proto(self, trajectory_db: Trajectory) -> Any:
         from google.protobuf.timestamp_pb2 import Timestamp
 
@@ -55,7 +198,16 @@ class TrajectoryServiceImpl(TrajectoryService):
         return TrajectoryProto(
             id=trajectory_db.id,
             agent_id=trajectory_db.agent_id,
-            agent_run=trajectory_db.agent_run,
+            agent_run={
+                **trajectory_db.agent_run,
+                "blocks": [
+                    AgentServiceImpl.dict_to_block_proto(block)
+                    for block in trajectory_db.agent_run.get("blocks") or []
+                ],
+                "metrics": AgentServiceImpl.metrics_to_proto(
+                    trajectory_db.agent_run.get("metrics")
+                ),
+            },
             reward=trajectory_db.reward,
             annotation=trajectory_db.annotation,
             created_at=created_at,
@@ -28,6 +28,11 @@ class Tool(ABC):
     def context(self) -> str:
         pass
 
+    @property
+    def deterministic(self) -> bool:
+        """Whether equal inputs always give equal outputs without side effects."""
+        return False
+
     @abstractmethod
     async def execute(self, input_data: dict[str, Any]) -> Any:
         pass
@@ -148,6 +148,10 @@ class ZohoPoliciesTool(Tool):
     def context(self) -> str:
         return self._context
 
+    @property
+    def deterministic(self) -> bool:
+        return True
+
     async def execute(self, input_data: dict[str, str | dict | None]) -> dict[str, list | dict]:
         validated_input: ZohoPoliciesInput = ZohoPoliciesInput.model_validate(input_data)
 
@@ -0,0 +1,461 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import ColumnElement, Row, SQLColumnExpression, case, func
+
+from agent_platform.config import settings
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.trajectory import Trajectory
+from agent_platform.db.repository.trajectory import TrajectoryRepository
+from agent_platform.llm.executor import Status
+from agent_platform.trajectories.filters import LABEL, LABEL_UNSPECIFIED, REWARD_SCORE, enum_name
+
+logger = logging.getLogger(__name__)
+
+# Values of AnalyticsDimension and AnalyticsMetric.
+DIMENSIONS: dict[int, str] = {1: "agent", 2: "day", 3: "label", 4: "status"}
+METRICS: dict[int, str] = {
+    1: "reward_score",
+    2: "tool_call_count",
+    3: "block_count",
+    4: "duration_seconds",
+    5: "total_tokens",
+}
+
+_BLOCKS: ColumnElement[Any] = Trajectory.agent_run["blocks"]
+
+# Everything the mirror keeps is computed by Postgres, so syncing never ships run JSON.
+_MIRROR_COLUMNS: list[SQLColumnExpression[Any]] = [
+    Trajectory.id.label("trajectory_id"),
+    Trajectory.agent_id,
+    Trajectory.created_at,
+    Trajectory.updated_at,
+    REWARD_SCORE.label("reward_score"),
+    LABEL.label("label"),
+    Trajectory.agent_run["status"].as_integer().label("status"),
+    Trajectory.agent_run[("metrics", "tool_call_count")].as_integer().label("tool_call_count"),
+    case((func.json_typeof(_BLOCKS) == "array", func.json_array_length(_BLOCKS))).label(
+        "block_count"
+    ),
+    (
+        Trajectory.agent_run[("finished_at", "seconds")].as_float()
+        - Trajectory.agent_run[("started_at", "seconds")].as_float()
+        + (
+            func.coalesce(Trajectory.agent_run[("finished_at", "nanos")].as_float(), 0)
+            - func.coalesce(Trajectory.agent_run[("started_at", "nanos")].as_float(), 0)
+        )
+        / 1e9
+    ).label("duration_seconds"),
+    Trajectory.agent_run[("metrics", "total_tokens")].as_integer().label("total_tokens"),
+    Trajectory.duplicate_similarity,
+]
+
+MIRROR_SCHEMA: pa.Schema = pa.schema(
+    [
+        ("trajectory_id", pa.string()),
+        ("agent_id", pa.string()),
+        ("created_at", pa.timestamp("us")),
+        ("updated_at", pa.timestamp("us")),
+        ("reward_score", pa.float64()),
+        ("label", pa.int32()),
+        ("status", pa.int32()),
+        ("tool_call_count", pa.int32()),
+        ("block_count", pa.int32()),
+        ("duration_seconds", pa.float64()),
+        ("total_tokens", pa.int64()),
+        ("duplicate_similarity", pa.float64()),
+    ]
+)
+
+_STATUS_NAMES: dict[int, str] = {
+    value: name for name, value in vars(Status).items() if name.isupper()
+}
+_MICROSECONDS_PER_DAY: int = 86_400_000_000
+
+
+class AnalyticsStore:
+    """A local columnar mirror of trajectories for aggregate queries.
+
+    The mirror is a directory of Parquet segments, synced incrementally from trajectories
+    updated since the last sync and compacted once there are more than ``max_segments``.
+    Queries run on NumPy arrays of the whole mirror held in memory, reloading from Postgres
+    first when the last sync is older than ``refresh_seconds``.
+    """
+
+    def __init__(
+        self,
+        root: str = settings.analytics_store_path,
+        refresh_seconds: float = settings.analytics_refresh_seconds,
+        overlap_seconds: float = settings.analytics_sync_overlap_seconds,
+        segment_rows: int = settings.analytics_segment_rows,
+        max_segments: int = settings.analytics_max_segments,
+    ) -> None:
+        self.root: Path = Path(root)
+        self.refresh_seconds: float = refresh_seconds
+        self.overlap: timedelta = timedelta(seconds=overlap_seconds)
+        self.segment_rows: int = max(1, segment_rows)
+        self.max_segments: int = max(1, max_segments)
+        self.synced_at: datetime | None = None
+        self._table: pa.Table | None = None
+        self._columns: _Columns | None = None
+        self._watermark: datetime | None = None
+        self._next_segment: int = 0
+        # Versions synced within the overlap window, which the next sync reads again.
+        self._recent: dict[str, datetime] = {}
+        self._refreshed: float = -float("inf")
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    async def refresh(self) -> None:
+        if time.monotonic() - self._refreshed < self.refresh_seconds:
+            return
+        async with self._lock:
+            if time.monotonic() - self._refreshed >= self.refresh_seconds:
+                await self._sync()
+
+    async def sync(self) -> int:
+        """Mirror the trajectories updated since the last sync; returns how many."""
+        async with self._lock:
+            return await self._sync()
+
+    async def _sync(self) -> int:
+        if self._table is None:
+            await asyncio.to_thread(self._load)
+        started: datetime = datetime.utcnow()
+        synced: int = 0
+        pending: list[Row] = []
+        async with AsyncSessionLocal() as session:
+            conditions: list[ColumnElement[bool]] = []
+            if self._watermark is not None:
+                conditions.append(Trajectory.updated_at >= self._watermark - self.overlap)
+            async for batch in TrajectoryRepository(session).stream_rows(
+                _MIRROR_COLUMNS,
+                conditions,
+                settings.export_batch_size,
+                order_by=(Trajectory.updated_at, Trajectory.id),
+            ):
+                pending.extend(
+                    row for row in batch if self._recent.get(row.trajectory_id) != row.updated_at
+                )
+                if len(pending) >= self.segment_rows:
+                    synced += len(pending)
+                    await asyncio.to_thread(self._append, pending)
+                    pending = []
+        if pending:
+            synced += len(pending)
+            await asyncio.to_thread(self._append, pending)
+        if len(list(self._segments())) > self.max_segments:
+            await asyncio.to_thread(self._compact)
+
+        if self._watermark is not None:
+            horizon: datetime = self._watermark - self.overlap
+            self._recent = {key: value for key, value in self._recent.items() if value >= horizon}
+        self.synced_at = started
+        self._refreshed = time.monotonic()
+        if synced:
+            logger.info("Synced %d trajectories into the analytics mirror", synced)
+        return synced
+
+    async def query(
+        self,
+        filter: Any,
+        group_by: Sequence[int],
+        metric: int,
+        percentiles: Sequence[float] = (),
+        histogram_bins: int = 0,
+        histogram_range: tuple[float | None, float | None] = (None, None),
+    ) -> dict[str, Any]:
+        """Aggregates of ``metric`` over the trajectories matching ``filter``, grouped by the
+        ``group_by`` dimensions, as ``QueryTrajectoryAnalyticsResponse`` fields."""
+        if metric not in METRICS:
+            raise ValueError("An analytics query needs a metric")
+        if any(dimension not in DIMENSIONS for dimension in group_by):
+            raise ValueError("Unknown analytics dimension")
+        if any(not 0 <= percentile <= 100 for percentile in percentiles):
+            raise ValueError("Percentiles must be between 0 and 100")
+        await self.refresh()
+        columns: _Columns | None = self._columns
+        if columns is None:
+            return {"groups": [], "histogram_edges": [], "trajectory_count": 0}
+        return await asyncio.to_thread(
+            columns.aggregate,
+            filter,
+            [DIMENSIONS[dimension] for dimension in group_by],
+            METRICS[metric],
+            list(percentiles),
+            max(0, histogram_bins),
+            histogram_range,
+        )
+
+    def _load(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        state_path: Path = self.root / "state.json"
+        if state_path.exists():
+            state: dict = json.loads(state_path.read_text())
+            if state["watermark"] is not None:
+                self._watermark = datetime.fromisoformat(state["watermark"])
+            self._next_segment = state["next_segment"]
+        table: pa.Table = MIRROR_SCHEMA.empty_table()
+        for segment in self._segments():
+            table = _replace(table, pq.read_table(segment, schema=MIRROR_SCHEMA))
+            self._next_segment = max(self._next_segment, int(segment.stem) + 1)
+        self._set_table(table)
+
+    def _append(self, rows: list[Row]) -> None:
+        batch: pa.Table = pa.Table.from_arrays(
+            [
+                pa.array(values, type=field.type)
+                for values, field in zip(zip(*rows, strict=True), MIRROR_SCHEMA, strict=True)
+            ],
+            schema=MIRROR_SCHEMA,
+        )
+        self._write_segment(batch)
+        self._set_table(_replace(self._table, batch))
+        for row in rows:
+            self._recent[row.trajectory_id] = row.updated_at
+        latest: datetime = max(row.updated_at for row in rows)
+        if self._watermark is None or latest > self._watermark:
+            self._watermark = latest
+        self._write_state()
+
+    def _compact(self) -> None:
+        old: list[Path] = list(self._segments())
+        self._write_segment(self._table)
+        self._write_state()
+        for segment in old:
+            segment.unlink()
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.root.glob("*.parquet"), key=lambda path: int(path.stem))
+
+    def _write_segment(self, table: pa.Table) -> None:
+        path: Path = self.root / f"{self._next_segment}.parquet"
+        staging: Path = path.with_suffix(".tmp")
+        pq.write_table(table, staging, compression="zstd")
+        os.replace(staging, path)
+        self._next_segment += 1
+
+    def _write_state(self) -> None:
+        staging: Path = self.root / "state.json.tmp"
+        staging.write_text(
+            json.dumps(
+                {
+                    "watermark": self._watermark.isoformat() if self._watermark else None,
+                    "next_segment": self._next_segment,
+                }
+            )
+        )
+        os.replace(staging, self.root / "state.json")
+
+    def _set_table(self, table: pa.Table) -> None:
+        self._table = table
+        self._columns = _Columns(table)
+
+
+class _Columns:
+    """NumPy arrays of one version of the mirror.
+
+    Dimensions are stored as dense integer codes so groups are formed by arithmetic rather
+    than sorting; each metric is sorted once per version, when a percentile needs it.
+    """
+
+    def __init__(self, table: pa.Table) -> None:
+        agents: pa.DictionaryArray = table.column("agent_id").combine_chunks().dictionary_encode()
+        self.agent_names: list[str] = agents.dictionary.to_pylist()
+        self.created: np.ndarray = _integers(table.column("created_at").cast(pa.int64()))
+        day: np.ndarray = self.created // _MICROSECONDS_PER_DAY
+        self.first_day: int = int(day.min()) if len(day) else 0
+        self.label: np.ndarray = _integers(table.column("label"), LABEL_UNSPECIFIED)
+        # Statuses are shifted by one so a missing status (-1) gets code 0.
+        status: np.ndarray = _integers(table.column("status"), -1)
+        self.codes: dict[str, np.ndarray] = {
+            "agent": agents.indices.to_numpy().astype(np.int64),
+            "day": day - self.first_day,
+            "label": self.label,
+            "status": status + 1,
+        }
+        self.cardinality: dict[str, int] = {
+            name: int(codes.max()) + 1 if len(codes) else 1 for name, codes in self.codes.items()
+        }
+        self.metrics: dict[str, np.ndarray] = {
+            name: table.column(name).cast(pa.float64()).to_numpy().astype(np.float64)
+            for name in METRICS.values()
+        }
+        self.duplicate_similarity: np.ndarray = (
+            table.column("duplicate_similarity").cast(pa.float64()).to_numpy().astype(np.float64)
+        )
+        self._sorted: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def matching(self, filter: Any) -> np.ndarray:
+        """Mask of the rows a ``TrajectoryFilter`` selects, like ``filter_conditions``."""
+        mask: np.ndarray = np.ones(len(self.created), dtype=bool)
+        if filter.agent_ids:
+            wanted: set[str] = set(filter.agent_ids)
+            codes: list[int] = [
+                code for code, name in enumerate(self.agent_names) if name in wanted
+            ]
+            mask &= np.isin(self.codes["agent"], codes)
+        if filter.labels:
+            mask &= np.isin(self.label, list(filter.labels))
+        reward: np.ndarray = self.metrics["reward_score"]
+        with np.errstate(invalid="ignore"):
+            if filter.min_reward_score:
+                mask &= reward >= round(filter.min_reward_score, 6)
+            if filter.max_reward_score:
+                mask &= reward <= round(filter.max_reward_score, 6)
+            if filter.near_duplicate_threshold:
+                mask &= ~(self.duplicate_similarity >= round(filter.near_duplicate_threshold, 6))
+        if filter.HasField("created_after"):
+            mask &= self.created >= _microseconds(filter.created_after.ToDatetime())
+        if filter.HasField("created_before"):
+            mask &= self.created < _microseconds(filter.created_before.ToDatetime())
+        return mask
+
+    def aggregate(
+        self,
+        filter: Any,
+        dimensions: list[str],
+        metric: str,
+        percentiles: list[float],
+        histogram_bins: int,
+        histogram_range: tuple[float | None, float | None],
+    ) -> dict[str, Any]:
+        mask: np.ndarray = self.matching(filter)
+        trajectory_count: int = int(mask.sum())
+        column: np.ndarray = self.metrics[metric]
+        rows: np.ndarray = np.flatnonzero(mask & ~np.isnan(column))
+        values: np.ndarray = column[rows]
+
+        group: np.ndarray = np.zeros(len(rows), dtype=np.int64)
+        size: int = 1
+        for dimension in dimensions:
+            group = group * self.cardinality[dimension] + self.codes[dimension][rows]
+            size *= self.cardinality[dimension]
+            if size > max(len(rows), 1 << 20):
+                present, group = np.unique(group, return_inverse=True)
+                size = len(present)
+        counts: np.ndarray = np.bincount(group, minlength=size)
+        present = np.flatnonzero(counts)
+        dense: np.ndarray = np.zeros(size, dtype=np.int64)
+        dense[present] = np.arange(len(present))
+        group, counts = dense[group], counts[present]
+        groups: int = len(present)
+
+        sums: np.ndarray = np.bincount(group, weights=values, minlength=groups)
+        minimums: np.ndarray = np.full(groups, np.inf)
+        np.minimum.at(minimums, group, values)
+        maximums: np.ndarray = np.full(groups, -np.inf)
+        np.maximum.at(maximums, group, values)
+        # Any row of a group gives its keys.
+        representative: np.ndarray = np.zeros(groups, dtype=np.int64)
+        representative[group] = rows
+
+        quantiles: list[np.ndarray] = []
+        if percentiles and len(rows):
+            # Sorting (group, rank of the value) puts each group's values in order.
+            ranks, ordered = self._ranks(metric)
+            keys: np.ndarray = group * len(column) + ranks[rows]
+            keys.sort()
+            ascending: np.ndarray = ordered[keys % len(column)]
+            starts: np.ndarray = np.cumsum(counts) - counts
+            for percentile in percentiles:
+                position: np.ndarray = percentile / 100 * (counts - 1)
+                lower: np.ndarray = np.floor(position).astype(np.int64)
+                fraction: np.ndarray = position - lower
+                upper: np.ndarray = np.minimum(lower + 1, counts - 1)
+                quantiles.append(
+                    ascending[starts + lower] * (1 - fraction)
+                    + ascending[starts + upper] * fraction
+                )
+
+        edges: np.ndarray = np.array([])
+        histograms: np.ndarray = np.zeros((groups, 0), dtype=np.int64)
+        if histogram_bins and len(rows):
+            low: float = histogram_range[0] if histogram_range[0] is not None else values.min()
+            high: float = histogram_range[1] if histogram_range[1] is not None else values.max()
+            if high < low:
+                raise ValueError("histogram_max is below histogram_min")
+            edges = np.linspace(low, high, histogram_bins + 1)
+            inside: np.ndarray = (values >= low) & (values <= high)
+            width: float = (high - low) / histogram_bins or 1.0
+            bins: np.ndarray = np.minimum(
+                ((values[inside] - low) / width).astype(np.int64), histogram_bins - 1
+            )
+            histograms = np.bincount(
+                group[inside] * histogram_bins + bins, minlength=groups * histogram_bins
+            ).reshape(groups, histogram_bins)
+
+        names: list[Callable[[int], str]] = [self._name(dimension) for dimension in dimensions]
+        return {
+            "groups": [
+                {
+                    "keys": [
+                        name(int(self.codes[dimension][representative[index]]))
+                        for dimension, name in zip(dimensions, names, strict=True)
+                    ],
+                    "count": int(counts[index]),
+                    "sum": float(sums[index]),
+                    "mean": float(sums[index] / counts[index]),
+                    "min": float(minimums[index]),
+                    "max": float(maximums[index]),
+                    "percentiles": [float(quantile[index]) for quantile in quantiles],
+                    "histogram": histograms[index].tolist(),
+                }
+                for index in range(groups)
+            ],
+            "histogram_edges": edges.tolist(),
+            "trajectory_count": trajectory_count,
+        }
+
+    def _ranks(self, metric: str) -> tuple[np.ndarray, np.ndarray]:
+        """Each row's position among the ascending values of ``metric``, and those values."""
+        with self._lock:
+            if metric not in self._sorted:
+                column: np.ndarray = self.metrics[metric]
+                order: np.ndarray = np.argsort(column, kind="stable")
+                ranks: np.ndarray = np.empty(len(column), dtype=np.int64)
+                ranks[order] = np.arange(len(column))
+                self._sorted[metric] = (ranks, column[order])
+            return self._sorted[metric]
+
+    def _name(self, dimension: str) -> Callable[[int], str]:
+        from agent_platform.trajectory.v1.trajectory_pb2 import TrajectoryLabel
+
+        if dimension == "agent":
+            return lambda code: self.agent_names[code]
+        if dimension == "day":
+            return lambda code: (
+                (datetime(1970, 1, 1) + timedelta(days=self.first_day + code)).date().isoformat()
+            )
+        if dimension == "label":
+            return lambda code: enum_name(TrajectoryLabel, code)
+        return lambda code: _STATUS_NAMES.get(code - 1, str(code - 1))
+
+
+def _replace(table: pa.Table, batch: pa.Table) -> pa.Table:
+    """``table`` with ``batch`` appended, dropping the rows it has newer versions of."""
+    if len(table) and len(batch):
+        table = table.filter(
+            pc.invert(pc.is_in(table.column("trajectory_id"), value_set=batch["trajectory_id"]))
+        )
+    return pa.concat_tables([table, batch]).combine_chunks()
+
+
+def _integers(column: pa.ChunkedArray, null: int = 0) -> np.ndarray:
+    return column.fill_null(null).to_numpy().astype(np.int64)
+
+
+def _microseconds(value: datetime) -> int:
+    return int(np.datetime64(value, "us").astype(np.int64))
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import re
+import zlib
+from typing import Any
+
+import numpy as np
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.db.repository.trajectory import TrajectoryRepository
+
+# 32 bands of 4 rows make trajectories about 40% similar collide in some band half the
+# time and 60% similar ones almost always. Changing these invalidates stored signatures.
+NUM_PERM: int = 128
+BANDS: int = 32
+ROWS_PER_BAND: int = NUM_PERM // BANDS
+
+# Trajectories filed per bucket. Later members of a full bucket are still compared with
+# the ones already in it, so clusters of repeats cost the same as a handful of trajectories.
+_BUCKET_CAPACITY: int = 16
+_SHINGLE_WORDS: int = 3
+_WORD: re.Pattern[str] = re.compile(r"\w+")
+
+_rng: np.random.Generator = np.random.default_rng(0x6D696E68)
+_UINT64_MAX: int = np.iinfo(np.uint64).max
+# Multiply-shift hash functions, one per permutation, and the weights folding a band of
+# signature rows into its bucket.
+_MULTIPLIERS: np.ndarray = _rng.integers(0, _UINT64_MAX, NUM_PERM, np.uint64, endpoint=True) | 1
+_INCREMENTS: np.ndarray = _rng.integers(0, _UINT64_MAX, NUM_PERM, np.uint64, endpoint=True)
+_BAND_WEIGHTS: np.ndarray = (
+    _rng.integers(0, _UINT64_MAX, ROWS_PER_BAND, np.uint64, endpoint=True) | 1
+)
+
+
+def trajectory_shingles(blocks: list[dict[str, Any]] | None) -> set[str]:
+    """What near-duplicates share: word 3-grams of the final answer, each tool call with its
+    input, and consecutive pairs of tools called."""
+    answer: str = ""
+    tools: list[str] = []
+    shingles: set[str] = set()
+    for block in blocks or []:
+        if "assistant_message" in block:
+            answer = block["assistant_message"].get("text") or ""
+        elif "tool_call" in block:
+            tool_call: dict[str, Any] = block["tool_call"]
+            tools.append(tool_call.get("tool_id", ""))
+            shingles.add(f"call\0{tools[-1]}\0{json.dumps(tool_call.get('input'), sort_keys=True)}")
+    shingles.update(f"tools\0{first}\0{second}" for first, second in zip(tools, tools[1:]))
+    words: list[str] = _WORD.findall(answer.lower())
+    shingles.update(
+        " ".join(words[start : start + _SHINGLE_WORDS])
+        for start in range(max(1, len(words) - _SHINGLE_WORDS + 1))
+    )
+    return shingles
+
+
+def minhash(shingles: set[str]) -> np.ndarray:
+    """The ``NUM_PERM`` MinHash signature of a set of shingles, as uint32."""
+    hashes: np.ndarray = np.fromiter(
+        (zlib.crc32(shingle.encode()) for shingle in shingles or {""}),
+        dtype=np.uint64,
+        count=len(shingles or {""}),
+    )
+    permuted: np.ndarray = (hashes[:, None] * _MULTIPLIERS + _INCREMENTS) >> np.uint64(32)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def lsh_buckets(signature: np.ndarray) -> list[int]:
+    """The bucket of each band of a signature, as signed 64-bit integers."""
+    bands: np.ndarray = signature.astype(np.uint64).reshape(BANDS, ROWS_PER_BAND)
+    return (bands * _BAND_WEIGHTS).sum(axis=1, dtype=np.uint64).view(np.int64).tolist()
+
+
+class DeduplicationIndex:
+    """Incremental MinHash/LSH index of trajectory text.
+
+    Each call hashes the oldest ``batch_size`` trajectories without a signature and records
+    their highest estimated Jaccard similarity to any trajectory hashed before them, found
+    through the LSH buckets rather than pairwise comparison. Filters then drop near-duplicates
+    with a plain comparison against ``Trajectory.duplicate_similarity``.
+    """
+
+    def __init__(self, batch_size: int) -> None:
+        self.batch_size: int = max(1, batch_size)
+
+    async def index_batch(self, session: AsyncSession) -> int:
+        """Hash one batch inside the caller's transaction; returns how many were hashed."""
+        repo: TrajectoryRepository = TrajectoryRepository(session)
+        rows: list[Row] = await repo.get_unhashed(self.batch_size)
+        if not rows:
+            return 0
+        signatures: list[np.ndarray] = await asyncio.to_thread(
+            _signatures, [row.blocks for row in rows]
+        )
+        buckets: list[list[int]] = [lsh_buckets(signature) for signature in signatures]
+
+        members: dict[tuple[int, int], list[str]] = {}
+        for band, bucket, trajectory_id in await repo.get_bucket_members(
+            list({key for row_buckets in buckets for key in enumerate(row_buckets)})
+        ):
+            members.setdefault((band, bucket), []).append(trajectory_id)
+        known: dict[str, np.ndarray] = {
+            trajectory_id: np.frombuffer(value, dtype=np.uint32)
+            for trajectory_id, value in (
+                await repo.get_minhashes(
+                    list({id for bucket_members in members.values() for id in bucket_members})
+                )
+            ).items()
+        }
+
+        hashed: list[tuple[str, bytes, float]] = []
+        filed: list[tuple[int, int, str]] = []
+        for row, signature, row_buckets in zip(rows, signatures, buckets, strict=True):
+            candidates: set[str] = set()
+            for band, bucket in enumerate(row_buckets):
+                bucket_members: list[str] = members.setdefault((band, bucket), [])
+                candidates.update(bucket_members)
+                if len(bucket_members) < _BUCKET_CAPACITY:
+                    bucket_members.append(row.id)
+                    filed.append((band, bucket, row.id))
+            candidates.discard(row.id)
+            similarity: float = 0.0
+            compared: list[np.ndarray] = [known[id] for id in candidates if id in known]
+            if compared:
+                similarity = float((np.stack(compared) == signature).mean(axis=1).max())
+            known[row.id] = signature
+            hashed.append((row.id, signature.tobytes(), similarity))
+        await repo.save_minhashes(hashed, filed)
+        return len(hashed)
+
+
+def _signatures(trajectory_blocks: list[list[dict[str, Any]] | None]) -> list[np.ndarray]:
+    return [minhash(trajectory_shingles(blocks)) for blocks in trajectory_blocks]
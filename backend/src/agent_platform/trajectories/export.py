@@ -0,0 +1,183 @@
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import ColumnElement, Row, SQLColumnExpression, Text, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.config import settings
+from agent_platform.db.models.trajectory import Trajectory
+from agent_platform.db.repository.trajectory import TrajectoryRepository
+from agent_platform.trajectories.filters import LABEL, REWARD_SCORE
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS: dict[int, str] = {1: "jsonl", 2: "parquet"}
+
+# JSON columns are read as their stored text and copied into the output unparsed.
+_COLUMNS: list[SQLColumnExpression[Any]] = [
+    Trajectory.id,
+    Trajectory.agent_id,
+    Trajectory.created_at,
+    REWARD_SCORE.label("reward_score"),
+    LABEL.label("label"),
+    cast(Trajectory.agent_run, Text).label("agent_run"),
+    cast(Trajectory.reward, Text).label("reward"),
+    cast(Trajectory.annotation, Text).label("annotation"),
+]
+
+PARQUET_SCHEMA: pa.Schema = pa.schema(
+    [
+        ("id", pa.string()),
+        ("agent_id", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("reward_score", pa.float64()),
+        ("label", pa.int32()),
+        ("agent_run", pa.string()),
+        ("reward", pa.string()),
+        ("annotation", pa.string()),
+    ]
+)
+
+
+class TrajectoryExport:
+    """Streams the trajectories matching some conditions as JSONL or Parquet bytes.
+
+    Rows come from a server-side cursor ``batch_size`` at a time and the output is cut into
+    chunks of exactly ``chunk_bytes`` (the last one shorter). Parquet output is written one
+    row group at a time, each closed once it holds about ``row_group_bytes`` of JSON text,
+    so memory depends on those sizes and not on how many trajectories match.
+    """
+
+    def __init__(
+        self,
+        format: str,
+        chunk_bytes: int = settings.export_chunk_bytes,
+        batch_size: int = settings.export_batch_size,
+        row_group_bytes: int = settings.export_row_group_bytes,
+    ) -> None:
+        self.format: str = format
+        self.chunk_bytes: int = max(1, chunk_bytes)
+        self.batch_size: int = max(1, batch_size)
+        self.row_group_bytes: int = row_group_bytes
+        self.rows: int = 0
+        self.bytes: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes / 1_000_000 / self.seconds if self.seconds else 0.0
+
+    async def stream(
+        self, session: AsyncSession, conditions: Sequence[ColumnElement[bool]]
+    ) -> AsyncIterator[bytes]:
+        started: float = time.perf_counter()
+        sink: _ChunkSink = _ChunkSink(self.chunk_bytes)
+        batches: AsyncIterator[Sequence[Row]] = TrajectoryRepository(session).stream_rows(
+            _COLUMNS, conditions, self.batch_size
+        )
+        writer: pq.ParquetWriter | None = None
+        if self.format == "parquet":
+            writer = pq.ParquetWriter(sink, PARQUET_SCHEMA, compression="zstd")
+        group: list[Row] = []
+        group_bytes: int = 0
+        try:
+            async for batch in batches:
+                self.rows += len(batch)
+                if writer is None:
+                    sink.write("".join(map(_jsonl_line, batch)).encode())
+                else:
+                    group.extend(batch)
+                    group_bytes += sum(len(row.agent_run) for row in batch)
+                    if group_bytes >= self.row_group_bytes:
+                        await asyncio.to_thread(_write_row_group, writer, group)
+                        group, group_bytes = [], 0
+                for chunk in sink.take():
+                    yield chunk
+            if writer is not None:
+                if group:
+                    await asyncio.to_thread(_write_row_group, writer, group)
+                writer.close()
+                writer = None
+            for chunk in sink.take(final=True):
+                yield chunk
+        finally:
+            if writer is not None:
+                writer.close()
+            self.bytes = sink.position
+            self.seconds = time.perf_counter() - started
+        logger.info(
+            "Exported %d trajectories as %s: %.1f MB in %.1fs (%.1f MB/s)",
+            self.rows,
+            self.format,
+            self.bytes / 1_000_000,
+            self.seconds,
+            self.megabytes_per_second,
+        )
+
+
+class _ChunkSink:
+    """Write-only file object that cuts what is written into chunks of ``size`` bytes."""
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+        self.position: int = 0
+        self.closed: bool = False
+        self._buffer: bytearray = bytearray()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def take(self, final: bool = False) -> list[bytes]:
+        """Remove and return the complete chunks, and the partial one too when ``final``."""
+        end: int = len(self._buffer) if final else len(self._buffer) // self.size * self.size
+        view: memoryview = memoryview(self._buffer)
+        chunks: list[bytes] = [
+            bytes(view[start : min(start + self.size, end)]) for start in range(0, end, self.size)
+        ]
+        view.release()
+        del self._buffer[:end]
+        return chunks
+
+
+def _jsonl_line(row: Row) -> str:
+    return (
+        f'{{"id":{json.dumps(row.id)},"agent_id":{json.dumps(row.agent_id)},'
+        f'"created_at":"{row.created_at.isoformat()}Z",'
+        f'"agent_run":{_json_text(row.agent_run)},"reward":{_json_text(row.reward)},'
+        f'"annotation":{_json_text(row.annotation)}}}\n'
+    )
+
+
+def _json_text(text: str | None) -> str:
+    # Newlines can only be whitespace between JSON tokens, but would end a JSONL record.
+    if text is None:
+        return "null"
+    return text.replace("\n", " ") if "\n" in text else text
+
+
+def _write_row_group(writer: pq.ParquetWriter, rows: list[Row]) -> None:
+    columns: list[list[Any]] = [list(column) for column in zip(*rows, strict=True)]
+    writer.write_table(
+        pa.Table.from_arrays(
+            [pa.array(values, type=field.type) for values, field in zip(columns, PARQUET_SCHEMA)],
+            schema=PARQUET_SCHEMA,
+        ),
+        row_group_size=len(rows),
+    )
@@ -0,0 +1,49 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement, or_
+
+from agent_platform.db.models.trajectory import Trajectory
+
+# TrajectoryLabel values as stored in the annotation JSON; 0 (unspecified) also stands for
+# trajectories nobody has annotated.
+LABEL_UNSPECIFIED: int = 0
+
+REWARD_SCORE: ColumnElement[float] = Trajectory.reward["score"].as_float()
+LABEL: ColumnElement[int] = Trajectory.annotation["label"].as_integer()
+
+
+def filter_conditions(filter: Any) -> list[ColumnElement[bool]]:
+    """SQL conditions for a ``TrajectoryFilter``; zero scores and empty lists match all."""
+    conditions: list[ColumnElement[bool]] = []
+    if filter.agent_ids:
+        conditions.append(Trajectory.agent_id.in_(list(filter.agent_ids)))
+    if filter.labels:
+        condition: ColumnElement[bool] = LABEL.in_(list(filter.labels))
+        if LABEL_UNSPECIFIED in filter.labels:
+            condition = or_(condition, LABEL.is_(None))
+        conditions.append(condition)
+    # Scores arrive as float32; rounding keeps 0.7 from meaning 0.699999988.
+    if filter.min_reward_score:
+        conditions.append(REWARD_SCORE >= round(filter.min_reward_score, 6))
+    if filter.max_reward_score:
+        conditions.append(REWARD_SCORE <= round(filter.max_reward_score, 6))
+    if filter.HasField("created_after"):
+        conditions.append(Trajectory.created_at >= filter.created_after.ToDatetime())
+    if filter.HasField("created_before"):
+        conditions.append(Trajectory.created_at < filter.created_before.ToDatetime())
+    if filter.near_duplicate_threshold:
+        conditions.append(
+            or_(
+                Trajectory.duplicate_similarity.is_(None),
+                Trajectory.duplicate_similarity < round(filter.near_duplicate_threshold, 6),
+            )
+        )
+    return conditions
+
+
+def enum_name(enum: Any, value: int) -> str:
+    """Name of ``value`` in a protobuf enum, or the number for values it does not know."""
+    try:
+        return enum.Name(value)
+    except ValueError:
+        return str(value)
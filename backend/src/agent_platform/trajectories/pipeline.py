@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import Row
+
+from agent_platform.config import settings
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.repository.trajectory import TrajectoryRepository
+from agent_platform.trajectories.dedup import DeduplicationIndex
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock held while creating a batch, so concurrent pipelines take turns.
+_LOCK_KEY: int = 0x7472616A
+
+
+class TrajectoryPipeline:
+    """Creates a trajectory for every completed agent run, in the background and in batches.
+
+    Runs are read by finish time after a cursor kept in memory, ``batch_size`` at a time,
+    and inserted with one ``INSERT ... SELECT`` per batch that copies the run and its
+    benchmark reward inside the database. Trajectories are keyed by agent run, so batches
+    are idempotent and several pipelines may run at once. A run waits for its reward until
+    a benchmark row holding it is scored or ``settle_seconds`` have passed; the cursor trails
+    by ``overlap_seconds`` (more than ``settle_seconds``) so runs committed late or still
+    waiting are picked up by later batches. Each batch also advances the deduplication index
+    by up to ``batch_size`` trajectories.
+
+    ``lag_seconds`` is how long the oldest run without a trajectory has been finished.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.trajectory_batch_size,
+        poll_interval: float = settings.trajectory_poll_interval,
+        settle_seconds: float = settings.trajectory_settle_seconds,
+        overlap_seconds: float = settings.trajectory_overlap_seconds,
+        lag_warning_seconds: float = settings.trajectory_lag_warning_seconds,
+    ) -> None:
+        self.batch_size: int = max(1, batch_size)
+        self.poll_interval: float = poll_interval
+        self.settle: timedelta = timedelta(seconds=settle_seconds)
+        self.overlap: timedelta = timedelta(seconds=max(overlap_seconds, settle_seconds))
+        self.lag_warning_seconds: float = lag_warning_seconds
+        self.cursor: datetime | None = None
+        self.lag_seconds: float = 0.0
+        self.created: int = 0
+        self.hashed: int = 0
+        self.dedup: DeduplicationIndex = DeduplicationIndex(self.batch_size)
+        self._stopping: asyncio.Event = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info("Trajectory pipeline started")
+        while not self._stopping.is_set():
+            try:
+                full: bool = await self.process_batch()
+            except Exception:
+                logger.exception("Trajectory batch failed")
+                full = False
+            if full:
+                continue
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+            except TimeoutError:
+                pass
+        logger.info("Trajectory pipeline stopped after creating %d trajectories", self.created)
+
+    async def process_batch(self) -> bool:
+        """Create the trajectories of one batch of runs and hash one batch for deduplication.
+        Returns whether either batch was full, meaning more work is probably waiting."""
+        now: datetime = datetime.utcnow()
+        finished_after: datetime | None = (
+            self.cursor - self.overlap if self.cursor is not None else None
+        )
+        async with AsyncSessionLocal() as session:
+            repo: TrajectoryRepository = TrajectoryRepository(session)
+            if not await repo.try_lock(_LOCK_KEY):
+                return False
+            runs: list[Row] = await repo.pending_agent_runs(
+                finished_after, now - self.settle, self.batch_size
+            )
+            created: int = 0
+            if runs:
+                created = await repo.create_from_agent_runs([run.id for run in runs])
+            hashed: int = await self.dedup.index_batch(session)
+            await session.commit()
+
+        self.created += created
+        self.hashed += hashed
+        self.lag_seconds = (now - runs[0].finished_at).total_seconds() if runs else 0.0
+        full: bool = len(runs) == self.batch_size
+        self.cursor = runs[-1].finished_at if full else now - self.settle
+        if runs or hashed:
+            logger.info(
+                "Created %d trajectories from %d agent runs (lag %.1fs), hashed %d",
+                created,
+                len(runs),
+                self.lag_seconds,
+                hashed,
+            )
+        if self.lag_seconds > self.lag_warning_seconds:
+            logger.warning("Trajectory creation is %.0fs behind", self.lag_seconds)
+        return full or hashed == self.batch_size
@@ -0,0 +1,140 @@
+import heapq
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Integer,
+    Row,
+    SQLColumnExpression,
+    case,
+    cast,
+    func,
+)
+from sqlalchemy.dialects.postgresql import BIT
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from agent_platform.config import settings
+from agent_platform.db.models.trajectory import Trajectory
+from agent_platform.db.repository.trajectory import TrajectoryRepository
+from agent_platform.trajectories.filters import LABEL, LABEL_UNSPECIFIED, REWARD_SCORE, enum_name
+
+logger = logging.getLogger(__name__)
+
+# Values of SampleStratum.
+STRATA: dict[int, str] = {1: "label", 2: "agent", 3: "reward_bucket"}
+DEFAULT_REWARD_BUCKETS: int = 4
+
+
+class StratifiedSampler:
+    """Single-pass stratified sampling of trajectories.
+
+    Matching trajectories are streamed once, unordered, through a server-side cursor as their
+    id, a priority and their strata, all computed by Postgres. Each stratum keeps a reservoir
+    of the ``per_stratum`` trajectories with the lowest priority, a hash of ``seed`` and the
+    trajectory id: a uniform sample without replacement that depends only on the seed and the
+    trajectories, not on the order the database returns them in. Memory is ``per_stratum``
+    ids per stratum, whatever the size of the table.
+    """
+
+    def __init__(
+        self,
+        strata: Sequence[int],
+        per_stratum: int,
+        seed: int,
+        reward_buckets: int = DEFAULT_REWARD_BUCKETS,
+        batch_size: int = settings.export_batch_size,
+    ) -> None:
+        if any(stratum not in STRATA for stratum in strata):
+            raise ValueError("Unknown sample stratum")
+        if per_stratum <= 0:
+            raise ValueError("A sample needs a positive per_stratum size")
+        self.strata: list[str] = [STRATA[stratum] for stratum in strata]
+        self.per_stratum: int = per_stratum
+        self.seed: int = seed
+        self.reward_buckets: int = max(1, reward_buckets)
+        self.batch_size: int = max(1, batch_size)
+
+    async def sample(
+        self, session: AsyncSession, conditions: Sequence[ColumnElement[bool]]
+    ) -> list[dict[str, Any]]:
+        """``keys``, ``population`` and sampled ``trajectory_ids`` of every non-empty stratum,
+        ordered by keys; ids are in priority order."""
+        started: float = time.perf_counter()
+        columns: list[SQLColumnExpression[Any]] = [
+            Trajectory.id,
+            self._priority(),
+            *(self._column(name) for name in self.strata),
+        ]
+        reservoirs: dict[tuple[Any, ...], list[tuple[int, str]]] = {}
+        population: dict[tuple[Any, ...], int] = {}
+        rows: int = 0
+        batches: AsyncIterator[Sequence[Row]] = TrajectoryRepository(session).stream_rows(
+            columns, conditions, self.batch_size, order_by=()
+        )
+        async for batch in batches:
+            rows += len(batch)
+            for row in batch:
+                stratum: tuple[Any, ...] = tuple(row[2:])
+                reservoir: list[tuple[int, str]] | None = reservoirs.get(stratum)
+                if reservoir is None:
+                    reservoir = reservoirs[stratum] = []
+                    population[stratum] = 0
+                population[stratum] += 1
+                # A max-heap of the lowest priorities, by negating them.
+                priority: int = -row.priority
+                if len(reservoir) < self.per_stratum:
+                    heapq.heappush(reservoir, (priority, row.id))
+                elif priority > reservoir[0][0]:
+                    heapq.heapreplace(reservoir, (priority, row.id))
+        logger.info(
+            "Sampled %d strata from %d trajectories in %.2fs",
+            len(reservoirs),
+            rows,
+            time.perf_counter() - started,
+        )
+        names: list[Callable[[Any], str]] = [self._name(name) for name in self.strata]
+        return [
+            {
+                "keys": [name(value) for name, value in zip(names, stratum, strict=True)],
+                "population": population[stratum],
+                "trajectory_ids": [id for _, id in sorted(reservoirs[stratum], reverse=True)],
+            }
+            for stratum in sorted(reservoirs)
+        ]
+
+    def _priority(self) -> ColumnElement[int]:
+        """The first 64 bits of the MD5 of the seed and trajectory id, as a signed integer."""
+        digest: ColumnElement[str] = func.md5(f"{self.seed}:" + Trajectory.id)
+        return cast(cast(func.concat("x", func.substr(digest, 1, 16)), BIT(64)), BigInteger).label(
+            "priority"
+        )
+
+    def _column(self, stratum: str) -> SQLColumnExpression[Any]:
+        if stratum == "label":
+            return func.coalesce(LABEL, LABEL_UNSPECIFIED)
+        if stratum == "agent":
+            return Trajectory.agent_id
+        # Bucket -1 holds trajectories without a reward.
+        return case(
+            (REWARD_SCORE.is_(None), -1),
+            else_=func.least(
+                func.greatest(cast(func.floor(REWARD_SCORE * self.reward_buckets), Integer), 0),
+                self.reward_buckets - 1,
+            ),
+        )
+
+    def _name(self, stratum: str) -> Callable[[Any], str]:
+        from agent_platform.trajectory.v1.trajectory_pb2 import TrajectoryLabel
+
+        if stratum == "label":
+            return lambda value: enum_name(TrajectoryLabel, value)
+        if stratum == "agent":
+            return str
+        buckets: int = self.reward_buckets
+        return lambda value: (
+            "none" if value < 0 else f"{value / buckets:g}-{(value + 1) / buckets:g}"
+        )
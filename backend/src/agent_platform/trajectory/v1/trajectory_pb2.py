@@ -21,7 +21,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n-agent_platform/trajectory/v1/trajectory.proto\x12\x1c\x61gent_platform.trajectory.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\'agent_platform/agent/v1/agent_run.proto\x1a%agent_platform/reward/v1/reward.proto"\xc6\x02\n\nTrajectory\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x19\n\x08\x61gent_id\x18\x02 \x01(\tR\x07\x61gentId\x12>\n\tagent_run\x18\x03 \x01(\x0b\x32!.agent_platform.agent.v1.AgentRunR\x08\x61gentRun\x12>\n\x06reward\x18\x04 \x01(\x0b\x32&.agent_platform.reward.v1.RewardResultR\x06reward\x12R\n\nannotation\x18\x05 \x01(\x0b\x32\x32.agent_platform.trajectory.v1.TrajectoryAnnotationR\nannotation\x12\x39\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt"\xac\x02\n\x14TrajectoryAnnotation\x12!\n\x0c\x61nnotator_id\x18\x01 \x01(\tR\x0b\x61nnotatorId\x12\x43\n\x05label\x18\x02 \x01(\x0e\x32-.agent_platform.trajectory.v1.TrajectoryLabelR\x05label\x12\x14\n\x05notes\x18\x03 \x01(\tR\x05notes\x12W\n\x10step_annotations\x18\x04 \x03(\x0b\x32,.agent_platform.trajectory.v1.StepAnnotationR\x0fstepAnnotations\x12=\n\x0c\x61nnotated_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0b\x61nnotatedAt"\x86\x01\n\x0eStepAnnotation\x12\x19\n\x08\x62lock_id\x18\x01 \x01(\tR\x07\x62lockId\x12=\n\x05label\x18\x02 \x01(\x0e\x32\'.agent_platform.trajectory.v1.StepLabelR\x05label\x12\x1a\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x03 \x01(\tR\x08\x66\x65\x65\x64\x62\x61\x63k"\xce\x02\n\x10TrajectoryFilter\x12\x1b\n\tagent_ids\x18\x01 \x03(\tR\x08\x61gentIds\x12\x45\n\x06labels\x18\x02 \x03(\x0e\x32-.agent_platform.trajectory.v1.TrajectoryLabelR\x06labels\x12(\n\x10min_reward_score\x18\x03 \x01(\x02R\x0eminRewardScore\x12(\n\x10max_reward_score\x18\x04 \x01(\x02R\x0emaxRewardScore\x12?\n\rcreated_after\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x63reatedAfter\x12\x41\n\x0e\x63reated_before\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\rcreatedBefore*\xb2\x01\n\x0fTrajectoryLabel\x12 \n\x1cTRAJECTORY_LABEL_UNSPECIFIED\x10\x00\x12\x1c\n\x18TRAJECTORY_LABEL_CORRECT\x10\x01\x12\x1e\n\x1aTRAJECTORY_LABEL_INCORRECT\x10\x02\x12\x1c\n\x18TRAJECTORY_LABEL_PARTIAL\x10\x03\x12!\n\x1dTRAJECTORY_LABEL_NEEDS_REVIEW\x10\x04*\x95\x01\n\tStepLabel\x12\x1a\n\x16STEP_LABEL_UNSPECIFIED\x10\x00\x12\x16\n\x12STEP_LABEL_CORRECT\x10\x01\x12\x18\n\x14STEP_LABEL_INCORRECT\x10\x02\x12\x1a\n\x16STEP_LABEL_UNNECESSARY\x10\x03\x12\x1e\n\x1aSTEP_LABEL_MISSING_CONTEXT\x10\x04\x42\x8c\x02\n com.agent_platform.trajectory.v1B\x0fTrajectoryProtoP\x01ZIgithub.com/agentplatform/gen/go/agent_platform/trajectory/v1;trajectoryv1\xa2\x02\x03\x41TX\xaa\x02\x1b\x41gentPlatform.Trajectory.V1\xca\x02\x1b\x41gentPlatform\\Trajectory\\V1\xe2\x02\'AgentPlatform\\Trajectory\\V1\\GPBMetadata\xea\x02\x1d\x41gentPlatform::Trajectory::V1b\x06proto3'
+    b'\n-agent_platform/trajectory/v1/trajectory.proto\x12\x1c\x61gent_platform.trajectory.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\'agent_platform/agent/v1/agent_run.proto\x1a%agent_platform/reward/v1/reward.proto"\xc6\x02\n\nTrajectory\x12\x0e\n\x02id\x18\x01 \x01(\tR\x02id\x12\x19\n\x08\x61gent_id\x18\x02 \x01(\tR\x07\x61gentId\x12>\n\tagent_run\x18\x03 \x01(\x0b\x32!.agent_platform.agent.v1.AgentRunR\x08\x61gentRun\x12>\n\x06reward\x18\x04 \x01(\x0b\x32&.agent_platform.reward.v1.RewardResultR\x06reward\x12R\n\nannotation\x18\x05 \x01(\x0b\x32\x32.agent_platform.trajectory.v1.TrajectoryAnnotationR\nannotation\x12\x39\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\tcreatedAt"\xac\x02\n\x14TrajectoryAnnotation\x12!\n\x0c\x61nnotator_id\x18\x01 \x01(\tR\x0b\x61nnotatorId\x12\x43\n\x05label\x18\x02 \x01(\x0e\x32-.agent_platform.trajectory.v1.TrajectoryLabelR\x05label\x12\x14\n\x05notes\x18\x03 \x01(\tR\x05notes\x12W\n\x10step_annotations\x18\x04 \x03(\x0b\x32,.agent_platform.trajectory.v1.StepAnnotationR\x0fstepAnnotations\x12=\n\x0c\x61nnotated_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0b\x61nnotatedAt"\x86\x01\n\x0eStepAnnotation\x12\x19\n\x08\x62lock_id\x18\x01 \x01(\tR\x07\x62lockId\x12=\n\x05label\x18\x02 \x01(\x0e\x32\'.agent_platform.trajectory.v1.StepLabelR\x05label\x12\x1a\n\x08\x66\x65\x65\x64\x62\x61\x63k\x18\x03 \x01(\tR\x08\x66\x65\x65\x64\x62\x61\x63k"\x88\x03\n\x10TrajectoryFilter\x12\x1b\n\tagent_ids\x18\x01 \x03(\tR\x08\x61gentIds\x12\x45\n\x06labels\x18\x02 \x03(\x0e\x32-.agent_platform.trajectory.v1.TrajectoryLabelR\x06labels\x12(\n\x10min_reward_score\x18\x03 \x01(\x02R\x0eminRewardScore\x12(\n\x10max_reward_score\x18\x04 \x01(\x02R\x0emaxRewardScore\x12?\n\rcreated_after\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\x0c\x63reatedAfter\x12\x41\n\x0e\x63reated_before\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampR\rcreatedBefore\x12\x38\n\x18near_duplicate_threshold\x18\x07 \x01(\x02R\x16nearDuplicateThreshold*\xb2\x01\n\x0fTrajectoryLabel\x12 \n\x1cTRAJECTORY_LABEL_UNSPECIFIED\x10\x00\x12\x1c\n\x18TRAJECTORY_LABEL_CORRECT\x10\x01\x12\x1e\n\x1aTRAJECTORY_LABEL_INCORRECT\x10\x02\x12\x1c\n\x18TRAJECTORY_LABEL_PARTIAL\x10\x03\x12!\n\x1dTRAJECTORY_LABEL_NEEDS_REVIEW\x10\x04*\x95\x01\n\tStepLabel\x12\x1a\n\x16STEP_LABEL_UNSPECIFIED\x10\x00\x12\x16\n\x12STEP_LABEL_CORRECT\x10\x01\x12\x18\n\x14STEP_LABEL_INCORRECT\x10\x02\x12\x1a\n\x16STEP_LABEL_UNNECESSARY\x10\x03\x12\x1e\n\x1aSTEP_LABEL_MISSING_CONTEXT\x10\x04\x42\x8c\x02\n com.agent_platform.trajectory.v1B\x0fTrajectoryProtoP\x01ZIgithub.com/agentplatform/gen/go/agent_platform/trajectory/v1;trajectoryv1\xa2\x02\x03\x41TX\xaa\x02\x1b\x41gentPlatform.Trajectory.V1\xca\x02\x1b\x41gentPlatform\\Trajectory\\V1\xe2\x02\'AgentPlatform\\Trajectory\\V1\\GPBMetadata\xea\x02\x1d\x41gentPlatform::Trajectory::V1b\x06proto3'
 )
 
 _globals = globals()
@@ -34,10 +34,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals[
         "DESCRIPTOR"
     ]._serialized_options = b"\n com.agent_platform.trajectory.v1B\017TrajectoryProtoP\001ZIgithub.com/agentplatform/gen/go/agent_platform/trajectory/v1;trajectoryv1\242\002\003ATX\252\002\033AgentPlatform.Trajectory.V1\312\002\033AgentPlatform\\Trajectory\\V1\342\002'AgentPlatform\\Trajectory\\V1\\GPBMetadata\352\002\035AgentPlatform::Trajectory::V1"
-    _globals["_TRAJECTORYLABEL"]._serialized_start = 1299
-    _globals["_TRAJECTORYLABEL"]._serialized_end = 1477
-    _globals["_STEPLABEL"]._serialized_start = 1480
-    _globals["_STEPLABEL"]._serialized_end = 1629
+    _globals["_TRAJECTORYLABEL"]._serialized_start = 1357
+    _globals["_TRAJECTORYLABEL"]._serialized_end = 1535
+    _globals["_STEPLABEL"]._serialized_start = 1538
+    _globals["_STEPLABEL"]._serialized_end = 1687
     _globals["_TRAJECTORY"]._serialized_start = 193
     _globals["_TRAJECTORY"]._serialized_end = 519
     _globals["_TRAJECTORYANNOTATION"]._serialized_start = 522
@@ -45,5 +45,5 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_STEPANNOTATION"]._serialized_start = 825
     _globals["_STEPANNOTATION"]._serialized_end = 959
     _globals["_TRAJECTORYFILTER"]._serialized_start = 962
-    _globals["_TRAJECTORYFILTER"]._serialized_end = 1296
+    _globals["_TRAJECTORYFILTER"]._serialized_end = 1354
 # @@protoc_insertion_point(module_scope)
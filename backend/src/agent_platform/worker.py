@@ -0,0 +1,247 @@
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+
+from agent_platform.benchmarks.concurrency import AdaptiveLimiter
+from agent_platform.benchmarks.execution import RowState, execute_agent_run, load_agent_model
+from agent_platform.config import settings
+from agent_platform.db.engine import AsyncSessionLocal
+from agent_platform.db.models.agent import Agent
+from agent_platform.db.models.benchmark import BenchmarkRun, BenchmarkTask
+from agent_platform.db.models.dataset import PromptDatasetRow
+from agent_platform.db.repository.agent import AgentRepository
+from agent_platform.db.repository.benchmark import BenchmarkRunRepository, BenchmarkTaskRepository
+from agent_platform.db.repository.dataset import PromptDatasetRowRepository
+from agent_platform.llm.client import AnthropicClient
+from agent_platform.llm.executor import AgentExecutor, Status
+from agent_platform.models.agent import AgentModel
+from agent_platform.rewards.cache import RewardCache
+from agent_platform.rewards.evaluation import RewardEvaluator
+from agent_platform.rewards.scoring import configured_scorers
+from agent_platform.tools.registry import ToolRegistry
+from agent_platform.trajectories.pipeline import TrajectoryPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(Exception):
+    pass
+
+
+class BenchmarkWorker:
+    """Claims queued benchmark rows and executes them with an ``AgentExecutor``.
+
+    Rows are leased for ``lease_seconds`` and kept alive by a heartbeat; rows whose lease
+    expires (a worker died) are reclaimed by any other worker and resume from their last
+    checkpoint. The number of rows in flight adapts to rate limiting and latency, up to
+    ``concurrency``.
+    """
+
+    def __init__(
+        self,
+        executor: AgentExecutor,
+        concurrency: int = settings.worker_concurrency,
+        lease_seconds: int = settings.worker_lease_seconds,
+        max_attempts: int = settings.worker_max_attempts,
+        poll_interval: float = settings.benchmark_poll_interval,
+    ) -> None:
+        self.executor: AgentExecutor = executor
+        self.concurrency: int = max(1, concurrency)
+        self.limiter: AdaptiveLimiter = AdaptiveLimiter(
+            self.concurrency, initial=settings.benchmark_initial_parallel_runs
+        )
+        self.lease_seconds: int = lease_seconds
+        self.max_attempts: int = max_attempts
+        self.poll_interval: float = poll_interval
+        self.reward_cache: RewardCache = RewardCache()
+        self.worker_id: str = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._active: dict[str, asyncio.Task] = {}
+        self._contexts: dict[str, tuple[AgentModel, RewardEvaluator, int]] = {}
+        self._context_users: dict[str, int] = {}
+        self._stopping: asyncio.Event = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info("Worker %s started with concurrency %d", self.worker_id, self.concurrency)
+        heartbeat: asyncio.Task = asyncio.create_task(self._heartbeat())
+        try:
+            while not self._stopping.is_set():
+                if len(self._active) >= self.limiter.limit:
+                    await asyncio.wait(
+                        set(self._active.values()), return_when=asyncio.FIRST_COMPLETED
+                    )
+                    continue
+                async with AsyncSessionLocal() as session:
+                    claimed: list[BenchmarkTask] = await BenchmarkTaskRepository(session).claim(
+                        self.worker_id,
+                        self.limiter.limit - len(self._active),
+                        self.lease_seconds,
+                        self.max_attempts,
+                    )
+                    await session.commit()
+                for task in claimed:
+                    self._spawn(task)
+                if not claimed:
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                    except TimeoutError:
+                        pass
+        finally:
+            heartbeat.cancel()
+            active: list[str] = list(self._active)
+            for running in self._active.values():
+                running.cancel()
+            if active:
+                await asyncio.wait(set(self._active.values()))
+                async with AsyncSessionLocal() as session:
+                    await BenchmarkTaskRepository(session).release(self.worker_id, active)
+                    await session.commit()
+            logger.info("Worker %s stopped", self.worker_id)
+
+    def _spawn(self, task: BenchmarkTask) -> None:
+        running: asyncio.Task = asyncio.create_task(self._process(task))
+        self._active[task.id] = running
+        self._context_users[task.benchmark_run_id] = (
+            self._context_users.get(task.benchmark_run_id, 0) + 1
+        )
+        running.add_done_callback(lambda _: self._finished(task))
+
+    def _finished(self, task: BenchmarkTask) -> None:
+        self._active.pop(task.id, None)
+        # A run's context goes once none of its tasks runs here, so contexts of finished
+        # runs do not pile up and a later task reloads the run's reward definitions.
+        self._context_users[task.benchmark_run_id] -= 1
+        if not self._context_users[task.benchmark_run_id]:
+            del self._context_users[task.benchmark_run_id]
+            self._contexts.pop(task.benchmark_run_id, None)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with AsyncSessionLocal() as session:
+                    await BenchmarkTaskRepository(session).heartbeat(
+                        self.worker_id, list(self._active), self.lease_seconds
+                    )
+                    await session.commit()
+            except Exception:
+                logger.exception("Worker %s heartbeat failed", self.worker_id)
+
+    async def _process(self, task: BenchmarkTask) -> None:
+        try:
+            agent, evaluator, runs_per_prompt = await self._context(task.benchmark_run_id)
+            async with AsyncSessionLocal() as session:
+                dataset_row: PromptDatasetRow | None = await PromptDatasetRowRepository(
+                    session
+                ).get_by_id(task.prompt_dataset_row_id)
+            if dataset_row is None:
+                raise ValueError(f"Prompt dataset row {task.prompt_dataset_row_id} not found")
+
+            state: RowState = RowState.from_checkpoint(
+                dataset_row, runs_per_prompt, task.checkpoint.get("cache_key", ""), task.checkpoint
+            )
+            # A worker may have died after the last agent run but before finishing the task.
+            if state.remaining == 0:
+                await self._checkpoint(task.id, state.to_dict())
+            while state.remaining > 0:
+                await self._execute_limited(agent, evaluator, state)
+                await self._checkpoint(task.id, state.to_dict())
+        except LeaseLostError:
+            logger.warning("Worker %s lost the lease on task %s", self.worker_id, task.id)
+        except Exception as e:
+            logger.exception("Benchmark task %s failed", task.id)
+            try:
+                await self._checkpoint(
+                    task.id, {**task.checkpoint, "status": Status.ERROR, "error": str(e)}
+                )
+            except LeaseLostError:
+                pass
+
+    async def _execute_limited(
+        self, agent: AgentModel, evaluator: RewardEvaluator, state: RowState
+    ) -> None:
+        started: float = await self.limiter.acquire()
+        try:
+            error_type: str | None = await execute_agent_run(self.executor, agent, state, evaluator)
+        except BaseException:
+            self.limiter.release()
+            raise
+        if self.limiter.release(started, error_type):
+            logger.info(
+                "Worker %s concurrency limit %d (%s)",
+                self.worker_id,
+                self.limiter.limit,
+                self.limiter.reason,
+            )
+
+    async def _checkpoint(self, task_id: str, row: dict) -> None:
+        async with AsyncSessionLocal() as session:
+            owned: bool = await BenchmarkTaskRepository(session).checkpoint(
+                task_id, self.worker_id, row, self.lease_seconds
+            )
+            await session.commit()
+        if not owned:
+            raise LeaseLostError(task_id)
+
+    async def _context(self, benchmark_run_id: str) -> tuple[AgentModel, RewardEvaluator, int]:
+        if benchmark_run_id not in self._contexts:
+            async with AsyncSessionLocal() as session:
+                run: BenchmarkRun | None = await BenchmarkRunRepository(session).get_by_id(
+                    benchmark_run_id
+                )
+                if run is None:
+                    raise ValueError(f"Benchmark run {benchmark_run_id} not found")
+                agent_db: Agent | None = await AgentRepository(session).get_by_id(run.agent_id)
+                if agent_db is None:
+                    raise ValueError(f"Agent {run.agent_id} not found")
+            config: dict = run.config or {}
+            runs_per_prompt: int = max(1, int(config.get("runs_per_prompt") or 1))
+            self._contexts[benchmark_run_id] = (
+                load_agent_model(agent_db, run.agent_config),
+                RewardEvaluator(
+                    self.executor,
+                    agent_db.policy_agent_ids,
+                    cache=self.reward_cache,
+                    local_scorers=configured_scorers(config.get("local_scoring")),
+                ),
+                runs_per_prompt,
+            )
+        return self._contexts[benchmark_run_id]
+
+
+async def serve(concurrency: int) -> None:
+    executor: AgentExecutor = AgentExecutor(AnthropicClient(), ToolRegistry())
+    worker: BenchmarkWorker = BenchmarkWorker(executor, concurrency=concurrency)
+    pipeline: TrajectoryPipeline = TrajectoryPipeline()
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+    def stop() -> None:
+        worker.stop()
+        pipeline.stop()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop)
+    if settings.trajectory_pipeline:
+        await asyncio.gather(worker.run(), pipeline.run())
+    else:
+        await worker.run()
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Execute queued benchmark rows"
+    )
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency)
+    args: argparse.Namespace = parser.parse_args()
+    logging.basicConfig(level=settings.log_level)
+    asyncio.run(serve(args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -57,7 +57,8 @@ function createBenchmarkStore() {
 
 	async function loadRun(benchmarkRunId: string) {
 		const state = get(store);
-		if (state.runs.has(benchmarkRunId)) {
+		// Listed runs come without rows, so only runs fetched on their own are reused.
+		if (state.runs.get(benchmarkRunId)?.rows.length) {
 			store.update((prev) => ({ ...prev, selectedRunId: benchmarkRunId }));
 			return;
 		}